@@ -7,25 +7,55 @@ Run with:
     uvicorn neoscene.app.api:app --reload
 """
 
+import json
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse, Response
+from fastapi.responses import (
+    HTMLResponse,
+    JSONResponse,
+    PlainTextResponse,
+    Response,
+    StreamingResponse,
+)
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
+from neoscene.app.batch import BatchGenerator, BatchItem, shutdown_export_pool
+from neoscene.app.telemetry_stream import (
+    DEFAULT_CAMERA_FPS,
+    DEFAULT_MJPEG_FPS,
+    DEFAULT_SENSOR_HZ,
+    MAX_MJPEG_FPS,
+    MJPEG_BOUNDARY,
+    TelemetryStream,
+    mjpeg_parts,
+    serve_telemetry,
+)
+from neoscene.backends.process_worker import process_pool_from_env
 from neoscene.backends.session_manager import SceneSessionManager
 from neoscene.core.errors import (
     AssetNotFoundError,
     LLMError,
     NeosceneError,
 )
-from neoscene.core.llm_client import GeminiClient
+from neoscene.core.llm_client import (
+    GeminiClient,
+    LLMQueueFullError,
+    llm_session,
+    load_llm_config,
+)
 from neoscene.core.logging_config import get_logger, setup_logging
+from neoscene.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from neoscene.core.metrics import REGISTRY
 from neoscene.core.scene_agent import SceneAgent, SceneGenerationError
 from neoscene.core.scene_tools import list_assets_by_category, search_assets
+from neoscene.core.speculation import speculation_from_config
+from neoscene.core.tracing import Trace, current_trace, stage_summary, start_trace, use_trace
 from neoscene.exporters.mjcf_exporter import scene_to_mjcf
 
 # Setup logging
@@ -36,7 +66,15 @@ logger = get_logger(__name__)
 # FastAPI App Configuration
 # =============================================================================
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Stop the shared batch export processes when the server shuts down."""
+    yield
+    shutdown_export_pool()
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="Neoscene API",
     description="Text-to-scene generator for MuJoCo simulations",
     version="0.1.0",
@@ -53,6 +91,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "neoscene_http_request_duration_seconds",
+    "HTTP request latency until the response headers are sent, per route",
+    ("method", "route"),
+)
+HTTP_REQUESTS = REGISTRY.counter(
+    "neoscene_http_requests_total",
+    "HTTP requests per route and status code",
+    ("method", "route", "status"),
+)
+
+
+@app.middleware("http")
+async def trace_requests(request: Request, call_next):
+    """Trace pipeline stages per request and report them in Server-Timing.
+
+    Also records the request latency and status per route template (e.g.
+    "/sensors/{session_id}"), so metrics stay bounded by the number of routes.
+    """
+    start = time.perf_counter()
+    status = 500
+    try:
+        with start_trace() as trace:
+            response = await call_next(request)
+            response.headers["Server-Timing"] = trace.server_timing()
+        status = response.status_code
+        return response
+    finally:
+        route = getattr(request.scope.get("route"), "path", "unmatched")
+        HTTP_REQUEST_SECONDS.observe(
+            time.perf_counter() - start, method=request.method, route=route
+        )
+        HTTP_REQUESTS.inc(method=request.method, route=route, status=status)
+
+
 # Serve static files
 static_dir = Path(__file__).resolve().parent / "static"
 if static_dir.exists():
@@ -81,6 +155,23 @@ async def neoscene_exception_handler(request: Request, exc: NeosceneError):
     )
 
 
+@app.exception_handler(LLMQueueFullError)
+async def llm_queue_full_handler(request: Request, exc: LLMQueueFullError):
+    """Reject requests while the LLM queue is full, with a retry hint."""
+    logger.warning(f"LLM queue full: {exc}")
+    retry_after = int(exc.retry_after)
+
+    return JSONResponse(
+        status_code=429,
+        headers={"Retry-After": str(retry_after)},
+        content={
+            "error": "LLMQueueFullError",
+            "message": str(exc),
+            "retry_after": retry_after,
+        },
+    )
+
+
 @app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception):
     """Handle unexpected errors with truncated messages."""
@@ -104,13 +195,77 @@ async def generic_exception_handler(request: Request, exc: Exception):
 asset_root = Path(__file__).resolve().parents[1] / "assets"
 
 # Create singleton instances
-session_manager = SceneSessionManager(asset_root)
+session_manager = SceneSessionManager(asset_root, process_pool=process_pool_from_env())
 llm = GeminiClient.from_default_config()
-agent = SceneAgent(session_manager.catalog, llm)
+agent = SceneAgent(
+    session_manager.catalog,
+    llm,
+    speculation=speculation_from_config(load_llm_config()),
+)
 
 logger.info(f"Initialized with {len(session_manager.catalog)} assets from {asset_root}")
 
 
+def _register_metrics() -> None:
+    """Register scrape-time gauges over the API singletons."""
+    REGISTRY.gauge(
+        "neoscene_active_sessions", "Scene sessions", session_manager.session_count
+    )
+    REGISTRY.gauge(
+        "neoscene_catalog_assets", "Assets in the catalog", lambda: len(session_manager.catalog)
+    )
+    REGISTRY.gauge(
+        "neoscene_telemetry_streams", "Open telemetry WebSockets", lambda: TelemetryStream.active
+    )
+
+    def per_worker(attribute: str):
+        return lambda: {
+            session_id: getattr(worker, attribute)
+            for session_id, worker in session_manager.sim_workers().items()
+        }
+
+    for name, attribute, documentation in (
+        ("neoscene_sim_step_rate_hz", "step_rate", "Simulation steps per wall-clock second"),
+        ("neoscene_sim_realtime_factor", "realtime_factor",
+         "Simulated seconds per wall-clock second"),
+        ("neoscene_sim_render_seconds", "last_render_seconds",
+         "Render time of the latest camera frame"),
+    ):
+        REGISTRY.gauge(name, documentation, per_worker(attribute), ("session",))
+    for name, attribute, documentation in (
+        ("neoscene_sim_steps_total", "steps", "Simulation steps"),
+        ("neoscene_sim_frames_total", "frames", "Camera frames rendered"),
+        ("neoscene_sim_render_seconds_total", "render_seconds_total",
+         "Time spent rendering camera frames"),
+        ("neoscene_sim_overruns_total", "overruns",
+         "Ticks on which the physics backlog was dropped"),
+        ("neoscene_sim_dropped_ticks_total", "dropped_ticks",
+         "Sensor/camera ticks skipped because the loop ran late"),
+    ):
+        REGISTRY.callback_counter(name, documentation, per_worker(attribute), ("session",))
+
+    if llm.cache is not None:
+        REGISTRY.gauge(
+            "neoscene_llm_cache_hit_ratio",
+            "Fraction of LLM response cache lookups that were hits",
+            lambda: llm.cache.stats()["hit_ratio"],
+        )
+    if llm.scheduler is not None:
+        REGISTRY.gauge(
+            "neoscene_llm_queue_depth",
+            "LLM requests waiting for a slot",
+            lambda: llm.scheduler.stats()["queue_depth"],
+        )
+        REGISTRY.gauge(
+            "neoscene_llm_in_flight",
+            "LLM requests being sent",
+            lambda: llm.scheduler.stats()["in_flight"],
+        )
+
+
+_register_metrics()
+
+
 # =============================================================================
 # Request/Response Models
 # =============================================================================
@@ -131,6 +286,10 @@ class ChatResponse(BaseModel):
     assistant_message: str
     scene_spec: Optional[Dict[str, Any]] = None
     scene_summary: Dict[str, Any]
+    timings: Optional[Dict[str, float]] = Field(
+        default=None,
+        description="Milliseconds spent in each pipeline stage",
+    )
 
 
 class GenerateSceneRequest(BaseModel):
@@ -162,6 +321,29 @@ class GenerateSceneResponse(BaseModel):
         description="The generated MJCF XML string (if requested)",
     )
     created_at: str = Field(description="ISO timestamp of generation")
+    timings: Optional[Dict[str, float]] = Field(
+        default=None,
+        description="Milliseconds spent in each pipeline stage",
+    )
+
+
+class BatchGenerateRequest(BaseModel):
+    """Request body for batch scene generation."""
+
+    prompts: List[str] = Field(
+        ...,
+        description="Natural language scene descriptions",
+        min_length=1,
+        max_length=5000,
+    )
+    include_mjcf: bool = Field(
+        default=False,
+        description="Whether to include the MJCF XML in each result",
+    )
+    validate_mjcf: bool = Field(
+        default=True,
+        description="Whether to check that each MJCF compiles in MuJoCo",
+    )
 
 
 class AssetInfo(BaseModel):
@@ -290,7 +472,7 @@ async def chat(req: ChatRequest):
                 )
             
             # Try to start the task
-            ok = session_manager.start_task(session.session_id, task_name)
+            ok = await session_manager.start_task_async(session.session_id, task_name)
             if ok:
                 assistant_msg = f"🚀 Started task '{task_name}'. The tractor is now following the path."
             else:
@@ -325,7 +507,7 @@ async def chat(req: ChatRequest):
             # Start the first available task
             if session.last_scene and session.last_scene.tasks:
                 task_name = session.last_scene.tasks[0].name
-                ok = session_manager.start_task(session.session_id, task_name)
+                ok = await session_manager.start_task_async(session.session_id, task_name)
                 if ok:
                     assistant_msg = f"🚀 Started task '{task_name}'. The tractor is now following the path."
                 else:
@@ -341,20 +523,142 @@ async def chat(req: ChatRequest):
                 scene_summary=session_manager.describe_scene(session),
             )
 
-    # Not a control command - use LLM for scene editing / task planning
+    # Not a control command - apply simple edits locally, otherwise use LLM
+    # for scene editing / task planning
+    local = agent.try_local_edit(session.last_scene, message)
+    if local is not None:
+        spec = local.scene
+    else:
+        try:
+            with llm_session(session.session_id):
+                spec = await agent.update_scene_spec_async(session.last_scene, message)
+        except LLMQueueFullError:
+            raise
+        except SceneGenerationError as e:
+            raise HTTPException(status_code=500, detail=f"Failed to update scene: {e}")
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to update scene: {e}")
+
+    # Update viewer and simulation (blocking work, run off the event loop)
+    await session_manager.update_scene_async(session, spec)
+
+    # Prepare assistant message (short summary)
+    summary = session_manager.describe_scene(session)
+    assistant_msg = _scene_update_message(
+        spec, summary, local.description if local is not None else None
+    )
+
+    logger.info(f"[{session.session_id}] Generated: {summary.get('scene_name')}")
+
+    return ChatResponse(
+        session_id=session.session_id,
+        user_message=req.message,
+        assistant_message=assistant_msg,
+        scene_spec=spec.model_dump(),
+        scene_summary=summary,
+        timings=_request_timings(),
+    )
+
+
+@app.post("/chat/stream", tags=["Chat"])
+async def chat_stream(req: ChatRequest):
+    """Chat-driven scene generation with streamed progress (Server-Sent Events).
+
+    The scene is generated from a streamed LLM response. Each object,
+    camera, light, path and task is validated as soon as it arrives and
+    reported as an "element" event; a final "done" event carries the same
+    payload as /chat. Control commands are not streamed; use /chat.
+    """
+    message = req.message.strip()
+    if not message:
+        raise HTTPException(status_code=400, detail="Message cannot be empty")
+    if _parse_control_command(message):
+        raise HTTPException(status_code=400, detail="Control commands are not streamed; use /chat")
+
+    session = session_manager.get_or_create_session(req.session_id)
+    logger.info(f"[{session.session_id}] Chat (stream): '{message[:100]}...'")
+
+    return StreamingResponse(
+        _chat_stream_events(session, req.message, message, current_trace()),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _chat_stream_events(
+    session,
+    user_message: str,
+    message: str,
+    trace: Optional[Trace] = None,
+) -> Iterator[str]:
+    """Run a streamed scene update and format its progress as SSE messages.
+
+    Runs in Starlette's thread pool, so the blocking LLM stream and the
+    viewer restart do not block the event loop. The response headers are
+    sent before generation starts, so stage timings are reported in the
+    "done" event instead of the Server-Timing header.
+    """
     try:
-        spec = agent.update_scene_spec(session.last_scene, message)
-    except SceneGenerationError as e:
-        raise HTTPException(status_code=500, detail=f"Failed to update scene: {e}")
+        events = agent.stream_scene_spec(message, session.last_scene)
+        while True:
+            # Each step may run on a different pool thread, so the session
+            # is attributed per step rather than around the whole loop
+            with llm_session(session.session_id), use_trace(trace):
+                event = next(events, None)
+            if event is None:
+                break
+            if event["event"] != "scene":
+                yield _sse(event["event"], event)
+                continue
+
+            spec = event["scene"]
+            with use_trace(trace):
+                session_manager.update_scene(session, spec)
+            summary = session_manager.describe_scene(session)
+            response = ChatResponse(
+                session_id=session.session_id,
+                user_message=user_message,
+                assistant_message=_scene_update_message(
+                    spec, summary, event.get("description")
+                ),
+                scene_spec=spec.model_dump(),
+                scene_summary=summary,
+                timings=trace.timings(total=True) if trace else None,
+            )
+            logger.info(f"[{session.session_id}] Generated (stream): {summary.get('scene_name')}")
+            yield _sse("done", response.model_dump())
+    except LLMQueueFullError as e:
+        logger.warning(f"[{session.session_id}] LLM queue full: {e}")
+        yield _sse("error", {"event": "error", "detail": str(e), "retry_after": int(e.retry_after)})
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to update scene: {e}")
+        logger.error(f"[{session.session_id}] Streamed update failed: {e}")
+        yield _sse("error", {"event": "error", "detail": f"Failed to update scene: {e}"})
 
-    # Update viewer
-    session_manager.update_scene(session, spec)
 
-    # Prepare assistant message (short summary)
-    summary = session_manager.describe_scene(session)
-    
+def _request_timings() -> Optional[Dict[str, float]]:
+    """Return the current request's stage timings, including the total."""
+    trace = current_trace()
+    return trace.timings(total=True) if trace else None
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _scene_update_message(
+    spec,
+    summary: Dict[str, Any],
+    description: Optional[str] = None,
+) -> str:
+    """Build the assistant message describing an updated scene.
+
+    Args:
+        spec: The updated SceneSpec.
+        summary: The session's scene summary.
+        description: What a local edit changed; replaces the generic
+            "Updated scene" opening when given.
+    """
     # Include task/path info if present
     path_count = len(spec.paths)
     task_count = len(spec.tasks)
@@ -364,25 +668,16 @@ async def chat(req: ChatRequest):
         if task_count > 0:
             task_names = [t.name for t in spec.tasks]
             extra_info += f" Use 'start task {task_names[0]}' to execute."
-    
-    assistant_msg = (
-        f"Updated scene '{summary.get('scene_name', 'unnamed')}'. "
+
+    opening = description or f"Updated scene '{summary.get('scene_name', 'unnamed')}'."
+    return (
+        f"{opening} "
         f"{summary.get('object_count', 0)} object(s), "
         f"{summary.get('camera_count', 0)} camera(s), "
         f"environment: {summary.get('environment_asset_id', 'unknown')}."
         f"{extra_info}"
     )
 
-    logger.info(f"[{session.session_id}] Generated: {summary.get('scene_name')}")
-
-    return ChatResponse(
-        session_id=session.session_id,
-        user_message=req.message,
-        assistant_message=assistant_msg,
-        scene_spec=spec.model_dump(),
-        scene_summary=summary,
-    )
-
 
 # =============================================================================
 # Static File Serving
@@ -414,6 +709,41 @@ async def health_check():
     )
 
 
+@app.get("/llm/stats", tags=["System"])
+async def llm_stats():
+    """LLM scheduler and response cache metrics.
+
+    Reports the request queue depth (total and per session), in-flight
+    calls, coalesced and rejected requests and queue wait times.
+    """
+    return {
+        "scheduler": llm.scheduler.stats() if llm.scheduler is not None else None,
+        "cache": llm.cache.stats() if llm.cache is not None else None,
+    }
+
+
+@app.get("/timings", tags=["System"])
+async def timings():
+    """Latency histograms of each pipeline stage since startup.
+
+    Returns count, mean and estimated p50/p95/p99 in milliseconds per stage
+    (llm, prompt_build, json_parse, schema_validation, asset_validation,
+    mjcf_export, temp_write, viewer_spawn, sim_worker_start, ...).
+    """
+    return {"stages": stage_summary()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse, tags=["System"])
+async def metrics():
+    """Prometheus metrics in the text exposition format.
+
+    Covers per-route request latency, sessions, per-session simulation step
+    rate, real-time factor and render time, LLM call latency, tokens and
+    errors, catalog size, cache hit ratios and pipeline stage durations.
+    """
+    return PlainTextResponse(REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+
 @app.get("/api", tags=["System"])
 async def api_info():
     """API information endpoint."""
@@ -433,11 +763,12 @@ async def api_info():
         400: {"model": ErrorResponse, "description": "Invalid request"},
         404: {"model": ErrorResponse, "description": "Asset not found"},
         500: {"model": ErrorResponse, "description": "Generation failed"},
+        429: {"model": ErrorResponse, "description": "LLM queue full"},
         502: {"model": ErrorResponse, "description": "LLM error"},
     },
     tags=["Scene Generation"],
 )
-async def generate_scene(req: GenerateSceneRequest):
+async def generate_scene(req: GenerateSceneRequest, request: Request):
     """Generate a MuJoCo scene from a natural language description.
 
     This endpoint takes a text prompt describing a scene and returns:
@@ -453,10 +784,11 @@ async def generate_scene(req: GenerateSceneRequest):
     logger.info(f"Generating scene for prompt: '{req.prompt[:100]}...'")
 
     # Generate the scene spec (exceptions will be caught by handlers)
-    if req.repair_on_error:
-        spec = agent.generate_and_repair(req.prompt)
-    else:
-        spec = agent.generate_scene_spec(req.prompt)
+    with llm_session(request.client.host if request.client else None):
+        if req.repair_on_error:
+            spec = await agent.generate_and_repair_async(req.prompt)
+        else:
+            spec = await agent.generate_scene_spec_async(req.prompt)
 
     logger.info(
         f"Scene generated: name='{spec.name}', "
@@ -475,9 +807,39 @@ async def generate_scene(req: GenerateSceneRequest):
         scene_spec=spec.model_dump(),
         mjcf_xml=mjcf_xml,
         created_at=datetime.utcnow().isoformat() + "Z",
+        timings=_request_timings(),
     )
 
 
+@app.post("/generate_scene/batch", tags=["Scene Generation"])
+async def generate_scene_batch(req: BatchGenerateRequest):
+    """Generate scenes for many prompts, streamed back as NDJSON.
+
+    Prompts are generated concurrently within the LLM scheduler limits;
+    MJCF export and validation run in a process pool. Each line of the
+    response is one result, written as soon as that prompt completes
+    (results carry their input "index" since they arrive out of order).
+    """
+    prompts = [p.strip() for p in req.prompts]
+    if not all(prompts):
+        raise HTTPException(status_code=400, detail="Prompts cannot be empty")
+
+    logger.info(f"Batch generation: {len(prompts)} prompts")
+    batch = BatchGenerator(
+        agent,
+        asset_root,
+        include_mjcf=req.include_mjcf,
+        validate=req.validate_mjcf,
+    )
+    items = [BatchItem(index, prompt) for index, prompt in enumerate(prompts)]
+
+    async def lines():
+        async for result in batch.run(items):
+            yield json.dumps(result, default=str) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @app.get("/assets", response_model=AssetListResponse, tags=["Assets"])
 async def list_assets(category: Optional[str] = None):
     """List all available assets, optionally filtered by category.
@@ -524,50 +886,66 @@ async def search_assets_endpoint(req: SearchAssetsRequest):
 async def get_sensors(session_id: str):
     """Get latest sensor values for a session.
     
-    Returns sensor data from the headless simulation worker.
-    Poll this endpoint at ~2Hz for live telemetry.
+    Returns sensor data from the headless simulation worker. For live
+    telemetry prefer the /ws/{session_id} stream over polling this.
     """
     result = session_manager.get_sensors(session_id)
     return JSONResponse(result)
 
 
 @app.get("/camera/{session_id}", tags=["Telemetry"])
-async def get_camera(session_id: str):
+async def get_camera(session_id: str, request: Request):
     """Get latest camera image for a session.
     
-    Returns a JPEG image from the first camera in the scene.
-    Poll this endpoint at ~1Hz for live camera feed.
+    Returns a JPEG image from the first camera in the scene. Each frame is
+    encoded once (off the event loop) and shared by all clients; the ETag
+    identifies the frame, so conditional requests (If-None-Match) for a
+    frame the client already has get 304 Not Modified.
     Returns 204 No Content if no image is available.
     """
-    image = session_manager.get_camera_image(session_id)
-    
-    if image is None:
+    frames = session_manager.get_camera_frames(session_id)
+    frame = await frames.get_async() if frames is not None else None
+
+    if frame is None:
         return Response(status_code=204)
-    
-    # Encode numpy image as JPEG
-    try:
-        import cv2
-        # Convert RGB to BGR for cv2 encoding
-        if len(image.shape) == 3 and image.shape[2] == 3:
-            image_bgr = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-        else:
-            image_bgr = image
-        _, buf = cv2.imencode(".jpg", image_bgr, [cv2.IMWRITE_JPEG_QUALITY, 80])
-        return Response(
-            content=buf.tobytes(),
-            media_type="image/jpeg",
-        )
-    except ImportError:
-        # cv2 not available, try PIL
-        try:
-            from PIL import Image
-            import io
-            pil_image = Image.fromarray(image)
-            buf = io.BytesIO()
-            pil_image.save(buf, format="JPEG", quality=80)
-            return Response(
-                content=buf.getvalue(),
-                media_type="image/jpeg",
-            )
-        except ImportError:
-            return Response(status_code=204)
+
+    headers = {"ETag": frame.etag, "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == frame.etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=frame.data, media_type="image/jpeg", headers=headers)
+
+
+@app.get("/camera/{session_id}/stream", tags=["Telemetry"])
+async def stream_camera(
+    session_id: str,
+    fps: float = Query(DEFAULT_MJPEG_FPS, gt=0, le=MAX_MJPEG_FPS),
+):
+    """Stream the session camera as MJPEG (multipart/x-mixed-replace).
+
+    Usable directly as an <img> src. One long-lived connection replaces
+    polling /camera; frames are encoded once and shared by all viewers.
+    """
+    if session_manager.get_session(session_id) is None:
+        raise HTTPException(status_code=404, detail=f"Unknown session: {session_id}")
+    return StreamingResponse(
+        mjpeg_parts(session_manager, session_id, fps),
+        media_type=f"multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.websocket("/ws/{session_id}")
+async def stream_telemetry(
+    websocket: WebSocket,
+    session_id: str,
+    sensor_hz: float = DEFAULT_SENSOR_HZ,
+    camera_fps: float = DEFAULT_CAMERA_FPS,
+):
+    """Push sensor deltas and JPEG camera frames for a session.
+
+    Sensors arrive as JSON text messages holding the values that changed,
+    frames as binary JPEG messages. Send {"sensor_hz": ..., "camera_fps": ...}
+    to change rates; 0 pauses a channel. Slow clients get frames dropped
+    rather than queued. See neoscene.app.telemetry_stream for the protocol.
+    """
+    await serve_telemetry(websocket, session_manager, session_id, sensor_hz, camera_fps)
@@ -0,0 +1,299 @@
+"""Batch scene generation.
+
+Generates scenes for many prompts at once, e.g. to build a dataset of
+scene variants:
+
+- LLM generation runs concurrently on the event loop, bounded so the batch
+  stays within the LLM scheduler's limits (and retries when the shared
+  queue is full).
+- MJCF export and MuJoCo validation are CPU-bound and run in a process
+  pool, one catalog per worker process. The pool is created on first use
+  and shared by later batches; call shutdown_export_pool() on exit.
+- Results are yielded as each prompt completes, not in input order, and
+  are meant to be written as NDJSON (one JSON object per line).
+"""
+
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from neoscene.core.llm_client import LLMQueueFullError
+from neoscene.core.logging_config import get_logger
+from neoscene.core.scene_agent import SceneAgent
+
+logger = get_logger(__name__)
+
+# Times a prompt is retried when the shared LLM queue is full
+MAX_QUEUE_RETRIES = 5
+
+
+@dataclass
+class BatchItem:
+    """One prompt in a batch.
+
+    Attributes:
+        index: Position in the input.
+        prompt: Scene description.
+        id: Optional caller-supplied identifier, echoed in the result.
+    """
+
+    index: int
+    prompt: str
+    id: Optional[str] = None
+
+
+def read_prompts(lines: Iterable[str]) -> List[BatchItem]:
+    """Parse batch input: plain-text prompts or JSONL records.
+
+    JSONL lines are objects with a "prompt" and an optional "id"; other
+    non-empty lines are taken as prompts verbatim.
+
+    Args:
+        lines: Input lines.
+
+    Returns:
+        The batch items in input order.
+
+    Raises:
+        ValueError: If a JSONL record has no prompt.
+    """
+    items: List[BatchItem] = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            record = json.loads(line)
+            if not record.get("prompt"):
+                raise ValueError(f"JSONL record without a prompt: {line[:80]}")
+            record_id = record.get("id")
+            if record_id is not None:
+                record_id = str(record_id)
+            items.append(BatchItem(len(items), record["prompt"], record_id))
+        else:
+            items.append(BatchItem(len(items), line))
+    return items
+
+
+# -- process pool worker -----------------------------------------------------
+
+_worker_catalog = None
+
+
+def _init_worker(assets_path: str) -> None:
+    """Load the asset catalog once per worker process."""
+    global _worker_catalog
+    from neoscene.core.asset_catalog import AssetCatalog
+
+    _worker_catalog = AssetCatalog(Path(assets_path))
+
+
+def export_and_validate(scene_json: str, include_mjcf: bool, validate: bool) -> Dict[str, Any]:
+    """Export a scene to MJCF and check that MuJoCo can load it.
+
+    Runs in a worker process initialized by _init_worker.
+
+    Args:
+        scene_json: SceneSpec JSON.
+        include_mjcf: Return the MJCF XML.
+        validate: Compile the MJCF with MuJoCo.
+
+    Returns:
+        Dict with the MJCF size, validation outcome, optionally the XML,
+        and the export/validation times in milliseconds.
+    """
+    from neoscene.core.scene_schema import SceneSpec
+    from neoscene.exporters.mjcf_exporter import scene_to_mjcf
+
+    scene = SceneSpec.model_validate_json(scene_json)
+    start = time.perf_counter()
+    xml = scene_to_mjcf(scene, _worker_catalog)
+    exported = time.perf_counter()
+
+    result: Dict[str, Any] = {"mjcf_bytes": len(xml), "valid": None}
+    if validate:
+        from neoscene.backends.mujoco_runner import validate_mjcf_xml
+
+        try:
+            result["valid"] = validate_mjcf_xml(xml)
+        except Exception as e:
+            result["valid"] = False
+            result["validation_error"] = str(e)[:500]
+    if include_mjcf:
+        result["mjcf_xml"] = xml
+    result["timings"] = {
+        "export_ms": round((exported - start) * 1000, 1),
+        "validate_ms": round((time.perf_counter() - exported) * 1000, 1),
+    }
+    return result
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_key: Optional[Tuple[str, Optional[int]]] = None
+_pool_lock = threading.Lock()
+
+
+def get_export_pool(assets_path: Path, workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Return the shared export/validation pool, creating it on first use.
+
+    Batches reuse one pool so a request does not pay for starting the
+    worker processes and loading their catalogs. A different asset
+    directory or worker count, or a broken pool (a worker died), gets a
+    new one; batches still running on the old pool finish on it.
+
+    Args:
+        assets_path: Asset directory, loaded by each worker process.
+        workers: Number of processes (default: CPU count).
+
+    Returns:
+        The process pool.
+    """
+    global _pool, _pool_key
+    key = (str(assets_path), workers)
+    with _pool_lock:
+        if _pool is not None and (_pool_key != key or getattr(_pool, "_broken", False)):
+            _pool.shutdown(wait=False)
+            _pool = None
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(str(assets_path),),
+            )
+            _pool_key = key
+        return _pool
+
+
+def shutdown_export_pool() -> None:
+    """Shut down the shared pool without waiting, cancelling queued exports."""
+    global _pool, _pool_key
+    with _pool_lock:
+        pool, _pool, _pool_key = _pool, None, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+# -- orchestration -----------------------------------------------------------
+
+
+class BatchGenerator:
+    """Generates, exports and validates scenes for a batch of prompts.
+
+    Example:
+        >>> batch = BatchGenerator(agent, assets_path)
+        >>> async for result in batch.run(read_prompts(lines)):  # doctest: +SKIP
+        ...     print(json.dumps(result))
+    """
+
+    def __init__(
+        self,
+        agent: SceneAgent,
+        assets_path: Path,
+        concurrency: Optional[int] = None,
+        workers: Optional[int] = None,
+        include_mjcf: bool = False,
+        validate: bool = True,
+    ):
+        """Initialize the batch generator.
+
+        Args:
+            agent: Scene agent used for generation.
+            assets_path: Asset directory, loaded by each worker process.
+            concurrency: Prompts generated at once. Defaults to the LLM
+                scheduler's max_concurrency (or 4 without a scheduler), so
+                a batch does not flood the shared queue.
+            workers: Export/validation processes (default: CPU count).
+            include_mjcf: Include the MJCF XML in each result.
+            validate: Compile each MJCF with MuJoCo.
+        """
+        self.agent = agent
+        self.assets_path = Path(assets_path)
+        scheduler = getattr(agent.llm, "scheduler", None)
+        self.concurrency = concurrency or (scheduler.max_concurrency if scheduler else 4)
+        self.workers = workers
+        self.include_mjcf = include_mjcf
+        self.validate = validate
+
+    async def run(self, items: List[BatchItem]) -> AsyncIterator[Dict[str, Any]]:
+        """Process a batch, yielding each result as it completes.
+
+        Args:
+            items: Prompts to generate.
+
+        Yields:
+            One result dict per item with "index", "id", "prompt", "status"
+            ("ok" or "error") and either the scene, validation and timings
+            or an "error" message.
+        """
+        if not items:
+            return
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        pool = get_export_pool(self.assets_path, self.workers)
+        tasks = [asyncio.ensure_future(self._process(item, semaphore, pool)) for item in items]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        logger.info(f"Batch of {len(items)} prompts finished")
+
+    async def _process(
+        self,
+        item: BatchItem,
+        semaphore: asyncio.Semaphore,
+        pool: ProcessPoolExecutor,
+    ) -> Dict[str, Any]:
+        """Generate one scene, then export and validate it in the pool."""
+        result: Dict[str, Any] = {"index": item.index, "id": item.id, "prompt": item.prompt}
+        start = time.perf_counter()
+        try:
+            async with semaphore:
+                spec = await self._generate(item.prompt)
+            generated = time.perf_counter()
+
+            loop = asyncio.get_running_loop()
+            export = await loop.run_in_executor(
+                pool,
+                export_and_validate,
+                spec.model_dump_json(),
+                self.include_mjcf,
+                self.validate,
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Batch item {item.index} failed: {e}")
+            result.update(status="error", error=f"{type(e).__name__}: {e}")
+            result["timings"] = {"total_ms": round((time.perf_counter() - start) * 1000, 1)}
+            return result
+
+        timings = export.pop("timings")
+        result.update(
+            status="ok" if export["valid"] is not False else "error",
+            scene_spec=spec.model_dump(),
+            **export,
+        )
+        result["timings"] = {
+            "generate_ms": round((generated - start) * 1000, 1),
+            **timings,
+            "total_ms": round((time.perf_counter() - start) * 1000, 1),
+        }
+        return result
+
+    async def _generate(self, prompt: str):
+        """Generate a scene, waiting and retrying while the LLM queue is full."""
+        for attempt in range(MAX_QUEUE_RETRIES + 1):
+            try:
+                return await self.agent.generate_and_repair_async(prompt)
+            except LLMQueueFullError as e:
+                if attempt == MAX_QUEUE_RETRIES:
+                    raise
+                await asyncio.sleep(e.retry_after)
@@ -0,0 +1,369 @@
+"""Local stand-in LLM server for load testing.
+
+Serves the HTTPBackend protocol (see ``neoscene.core.llm_backends``) and
+replays recorded responses with a configurable latency distribution and
+error rates, so the chat pipeline can be exercised under realistic
+concurrency without calling a real model.
+
+Run with:
+    python -m neoscene.app.llm_standin --responses examples/ --latency-ms 800 \\
+        --error 503:0.02 --error 429:0.01
+
+and point the API at it:
+    NEOSCENE_LLM_URL=http://127.0.0.1:8765 python -m neoscene.app.main --api
+
+Responses are read from ``.json`` files (the whole file is one response)
+and ``.jsonl`` files with one ``{"prompt": ..., "response": ...}`` or
+``{"match": ..., "response": ...}`` record per line. A request is answered
+with the record for its exact prompt, else the first record whose
+``match`` text occurs in the prompt, else the records in turn.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from neoscene.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Answer used when no responses are loaded
+DEFAULT_RESPONSE = json.dumps({
+    "name": "standin_scene",
+    "environment": {"asset_id": "orchard"},
+    "objects": [],
+    "cameras": [],
+})
+
+
+@dataclass
+class StandinConfig:
+    """Latency and error behaviour of the stand-in server.
+
+    Attributes:
+        latency_ms: Median response latency in milliseconds.
+        latency_sigma: Spread of the log-normal latency distribution
+            (0 for a fixed latency).
+        first_chunk_fraction: Share of the latency spent before the first
+            streamed chunk.
+        errors: Probability of answering with each HTTP status code.
+        stream_chunk_size: Characters per streamed chunk.
+        seed: Random seed for reproducible runs.
+    """
+
+    latency_ms: float = 800.0
+    latency_sigma: float = 0.4
+    first_chunk_fraction: float = 0.3
+    errors: Dict[int, float] = field(default_factory=dict)
+    stream_chunk_size: int = 64
+    seed: Optional[int] = None
+
+
+def _prompt_hash(prompt: str) -> str:
+    """Hash a prompt for exact-match lookup."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+class RecordedResponses:
+    """Responses to replay, looked up by prompt."""
+
+    def __init__(self, records: Iterable[Dict[str, str]]):
+        """Initialize from records.
+
+        Args:
+            records: Dicts with a "response" and optionally a "prompt"
+                (exact match) or "match" (substring match).
+        """
+        self._exact: Dict[str, str] = {}
+        self._matches: List[Dict[str, str]] = []
+        self._all: List[str] = []
+        for record in records:
+            response = record["response"]
+            if "prompt" in record:
+                self._exact[_prompt_hash(record["prompt"])] = response
+            if "match" in record:
+                self._matches.append(record)
+            self._all.append(response)
+        self._next = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[Path]) -> "RecordedResponses":
+        """Load responses from files and directories.
+
+        Args:
+            paths: ``.json``/``.jsonl`` files, or directories containing them.
+
+        Returns:
+            RecordedResponses with every record found.
+        """
+        records: List[Dict[str, str]] = []
+        for path in paths:
+            files = sorted(path.glob("*.json*")) if path.is_dir() else [path]
+            for file in files:
+                if file.suffix == ".jsonl":
+                    for line in file.read_text().splitlines():
+                        if line.strip():
+                            records.append(json.loads(line))
+                elif file.suffix == ".json":
+                    records.append({"response": file.read_text()})
+        logger.info(f"Loaded {len(records)} recorded responses")
+        return cls(records)
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return len(self._all)
+
+    def lookup(self, prompt: str) -> str:
+        """Return the response to replay for a prompt."""
+        exact = self._exact.get(_prompt_hash(prompt))
+        if exact is not None:
+            return exact
+        for record in self._matches:
+            if record["match"] in prompt:
+                return record["response"]
+        if not self._all:
+            return DEFAULT_RESPONSE
+        with self._lock:
+            response = self._all[self._next % len(self._all)]
+            self._next += 1
+        return response
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Request handler; state lives on the StandinServer."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging."""
+
+    def _send_json(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        """Serve /stats."""
+        if self.path != "/stats":
+            self._send_json(404, {"error": "not found"})
+            return
+        self._send_json(200, self.server.standin.stats())
+
+    def do_POST(self) -> None:
+        """Serve /generate and /generate_stream."""
+        standin: StandinServer = self.server.standin
+        if self.path not in ("/generate", "/generate_stream"):
+            self._send_json(404, {"error": "not found"})
+            return
+
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            prompt = json.loads(self.rfile.read(length))["prompt"]
+        except (ValueError, KeyError):
+            self._send_json(400, {"error": "expected JSON body with a prompt"})
+            return
+
+        standin._begin()
+        status = 200
+        try:
+            latency, error_status = standin._sample()
+            if error_status is not None:
+                time.sleep(latency * standin.config.first_chunk_fraction)
+                status = error_status
+                self._send_json(status, {"error": f"stand-in injected error {status}"})
+                return
+
+            response = standin.responses.lookup(prompt)
+            if self.path == "/generate":
+                time.sleep(latency)
+                self._send_json(200, {"text": response})
+            else:
+                self._stream(response, latency, standin.config)
+        finally:
+            standin._end(status)
+
+    def _stream(self, response: str, latency: float, config: StandinConfig) -> None:
+        """Send a response as newline-delimited JSON chunks."""
+        size = max(1, config.stream_chunk_size)
+        chunks = [response[i:i + size] for i in range(0, len(response), size)] or [""]
+        first = latency * config.first_chunk_fraction
+        gap = (latency - first) / max(1, len(chunks) - 1)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        time.sleep(first)
+        for i, chunk in enumerate(chunks):
+            if i:
+                time.sleep(gap)
+            self.wfile.write(json.dumps({"text": chunk}).encode("utf-8") + b"\n")
+            self.wfile.flush()
+        self.close_connection = True
+
+
+class StandinServer:
+    """Threaded HTTP server replaying LLM responses.
+
+    Example:
+        >>> server = StandinServer(RecordedResponses([]), StandinConfig(latency_ms=50), port=0)
+        >>> server.start()
+        >>> server.url  # doctest: +SKIP
+        'http://127.0.0.1:54321'
+        >>> server.stop()
+    """
+
+    def __init__(
+        self,
+        responses: RecordedResponses,
+        config: Optional[StandinConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+    ):
+        """Initialize the server (bound, not yet serving).
+
+        Args:
+            responses: Responses to replay.
+            config: Latency and error settings.
+            host: Host to bind to.
+            port: Port to listen on (0 picks a free port).
+        """
+        self.responses = responses
+        self.config = config or StandinConfig()
+        self._random = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Any] = {
+            "requests": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+            "status": {},
+        }
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.standin = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _sample(self) -> Tuple[float, Optional[int]]:
+        """Draw a latency (seconds) and an optional error status."""
+        config = self.config
+        with self._lock:
+            noise = self._random.gauss(0.0, 1.0) if config.latency_sigma > 0 else 0.0
+            roll = self._random.random()
+        latency = config.latency_ms / 1000.0 * math.exp(config.latency_sigma * noise)
+
+        threshold = 0.0
+        for status, probability in sorted(config.errors.items()):
+            threshold += probability
+            if roll < threshold:
+                return latency, status
+        return latency, None
+
+    def _begin(self) -> None:
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["in_flight"] += 1
+            in_flight = self._stats["in_flight"]
+            self._stats["max_in_flight"] = max(self._stats["max_in_flight"], in_flight)
+
+    def _end(self, status: int) -> None:
+        with self._lock:
+            self._stats["in_flight"] -= 1
+            self._stats["status"][status] = self._stats["status"].get(status, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request counts, concurrency and status counts."""
+        with self._lock:
+            return {**self._stats, "status": dict(self._stats["status"])}
+
+    def start(self) -> None:
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"LLM stand-in listening on {self.url}")
+
+    def serve_forever(self) -> None:
+        """Serve requests in the calling thread until interrupted."""
+        logger.info(f"LLM stand-in listening on {self.url}")
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+
+def _parse_error(value: str) -> Tuple[int, float]:
+    """Parse a STATUS:PROBABILITY option."""
+    status, _, probability = value.partition(":")
+    try:
+        return int(status), float(probability)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected STATUS:PROBABILITY, got {value!r}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the stand-in server from the command line."""
+    parser = argparse.ArgumentParser(description="Local stand-in LLM server for load testing")
+    parser.add_argument(
+        "--responses",
+        type=Path,
+        nargs="*",
+        default=[],
+        help="Response files or directories (.json / .jsonl)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Host to bind to")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--latency-ms", type=float, default=800.0, help="Median latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.4, help="Log-normal spread")
+    parser.add_argument(
+        "--error",
+        type=_parse_error,
+        action="append",
+        default=[],
+        metavar="STATUS:PROB",
+        help="Inject an HTTP error with this probability (repeatable)",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    args = parser.parse_args(argv)
+
+    config = StandinConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        errors=dict(args.error),
+        seed=args.seed,
+    )
+    server = StandinServer(
+        RecordedResponses.from_paths(args.responses),
+        config,
+        host=args.host,
+        port=args.port,
+    )
+    print(f"LLM stand-in serving {len(server.responses)} responses on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,286 @@
+"""Load generator for the chat pipeline.
+
+Drives N concurrent chat sessions against a running API and reports
+p50/p95/p99 latency per pipeline stage. Stages come from two sources:
+
+- Client-side timings: ``total`` for every request and, with ``--stream``,
+  ``first_event`` (time to the first SSE event) from /chat/stream.
+- Server-side timings from the ``Server-Timing`` response header, when the
+  API sends one (each metric becomes a stage named ``server.<name>``).
+
+Typical setup with the local stand-in LLM:
+    python -m neoscene.app.llm_standin --responses examples/ &
+    NEOSCENE_LLM_URL=http://127.0.0.1:8765 python -m neoscene.app.main --api &
+    python -m neoscene.app.loadtest --sessions 20 --requests 5
+"""
+
+import argparse
+import json
+import math
+import re
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+DEFAULT_PROMPTS = [
+    "Create an orchard with a tractor and three rows of trees",
+    "A warehouse with two rows of shelves and a forklift",
+    "add 5 barrels",
+    "A farm field with a drone flying overhead",
+    "Make the scene at sunset with a camera looking at the tractor",
+]
+
+_TIMING_ENTRY = re.compile(r"^\s*([^;,\s]+)(?:[^,]*?;\s*dur=([0-9.]+))?")
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Return the q-th percentile using linear interpolation.
+
+    Args:
+        values: Sample values.
+        q: Percentile between 0 and 100.
+
+    Returns:
+        The percentile, or 0.0 for no samples.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100.0
+    low = math.floor(rank)
+    high = math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def parse_server_timing(header: Optional[str]) -> Dict[str, float]:
+    """Parse a Server-Timing header into {metric: milliseconds}.
+
+    Metrics without a ``dur`` parameter are skipped.
+    """
+    timings: Dict[str, float] = {}
+    if not header:
+        return timings
+    for entry in header.split(","):
+        match = _TIMING_ENTRY.match(entry)
+        if match and match.group(2) is not None:
+            timings[match.group(1)] = float(match.group(2))
+    return timings
+
+
+@dataclass
+class LoadReport:
+    """Results of a load run.
+
+    Attributes:
+        stages: Samples in milliseconds per stage.
+        statuses: Count of each response status (or "error" for failures
+            without a response).
+        duration: Wall-clock duration of the run in seconds.
+    """
+
+    stages: Dict[str, List[float]] = field(default_factory=dict)
+    statuses: Counter = field(default_factory=Counter)
+    duration: float = 0.0
+
+    def add(self, stage: str, milliseconds: float) -> None:
+        """Record one sample for a stage."""
+        self.stages.setdefault(stage, []).append(milliseconds)
+
+    @property
+    def requests(self) -> int:
+        """Total number of requests sent."""
+        return sum(self.statuses.values())
+
+    def summary(self) -> Dict[str, Any]:
+        """Summarize the run.
+
+        Returns:
+            Dict with request counts, throughput and per-stage count, mean,
+            max and p50/p95/p99 in milliseconds.
+        """
+        stages = {}
+        for stage, samples in sorted(self.stages.items()):
+            stages[stage] = {
+                "count": len(samples),
+                "mean": round(sum(samples) / len(samples), 1),
+                "max": round(max(samples), 1),
+                **{f"p{q}": round(percentile(samples, q), 1) for q in PERCENTILES},
+            }
+        return {
+            "requests": self.requests,
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items(), key=str)},
+            "duration_s": round(self.duration, 2),
+            "throughput_rps": round(self.requests / self.duration, 2) if self.duration else 0.0,
+            "stages": stages,
+        }
+
+    def format_table(self) -> str:
+        """Render the summary as a text table."""
+        summary = self.summary()
+        lines = [
+            f"requests: {summary['requests']}  duration: {summary['duration_s']}s  "
+            f"throughput: {summary['throughput_rps']} req/s",
+            f"statuses: {summary['statuses']}",
+            "",
+            f"{'stage':<28}{'count':>7}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}",
+        ]
+        for stage, row in summary["stages"].items():
+            lines.append(
+                f"{stage:<28}{row['count']:>7}{row['p50']:>10.1f}{row['p95']:>10.1f}"
+                f"{row['p99']:>10.1f}{row['max']:>10.1f}"
+            )
+        return "\n".join(lines)
+
+
+class LoadGenerator:
+    """Runs concurrent chat sessions against the API.
+
+    Each session sends its requests one after another (like a user waiting
+    for each reply); sessions run concurrently.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        prompts: Optional[List[str]] = None,
+        stream: bool = False,
+        timeout: float = 120.0,
+    ):
+        """Initialize the generator.
+
+        Args:
+            base_url: API base URL (e.g. "http://127.0.0.1:8000").
+            prompts: Messages to send, cycled per session.
+            stream: Use /chat/stream instead of /chat.
+            timeout: Per-request timeout in seconds.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.prompts = prompts or DEFAULT_PROMPTS
+        self.stream = stream
+        self.timeout = timeout
+        self._lock = threading.Lock()
+
+    def run(self, sessions: int, requests_per_session: int) -> LoadReport:
+        """Run the load test.
+
+        Args:
+            sessions: Number of concurrent sessions.
+            requests_per_session: Requests sent by each session.
+
+        Returns:
+            LoadReport with every sample.
+        """
+        report = LoadReport()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=sessions) as pool:
+            for index in range(sessions):
+                pool.submit(self._session, index, requests_per_session, report)
+        report.duration = time.perf_counter() - start
+        return report
+
+    def _session(self, index: int, count: int, report: LoadReport) -> None:
+        """Run one session's requests in order."""
+        session_id = f"load-{index}"
+        for i in range(count):
+            message = self.prompts[(index + i) % len(self.prompts)]
+            self._request(session_id, message, report)
+
+    def _request(self, session_id: str, message: str, report: LoadReport) -> None:
+        """Send one chat request and record its timings."""
+        path = "/chat/stream" if self.stream else "/chat"
+        body = json.dumps({"message": message, "session_id": session_id}).encode("utf-8")
+        request = urllib.request.Request(
+            f"{self.base_url}{path}",
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+
+        samples: Dict[str, float] = {}
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                status: Any = response.status
+                if self.stream:
+                    status = self._read_stream(response, start, samples)
+                else:
+                    response.read()
+                for name, ms in parse_server_timing(response.headers.get("Server-Timing")).items():
+                    samples[f"server.{name}"] = ms
+        except urllib.error.HTTPError as e:
+            status = e.code
+            e.read()
+        except (urllib.error.URLError, OSError):
+            status = "error"
+        samples["total"] = (time.perf_counter() - start) * 1000.0
+
+        with self._lock:
+            report.statuses[status] += 1
+            if status == 200:
+                for stage, ms in samples.items():
+                    report.add(stage, ms)
+
+    @staticmethod
+    def _read_stream(response: Any, start: float, samples: Dict[str, float]) -> Any:
+        """Consume an SSE response, timing the first event.
+
+        Returns:
+            200 if the stream ended with a "done" event, otherwise "stream_error".
+        """
+        outcome: Any = "stream_error"
+        for raw in response:
+            line = raw.decode("utf-8").strip()
+            if not line.startswith("event:"):
+                continue
+            samples.setdefault("first_event", (time.perf_counter() - start) * 1000.0)
+            if line == "event: done":
+                outcome = 200
+        return outcome
+
+
+def load_prompts(path: Path) -> List[str]:
+    """Read prompts from a text file (one per line) or JSONL ({"prompt": ...})."""
+    prompts = []
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        prompts.append(json.loads(line)["prompt"] if line.startswith("{") else line)
+    return prompts
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the load generator from the command line."""
+    parser = argparse.ArgumentParser(description="Load test the Neoscene chat pipeline")
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="API base URL")
+    parser.add_argument("--sessions", type=int, default=10, help="Concurrent sessions")
+    parser.add_argument("--requests", type=int, default=5, help="Requests per session")
+    parser.add_argument("--prompts", type=Path, default=None, help="Prompt file (.txt or .jsonl)")
+    parser.add_argument("--stream", action="store_true", help="Use /chat/stream")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Request timeout (s)")
+    parser.add_argument("--json", type=Path, default=None, help="Write the summary as JSON")
+    args = parser.parse_args(argv)
+
+    generator = LoadGenerator(
+        args.url,
+        prompts=load_prompts(args.prompts) if args.prompts else None,
+        stream=args.stream,
+        timeout=args.timeout,
+    )
+    print(f"Running {args.sessions} sessions x {args.requests} requests against {args.url}")
+    report = generator.run(args.sessions, args.requests)
+    print(report.format_table())
+    if args.json:
+        args.json.write_text(json.dumps(report.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 """Neoscene CLI entry point."""
 
 import argparse
+import os
 import sys
 from pathlib import Path
 from typing import Optional
@@ -17,6 +18,8 @@ def run_scene(
     assets_path: Optional[Path] = None,
     output_xml: Optional[Path] = None,
     no_viewer: bool = False,
+    sim_seconds: Optional[float] = None,
+    speed: float = 1.0,
 ) -> int:
     """Run a scene from a SceneSpec JSON file.
 
@@ -25,6 +28,10 @@ def run_scene(
         assets_path: Optional custom assets directory.
         output_xml: Optional path to save the generated MJCF XML.
         no_viewer: If True, don't launch the viewer.
+        sim_seconds: If set, simulate this many seconds headless (with the
+            scene's controllers) instead of launching the viewer.
+        speed: Target real-time factor of the headless run; 0 or less
+            runs as fast as possible.
 
     Returns:
         Exit code (0 for success, non-zero for error).
@@ -83,6 +90,10 @@ def run_scene(
             print(f"Error: Failed to save MJCF: {e}", file=sys.stderr)
             return 1
 
+    # Headless simulation
+    if sim_seconds is not None:
+        return run_headless(mjcf_xml, scene, sim_seconds, speed)
+
     # Run simulation
     if not no_viewer:
         try:
@@ -97,17 +108,76 @@ def run_scene(
     return 0
 
 
-def run_api(host: str = "0.0.0.0", port: int = 8000, reload: bool = False) -> int:
+def run_headless(mjcf_xml: str, scene, sim_seconds: float, speed: float = 1.0) -> int:
+    """Simulate a scene without a viewer and report the achieved real-time factor.
+
+    Args:
+        mjcf_xml: MJCF XML of the scene.
+        scene: The SceneSpec (used by the task runner).
+        sim_seconds: Simulated seconds to run.
+        speed: Target real-time factor; 0 or less runs as fast as possible.
+
+    Returns:
+        Exit code.
+    """
+    import tempfile
+    import time
+
+    from neoscene.backends.session_manager import SimulationWorker
+
+    with tempfile.NamedTemporaryFile(
+        mode="w", suffix=".xml", delete=False, prefix="neoscene_"
+    ) as f:
+        f.write(mjcf_xml)
+        xml_path = Path(f.name)
+
+    try:
+        worker = SimulationWorker(
+            xml_path=str(xml_path),
+            speed=speed if speed > 0 else None,
+            max_sim_time=sim_seconds,
+        )
+        target = f"{speed}x real time" if speed > 0 else "as fast as possible"
+        print(f"Simulating {sim_seconds}s headless ({target})...")
+        start = time.perf_counter()
+        worker.loop()
+        wall = time.perf_counter() - start
+    finally:
+        xml_path.unlink(missing_ok=True)
+
+    if worker._data is None:
+        print("Error: Failed to start simulation", file=sys.stderr)
+        return 1
+    sim_time = worker._data.time
+    print(
+        f"Simulated {sim_time:.2f}s in {wall:.2f}s wall time "
+        f"(real-time factor {sim_time / wall:.2f}, {worker.steps} steps, "
+        f"{worker.overruns} overruns, {worker.dropped_ticks} dropped ticks)"
+    )
+    return 0
+
+
+def run_api(
+    host: str = "0.0.0.0", port: int = 8000, reload: bool = False, sim_processes: int = 0
+) -> int:
     """Run the FastAPI server.
 
     Args:
         host: Host to bind to.
         port: Port to listen on.
         reload: Enable auto-reload for development.
+        sim_processes: Warm simulation processes to keep (0 runs simulations
+            on threads in the server process).
 
     Returns:
         Exit code.
     """
+    if sim_processes > 0:
+        # Read by the api module at import (also in uvicorn's reload workers)
+        from neoscene.backends.process_worker import PROCESSES_ENV
+
+        os.environ[PROCESSES_ENV] = str(sim_processes)
+
     try:
         import uvicorn
 
@@ -173,6 +243,91 @@ def run_generate(prompt: str, assets_path: Optional[Path] = None, output: Option
         return 1
 
 
+def run_batch(
+    prompts_path: Path,
+    assets_path: Optional[Path] = None,
+    output: Optional[Path] = None,
+    workers: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    include_mjcf: bool = False,
+) -> int:
+    """Generate scenes for every prompt in a file, writing NDJSON results.
+
+    Args:
+        prompts_path: Text file with one prompt per line, or JSONL with
+            {"prompt": ..., "id": ...} records ("-" reads stdin).
+        assets_path: Optional custom assets directory.
+        output: Optional NDJSON output path (default: stdout).
+        workers: Export/validation processes (default: CPU count).
+        concurrency: Prompts generated at once (default: scheduler limit).
+        include_mjcf: Include the MJCF XML in each result.
+
+    Returns:
+        Exit code (0 if every prompt succeeded, 1 otherwise).
+    """
+    import asyncio
+    import json
+
+    from neoscene.app.batch import BatchGenerator, read_prompts, shutdown_export_pool
+    from neoscene.core.asset_catalog import AssetCatalog
+    from neoscene.core.llm_client import GeminiClient
+    from neoscene.core.scene_agent import SceneAgent
+
+    if assets_path is None:
+        assets_path = get_default_assets_path()
+
+    try:
+        if str(prompts_path) == "-":
+            items = read_prompts(sys.stdin)
+        else:
+            items = read_prompts(prompts_path.read_text().splitlines())
+    except (OSError, ValueError) as e:
+        print(f"Error: Failed to read prompts: {e}", file=sys.stderr)
+        return 1
+
+    agent = SceneAgent(AssetCatalog(assets_path), GeminiClient.from_default_config())
+    batch = BatchGenerator(
+        agent,
+        assets_path,
+        concurrency=concurrency,
+        workers=workers,
+        include_mjcf=include_mjcf,
+    )
+
+    async def run() -> int:
+        failed = 0
+        out = output.open("w") if output else sys.stdout
+        try:
+            async for done, result in _enumerate_async(batch.run(items), start=1):
+                out.write(json.dumps(result, default=str) + "\n")
+                out.flush()
+                if result["status"] != "ok":
+                    failed += 1
+                print(
+                    f"[{done}/{len(items)}] #{result['index']} {result['status']}",
+                    file=sys.stderr,
+                )
+        finally:
+            if output:
+                out.close()
+        return failed
+
+    try:
+        failed = asyncio.run(run())
+    finally:
+        shutdown_export_pool()
+    print(f"Done: {len(items) - failed} ok, {failed} failed", file=sys.stderr)
+    return 0 if failed == 0 else 1
+
+
+async def _enumerate_async(iterator, start: int = 0):
+    """Async counterpart of enumerate()."""
+    index = start
+    async for value in iterator:
+        yield index, value
+        index += 1
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser."""
     parser = argparse.ArgumentParser(
@@ -187,12 +342,18 @@ Examples:
   # Generate MJCF without launching viewer
   python -m neoscene.app.main --scene-json examples/orchard_scene.json --output scene.xml --no-viewer
 
+  # Simulate a scene headless as fast as possible and report the real-time factor
+  python -m neoscene.app.main --scene-json examples/orchard_scene.json --sim-seconds 30 --speed 0
+
   # Start the API server with chat UI
   python -m neoscene.app.main --chat-ui
   python -m neoscene.app.main --api  # (same as --chat-ui)
 
   # Generate a scene from text prompt (one-shot)
   python -m neoscene.app.main --generate "An orchard with a tractor"
+
+  # Generate scenes for a file of prompts (text or JSONL), NDJSON results
+  python -m neoscene.app.main --batch prompts.jsonl -o results.ndjson
 """,
     )
 
@@ -224,6 +385,13 @@ Examples:
         help="Generate a scene from a text prompt",
     )
 
+    mode_group.add_argument(
+        "--batch",
+        type=Path,
+        metavar="PROMPTS",
+        help="Generate scenes for a file of prompts (text or JSONL, '-' for stdin)",
+    )
+
     # Common options
     parser.add_argument(
         "--assets-path",
@@ -246,6 +414,41 @@ Examples:
         help="Don't launch the MuJoCo viewer",
     )
 
+    parser.add_argument(
+        "--sim-seconds",
+        type=float,
+        default=None,
+        help="With --scene-json: simulate this many seconds headless and report the RTF",
+    )
+
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Target real-time factor for --sim-seconds (0 = as fast as possible)",
+    )
+
+    # Batch options
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Batch export/validation processes (default: CPU count)",
+    )
+
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Batch prompts generated at once (default: LLM scheduler limit)",
+    )
+
+    parser.add_argument(
+        "--include-mjcf",
+        action="store_true",
+        help="Include the MJCF XML in batch results",
+    )
+
     # API options
     parser.add_argument(
         "--host",
@@ -267,6 +470,14 @@ Examples:
         help="Enable auto-reload for API development",
     )
 
+    parser.add_argument(
+        "--sim-processes",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Run API simulations in worker processes, keeping N warm (default: 0, threads)",
+    )
+
     parser.add_argument(
         "--version",
         action="version",
@@ -283,19 +494,35 @@ def main() -> None:
 
     # Determine mode and run
     if args.api or getattr(args, 'chat_ui', False):
-        exit_code = run_api(host=args.host, port=args.port, reload=args.reload)
+        exit_code = run_api(
+            host=args.host,
+            port=args.port,
+            reload=args.reload,
+            sim_processes=args.sim_processes,
+        )
     elif args.generate:
         exit_code = run_generate(
             prompt=args.generate,
             assets_path=args.assets_path,
             output=args.output,
         )
+    elif args.batch:
+        exit_code = run_batch(
+            prompts_path=args.batch,
+            assets_path=args.assets_path,
+            output=args.output,
+            workers=args.workers,
+            concurrency=args.concurrency,
+            include_mjcf=args.include_mjcf,
+        )
     elif args.scene_json:
         exit_code = run_scene(
             scene_json_path=args.scene_json,
             assets_path=args.assets_path,
             output_xml=args.output,
             no_viewer=args.no_viewer,
+            sim_seconds=args.sim_seconds,
+            speed=args.speed,
         )
     else:
         # No mode specified, show help
@@ -305,6 +532,7 @@ def main() -> None:
         print("  python -m neoscene.app.main --chat-ui            # Start chat UI server")
         print("  python -m neoscene.app.main --scene-json <path>  # Run a scene from JSON")
         print("  python -m neoscene.app.main --generate <prompt>  # One-shot generate from text")
+        print("  python -m neoscene.app.main --batch <prompts>    # Batch generate to NDJSON")
         print()
         print("Run with --help for more options.")
         exit_code = 0
@@ -298,9 +298,90 @@ async function sendMessage() {
 }
 
 // ============================================
-// Sensor Polling
+// Live Telemetry (WebSocket push, polling fallback)
 // ============================================
 
+let telemetrySocket = null;
+let telemetrySessionId = null;
+let liveSensors = {};
+let frameUrl = null;
+
+function telemetryLive() {
+  return telemetrySocket !== null && telemetrySocket.readyState === WebSocket.OPEN;
+}
+
+function connectTelemetry() {
+  if (!currentSessionId || telemetrySessionId === currentSessionId) return;
+  if (!("WebSocket" in window)) return;
+
+  if (telemetrySocket) telemetrySocket.close();
+  telemetrySessionId = currentSessionId;
+  liveSensors = {};
+
+  const scheme = location.protocol === "https:" ? "wss:" : "ws:";
+  const ws = new WebSocket(
+    `${scheme}//${location.host}/ws/${currentSessionId}?sensor_hz=10&camera_fps=5`
+  );
+  ws.binaryType = "blob";
+
+  ws.onmessage = (ev) => {
+    if (typeof ev.data === "string") {
+      const msg = JSON.parse(ev.data);
+      if (msg.type === "sensors") {
+        // Deltas only carry changed values; full snapshots replace the set
+        liveSensors = msg.full ? msg.sensors : Object.assign(liveSensors, msg.sensors);
+        renderSensors(liveSensors);
+      }
+    } else {
+      showFrame(ev.data);
+    }
+  };
+  ws.onclose = () => {
+    // Fall back to polling; reconnect on the next poll tick
+    if (telemetrySocket === ws) {
+      telemetrySocket = null;
+      telemetrySessionId = null;
+    }
+  };
+  telemetrySocket = ws;
+}
+
+// ============================================
+// Sensor Panel
+// ============================================
+
+function renderSensors(sensors) {
+  const el = document.getElementById("sensor-panel");
+  if (!el) return;
+
+  const names = Object.keys(sensors);
+  if (names.length === 0) {
+    el.innerHTML = '<div class="no-data">No sensors in current scene.</div>';
+    return;
+  }
+
+  // One "window" per sensor in a grid
+  const cards = names.map((name) => {
+    const val = sensors[name];
+    let displayVal;
+    if (Array.isArray(val)) {
+      displayVal = val.map(v => v.toFixed(2)).join(", ");
+    } else if (typeof val === "number") {
+      displayVal = val.toFixed(4);
+    } else {
+      displayVal = JSON.stringify(val);
+    }
+    return `
+      <div class="sensor-card">
+        <div class="sensor-name"><code>${name}</code></div>
+        <div class="sensor-value">${displayVal}</div>
+      </div>
+    `;
+  });
+
+  el.innerHTML = `<div class="sensor-grid">${cards.join("")}</div>`;
+}
+
 function updateSensors() {
   const el = document.getElementById("sensor-panel");
   if (!el) return;
@@ -310,51 +391,25 @@ function updateSensors() {
     return;
   }
 
+  connectTelemetry();
+  if (telemetryLive()) return;  // Pushed by the telemetry stream
+
   fetch("/sensors/" + currentSessionId)
     .then((r) => r.json())
-    .then((data) => {
-      const sensors = data.ok ? data.sensors || {} : {};
-      const names = Object.keys(sensors);
-
-      if (names.length === 0) {
-        el.innerHTML = '<div class="no-data">No sensors in current scene.</div>';
-        return;
-      }
-
-      // One "window" per sensor in a grid
-      const cards = names.map((name) => {
-        const val = sensors[name];
-        let displayVal;
-        if (Array.isArray(val)) {
-          displayVal = val.map(v => v.toFixed(2)).join(", ");
-        } else if (typeof val === "number") {
-          displayVal = val.toFixed(4);
-        } else {
-          displayVal = JSON.stringify(val);
-        }
-        return `
-          <div class="sensor-card">
-            <div class="sensor-name"><code>${name}</code></div>
-            <div class="sensor-value">${displayVal}</div>
-          </div>
-        `;
-      });
-
-      el.innerHTML = `<div class="sensor-grid">${cards.join("")}</div>`;
-    })
+    .then((data) => renderSensors(data.ok ? data.sensors || {} : {}))
     .catch(() => {
       el.innerHTML = '<div class="no-data" style="color:#f87171;">Error reading sensors.</div>';
     });
 }
 
 // ============================================
-// Camera Polling
+// Camera Panel
 // ============================================
 
-function updateCamera() {
+function cameraView() {
   const container = document.getElementById("camera-panel-body");
   const noText = document.getElementById("camera-no-text");
-  if (!container || !noText) return;
+  if (!container || !noText) return null;
 
   // No session or no cameras in scene
   if (!currentSessionId || currentCameras.length === 0) {
@@ -363,7 +418,7 @@ function updateCamera() {
     noText.textContent = currentSessionId 
       ? "No camera in current scene." 
       : "No scene loaded.";
-    return;
+    return null;
   }
 
   // Show the first camera (we can extend to multiple later)
@@ -383,6 +438,22 @@ function updateCamera() {
     `;
     img = document.getElementById("camera-view");
   }
+  return img;
+}
+
+function showFrame(blob) {
+  const img = cameraView();
+  if (!img) return;
+  const previous = frameUrl;
+  frameUrl = URL.createObjectURL(blob);
+  img.src = frameUrl;
+  img.style.display = "block";
+  if (previous) URL.revokeObjectURL(previous);
+}
+
+function updateCamera() {
+  const img = cameraView();
+  if (!img || telemetryLive()) return;  // Frames are pushed when live
 
   // Update the image source with cache-buster
   const newSrc = `/camera/${currentSessionId}?t=${Date.now()}`;
@@ -416,7 +487,8 @@ document.addEventListener("DOMContentLoaded", () => {
   appendOp("Console initialized", "info");
   appendOp("Waiting for commands...", "info");
   
-  // Start polling for sensors and camera
+  // Sensors and camera are pushed over /ws once a session exists; these
+  // ticks open the stream and fall back to polling while it is down
   setInterval(updateSensors, 500);  // 2 Hz
   setInterval(updateCamera, 1000);  // 1 Hz
 });
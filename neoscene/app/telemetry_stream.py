@@ -0,0 +1,279 @@
+"""Push streaming of session telemetry over WebSocket.
+
+Instead of polling ``/sensors/{id}`` and ``/camera/{id}``, a client opens
+``/ws/{session_id}?sensor_hz=10&camera_fps=5`` and receives:
+
+- Text messages ``{"type": "sensors", "full": bool, "sensors": {...}}``
+  holding only the values that changed since the previous message. The
+  first message (and any message after the set of sensors changed, e.g.
+  when the scene was replaced) has ``full`` set and carries every value.
+- Binary messages, each one JPEG camera frame. Frames come from the
+  worker's shared JpegFrameCache, so they are encoded once however many
+  clients watch.
+
+``mjpeg_parts`` serves the same shared frames as an MJPEG
+(``multipart/x-mixed-replace``) stream for ``<img>`` tags and dashboards.
+
+The client may change its rates at any time by sending
+``{"sensor_hz": 2, "camera_fps": 0}``; a rate of 0 pauses that channel.
+
+Downsampling happens on the server: sensors are sampled from the latest
+published values at ``sensor_hz``, and frames at most ``camera_fps``,
+skipping frames already sent. A single sender task writes to the socket;
+while it is blocked on a slow client, newer sensor deltas are merged into
+the pending message and a pending frame is replaced by the newer one, so
+slow clients get fewer, fresher updates instead of a growing backlog.
+"""
+
+import asyncio
+import json
+from typing import AsyncIterator, Optional, Tuple
+
+from fastapi import WebSocket, WebSocketDisconnect
+
+from neoscene.backends.session_manager import RENDER_FPS, SceneSessionManager
+from neoscene.core.logging_config import get_logger
+from neoscene.core.metrics import REGISTRY
+
+logger = get_logger(__name__)
+
+DEFAULT_SENSOR_HZ = 10.0
+MAX_SENSOR_HZ = 50.0
+DEFAULT_CAMERA_FPS = 5.0
+MAX_CAMERA_FPS = RENDER_FPS
+
+DEFAULT_MJPEG_FPS = RENDER_FPS
+# Workers render at most RENDER_FPS; a higher rate would only resend nothing
+MAX_MJPEG_FPS = RENDER_FPS
+MJPEG_BOUNDARY = "frame"
+
+# How often a paused channel (rate 0) checks whether it was resumed
+PAUSED_POLL_SECONDS = 0.5
+
+STREAM_MESSAGES = REGISTRY.counter(
+    "neoscene_stream_messages_total", "Telemetry stream messages sent", ("kind",)
+)
+STREAM_DROPPED_FRAMES = REGISTRY.counter(
+    "neoscene_stream_dropped_frames_total",
+    "Camera frames replaced by a newer one before a slow client received them",
+)
+
+
+def clamp_rate(value: float, maximum: float) -> float:
+    """Clamp a client-requested rate to [0, maximum]."""
+    return max(0.0, min(float(value), maximum))
+
+
+def sensor_delta(previous: Optional[dict], current: dict) -> Tuple[bool, dict]:
+    """Compute the sensor values to send after ``previous`` was sent.
+
+    Args:
+        previous: Sensor values of the last message, or None if none was sent.
+        current: Latest sensor values.
+
+    Returns:
+        (full, values): ``full`` is True when ``values`` is a complete
+        snapshot (first message or changed sensor names); otherwise
+        ``values`` only has the entries that changed.
+    """
+    if previous is None or previous.keys() != current.keys():
+        return True, dict(current)
+    return False, {name: value for name, value in current.items() if previous[name] != value}
+
+
+class TelemetryStream:
+    """Pushes one session's sensors and camera frames to one WebSocket."""
+
+    active = 0
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        manager: SceneSessionManager,
+        session_id: str,
+        sensor_hz: float = DEFAULT_SENSOR_HZ,
+        camera_fps: float = DEFAULT_CAMERA_FPS,
+    ):
+        """Initialize the stream.
+
+        Args:
+            websocket: Accepted WebSocket connection.
+            manager: Session manager to read telemetry from.
+            session_id: Session to stream.
+            sensor_hz: Sensor messages per second (0 pauses sensors).
+            camera_fps: Camera frames per second (0 pauses the camera).
+        """
+        self.websocket = websocket
+        self.manager = manager
+        self.session_id = session_id
+        self.sensor_hz = clamp_rate(sensor_hz, MAX_SENSOR_HZ)
+        self.camera_fps = clamp_rate(camera_fps, MAX_CAMERA_FPS)
+        self.dropped_frames = 0
+        self._pending_sensors: Optional[dict] = None
+        self._pending_full = False
+        self._pending_frame: Optional[bytes] = None
+        self._ready = asyncio.Event()
+
+    def set_rates(self, sensor_hz: Optional[float] = None, camera_fps: Optional[float] = None):
+        """Change the sensor and/or camera rate."""
+        if sensor_hz is not None:
+            self.sensor_hz = clamp_rate(sensor_hz, MAX_SENSOR_HZ)
+        if camera_fps is not None:
+            self.camera_fps = clamp_rate(camera_fps, MAX_CAMERA_FPS)
+
+    def queue_sensors(self, full: bool, values: dict):
+        """Queue sensor values, merging them into any message not yet sent."""
+        if full or self._pending_sensors is None:
+            self._pending_sensors = dict(values)
+            self._pending_full = full
+        else:
+            self._pending_sensors.update(values)
+        self._ready.set()
+
+    def queue_frame(self, data: bytes):
+        """Queue a JPEG frame, replacing (dropping) any frame not yet sent."""
+        if self._pending_frame is not None:
+            self.dropped_frames += 1
+            STREAM_DROPPED_FRAMES.inc()
+        self._pending_frame = data
+        self._ready.set()
+
+    async def run(self):
+        """Stream until the client disconnects.
+
+        The sender and samplers run as tasks; this task reads client
+        messages, so a disconnect ends the stream as soon as it arrives.
+
+        Raises:
+            WebSocketDisconnect: When the client goes away.
+        """
+        tasks = [
+            asyncio.create_task(coro)
+            for coro in (self._send_loop(), self._sensor_loop(), self._camera_loop())
+        ]
+        TelemetryStream.active += 1
+        try:
+            await self._receive_loop()
+        finally:
+            TelemetryStream.active -= 1
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _send_loop(self):
+        """Send whatever is pending whenever the socket is free."""
+        while True:
+            await self._ready.wait()
+            self._ready.clear()
+            if self._pending_sensors is not None:
+                message = {
+                    "type": "sensors",
+                    "full": self._pending_full,
+                    "sensors": self._pending_sensors,
+                }
+                self._pending_sensors = None
+                await self.websocket.send_text(json.dumps(message))
+                STREAM_MESSAGES.inc(kind="sensors")
+            if self._pending_frame is not None:
+                data, self._pending_frame = self._pending_frame, None
+                await self.websocket.send_bytes(data)
+                STREAM_MESSAGES.inc(kind="frame")
+
+    async def _receive_loop(self):
+        """Apply rate changes sent by the client."""
+        while True:
+            text = await self.websocket.receive_text()
+            try:
+                message = json.loads(text)
+                if isinstance(message, dict):
+                    self.set_rates(message.get("sensor_hz"), message.get("camera_fps"))
+            except (TypeError, ValueError) as e:
+                logger.debug(f"Ignoring invalid stream message {text!r}: {e}")
+
+    async def _sensor_loop(self):
+        """Sample sensors at the client's rate and queue the changes."""
+        previous: Optional[dict] = None
+        while True:
+            if self.sensor_hz <= 0:
+                await asyncio.sleep(PAUSED_POLL_SECONDS)
+                continue
+            result = self.manager.get_sensors(self.session_id)
+            if result["ok"]:
+                full, values = sensor_delta(previous, result["sensors"])
+                previous = result["sensors"]
+                if full or values:
+                    self.queue_sensors(full, values)
+            await asyncio.sleep(1.0 / self.sensor_hz)
+
+    async def _camera_loop(self):
+        """Queue each new camera frame, at most at the client's rate."""
+        last_etag = None
+        while True:
+            if self.camera_fps <= 0:
+                await asyncio.sleep(PAUSED_POLL_SECONDS)
+                continue
+            frames = self.manager.get_camera_frames(self.session_id)
+            frame = await frames.get_async() if frames is not None else None
+            # ETags are unique across workers, so a replaced scene's first
+            # frame is never mistaken for one already sent
+            if frame is not None and frame.etag != last_etag:
+                last_etag = frame.etag
+                self.queue_frame(frame.data)
+            await asyncio.sleep(1.0 / self.camera_fps)
+
+
+async def mjpeg_parts(
+    manager: SceneSessionManager, session_id: str, fps: float = DEFAULT_MJPEG_FPS
+) -> AsyncIterator[bytes]:
+    """Yield one multipart/x-mixed-replace part per new camera frame.
+
+    Frames are read from the worker's shared JpegFrameCache, so every
+    viewer of a session reuses the same encode. ``fps`` is clamped to
+    MAX_MJPEG_FPS, the workers' render rate. Ends when the session is
+    removed.
+
+    Args:
+        manager: Session manager to read frames from.
+        session_id: Session to stream.
+        fps: Most frames per second to send.
+    """
+    period = 1.0 / clamp_rate(fps, MAX_MJPEG_FPS)
+    last_etag = None
+    while manager.get_session(session_id) is not None:
+        frames = manager.get_camera_frames(session_id)
+        frame = await frames.get_async() if frames is not None else None
+        if frame is not None and frame.etag != last_etag:
+            last_etag = frame.etag
+            header = (
+                f"--{MJPEG_BOUNDARY}\r\n"
+                f"Content-Type: image/jpeg\r\n"
+                f"Content-Length: {len(frame.data)}\r\n\r\n"
+            )
+            yield header.encode() + frame.data + b"\r\n"
+            STREAM_MESSAGES.inc(kind="mjpeg")
+        await asyncio.sleep(period)
+
+
+async def serve_telemetry(
+    websocket: WebSocket,
+    manager: SceneSessionManager,
+    session_id: str,
+    sensor_hz: float = DEFAULT_SENSOR_HZ,
+    camera_fps: float = DEFAULT_CAMERA_FPS,
+):
+    """Accept a telemetry WebSocket and stream until the client leaves.
+
+    Unknown sessions are rejected with close code 4404.
+    """
+    if manager.get_session(session_id) is None:
+        await websocket.close(code=4404, reason="Unknown session")
+        return
+    await websocket.accept()
+    stream = TelemetryStream(websocket, manager, session_id, sensor_hz, camera_fps)
+    try:
+        await stream.run()
+    except WebSocketDisconnect:
+        pass
+    logger.debug(
+        f"Telemetry stream for {session_id} closed ({stream.dropped_frames} frames dropped)"
+    )
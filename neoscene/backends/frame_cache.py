@@ -0,0 +1,152 @@
+"""Encode-once JPEG cache for simulation camera frames.
+
+Every reader of a session's camera (browser tabs, dashboards, streams)
+shares one cache per worker: each published frame is JPEG-encoded at most
+once, on the first read after it was rendered, and later readers get the
+same bytes. Concurrent readers of a new frame wait for the single encode
+instead of encoding it again.
+
+Encoding runs in ENCODE_POOL when called through ``get_async`` so the
+event loop is never blocked (OpenCV and Pillow release the GIL while
+encoding).
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+from neoscene.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+JPEG_QUALITY = 80
+
+ENCODE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="jpeg")
+
+
+def encode_jpeg(image: np.ndarray, quality: int = JPEG_QUALITY) -> Optional[bytes]:
+    """Encode an RGB image as JPEG with OpenCV, falling back to Pillow.
+
+    Args:
+        image: RGB (or single-channel) image.
+        quality: JPEG quality (0-100).
+
+    Returns:
+        The JPEG bytes, or None if neither OpenCV nor Pillow is installed.
+    """
+    try:
+        import cv2
+
+        # Convert RGB to BGR for cv2 encoding
+        if len(image.shape) == 3 and image.shape[2] == 3:
+            image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+        _, buf = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        return buf.tobytes()
+    except ImportError:
+        pass
+
+    try:
+        import io
+
+        from PIL import Image
+
+        buf = io.BytesIO()
+        Image.fromarray(image).save(buf, format="JPEG", quality=quality)
+        return buf.getvalue()
+    except ImportError:
+        return None
+
+
+@dataclass(frozen=True)
+class EncodedFrame:
+    """A JPEG-encoded camera frame.
+
+    Attributes:
+        number: Frame number within the worker (increases with each render).
+        etag: Strong HTTP entity tag, unique across workers.
+        data: JPEG bytes.
+    """
+
+    number: int
+    etag: str
+    data: bytes
+
+
+class JpegFrameCache:
+    """Encodes each frame of one frame source at most once."""
+
+    def __init__(
+        self,
+        frame_number: Callable[[], int],
+        snapshot: Callable[[], Optional[Tuple[int, np.ndarray]]],
+        tag: str,
+        quality: int = JPEG_QUALITY,
+    ):
+        """Initialize the cache.
+
+        Args:
+            frame_number: Returns the number of the latest frame (cheap, no copy).
+            snapshot: Returns (frame number, image copy) or None.
+            tag: Prefix making ETags unique to this source.
+            quality: JPEG quality.
+        """
+        self._frame_number = frame_number
+        self._snapshot = snapshot
+        self._tag = tag
+        self.quality = quality
+        self.encodes = 0
+        self._latest: Optional[EncodedFrame] = None
+        self._pending: Optional[Tuple[int, Future]] = None
+        self._lock = threading.Lock()
+
+    def get(self) -> Optional[EncodedFrame]:
+        """Return the latest frame as JPEG, encoding it if nobody has yet.
+
+        Returns:
+            The encoded frame, or None if there is no frame (or no encoder).
+        """
+        latest = self._latest
+        if latest is not None and latest.number == self._frame_number():
+            return latest
+
+        snapshot = self._snapshot()
+        if snapshot is None:
+            return latest
+        number, image = snapshot
+
+        with self._lock:
+            latest = self._latest
+            if latest is not None and latest.number >= number:
+                return latest
+            if self._pending is not None and self._pending[0] == number:
+                future, owner = self._pending[1], False
+            else:
+                future, owner = Future(), True
+                self._pending = (number, future)
+
+        if not owner:
+            return future.result()
+
+        frame = None
+        try:
+            data = encode_jpeg(image, self.quality)
+            if data is not None:
+                frame = EncodedFrame(number, f'"{self._tag}-{number}"', data)
+        except Exception as e:
+            logger.warning(f"JPEG encoding failed: {e}")
+        with self._lock:
+            self.encodes += 1
+            if frame is not None and (self._latest is None or self._latest.number < number):
+                self._latest = frame
+            if self._pending is not None and self._pending[1] is future:
+                self._pending = None
+        future.set_result(frame)
+        return frame
+
+    async def get_async(self) -> Optional[EncodedFrame]:
+        """Like get(), but encodes in ENCODE_POOL instead of the calling thread."""
+        return await asyncio.get_running_loop().run_in_executor(ENCODE_POOL, self.get)
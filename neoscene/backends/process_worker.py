@@ -0,0 +1,594 @@
+"""Out-of-process simulation workers.
+
+By default each session's SimulationWorker runs in a thread of the API
+process, so every session's control code, sensor reading and rendering
+shares one GIL with the web server. With a SimulationProcessPool each
+session's simulation runs in a worker process instead:
+
+- The API process controls the simulation over a multiprocessing Pipe
+  (load/unload, scene, task commands, frame requests).
+- The worker process publishes telemetry and camera frames into
+  shared-memory rings (see shm_ring), which the API process reads
+  directly, without a round trip to the worker.
+- Processes are pooled: when a scene is replaced, the process that ran it
+  is kept (with MuJoCo already imported) for the next scene.
+
+ProcessSimulationWorker offers the interface SceneSessionManager and the
+API use from SimulationWorker, so callers do not need to know which mode
+is active. Enable it for the API server with NEOSCENE_SIM_PROCESSES=<n>,
+the number of idle processes kept warm.
+"""
+
+import itertools
+import json
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from neoscene.backends.frame_cache import JpegFrameCache
+from neoscene.backends.session_manager import (
+    CAMERA_HEIGHT,
+    CAMERA_WIDTH,
+    FrameSnapshot,
+    SensorLayout,
+    SimulationWorker,
+    TelemetrySnapshot,
+    format_sensors,
+)
+from neoscene.backends.shm_ring import ShmRing
+from neoscene.core.errors import NeosceneError
+from neoscene.core.logging_config import get_logger
+from neoscene.core.scene_schema import SceneSpec
+
+logger = get_logger(__name__)
+
+# Environment variable: number of idle worker processes to keep (unset/0 = threads)
+PROCESSES_ENV = "NEOSCENE_SIM_PROCESSES"
+
+SENSOR_SLOTS = 8
+FRAME_SLOTS = 3
+
+# Room for the JSON task/navigator status and worker stats in each sensor slot
+STATUS_BYTES = 4096
+
+LOAD_TIMEOUT_SECONDS = 30.0
+UNLOAD_TIMEOUT_SECONDS = 2.0
+CALL_TIMEOUT_SECONDS = 5.0
+
+# Frame requests are forwarded to the worker process at most this often;
+# the worker keeps rendering for FRAME_DEMAND_SECONDS after each one
+FRAME_REQUEST_INTERVAL = 0.5
+
+# Worker telemetry published with the sensors (see SimulationWorker)
+STATS = (
+    "steps",
+    "step_rate",
+    "realtime_factor",
+    "frames",
+    "last_render_seconds",
+    "render_seconds_total",
+    "overruns",
+    "dropped_ticks",
+)
+
+
+class SimulationProcessError(NeosceneError):
+    """Raised when a simulation worker process fails or does not answer."""
+
+
+# ---------------------------------------------------------------------------
+# Worker process side
+# ---------------------------------------------------------------------------
+
+
+def _json_default(value: Any) -> Any:
+    """Convert NumPy scalars (and anything else) for json.dumps."""
+    return value.item() if hasattr(value, "item") else str(value)
+
+
+@dataclass
+class _PublishingWorker(SimulationWorker):
+    """SimulationWorker that also publishes into shared-memory rings."""
+
+    sensor_ring: Optional[ShmRing] = None
+    frame_ring: Optional[ShmRing] = None
+    _status_overflow_logged: bool = False
+
+    def start(self):
+        """Initialize MuJoCo, then create the rings sized for this model."""
+        super().start()
+        self.sensor_ring = ShmRing.create(SENSOR_SLOTS, self._model.nsensordata * 8 + STATUS_BYTES)
+        if self._camera_idx >= 0:
+            self.frame_ring = ShmRing.create(FRAME_SLOTS, CAMERA_HEIGHT * CAMERA_WIDTH * 3)
+
+    def _read_sensors(self):
+        """Publish telemetry locally and into the sensor ring."""
+        super()._read_sensors()
+        telemetry = self.telemetry
+        status = {
+            "task": telemetry.task_status,
+            "nav": telemetry.navigator_status,
+            "stats": {name: getattr(self, name) for name in STATS},
+        }
+        encoded = json.dumps(status, default=_json_default).encode()
+        if len(encoded) > STATUS_BYTES:
+            if not self._status_overflow_logged:
+                logger.warning(f"Worker status exceeds {STATUS_BYTES} bytes; dropping it")
+                self._status_overflow_logged = True
+            encoded = b"{}"
+        self.sensor_ring.write(
+            telemetry.sensordata.tobytes() + encoded, telemetry.timestamp, telemetry.sim_time
+        )
+
+    def _publish_frame(self, renderer, sim_time: float):
+        """Publish a frame locally and into the frame ring."""
+        super()._publish_frame(renderer, sim_time)
+        frame = self.frame
+        if self.frame_ring is not None:
+            self.frame_ring.write(frame.image, frame.timestamp, frame.sim_time)
+
+    def info(self) -> Dict[str, Any]:
+        """Describe the rings and model for the API process."""
+        layout = self._sensor_layout
+        return {
+            "pid": os.getpid(),
+            "nsensordata": int(self._model.nsensordata),
+            "layout": (layout.names, layout.adr, layout.dim),
+            "has_task_runner": self._task_runner is not None,
+            "has_navigator": self._navigator is not None,
+            "sensor_ring": self.sensor_ring.name,
+            "sensor_slot_size": self.sensor_ring.slot_size,
+            "frame_ring": self.frame_ring.name if self.frame_ring is not None else None,
+        }
+
+    def close_rings(self):
+        """Remove the rings (after the loop and render thread have stopped)."""
+        for ring in (self.sensor_ring, self.frame_ring):
+            if ring is not None:
+                ring.close()
+        self.sensor_ring = self.frame_ring = None
+
+
+def _load(
+    xml_path: str,
+    speed: Optional[float],
+    state_ring_name: Optional[str] = None,
+    scene_json: Optional[str] = None,
+) -> Tuple[_PublishingWorker, threading.Thread]:
+    """Start a simulation in this process and wait until its rings exist."""
+    scene = SceneSpec.model_validate_json(scene_json) if scene_json is not None else None
+    worker = _PublishingWorker(
+        xml_path=xml_path, speed=speed, state_ring_name=state_ring_name, scene=scene
+    )
+    thread = threading.Thread(target=worker.loop, daemon=True)
+    thread.start()
+    if not worker.wait_ready(timeout=LOAD_TIMEOUT_SECONDS):
+        # Also stops a worker still loading: it exits as soon as it has started
+        worker.stop()
+        raise SimulationProcessError(f"Simulation failed to start: {xml_path}")
+    return worker, thread
+
+
+def _unload(worker: _PublishingWorker, thread: threading.Thread):
+    """Stop the simulation and remove its rings."""
+    worker.stop()
+    if not worker.join(timeout=UNLOAD_TIMEOUT_SECONDS):
+        logger.warning(
+            f"Simulation of {worker.xml_path} did not stop within {UNLOAD_TIMEOUT_SECONDS}s"
+        )
+    worker.close_rings()
+
+
+def _process_main(conn):
+    """Worker process entry point: run simulations as instructed over conn.
+
+    Messages are ``(op, call_id, args)``; calls with a call_id are answered
+    with ``(call_id, ok, value)``.
+    """
+    worker: Optional[_PublishingWorker] = None
+    thread: Optional[threading.Thread] = None
+    while True:
+        try:
+            op, call_id, args = conn.recv()
+        except (EOFError, OSError):
+            break
+        if op == "shutdown":
+            break
+        ok, value = True, None
+        try:
+            if op == "load":
+                if worker is not None:
+                    _unload(worker, thread)
+                    worker = thread = None
+                worker, thread = _load(*args)
+                value = worker.info()
+            elif op == "unload":
+                if worker is not None:
+                    _unload(worker, thread)
+                worker = thread = None
+            elif worker is None:
+                raise SimulationProcessError(f"No simulation loaded for '{op}'")
+            elif op == "set_scene":
+                worker.set_scene(SceneSpec.model_validate_json(args[0]))
+            elif op == "start_task":
+                value = worker.start_task(args[0])
+            elif op == "stop_task":
+                worker.stop_task()
+            elif op == "request_frame":
+                worker.request_frame()
+            else:
+                raise SimulationProcessError(f"Unknown command '{op}'")
+        except Exception as e:
+            ok, value = False, str(e)
+            if call_id is None:
+                logger.warning(f"Simulation process command '{op}' failed: {e}")
+        if call_id is not None:
+            conn.send((call_id, ok, value))
+    if worker is not None:
+        _unload(worker, thread)
+
+
+# ---------------------------------------------------------------------------
+# API process side
+# ---------------------------------------------------------------------------
+
+
+class SimulationProcess:
+    """A worker process and the pipe that controls it."""
+
+    def __init__(self, context: Optional[Any] = None):
+        """Spawn the process.
+
+        Args:
+            context: multiprocessing context (default: "spawn", which is safe
+                with the API's threads and GL contexts).
+        """
+        context = context or multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_process_main, args=(child_conn,), daemon=True, name="neoscene-sim"
+        )
+        self.process.start()
+        child_conn.close()
+        self._lock = threading.Lock()
+        self._call_ids = itertools.count(1)
+
+    def is_alive(self) -> bool:
+        """Whether the process is running."""
+        return self.process.is_alive()
+
+    def send(self, op: str, *args):
+        """Send a command without waiting for it."""
+        with self._lock:
+            self._conn.send((op, None, args))
+
+    def call(self, op: str, *args, timeout: float = CALL_TIMEOUT_SECONDS) -> Any:
+        """Send a command and wait for its result.
+
+        Raises:
+            SimulationProcessError: If the command failed, timed out or the
+                process is gone.
+        """
+        with self._lock:
+            call_id = next(self._call_ids)
+            try:
+                self._conn.send((op, call_id, args))
+                deadline = time.monotonic() + timeout
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._conn.poll(remaining):
+                        raise SimulationProcessError(f"Simulation process timed out on '{op}'")
+                    reply_id, ok, value = self._conn.recv()
+                    # Earlier replies belong to calls that already timed out
+                    if reply_id == call_id:
+                        break
+            except (EOFError, OSError) as e:
+                raise SimulationProcessError(f"Simulation process is gone: {e}") from e
+        if not ok:
+            raise SimulationProcessError(value)
+        return value
+
+    def shutdown(self, timeout: float = 2.0):
+        """Ask the process to exit, terminating it if it does not."""
+        try:
+            self.send("shutdown")
+        except OSError:
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+        self._conn.close()
+
+
+class SimulationProcessPool:
+    """Pool of worker processes, each running at most one simulation."""
+
+    def __init__(self, max_idle: int = 1, context: Optional[Any] = None):
+        """Initialize the pool and spawn its idle processes.
+
+        Args:
+            max_idle: Idle processes kept warm (more are spawned on demand
+                and shut down when released beyond this number).
+            context: multiprocessing context (default: "spawn").
+        """
+        self.max_idle = max_idle
+        self._context = context or multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        self._idle = [SimulationProcess(self._context) for _ in range(max_idle)]
+
+    def acquire(self) -> SimulationProcess:
+        """Take an idle process, or spawn one."""
+        with self._lock:
+            while self._idle:
+                process = self._idle.pop()
+                if process.is_alive():
+                    return process
+        return SimulationProcess(self._context)
+
+    def release(self, process: SimulationProcess):
+        """Return a process whose simulation was unloaded."""
+        with self._lock:
+            if process.is_alive() and len(self._idle) < self.max_idle:
+                self._idle.append(process)
+                return
+        process.shutdown()
+
+    def start_worker(
+        self,
+        xml_path: str,
+        speed: Optional[float] = 1.0,
+        state_ring_name: Optional[str] = None,
+        scene: Optional[SceneSpec] = None,
+    ) -> "ProcessSimulationWorker":
+        """Run a simulation in a pooled process.
+
+        Args:
+            xml_path: MJCF file to simulate.
+            speed: Target real-time factor (None = as fast as possible).
+            state_ring_name: Publish the physics state for viewers under
+                this name (see SimulationWorker.state_ring_name).
+            scene: Scene given to the TaskRunner when the simulation starts.
+
+        Returns:
+            Handle to the running simulation.
+
+        Raises:
+            SimulationProcessError: If the simulation could not be started.
+        """
+        process = self.acquire()
+        try:
+            info = process.call(
+                "load",
+                xml_path,
+                speed,
+                state_ring_name,
+                scene.model_dump_json() if scene is not None else None,
+                timeout=LOAD_TIMEOUT_SECONDS,
+            )
+        except SimulationProcessError:
+            process.shutdown()
+            raise
+        logger.info(f"Simulation of {xml_path} running in process {info['pid']}")
+        return ProcessSimulationWorker(self, process, info)
+
+    def shutdown(self):
+        """Shut down the idle processes."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for process in idle:
+            process.shutdown()
+
+
+def _stat(name: str) -> property:
+    """Property reading a worker stat published with the latest telemetry."""
+
+    def getter(self: "ProcessSimulationWorker"):
+        self.telemetry  # Refresh stats from the newest slot
+        return self._stats.get(name, 0)
+
+    return property(getter, doc=f"Worker '{name}', as of the latest telemetry.")
+
+
+class ProcessSimulationWorker:
+    """API-side handle of a simulation running in a pooled process.
+
+    Reads telemetry and frames from the shared-memory rings; forwards
+    scene and task commands over the pipe.
+    """
+
+    steps = _stat("steps")
+    step_rate = _stat("step_rate")
+    realtime_factor = _stat("realtime_factor")
+    frames = _stat("frames")
+    last_render_seconds = _stat("last_render_seconds")
+    render_seconds_total = _stat("render_seconds_total")
+    overruns = _stat("overruns")
+    dropped_ticks = _stat("dropped_ticks")
+
+    def __init__(self, pool: SimulationProcessPool, process: SimulationProcess, info: dict):
+        """Attach to a loaded simulation (see SimulationProcessPool.start_worker)."""
+        self._pool = pool
+        self._process = process
+        self._loaded = True
+        self._layout = SensorLayout(*info["layout"])
+        self._nsensordata = info["nsensordata"]
+        self._has_task_runner = info["has_task_runner"]
+        self._has_navigator = info["has_navigator"]
+        self._lock = threading.Lock()  # Guards ring reads against close
+        self._sensor_ring: Optional[ShmRing] = ShmRing.attach(
+            info["sensor_ring"], SENSOR_SLOTS, info["sensor_slot_size"]
+        )
+        self._frame_ring: Optional[ShmRing] = None
+        if info["frame_ring"] is not None:
+            self._frame_ring = ShmRing.attach(
+                info["frame_ring"], FRAME_SLOTS, CAMERA_HEIGHT * CAMERA_WIDTH * 3
+            )
+        self._telemetry: Optional[TelemetrySnapshot] = None
+        self._stats: Dict[str, Any] = {}
+        self._frame: Optional[FrameSnapshot] = None
+        self._frame_request_sent = float("-inf")
+        self.jpeg_cache = JpegFrameCache(
+            frame_number=self._frame_number,
+            snapshot=self.frame_snapshot,
+            tag=uuid.uuid4().hex[:12],
+        )
+
+    @property
+    def running(self) -> bool:
+        """Whether the simulation is loaded and its process alive."""
+        return self._loaded and self._process.is_alive()
+
+    @property
+    def telemetry(self) -> Optional[TelemetrySnapshot]:
+        """Latest telemetry published by the worker process."""
+        with self._lock:
+            ring = self._sensor_ring
+            cached = self._telemetry
+            if ring is None or (cached is not None and cached.seq == ring.latest_seq()):
+                return cached
+            entry = ring.read()
+        if entry is None:
+            return cached
+        size = self._nsensordata * 8
+        sensordata = entry.data[:size].view(np.float64)
+        sensordata.flags.writeable = False
+        status = json.loads(entry.data[size:].tobytes() or b"{}")
+        self._stats = status.get("stats", {})
+        telemetry = TelemetrySnapshot(
+            seq=entry.seq,
+            timestamp=entry.timestamp,
+            sim_time=entry.sim_time,
+            sensordata=sensordata,
+            task_status=status.get("task", {"active": False}),
+            navigator_status=status.get("nav", {}),
+        )
+        self._telemetry = telemetry
+        return telemetry
+
+    @property
+    def latest_sensors(self) -> dict:
+        """Latest sensor values by name."""
+        return self.format_sensors(self.telemetry)
+
+    def format_sensors(self, telemetry: Optional[TelemetrySnapshot]) -> dict:
+        """Build {name: value} (plus task/navigator fields) from a snapshot."""
+        return format_sensors(
+            self._layout, telemetry, self._has_task_runner, self._has_navigator
+        )
+
+    def _frame_number(self) -> int:
+        """Number of the newest frame in the ring (cheap, no copy)."""
+        with self._lock:
+            return self._frame_ring.latest_seq() if self._frame_ring is not None else 0
+
+    @property
+    def frame(self) -> Optional[FrameSnapshot]:
+        """Latest camera frame published by the worker process."""
+        with self._lock:
+            ring = self._frame_ring
+            cached = self._frame
+            if ring is None or (cached is not None and cached.number == ring.latest_seq()):
+                return cached
+            entry = ring.read()
+        if entry is None:
+            return cached
+        image = entry.data.reshape(CAMERA_HEIGHT, CAMERA_WIDTH, 3)
+        image.flags.writeable = False
+        frame = FrameSnapshot(
+            number=entry.seq, timestamp=entry.timestamp, sim_time=entry.sim_time, image=image
+        )
+        self._frame = frame
+        return frame
+
+    def frame_snapshot(self) -> Optional[Tuple[int, np.ndarray]]:
+        """Return (frame number, read-only image) of the latest frame, or None."""
+        frame = self.frame
+        return (frame.number, frame.image) if frame is not None else None
+
+    @property
+    def latest_image(self) -> Optional[np.ndarray]:
+        """Latest camera frame (read-only RGB array), or None."""
+        frame = self.frame
+        return frame.image if frame is not None else None
+
+    def request_frame(self):
+        """Note that a client wants camera frames (forwarded, rate-limited)."""
+        now = time.perf_counter()
+        if now - self._frame_request_sent < FRAME_REQUEST_INTERVAL or not self.running:
+            return
+        self._frame_request_sent = now
+        try:
+            self._process.send("request_frame")
+        except OSError as e:
+            logger.debug(f"Could not request frame: {e}")
+
+    def set_scene(self, scene: SceneSpec):
+        """Update the scene reference for the task runner."""
+        self._process.send("set_scene", scene.model_dump_json())
+
+    def start_task(self, task_name: str) -> bool:
+        """Start a task by name. Returns True if successful."""
+        try:
+            return bool(self._process.call("start_task", task_name))
+        except SimulationProcessError as e:
+            logger.warning(f"Could not start task '{task_name}': {e}")
+            return False
+
+    def stop_task(self):
+        """Stop the currently active task."""
+        self._process.send("stop_task")
+
+    def get_task_status(self) -> dict:
+        """Get task execution status as of the latest published tick."""
+        telemetry = self.telemetry
+        return telemetry.task_status if telemetry is not None else {"active": False}
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Whether the simulation has stopped (stop() waits for the unload)."""
+        return not self._loaded
+
+    def stop(self):
+        """Unload the simulation and return the process to the pool."""
+        if not self._loaded:
+            return
+        self._loaded = False
+        try:
+            self._process.call("unload")
+            reusable = True
+        except SimulationProcessError as e:
+            logger.warning(f"Simulation process did not unload cleanly: {e}")
+            reusable = False
+        with self._lock:
+            for ring in (self._sensor_ring, self._frame_ring):
+                if ring is not None:
+                    ring.close()
+            self._sensor_ring = self._frame_ring = None
+        if reusable:
+            self._pool.release(self._process)
+        else:
+            self._process.shutdown()
+
+
+def process_pool_from_env() -> Optional[SimulationProcessPool]:
+    """Create the pool requested by NEOSCENE_SIM_PROCESSES, if any.
+
+    Returns:
+        A pool keeping that many idle processes, or None (thread workers)
+        when the variable is unset, 0 or invalid.
+    """
+    value = os.getenv(PROCESSES_ENV, "").strip()
+    if not value:
+        return None
+    try:
+        count = int(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {PROCESSES_ENV}={value!r}")
+        return None
+    return SimulationProcessPool(max_idle=count) if count > 0 else None
@@ -1,65 +1,399 @@
 """Scene Session Manager - tracks scene sessions and manages MuJoCo viewers.
 
-MVP behavior: on each update, restart the viewer with the new scene.
-Uses subprocess to avoid MuJoCo viewer segfaults when restarting.
-Also runs a headless simulation worker for sensor/camera data.
+Each session has one long-lived viewer subprocess (a subprocess avoids
+MuJoCo viewer segfaults in the server). Scene updates are sent to it over
+a local socket and swapped into the open window (see state_viewer).
+Each scene is simulated once, by a headless simulation worker that feeds
+sensors and the camera; the viewer only displays the worker's state,
+which the worker publishes into shared memory.
 """
 
+import asyncio
+import concurrent.futures
+import math
 import os
 import subprocess
+import sys
 import tempfile
 import threading
 import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
+from multiprocessing.connection import Client, Connection
 from pathlib import Path
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
 
 import numpy as np
 
+from neoscene.backends.frame_cache import JpegFrameCache
+from neoscene.backends.shm_ring import ShmRing
+from neoscene.backends.state_viewer import STATE_SLOTS, VIEWER_AUTHKEY_ENV, new_viewer_address
+from neoscene.backends.step_scheduler import StepScheduler
 from neoscene.core.asset_catalog import AssetCatalog
 from neoscene.core.logging_config import get_logger
 from neoscene.core.scene_schema import SceneSpec
+from neoscene.core.tracing import span
 from neoscene.exporters.mjcf_exporter import scene_to_mjcf
 
+if TYPE_CHECKING:
+    from neoscene.backends.process_worker import SimulationProcessPool
+
 logger = get_logger(__name__)
 
 # Use EGL for GPU rendering, fall back to OSMesa for software rendering
 os.environ.setdefault("MUJOCO_GL", "egl")
 
+# Window over which the worker's step rate and real-time factor are measured
+RATE_WINDOW_SECONDS = 1.0
+
+# Default control/sensor ticks per wall-clock second
+TICK_HZ = 50.0
+
+# Camera frame size and default maximum frame rate
+CAMERA_HEIGHT = 240
+CAMERA_WIDTH = 320
+RENDER_FPS = 10.0
+
+# In on-demand mode, keep rendering this long after a client asks for a
+# frame, so polling and streaming clients get fresh frames
+FRAME_DEMAND_SECONDS = 2.0
+
+# Longest a caller waits for the simulation loop to run a queued command
+COMMAND_TIMEOUT_SECONDS = 1.0
+
+# Longest update_scene waits for a just-started viewer to accept connections
+VIEWER_CONNECT_TIMEOUT_SECONDS = 2.0
+
+# Longest update_scene waits for a new worker to load its model, and for
+# the previous worker's threads to finish
+WORKER_START_TIMEOUT_SECONDS = 30.0
+WORKER_STOP_TIMEOUT_SECONDS = 2.0
+
+
+# Walking gait per actuator kind: (name marker, amplitude, left phase, right
+# phase, clamp at zero). Controls are amplitude * sin(2 t + phase).
+GAIT_ACTUATORS = (
+    ("hip_ctrl", 20.0, 0.0, math.pi, False),
+    ("knee_ctrl", 30.0, 0.0, math.pi, True),
+    ("shoulder_ctrl", 15.0, math.pi, 0.0, False),
+)
+
+
+@dataclass
+class ActuatorMap:
+    """Actuator indices grouped by role, classified once from actuator names.
+
+    Attributes:
+        left_drive: Left wheel motors ("motor" and "_rl" in the name).
+        right_drive: Right wheel motors ("motor" and "_rr" in the name).
+        drive: All drive actuators ("motor" or "drive" in the name).
+        gait: Human gait actuators.
+        gait_amplitude: Gait amplitude per gait actuator.
+        gait_phase: Gait phase offset per gait actuator.
+        gait_clamp: Whether the gait control is clamped at zero (knees).
+    """
+
+    left_drive: np.ndarray
+    right_drive: np.ndarray
+    drive: np.ndarray
+    gait: np.ndarray
+    gait_amplitude: np.ndarray
+    gait_phase: np.ndarray
+    gait_clamp: np.ndarray
+
+    @classmethod
+    def from_model(cls, model) -> "ActuatorMap":
+        """Classify the actuators of a MuJoCo model.
+
+        Args:
+            model: The MjModel.
+
+        Returns:
+            The actuator map.
+        """
+        import mujoco
+
+        left, right, drive = [], [], []
+        gait, amplitude, phase, clamp = [], [], [], []
+        for i in range(model.nu):
+            name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_ACTUATOR, i)
+            if not name:
+                continue
+            name_lower = name.lower()
+            if "motor" in name_lower:
+                if "_rl" in name_lower:
+                    left.append(i)
+                elif "_rr" in name_lower:
+                    right.append(i)
+            if "motor" in name_lower or "drive" in name_lower:
+                drive.append(i)
+            for marker, gait_amplitude, left_phase, right_phase, gait_clamp in GAIT_ACTUATORS:
+                if marker in name_lower:
+                    gait.append(i)
+                    amplitude.append(gait_amplitude)
+                    phase.append(left_phase if "left" in name_lower else right_phase)
+                    clamp.append(gait_clamp)
+                    break
+
+        def indices(values: list) -> np.ndarray:
+            return np.array(values, dtype=np.intp)
+
+        return cls(
+            left_drive=indices(left),
+            right_drive=indices(right),
+            drive=indices(drive),
+            gait=indices(gait),
+            gait_amplitude=np.array(amplitude, dtype=np.float64),
+            gait_phase=np.array(phase, dtype=np.float64),
+            gait_clamp=np.array(clamp, dtype=bool),
+        )
+
+
+@dataclass
+class SensorLayout:
+    """Name, start address and dimension of each sensor in ``data.sensordata``."""
+
+    names: List[str]
+    adr: List[int]
+    dim: List[int]
+
+    @classmethod
+    def from_model(cls, model) -> "SensorLayout":
+        """Read the sensor layout of a MuJoCo model once.
+
+        Args:
+            model: The MjModel.
+
+        Returns:
+            The sensor layout.
+        """
+        import mujoco
+
+        names = []
+        for sid in range(model.nsensor):
+            name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_SENSOR, sid)
+            names.append(name if name is not None else f"sensor_{sid}")
+        return cls(names, model.sensor_adr.tolist(), model.sensor_dim.tolist())
+
+    def to_dict(self, values: np.ndarray) -> dict:
+        """Map a copy of ``sensordata`` to {name: value or list of values}."""
+        sensors = {}
+        for name, start, dim in zip(self.names, self.adr, self.dim):
+            if dim == 1:
+                sensors[name] = float(values[start])
+            else:
+                sensors[name] = values[start:start + dim].tolist()
+        return sensors
+
+
+@dataclass(frozen=True)
+class TelemetrySnapshot:
+    """Telemetry published by the simulation loop at the end of a tick.
+
+    Snapshots are never modified after publication: the loop builds a new
+    one each tick and swaps the worker's reference to it, so readers on
+    other threads get a consistent view without locks or copies.
+
+    Attributes:
+        seq: Publication number (1 for the first tick).
+        timestamp: Wall-clock time of publication (``time.time()``).
+        sim_time: Simulated time (``data.time``).
+        sensordata: Read-only copy of ``data.sensordata``.
+        task_status: TaskRunner status.
+        navigator_status: RowNavigator status.
+    """
+
+    seq: int
+    timestamp: float
+    sim_time: float
+    sensordata: np.ndarray
+    task_status: dict
+    navigator_status: dict
+
+
+@dataclass(frozen=True)
+class FrameSnapshot:
+    """A camera frame published by the render thread (never modified).
+
+    Attributes:
+        number: Frame number (1 for the first frame).
+        timestamp: Wall-clock time of publication (``time.time()``).
+        sim_time: Simulated time the frame shows.
+        image: Read-only RGB image.
+    """
+
+    number: int
+    timestamp: float
+    sim_time: float
+    image: np.ndarray
+
+
+def format_sensors(
+    layout: SensorLayout,
+    telemetry: Optional[TelemetrySnapshot],
+    has_task_runner: bool,
+    has_navigator: bool,
+) -> dict:
+    """Build {name: value} plus task/navigator fields from a telemetry snapshot.
+
+    Args:
+        layout: Sensor layout of the model.
+        telemetry: Snapshot to format, or None.
+        has_task_runner: Whether the worker has a TaskRunner.
+        has_navigator: Whether the worker has a RowNavigator.
+
+    Returns:
+        JSON-ready sensor values ({} if there is no snapshot).
+    """
+    if telemetry is None:
+        return {}
+    task_status = telemetry.task_status
+    navigator_status = telemetry.navigator_status
+    sensors = layout.to_dict(telemetry.sensordata)
+
+    # Add task status if active
+    if has_task_runner and task_status.get("active"):
+        ts = task_status
+        sensors["_task_name"] = ts.get("task_name", "")
+        sensors["_task_waypoint"] = f"{ts.get('waypoint_index', 0)}/{ts.get('total_waypoints', 0)}"
+        sensors["_task_distance"] = ts.get("distance_traveled", 0.0)
+    elif has_navigator:
+        # Fallback to navigator status if no task active
+        nav = navigator_status
+        sensors["_nav_state"] = nav.get("state", "OFF")
+        sensors["_nav_row"] = nav.get("row", 0)
+        sensors["_nav_lateral_error"] = nav.get("lateral_error", 0.0)
+
+    return sensors
+
 
 @dataclass
 class SimulationWorker:
     """Headless simulation worker that runs MuJoCo and collects sensor/camera data."""
     
     xml_path: str
+    scene: Optional[SceneSpec] = None  # Scene given to the TaskRunner at start
     running: bool = False
-    latest_sensors: dict = field(default_factory=dict)
-    latest_image: Optional[np.ndarray] = None
     navigator_status: dict = field(default_factory=dict)
     task_status: dict = field(default_factory=dict)
     _model: object = None
     _data: object = None
-    _renderer: object = None
     _render_error_logged: bool = False
     _navigator: object = None  # RowNavigator when in orchard mode
     _task_runner: object = None  # TaskRunner for path following
+    speed: Optional[float] = 1.0  # Target real-time factor, None = as fast as possible
+    tick_hz: float = TICK_HZ  # Control/sensor/camera ticks per wall-clock second
+    max_sim_time: Optional[float] = None  # Stop once simulated time reaches this
+    _scheduler: Optional[StepScheduler] = None
+    _actuators: Optional[ActuatorMap] = None
+    # Latest published telemetry and camera frame. Other threads only read
+    # these references; the loop and render threads replace them whole
+    telemetry: Optional[TelemetrySnapshot] = None
+    frame: Optional[FrameSnapshot] = None
+    _sensor_layout: Optional[SensorLayout] = None
+    # Commands from other threads (task control, scene), run by the loop
+    # between ticks. The lock makes submit's running check and append atomic
+    # with the final drain in _shutdown, so no command is left unresolved
+    _commands: Deque[Tuple[Callable[[], Any], concurrent.futures.Future]] = field(
+        default_factory=deque
+    )
+    _command_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    # Camera rendering runs on its own thread from a copy of the physics state
+    render_fps: float = RENDER_FPS  # Maximum frames per second (0 = no limit)
+    render_on_demand: bool = True  # Only render while clients request frames
+    _camera_idx: int = -1  # Camera to render, -1 when the model has none
+    _render_thread: Optional[threading.Thread] = None
+    _render_wake: threading.Event = field(default_factory=threading.Event)
+    _render_state: Optional[np.ndarray] = None
+    _next_render: float = 0.0
+    _frame_requested_at: float = float("-inf")
+    jpeg_cache: Optional[JpegFrameCache] = field(default=None, repr=False)
+    # Publish the physics state each tick into a shared-memory ring of this
+    # name, for display clients such as the viewer (see state_viewer)
+    state_ring_name: Optional[str] = None
+    _state_ring: Optional[ShmRing] = None
+    _state_buffer: Optional[np.ndarray] = None
+    # Telemetry: plain attributes written only by the loop thread and read
+    # by the metrics endpoint, so the loop never takes a lock for them
+    steps: int = 0
+    step_rate: float = 0.0  # mj_step calls per wall-clock second
+    realtime_factor: float = 0.0  # simulated seconds per wall-clock second
+    frames: int = 0
+    last_render_seconds: float = 0.0
+    render_seconds_total: float = 0.0
+    _rate_wall: float = 0.0
+    _rate_steps: int = 0
+    _rate_sim_time: float = 0.0
+    # Lifecycle of loop(): _ready is set once start() has finished (check
+    # _start_error for failure), _stopped once the loop and render threads
+    # are done and the state ring is removed
+    _ready: threading.Event = field(default_factory=threading.Event)
+    _stopped: threading.Event = field(default_factory=threading.Event)
+    _start_error: Optional[Exception] = None
+    _stop_requested: bool = False  # stop() called, possibly before start() ran
     
+    def __post_init__(self):
+        """Create the shared JPEG cache for this worker's frames."""
+        self.jpeg_cache = JpegFrameCache(
+            frame_number=lambda: self.frame.number if self.frame is not None else 0,
+            snapshot=self.frame_snapshot,
+            tag=uuid.uuid4().hex[:12],
+        )
+
     def start(self):
         """Initialize MuJoCo model and data."""
         import mujoco
         self._model = mujoco.MjModel.from_xml_path(self.xml_path)
         self._data = mujoco.MjData(self._model)
+        self._actuators = ActuatorMap.from_model(self._model)
+        self._sensor_layout = SensorLayout.from_model(self._model)
+        # Before _init_camera: the render thread it starts runs while this is set
         self.running = True
+        self._init_camera()
+        self._init_state_ring()
         
         # Initialize TaskRunner for path following
         self._init_task_runner()
+        if self._task_runner and self.scene is not None:
+            self._task_runner.set_scene(self.scene)
         
         # Check if we have trees - if so, enable row navigator (fallback when no task)
         self._init_navigator()
         
         logger.info(f"SimWorker started: ncam={self._model.ncam}, nsensor={self._model.nsensor}, navigator={'active' if self._navigator else 'off'}, task_runner={'ready' if self._task_runner else 'off'}")
     
+    def _init_state_ring(self):
+        """Create the shared-memory ring the physics state is published into."""
+        if self.state_ring_name is None:
+            return
+        import mujoco
+
+        size = mujoco.mj_stateSize(self._model, mujoco.mjtState.mjSTATE_INTEGRATION)
+        self._state_buffer = np.zeros(size)
+        try:
+            self._state_ring = ShmRing.create(
+                STATE_SLOTS, self._state_buffer.nbytes, name=self.state_ring_name
+            )
+        except OSError as e:
+            logger.warning(f"Could not create state ring '{self.state_ring_name}': {e}")
+
+    def _publish_state(self):
+        """Publish the physics state for display clients (one copy, no locks)."""
+        if self._state_ring is None:
+            return
+        import mujoco
+
+        spec = mujoco.mjtState.mjSTATE_INTEGRATION
+        mujoco.mj_getState(self._model, self._data, self._state_buffer, spec)
+        self._state_ring.write(self._state_buffer, time.time(), self._data.time)
+
+    def _close_state_ring(self):
+        """Remove the state ring (display clients keep their last state)."""
+        if self._state_ring is not None:
+            self._state_ring.close()
+            self._state_ring = None
+
     def _init_task_runner(self):
         """Initialize TaskRunner for path-following tasks."""
         try:
@@ -70,27 +404,77 @@ class SimulationWorker:
             logger.warning(f"Failed to init TaskRunner: {e}")
             self._task_runner = None
     
+    def submit(self, command: Callable[[], Any]) -> concurrent.futures.Future:
+        """Queue a command to run on the loop thread at the top of the next tick.
+
+        Commands run in submission order, never in the middle of a physics
+        step. While the loop is not running, the command runs immediately.
+
+        Args:
+            command: Callable run with no arguments.
+
+        Returns:
+            Future resolved with the command's result.
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        with self._command_lock:
+            if self.running:
+                self._commands.append((command, future))
+                return future
+        self._run_command(command, future)
+        return future
+
+    def _run_command(self, command: Callable[[], Any], future: concurrent.futures.Future):
+        """Run one command and resolve its future with the result or error."""
+        try:
+            future.set_result(command())
+        except Exception as e:
+            future.set_exception(e)
+
+    def _run_commands(self):
+        """Run the queued commands (loop thread only)."""
+        while True:
+            with self._command_lock:
+                if not self._commands:
+                    return
+                command, future = self._commands.popleft()
+            # Outside the lock: a command may submit further commands
+            self._run_command(command, future)
+
     def set_scene(self, scene: SceneSpec):
         """Update the scene reference for the task runner."""
-        if self._task_runner:
-            self._task_runner.set_scene(scene)
+        def command():
+            self.scene = scene
+            if self._task_runner:
+                self._task_runner.set_scene(scene)
+        self.submit(command)
     
     def start_task(self, task_name: str) -> bool:
-        """Start a task by name. Returns True if successful."""
-        if self._task_runner:
-            return self._task_runner.start_task(task_name)
-        return False
+        """Start a task by name. Returns True if successful.
+
+        Waits (up to COMMAND_TIMEOUT_SECONDS) for the loop to run the command.
+        """
+        def command() -> bool:
+            if self._task_runner:
+                return self._task_runner.start_task(task_name)
+            return False
+        try:
+            return self.submit(command).result(timeout=COMMAND_TIMEOUT_SECONDS)
+        except concurrent.futures.TimeoutError:
+            logger.warning(f"SimWorker: timed out starting task '{task_name}'")
+            return False
     
     def stop_task(self):
-        """Stop the currently active task."""
-        if self._task_runner:
-            self._task_runner.stop_task()
+        """Stop the currently active task (at the top of the next tick)."""
+        def command():
+            if self._task_runner:
+                self._task_runner.stop_task()
+        self.submit(command)
     
     def get_task_status(self) -> dict:
-        """Get current task execution status."""
-        if self._task_runner:
-            return self._task_runner.get_status()
-        return {"active": False}
+        """Get task execution status as of the latest published tick."""
+        telemetry = self.telemetry
+        return telemetry.task_status if telemetry is not None else {"active": False}
     
     def _init_navigator(self):
         """Initialize row navigator if trees are present."""
@@ -114,29 +498,124 @@ class SimulationWorker:
                 logger.warning(f"Failed to init RowNavigator: {e}")
                 self._navigator = None
     
+    @property
+    def overruns(self) -> int:
+        """Ticks on which the physics backlog was too large and was dropped."""
+        return self._scheduler.overruns if self._scheduler else 0
+
+    @property
+    def dropped_ticks(self) -> int:
+        """Ticks (sensor/camera frames) skipped because the loop ran late."""
+        return self._scheduler.dropped_ticks if self._scheduler else 0
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait until loop() has loaded the model and is about to step.
+
+        Args:
+            timeout: Longest wait in seconds (None waits indefinitely).
+
+        Returns:
+            True if the worker started; False if it failed to start or
+            did not finish starting within the timeout.
+        """
+        return self._ready.wait(timeout) and self._start_error is None
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until loop() has returned and the render thread has finished.
+
+        Args:
+            timeout: Longest wait in seconds (None waits indefinitely).
+
+        Returns:
+            True if the worker has stopped.
+        """
+        return self._stopped.wait(timeout)
+
     def loop(self):
-        """Main simulation loop - runs at ~50Hz."""
-        import mujoco
-        
+        """Main simulation loop.
+
+        Runs at tick_hz wall-clock ticks. Each tick runs as many physics
+        substeps as needed to keep simulated time at ``speed`` times wall
+        time (see StepScheduler), then reads sensors and renders once.
+        Signals wait_ready() once started and join() once finished.
+        """
         try:
             self.start()
         except Exception as e:
             logger.error(f"SimWorker failed to start: {e}")
+            self._start_error = e
+            self.stop()  # Ends a render thread started before the failure
+            self._run_commands()  # Submitted while start() had set running
+            self._stopped.set()
+            self._ready.set()
             return
+        self._ready.set()
+        try:
+            if not self._stop_requested:
+                self._run_loop()
+        finally:
+            self._shutdown()
+
+    def _run_loop(self):
+        """Step, publish and render until stopped (loop thread)."""
+        import mujoco
         
+        m = self._model
+        d = self._data
+        scheduler = StepScheduler(m.opt.timestep, speed=self.speed, tick_hz=self.tick_hz)
+        self._scheduler = scheduler
+        self._rate_wall = time.perf_counter()
+        scheduler.reset(self._rate_wall, d.time)
         while self.running:
             try:
-                self._apply_controls()
-                mujoco.mj_step(self._model, self._data)
+                self._run_commands()
+                substeps = scheduler.plan(time.perf_counter(), d.time)
+                for _ in range(substeps):
+                    self._apply_controls()
+                    mujoco.mj_step(m, d)
+                self.steps += substeps
+                self._update_rates()
                 self._read_sensors()
-                self._render_camera()
-                time.sleep(0.02)  # 50 Hz
+                self._publish_state()
+                self._request_render()
+                if self.max_sim_time is not None and d.time >= self.max_sim_time:
+                    self.stop()
+                    break
+                # sleep(0) in fast mode still yields the GIL to the API threads
+                time.sleep(scheduler.sleep_time(time.perf_counter()))
             except Exception as e:
                 logger.error(f"SimWorker loop error: {e}")
                 break
         
-        logger.info("SimWorker stopped")
+        logger.info(
+            f"SimWorker stopped: sim_time={d.time:.2f}s, steps={self.steps}, "
+            f"rtf={self.realtime_factor:.2f}, overruns={self.overruns}, "
+            f"dropped_ticks={self.dropped_ticks}"
+        )
     
+    def _shutdown(self):
+        """Finish queued commands, stop the render thread and signal join()."""
+        # Nothing steps any more: run commands queued while stopping
+        self.stop()
+        self._run_commands()
+        self._close_state_ring()
+        if self._render_thread is not None:
+            self._render_thread.join(timeout=WORKER_STOP_TIMEOUT_SECONDS)
+        self._stopped.set()
+
+    def _update_rates(self):
+        """Refresh step rate and real-time factor about once per second."""
+        now = time.perf_counter()
+        elapsed = now - self._rate_wall
+        if elapsed < RATE_WINDOW_SECONDS:
+            return
+        sim_time = self._data.time
+        self.step_rate = (self.steps - self._rate_steps) / elapsed
+        self.realtime_factor = (sim_time - self._rate_sim_time) / elapsed
+        self._rate_wall = now
+        self._rate_steps = self.steps
+        self._rate_sim_time = sim_time
+
     def _apply_controls(self):
         """Apply control inputs to actuators for motion.
         
@@ -145,13 +624,13 @@ class SimulationWorker:
         2. Else if RowNavigator is active: use autonomous navigation
         3. Otherwise: simple demo motion for wheels
         
-        Human walking gait is always applied separately.
+        Human walking gait is always applied separately. Actuators are
+        classified once at start (see ActuatorMap), so each call is a few
+        vectorized writes to ``d.ctrl``.
         """
-        import mujoco
-        import math
-        
         m = self._model
         d = self._data
+        actuators = self._actuators
         dt = m.opt.timestep
         t = d.time
         
@@ -168,142 +647,172 @@ class SimulationWorker:
         # Priority 2: RowNavigator (autonomous orchard navigation, when no task)
         if not tractor_controlled and self._navigator is not None:
             v, omega = self._navigator.step(m, d, dt)
-            # Apply controls manually
+            # Differential drive: left (rl = rear left) and right (rr = rear right) motors
             wheelbase = 1.5
-            v_left = v - 0.5 * wheelbase * omega
-            v_right = v + 0.5 * wheelbase * omega
-            
-            # Find and set motor controls
-            for i in range(m.nu):
-                name = mujoco.mj_id2name(m, mujoco.mjtObj.mjOBJ_ACTUATOR, i)
-                if not name:
-                    continue
-                name_lower = name.lower()
-                
-                if 'motor' in name_lower:
-                    # Left motors (rl = rear left)
-                    if '_rl' in name_lower:
-                        d.ctrl[i] = v_left
-                    # Right motors (rr = rear right)
-                    elif '_rr' in name_lower:
-                        d.ctrl[i] = v_right
+            d.ctrl[actuators.left_drive] = v - 0.5 * wheelbase * omega
+            d.ctrl[actuators.right_drive] = v + 0.5 * wheelbase * omega
             
             self.navigator_status = self._navigator.get_status()
             tractor_controlled = True
         
         # Priority 3: Fallback - simple forward motion if no other controller
         if not tractor_controlled:
-            for i in range(m.nu):
-                name = mujoco.mj_id2name(m, mujoco.mjtObj.mjOBJ_ACTUATOR, i)
-                if not name:
-                    continue
-                name_lower = name.lower()
-                
-                if 'motor' in name_lower or 'drive' in name_lower:
-                    d.ctrl[i] = 2.0  # Forward at ~1 m/s
+            d.ctrl[actuators.drive] = 2.0  # Forward at ~1 m/s
         
         # Human walking gait (always active for any humans)
-        for i in range(m.nu):
-            name = mujoco.mj_id2name(m, mujoco.mjtObj.mjOBJ_ACTUATOR, i)
-            if not name:
-                continue
-            name_lower = name.lower()
-            
-            if 'hip_ctrl' in name_lower:
-                phase = 0 if 'left' in name_lower else math.pi
-                d.ctrl[i] = 20.0 * math.sin(2.0 * t + phase)
-            elif 'knee_ctrl' in name_lower:
-                phase = 0 if 'left' in name_lower else math.pi
-                d.ctrl[i] = 30.0 * max(0, math.sin(2.0 * t + phase))
-            elif 'shoulder_ctrl' in name_lower:
-                phase = math.pi if 'left' in name_lower else 0
-                d.ctrl[i] = 15.0 * math.sin(2.0 * t + phase)
+        if actuators.gait.size:
+            gait = np.sin(2.0 * t + actuators.gait_phase)
+            gait = np.where(actuators.gait_clamp, np.maximum(gait, 0.0), gait)
+            d.ctrl[actuators.gait] = actuators.gait_amplitude * gait
     
     def _read_sensors(self):
-        """Read all sensor values from the simulation."""
-        import mujoco
-        
-        m = self._model
-        d = self._data
-        sensors = {}
-        
-        for sid in range(m.nsensor):
-            name = mujoco.mj_id2name(m, mujoco.mjtObj.mjOBJ_SENSOR, sid)
-            if name is None:
-                name = f"sensor_{sid}"
-            # Get sensor dimension and address
-            dim = m.sensor_dim[sid]
-            start = m.sensor_adr[sid]
-            
-            if dim == 1:
-                sensors[name] = float(d.sensordata[start])
-            else:
-                sensors[name] = [float(d.sensordata[start + i]) for i in range(dim)]
-        
-        # Add task status if active
-        if self._task_runner is not None and self.task_status.get("active"):
-            ts = self.task_status
-            sensors["_task_name"] = ts.get("task_name", "")
-            sensors["_task_waypoint"] = f"{ts.get('waypoint_index', 0)}/{ts.get('total_waypoints', 0)}"
-            sensors["_task_distance"] = ts.get("distance_traveled", 0.0)
-        elif self._navigator is not None:
-            # Fallback to navigator status if no task active
-            nav = self.navigator_status
-            sensors["_nav_state"] = nav.get("state", "OFF")
-            sensors["_nav_row"] = nav.get("row", 0)
-            sensors["_nav_lateral_error"] = nav.get("lateral_error", 0.0)
-        
-        self.latest_sensors = sensors
+        """Publish this tick's telemetry as a new TelemetrySnapshot.
+
+        One NumPy copy of ``sensordata``; names and JSON-ready values are
+        only built when a client reads latest_sensors.
+        """
+        sensordata = self._data.sensordata.copy()
+        sensordata.flags.writeable = False
+        previous = self.telemetry
+        self.telemetry = TelemetrySnapshot(
+            seq=previous.seq + 1 if previous is not None else 1,
+            timestamp=time.time(),
+            sim_time=self._data.time,
+            sensordata=sensordata,
+            task_status=self.task_status,
+            navigator_status=self.navigator_status,
+        )
+
+    @property
+    def latest_sensors(self) -> dict:
+        """Latest sensor values by name, built from the published snapshot."""
+        return self.format_sensors(self.telemetry)
+
+    def format_sensors(self, telemetry: Optional[TelemetrySnapshot]) -> dict:
+        """Build {name: value} (plus task/navigator fields) from a snapshot."""
+        return format_sensors(
+            self._sensor_layout,
+            telemetry,
+            has_task_runner=self._task_runner is not None,
+            has_navigator=self._navigator is not None,
+        )
     
-    def _render_camera(self):
-        """Render camera view to image (if cameras exist)."""
+    def _init_camera(self):
+        """Pick the camera to render and start the render thread."""
         import mujoco
         
         m = self._model
-        d = self._data
-        
-        # Check if there are any cameras
         if m.ncam == 0:
             return
         
         # Find the best camera to use (prefer vehicle-mounted cameras)
-        camera_idx = 0
+        self._camera_idx = 0
         for i in range(m.ncam):
             name = mujoco.mj_id2name(m, mujoco.mjtObj.mjOBJ_CAMERA, i)
             if name and ('driver' in name.lower() or 'rear' in name.lower()):
-                camera_idx = i
+                self._camera_idx = i
                 break
         
-        # Initialize renderer if needed
-        if self._renderer is None:
-            try:
-                self._renderer = mujoco.Renderer(m, height=240, width=320)
-                cam_name = mujoco.mj_id2name(m, mujoco.mjtObj.mjOBJ_CAMERA, camera_idx)
-                logger.info(f"Camera renderer: using '{cam_name}' ({m.ncam} total)")
-            except Exception as e:
-                if not self._render_error_logged:
-                    logger.warning(f"Could not create camera renderer: {e}")
-                    self._render_error_logged = True
-                return
+        state_size = mujoco.mj_stateSize(m, mujoco.mjtState.mjSTATE_INTEGRATION)
+        self._render_state = np.zeros(state_size)
+        self._render_thread = threading.Thread(target=self._render_loop, daemon=True)
+        self._render_thread.start()
+
+    def request_frame(self):
+        """Note that a client wants camera frames (used in on-demand mode)."""
+        self._frame_requested_at = time.perf_counter()
+
+    def _request_render(self):
+        """Hand the current state to the render thread if a frame is due.
+
+        Called by the physics loop after each tick. Skipped while the render
+        thread is still busy with the previous frame, so rendering never
+        throttles physics.
+        """
+        if self._render_thread is None or self._render_wake.is_set():
+            return
+        now = time.perf_counter()
+        if now < self._next_render:
+            return
+        if self.render_on_demand and now - self._frame_requested_at > FRAME_DEMAND_SECONDS:
+            return
+        import mujoco
+
+        self._next_render = now + (1.0 / self.render_fps if self.render_fps > 0 else 0.0)
+        spec = mujoco.mjtState.mjSTATE_INTEGRATION
+        mujoco.mj_getState(self._model, self._data, self._render_state, spec)
+        self._render_wake.set()
+
+    def _render_loop(self):
+        """Render thread: renders camera frames from state copies.
         
+        The renderer's GL context belongs to this thread, and it renders
+        from its own MjData, so it never reads the data physics is stepping.
+        """
+        import mujoco
+
+        m = self._model
+        data = mujoco.MjData(m)
+        spec = mujoco.mjtState.mjSTATE_INTEGRATION
         try:
-            # Update scene and render
-            self._renderer.update_scene(d, camera=camera_idx)
-            self.latest_image = self._renderer.render()
+            renderer = mujoco.Renderer(m, height=CAMERA_HEIGHT, width=CAMERA_WIDTH)
+            cam_name = mujoco.mj_id2name(m, mujoco.mjtObj.mjOBJ_CAMERA, self._camera_idx)
+            logger.info(f"Camera renderer: using '{cam_name}' ({m.ncam} total)")
         except Exception as e:
-            if not self._render_error_logged:
-                logger.warning(f"Camera render error: {e}")
-                self._render_error_logged = True
+            logger.warning(f"Could not create camera renderer: {e}")
+            return
+
+        try:
+            while self.running:
+                if not self._render_wake.wait(timeout=0.5) or not self.running:
+                    continue
+                mujoco.mj_setState(m, data, self._render_state, spec)
+                # The state buffer is free again: physics may queue the next frame
+                self._render_wake.clear()
+                try:
+                    start = time.perf_counter()
+                    mujoco.mj_forward(m, data)
+                    renderer.update_scene(data, camera=self._camera_idx)
+                    self._publish_frame(renderer, data.time)
+                    elapsed = time.perf_counter() - start
+                    self.frames += 1
+                    self.last_render_seconds = elapsed
+                    self.render_seconds_total += elapsed
+                except Exception as e:
+                    if not self._render_error_logged:
+                        logger.warning(f"Camera render error: {e}")
+                        self._render_error_logged = True
+        finally:
+            renderer.close()
+
+    def _publish_frame(self, renderer, sim_time: float):
+        """Render a new image and publish it as the latest FrameSnapshot."""
+        image = renderer.render()
+        image.flags.writeable = False
+        previous = self.frame
+        self.frame = FrameSnapshot(
+            number=previous.number + 1 if previous is not None else 1,
+            timestamp=time.time(),
+            sim_time=sim_time,
+            image=image,
+        )
+
+    def frame_snapshot(self) -> Optional[Tuple[int, np.ndarray]]:
+        """Return (frame number, read-only image) of the latest frame, or None."""
+        frame = self.frame
+        return (frame.number, frame.image) if frame is not None else None
+
+    @property
+    def latest_image(self) -> Optional[np.ndarray]:
+        """Latest camera frame (read-only RGB array), or None."""
+        frame = self.frame
+        return frame.image if frame is not None else None
     
     def stop(self):
-        """Stop the simulation loop."""
+        """Stop the simulation loop and the render thread (see join())."""
+        self._stop_requested = True
         self.running = False
-        if self._renderer is not None:
-            try:
-                self._renderer.close()
-            except Exception:
-                pass
-            self._renderer = None
+        self._render_wake.set()
 
 
 @dataclass
@@ -313,28 +822,46 @@ class SceneSession:
     session_id: str
     last_scene: Optional[SceneSpec] = None
     viewer_process: Optional[subprocess.Popen] = None
+    viewer_address: Optional[str] = None
+    viewer_conn: Optional[Connection] = None
     temp_xml_path: Optional[Path] = None
     sim_worker: Optional[SimulationWorker] = None
     sim_thread: Optional[threading.Thread] = None
+    # Serializes scene updates, which run on worker threads
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
 
 
 class SceneSessionManager:
     """Keeps track of scene sessions and manages MuJoCo viewers for each.
 
-    MVP behavior: on each update, restart the viewer with the new scene.
-    Uses subprocess to avoid segfaults when restarting viewers.
-    Also starts a headless simulation worker for sensor/camera polling.
+    Each session's viewer process is started with its first scene and
+    kept: later scenes are loaded into the same window.
+    Also starts a headless simulation worker for sensor/camera polling,
+    whose published state is what the viewer displays.
     """
 
-    def __init__(self, asset_root: Path):
+    def __init__(
+        self,
+        asset_root: Path,
+        sim_speed: Optional[float] = 1.0,
+        process_pool: Optional["SimulationProcessPool"] = None,
+    ):
         """Initialize the session manager.
 
         Args:
             asset_root: Path to the assets directory.
+            sim_speed: Target real-time factor of the simulation workers
+                (None runs them as fast as possible).
+            process_pool: Run simulations in these worker processes instead
+                of threads of this process (see process_worker).
         """
         self.asset_root = asset_root
+        self.sim_speed = sim_speed
+        self.process_pool = process_pool
         self.catalog = AssetCatalog(asset_root)
         self._sessions: Dict[str, SceneSession] = {}
+        # Viewer processes only accept load requests authenticated with this key
+        self._viewer_authkey = os.urandom(16)
 
     def get_or_create_session(self, session_id: Optional[str]) -> SceneSession:
         """Get existing session or create a new one.
@@ -358,12 +885,27 @@ class SceneSessionManager:
         """Get a session by ID without creating a new one."""
         return self._sessions.get(session_id)
 
+    def session_count(self) -> int:
+        """Number of sessions."""
+        return len(self._sessions)
+
+    def sim_workers(self) -> Dict[str, SimulationWorker]:
+        """Return the running simulation worker of each session, by session ID."""
+        return {
+            session_id: session.sim_worker
+            for session_id, session in list(self._sessions.items())
+            if session.sim_worker is not None
+        }
+
     def _generate_session_id(self) -> str:
         """Generate a unique session ID."""
         return str(uuid.uuid4())
 
     def _kill_viewer(self, session: SceneSession) -> None:
         """Kill the viewer process for a session."""
+        if session.viewer_conn is not None:
+            session.viewer_conn.close()
+            session.viewer_conn = None
         if session.viewer_process and session.viewer_process.poll() is None:
             try:
                 session.viewer_process.terminate()
@@ -373,13 +915,24 @@ class SceneSessionManager:
             except Exception:
                 pass
         session.viewer_process = None
+        # A killed viewer cannot remove its socket file
+        if session.viewer_address and os.path.exists(session.viewer_address):
+            try:
+                os.unlink(session.viewer_address)
+            except OSError:
+                pass
+        session.viewer_address = None
     
     def _stop_sim_worker(self, session: SceneSession) -> None:
-        """Stop the simulation worker for a session."""
-        if session.sim_worker:
-            session.sim_worker.stop()
-        if session.sim_thread and session.sim_thread.is_alive():
-            session.sim_thread.join(timeout=1)
+        """Stop the simulation worker for a session and wait for it to finish."""
+        worker = session.sim_worker
+        if worker:
+            worker.stop()
+            if not worker.join(timeout=WORKER_STOP_TIMEOUT_SECONDS):
+                logger.warning(
+                    f"[{session.session_id}] Sim worker did not stop within "
+                    f"{WORKER_STOP_TIMEOUT_SECONDS}s"
+                )
         session.sim_worker = None
         session.sim_thread = None
 
@@ -392,80 +945,151 @@ class SceneSessionManager:
                 pass
         session.temp_xml_path = None
 
+    def _spawn_viewer(self, xml_path: Path, state_ring: str, address: str) -> subprocess.Popen:
+        """Start a viewer process showing xml_path and listening on address."""
+        # Let the child import neoscene even when it is not installed
+        package_root = str(Path(__file__).resolve().parents[2])
+        pythonpath = os.pathsep.join(filter(None, [package_root, os.getenv("PYTHONPATH")]))
+        return subprocess.Popen(
+            [
+                sys.executable, "-m", "neoscene.backends.state_viewer",
+                str(xml_path), state_ring, "--listen", address,
+            ],
+            env={
+                **os.environ,
+                "PYTHONPATH": pythonpath,
+                VIEWER_AUTHKEY_ENV: self._viewer_authkey.hex(),
+            },
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def _send_to_viewer(self, session: SceneSession, message: tuple) -> bool:
+        """Send a request to the session's viewer process.
+
+        Connects on first use, waiting up to VIEWER_CONNECT_TIMEOUT_SECONDS
+        for a viewer that is still starting to listen.
+
+        Returns:
+            True if the request was sent, False if there is no live viewer.
+        """
+        process = session.viewer_process
+        if process is None or process.poll() is not None or session.viewer_address is None:
+            return False
+        if session.viewer_conn is None:
+            deadline = time.monotonic() + VIEWER_CONNECT_TIMEOUT_SECONDS
+            while session.viewer_conn is None:
+                try:
+                    session.viewer_conn = Client(
+                        session.viewer_address, authkey=self._viewer_authkey
+                    )
+                except (FileNotFoundError, ConnectionRefusedError):
+                    if time.monotonic() > deadline or process.poll() is not None:
+                        return False
+                    time.sleep(0.05)
+        try:
+            session.viewer_conn.send(message)
+            return True
+        except (OSError, EOFError):
+            session.viewer_conn.close()
+            session.viewer_conn = None
+            return False
+
+    def _show_in_viewer(self, session: SceneSession, xml_path: Path, state_ring: str) -> None:
+        """Load a scene into the session's viewer, starting one if none is running."""
+        with span("viewer_load"):
+            if self._send_to_viewer(session, ("load", str(xml_path), state_ring)):
+                return
+        with span("viewer_spawn"):
+            self._kill_viewer(session)
+            session.viewer_address = new_viewer_address()
+            session.viewer_process = self._spawn_viewer(
+                xml_path, state_ring, session.viewer_address
+            )
+
+    async def update_scene_async(self, session: SceneSession, scene: SceneSpec) -> None:
+        """Async wrapper for update_scene; runs it in a thread, off the event loop."""
+        await asyncio.to_thread(self.update_scene, session, scene)
+
     def update_scene(self, session: SceneSession, scene: SceneSpec) -> None:
-        """Store scene and (re)start the MuJoCo viewer for this session.
+        """Store scene, restart its simulation worker and show it in the viewer.
+
+        The worker feeds sensor/camera data; the session's viewer (started
+        on the first update and kept afterwards) swaps in the new model and
+        displays the worker's simulation instead of running its own.
 
-        Also starts a headless simulation worker for sensor/camera data.
+        Blocks until the old worker has stopped and the new one has loaded
+        its model (or failed to), so call it from a worker thread, e.g.
+        through update_scene_async. Updates of one session are serialized.
 
         Args:
             session: The session to update.
             scene: The new scene specification.
         """
+        with session.lock:
+            self._update_scene(session, scene)
+
+    def _update_scene(self, session: SceneSession, scene: SceneSpec) -> None:
+        """Replace the session's scene (caller holds session.lock)."""
         session.last_scene = scene
 
-        # Kill old viewer and sim worker
-        self._kill_viewer(session)
-        self._stop_sim_worker(session)
-        self._cleanup_temp_file(session)
+        # Stop the old sim worker; the viewer keeps showing its last state
+        with span("sim_worker_stop"):
+            self._stop_sim_worker(session)
+            self._cleanup_temp_file(session)
 
         # Generate MJCF and write to temp file
         xml = scene_to_mjcf(scene, self.catalog)
         
         # Create a persistent temp file (won't be deleted on close)
-        temp_file = tempfile.NamedTemporaryFile(
-            mode="w", suffix=".xml", delete=False, prefix="neoscene_"
-        )
-        temp_file.write(xml)
-        temp_file.close()
+        with span("temp_write"):
+            temp_file = tempfile.NamedTemporaryFile(
+                mode="w", suffix=".xml", delete=False, prefix="neoscene_"
+            )
+            temp_file.write(xml)
+            temp_file.close()
         session.temp_xml_path = Path(temp_file.name)
 
-        # 1) Launch viewer in subprocess with UI hidden by default
-        viewer_script = f'''
-import mujoco
-import mujoco.viewer
-import time
-
-model = mujoco.MjModel.from_xml_path("{session.temp_xml_path}")
-data = mujoco.MjData(model)
-
-with mujoco.viewer.launch_passive(model, data) as viewer:
-    # Hide the UI panels (equivalent to pressing Tab)
-    viewer.opt.flags[mujoco.mjtVisFlag.mjVIS_COM] = False
-    viewer.opt.flags[mujoco.mjtVisFlag.mjVIS_JOINT] = False
-    
-    # Set a nicer camera position
-    viewer.cam.azimuth = -45
-    viewer.cam.elevation = -25
-    viewer.cam.distance = 30
-    viewer.cam.lookat[:] = [10, 10, 0]
-    
-    while viewer.is_running():
-        mujoco.mj_step(model, data)
-        viewer.sync()
-        time.sleep(model.opt.timestep)
-'''
-        
+        # 1) Show the scene in the viewer. It does not simulate: it shows the
+        # state the worker publishes into this shared-memory ring, and waits
+        # for the ring if the worker is not publishing yet
+        state_ring = f"neoscene_{uuid.uuid4().hex[:16]}"
         try:
-            session.viewer_process = subprocess.Popen(
-                ["python", "-c", viewer_script],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-        except Exception:
-            pass
+            self._show_in_viewer(session, session.temp_xml_path, state_ring)
+        except Exception as e:
+            logger.debug(f"Could not show scene in viewer: {e}")
 
         # 2) Start headless simulation worker for sensors/cameras
+        if self.process_pool is not None:
+            try:
+                with span("sim_worker_start"):
+                    session.sim_worker = self.process_pool.start_worker(
+                        str(session.temp_xml_path),
+                        speed=self.sim_speed,
+                        state_ring_name=state_ring,
+                        scene=scene,
+                    )
+            except Exception as e:
+                logger.warning(f"Failed to start sim worker process: {e}")
+            return
+
         try:
-            worker = SimulationWorker(xml_path=str(session.temp_xml_path))
-            sim_thread = threading.Thread(target=worker.loop, daemon=True)
-            session.sim_worker = worker
-            session.sim_thread = sim_thread
-            sim_thread.start()
-            
-            # Give worker time to initialize, then set scene for TaskRunner
-            time.sleep(0.2)
-            if session.sim_worker and session.sim_worker.running:
-                session.sim_worker.set_scene(scene)
+            with span("sim_worker_start"):
+                # The TaskRunner gets the scene when the worker starts
+                worker = SimulationWorker(
+                    xml_path=str(session.temp_xml_path),
+                    speed=self.sim_speed,
+                    state_ring_name=state_ring,
+                    scene=scene,
+                )
+                sim_thread = threading.Thread(target=worker.loop, daemon=True)
+                session.sim_worker = worker
+                session.sim_thread = sim_thread
+                sim_thread.start()
+
+            with span("sim_worker_ready"):
+                if not worker.wait_ready(timeout=WORKER_START_TIMEOUT_SECONDS):
+                    logger.warning(f"[{session.session_id}] Sim worker did not start")
         except Exception as e:
             logger.warning(f"Failed to start sim worker: {e}")
 
@@ -505,12 +1129,20 @@ with mujoco.viewer.launch_passive(model, data) as viewer:
         """Get latest sensor values for a session.
         
         Returns:
-            Dict with 'ok' boolean and 'sensors' dict.
+            Dict with 'ok' boolean and 'sensors' dict, plus the snapshot's
+            'seq', 'timestamp' and 'sim_time' once the worker has published.
         """
         session = self.get_session(session_id)
         if not session or not session.sim_worker:
             return {"ok": False, "sensors": {}}
-        return {"ok": True, "sensors": session.sim_worker.latest_sensors}
+        worker = session.sim_worker
+        telemetry = worker.telemetry
+        result = {"ok": True, "sensors": worker.format_sensors(telemetry)}
+        if telemetry is not None:
+            result.update(
+                seq=telemetry.seq, timestamp=telemetry.timestamp, sim_time=telemetry.sim_time
+            )
+        return result
     
     def get_camera_image(self, session_id: str) -> Optional[np.ndarray]:
         """Get latest camera image for a session.
@@ -521,8 +1153,23 @@ with mujoco.viewer.launch_passive(model, data) as viewer:
         session = self.get_session(session_id)
         if not session or not session.sim_worker:
             return None
+        session.sim_worker.request_frame()
         return session.sim_worker.latest_image
     
+    def get_camera_frames(self, session_id: str) -> Optional[JpegFrameCache]:
+        """Get the encode-once JPEG cache of a session's camera.
+
+        Also asks the worker to keep rendering frames (on-demand mode).
+
+        Returns:
+            The worker's JpegFrameCache, or None if no worker is running.
+        """
+        session = self.get_session(session_id)
+        if not session or not session.sim_worker:
+            return None
+        session.sim_worker.request_frame()
+        return session.sim_worker.jpeg_cache
+
     def start_task(self, session_id: str, task_name: str) -> bool:
         """Start a task by name for a session.
         
@@ -537,10 +1184,13 @@ with mujoco.viewer.launch_passive(model, data) as viewer:
         if not session or not session.sim_worker or not session.last_scene:
             return False
         
-        # Ensure TaskRunner has the current scene
-        session.sim_worker.set_scene(session.last_scene)
+        # The worker was created with session.last_scene
         return session.sim_worker.start_task(task_name)
     
+    async def start_task_async(self, session_id: str, task_name: str) -> bool:
+        """Async wrapper for start_task; waits for the worker in a thread, off the event loop."""
+        return await asyncio.to_thread(self.start_task, session_id, task_name)
+
     def stop_task(self, session_id: str) -> None:
         """Stop the active task for a session."""
         session = self.get_session(session_id)
@@ -561,3 +1211,5 @@ with mujoco.viewer.launch_passive(model, data) as viewer:
             self._stop_sim_worker(session)
             self._cleanup_temp_file(session)
         self._sessions.clear()
+        if self.process_pool is not None:
+            self.process_pool.shutdown()
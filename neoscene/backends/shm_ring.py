@@ -0,0 +1,191 @@
+"""Single-writer ring buffers in shared memory.
+
+Used by out-of-process simulation workers to publish sensors and camera
+frames to the API process without pickling or pipes. One
+``multiprocessing.shared_memory`` segment holds a header and ``slots``
+fixed-size slots:
+
+    int64 latest        sequence number of the newest complete slot (0 = none)
+    int64 seq[slots]    sequence number stored in each slot (-1 while written)
+    float64 meta[slots, 3]   timestamp, sim_time, payload length
+    uint8 payload[slots, slot_size]
+
+The writer fills slot ``seq % slots``, marking it -1 while it is being
+written, then publishes ``latest``. Readers copy the newest slot and
+accept the copy only if its slot sequence number is unchanged afterwards
+(a seqlock), so neither side ever blocks the other. With several slots a
+reader has ``slots - 1`` writes' worth of time before its slot is reused.
+"""
+
+import sys
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import Optional
+
+import numpy as np
+
+# Attempts at a consistent read before giving up (each retry sees a newer slot)
+READ_ATTEMPTS = 100
+
+
+@dataclass(frozen=True)
+class RingEntry:
+    """One slot read from a ring.
+
+    Attributes:
+        seq: Sequence number (1 for the first write).
+        timestamp: Wall-clock time given by the writer.
+        sim_time: Simulated time given by the writer.
+        data: Copy of the payload bytes.
+    """
+
+    seq: int
+    timestamp: float
+    sim_time: float
+    data: np.ndarray
+
+
+class ShmRing:
+    """A shared-memory ring buffer with one writer and any number of readers."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, slots: int, slot_size: int, owner: bool):
+        """Map a ring onto a shared memory segment (use create() or attach()).
+
+        Args:
+            shm: The shared memory segment.
+            slots: Number of slots.
+            slot_size: Payload bytes per slot.
+            owner: Whether this side created the segment and unlinks it on close.
+        """
+        self.shm = shm
+        self.slots = slots
+        self.slot_size = slot_size
+        self.owner = owner
+        buf = shm.buf
+        offset = 0
+        self._latest = np.ndarray((1,), dtype=np.int64, buffer=buf, offset=offset)
+        offset += 8
+        self._seq = np.ndarray((slots,), dtype=np.int64, buffer=buf, offset=offset)
+        offset += 8 * slots
+        self._meta = np.ndarray((slots, 3), dtype=np.float64, buffer=buf, offset=offset)
+        offset += 24 * slots
+        self._payload = np.ndarray((slots, slot_size), dtype=np.uint8, buffer=buf, offset=offset)
+
+    @staticmethod
+    def nbytes(slots: int, slot_size: int) -> int:
+        """Segment size needed for a ring."""
+        return 8 + 32 * slots + slots * slot_size
+
+    @classmethod
+    def create(cls, slots: int, slot_size: int, name: Optional[str] = None) -> "ShmRing":
+        """Create a new ring in a new shared memory segment.
+
+        Args:
+            slots: Number of slots (at least 2).
+            slot_size: Payload bytes per slot.
+            name: Segment name, so readers can attach before being told
+                it (default: a random name).
+
+        Returns:
+            The ring, owned by the caller.
+
+        Raises:
+            ValueError: If there are fewer than two slots.
+        """
+        if slots < 2:
+            raise ValueError("A ring needs at least two slots")
+        shm = shared_memory.SharedMemory(
+            name=name, create=True, size=cls.nbytes(slots, slot_size)
+        )
+        ring = cls(shm, slots, slot_size, owner=True)
+        ring._latest[0] = 0
+        ring._seq[:] = 0
+        return ring
+
+    @classmethod
+    def attach(cls, name: str, slots: int, slot_size: int, track: bool = True) -> "ShmRing":
+        """Attach to a ring created by another process.
+
+        Args:
+            name: Shared memory segment name (``ring.name`` of the creator).
+            slots: Number of slots.
+            slot_size: Payload bytes per slot.
+            track: Register the segment with this process's resource
+                tracker. Pass False from processes not started by
+                multiprocessing (they have their own tracker, which would
+                remove the creator's segment when they exit).
+
+        Raises:
+            FileNotFoundError: If there is no segment with that name.
+        """
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=track)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+            if not track:
+                resource_tracker.unregister(shm._name, "shared_memory")
+        return cls(shm, slots, slot_size, owner=False)
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory segment."""
+        return self.shm.name
+
+    def latest_seq(self) -> int:
+        """Sequence number of the newest complete slot (0 before the first write)."""
+        return int(self._latest[0])
+
+    def write(self, data, timestamp: float = 0.0, sim_time: float = 0.0) -> int:
+        """Write a payload into the next slot and publish it.
+
+        Args:
+            data: Bytes-like payload (bytes or a C-contiguous array).
+            timestamp: Wall-clock time to store with the payload.
+            sim_time: Simulated time to store with the payload.
+
+        Returns:
+            The payload's sequence number.
+
+        Raises:
+            ValueError: If the payload is larger than a slot.
+        """
+        payload = np.frombuffer(memoryview(data).cast("B"), dtype=np.uint8)
+        size = payload.size
+        if size > self.slot_size:
+            raise ValueError(f"Payload of {size} bytes exceeds slot size {self.slot_size}")
+        seq = int(self._latest[0]) + 1
+        slot = seq % self.slots
+        self._seq[slot] = -1
+        self._payload[slot, :size] = payload
+        self._meta[slot] = (timestamp, sim_time, size)
+        self._seq[slot] = seq
+        self._latest[0] = seq
+        return seq
+
+    def read(self) -> Optional[RingEntry]:
+        """Copy the newest slot.
+
+        Returns:
+            The entry, or None before the first write (or if the writer kept
+            overwriting the slot being read).
+        """
+        for _ in range(READ_ATTEMPTS):
+            seq = int(self._latest[0])
+            if seq == 0:
+                return None
+            slot = seq % self.slots
+            if self._seq[slot] != seq:
+                continue
+            timestamp, sim_time, size = self._meta[slot]
+            data = self._payload[slot, : int(size)].copy()
+            if self._seq[slot] == seq:
+                return RingEntry(seq, float(timestamp), float(sim_time), data)
+        return None
+
+    def close(self):
+        """Unmap the ring, and remove the segment if this side created it."""
+        # Drop the NumPy views first: the mapping cannot close while exported
+        del self._latest, self._seq, self._meta, self._payload
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
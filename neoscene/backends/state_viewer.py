@@ -0,0 +1,317 @@
+"""Long-lived MuJoCo viewer that displays simulation workers' state.
+
+The viewer does not simulate. It loads the model only to draw it, reads
+the physics state the session's SimulationWorker publishes into a
+shared-memory ring each tick (see ``SimulationWorker.state_ring_name``),
+and shows that state. The viewer window and the web UI's camera and
+sensors therefore always show the same simulation, including tasks
+started from the chat, and each scene is simulated once.
+
+One ViewerHost process serves a session for its whole life. Besides the
+first scene given on the command line, it accepts
+``("load", xml_path, ring_name)`` messages on a local socket
+(``multiprocessing.connection``, authenticated with the key in
+NEOSCENE_VIEWER_AUTHKEY) and swaps the new model into the open window,
+keeping the camera pose, so scene edits do not pay for a new
+interpreter, MuJoCo import, GL context and window. Loads that arrive
+while one is in progress are coalesced: only the newest is shown.
+
+Run as ``python -m neoscene.backends.state_viewer <scene.xml> <ring name>
+--listen <address>``; SceneSessionManager starts it for each session. The
+viewer may start before the worker: it shows the model's initial pose
+until the ring appears.
+"""
+
+import argparse
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener
+from typing import Optional, Tuple
+
+import numpy as np
+
+from neoscene.backends.shm_ring import RingEntry, ShmRing
+from neoscene.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Slots of the physics-state ring read by viewer processes
+STATE_SLOTS = 4
+
+# Viewer refresh rate; new states arrive at the worker's tick rate
+DISPLAY_FPS = 60.0
+
+# Environment variable holding the (hex) key viewer connections authenticate with
+VIEWER_AUTHKEY_ENV = "NEOSCENE_VIEWER_AUTHKEY"
+
+# Free-camera fields kept when a new model is swapped in
+CAMERA_POSE_FIELDS = (
+    "type", "fixedcamid", "trackbodyid", "lookat", "distance", "azimuth", "elevation",
+)
+
+
+def new_viewer_address() -> str:
+    """Return a fresh local socket address for a viewer host to listen on."""
+    name = f"neoscene_viewer_{uuid.uuid4().hex[:12]}"
+    if sys.platform == "win32":
+        return rf"\\.\pipe\{name}"
+    return os.path.join(tempfile.gettempdir(), f"{name}.sock")
+
+
+def apply_state(model, data, entry: RingEntry):
+    """Load a published physics state into ``data`` and update derived quantities.
+
+    Args:
+        model: The MjModel.
+        data: MjData to display.
+        entry: Ring entry holding an ``mjSTATE_INTEGRATION`` state.
+    """
+    import mujoco
+
+    state = entry.data.view(np.float64)
+    mujoco.mj_setState(model, data, state, mujoco.mjtState.mjSTATE_INTEGRATION)
+    mujoco.mj_forward(model, data)
+
+
+def attach_state_ring(model, ring_name: str, track: bool = False) -> Optional[ShmRing]:
+    """Attach to a worker's state ring, or return None if it does not exist yet.
+
+    Args:
+        model: The MjModel the worker simulates.
+        ring_name: Name given to the worker as ``state_ring_name``.
+        track: Register the ring with this process's resource tracker. The
+            viewer process does not, as it must not remove the worker's
+            ring when it exits; pass True when attaching from the process
+            that runs the worker.
+    """
+    import mujoco
+
+    size = mujoco.mj_stateSize(model, mujoco.mjtState.mjSTATE_INTEGRATION) * 8
+    try:
+        return ShmRing.attach(ring_name, STATE_SLOTS, size, track=track)
+    except FileNotFoundError:
+        return None
+
+
+def camera_pose(cam) -> dict:
+    """Copy the pose of an MjvCamera (see CAMERA_POSE_FIELDS)."""
+    return {name: np.copy(getattr(cam, name)) for name in CAMERA_POSE_FIELDS}
+
+
+def set_camera_pose(cam, pose: dict):
+    """Restore a pose saved with camera_pose()."""
+    for name, value in pose.items():
+        if name == "lookat":
+            cam.lookat[:] = value
+        else:
+            setattr(cam, name, value.item())
+
+
+class ViewerHost:
+    """Shows one session's scenes in one window, swapping models on request."""
+
+    def __init__(self, listener: Optional[Listener] = None):
+        """Initialize the host.
+
+        Args:
+            listener: Socket to accept load requests on (None: only the
+                loads queued with load()).
+        """
+        self.listener = listener
+        self.model = None
+        self.data = None
+        self.xml_path: Optional[str] = None
+        self.loads = 0
+        self._ring_name: Optional[str] = None
+        self._ring: Optional[ShmRing] = None
+        self._last_seq = 0
+        self._requests: "queue.Queue[Optional[Tuple[str, str]]]" = queue.Queue()
+        self._closed = False
+
+    def load(self, xml_path: str, ring_name: str):
+        """Queue a model to show, with the state ring of the worker simulating it."""
+        self._requests.put((xml_path, ring_name))
+
+    def close(self):
+        """Ask the display loop to close the window and exit."""
+        self._requests.put(None)
+
+    def serve(self):
+        """Accept connections and queue their requests (runs on its own thread)."""
+        while True:
+            try:
+                conn = self.listener.accept()
+            except (OSError, EOFError, AuthenticationError):
+                # Closed listener (host exiting) or a client failing authentication
+                if self._closed:
+                    return
+                continue
+            threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+
+    def _serve_connection(self, conn):
+        """Queue the requests arriving on one connection until it closes."""
+        with conn:
+            while True:
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    return
+                if message[0] == "load":
+                    self.load(message[1], message[2])
+                elif message[0] == "close":
+                    self.close()
+                else:
+                    logger.warning(f"Viewer host: ignoring unknown request {message[0]!r}")
+
+    def next_request(self, timeout: float = 0.0):
+        """Return the newest queued load (skipping older ones), "close", or None.
+
+        Args:
+            timeout: Seconds to wait for a request when none is queued.
+        """
+        try:
+            if timeout > 0:
+                request = self._requests.get(timeout=timeout)
+            else:
+                request = self._requests.get_nowait()
+        except queue.Empty:
+            return None
+        while request is not None:
+            try:
+                request = self._requests.get_nowait()
+            except queue.Empty:
+                break
+        return request if request is not None else "close"
+
+    def _open(self, xml_path: str, ring_name: str) -> bool:
+        """Load a model and switch to its worker's state ring.
+
+        Returns:
+            True if the model loaded (otherwise the current one is kept).
+        """
+        import mujoco
+
+        try:
+            model = mujoco.MjModel.from_xml_path(xml_path)
+        except Exception as e:
+            logger.warning(f"Viewer host: could not load {xml_path}: {e}")
+            return False
+        data = mujoco.MjData(model)
+        mujoco.mj_forward(model, data)
+        if self._ring is not None:
+            self._ring.close()
+        self.model, self.data, self.xml_path = model, data, xml_path
+        self._ring, self._ring_name, self._last_seq = None, ring_name, 0
+        self.loads += 1
+        return True
+
+    def show(self, viewer, xml_path: str, ring_name: str):
+        """Swap a new model into an open viewer, keeping the camera pose.
+
+        Args:
+            viewer: Passive viewer handle.
+            xml_path: MJCF file to show.
+            ring_name: State ring of the worker simulating it.
+
+        Returns:
+            The viewer showing the model: the same one, or None if the
+            model loaded but this MuJoCo cannot swap models in place.
+        """
+        if not self._open(xml_path, ring_name):
+            return viewer
+        sim = viewer._get_sim()
+        if sim is None or not hasattr(sim, "load"):
+            viewer.close()
+            return None
+        pose = camera_pose(viewer.cam)
+        sim.load(self.model, self.data, xml_path)
+        with viewer.lock():
+            set_camera_pose(viewer.cam, pose)
+        return viewer
+
+    def update(self, viewer):
+        """Apply the newest state published by the worker, if there is a new one."""
+        if self._ring is None and self._ring_name is not None:
+            self._ring = attach_state_ring(self.model, self._ring_name)
+        entry = self._ring.read() if self._ring is not None else None
+        if entry is not None and entry.seq != self._last_seq:
+            self._last_seq = entry.seq
+            with viewer.lock():
+                apply_state(self.model, self.data, entry)
+
+    def run(self) -> int:
+        """Display scenes until the window is closed or a close request arrives.
+
+        Returns:
+            Exit code.
+        """
+        import mujoco
+        import mujoco.viewer
+
+        if self.listener is not None:
+            threading.Thread(target=self.serve, daemon=True).start()
+        viewer = None
+        try:
+            while True:
+                request = self.next_request(timeout=0.5 if viewer is None else 0.0)
+                if request == "close":
+                    break
+                if request is not None:
+                    if viewer is not None:
+                        viewer = self.show(viewer, *request)
+                    elif not self._open(*request):
+                        continue
+                if viewer is None:
+                    if self.model is None:
+                        continue
+                    viewer = mujoco.viewer.launch_passive(self.model, self.data)
+                    # Hide the UI panels (equivalent to pressing Tab)
+                    viewer.opt.flags[mujoco.mjtVisFlag.mjVIS_COM] = False
+                    viewer.opt.flags[mujoco.mjtVisFlag.mjVIS_JOINT] = False
+
+                    # Set a nicer camera position
+                    viewer.cam.azimuth = -45
+                    viewer.cam.elevation = -25
+                    viewer.cam.distance = 30
+                    viewer.cam.lookat[:] = [10, 10, 0]
+                if not viewer.is_running():
+                    break
+                self.update(viewer)
+                viewer.sync()
+                time.sleep(1.0 / DISPLAY_FPS)
+        finally:
+            self._closed = True
+            if self.listener is not None:
+                self.listener.close()
+            if self._ring is not None:
+                self._ring.close()
+            if viewer is not None:
+                viewer.close()
+        return 0
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Display neoscene simulation workers")
+    parser.add_argument("xml_path", help="MJCF file of the first scene")
+    parser.add_argument("ring_name", help="Shared-memory state ring of its worker")
+    parser.add_argument("--listen", metavar="ADDRESS", help="Local socket for load requests")
+    args = parser.parse_args()
+
+    listener = None
+    if args.listen:
+        authkey = bytes.fromhex(os.environ[VIEWER_AUTHKEY_ENV])
+        listener = Listener(args.listen, authkey=authkey)
+    host = ViewerHost(listener)
+    host.load(args.xml_path, args.ring_name)
+    sys.exit(host.run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Fixed-rate physics stepping for the simulation worker.
+
+The worker runs in wall-clock ticks (control outputs, sensors and camera
+at ``tick_hz``). On each tick the scheduler decides how many ``mj_step``
+substeps bring simulated time up to ``speed`` times the elapsed wall time,
+so the physics rate no longer depends on the timestep or on loop overhead:
+
+- If the loop falls behind, later ticks run extra substeps to catch up.
+  When the backlog exceeds ``max_substeps`` in one tick it is dropped
+  (counted in ``overruns``) instead of spiralling.
+- Ticks whose deadline has already passed by more than a full period are
+  skipped (counted in ``dropped_ticks``); physics time is unaffected.
+- With ``speed=None`` the scheduler never sleeps and runs ``max_substeps``
+  per tick, for faster-than-real-time headless runs.
+
+Example:
+    >>> scheduler = StepScheduler(timestep=0.002, speed=1.0, tick_hz=50)
+    >>> scheduler.reset(now=0.0, sim_time=0.0)
+    >>> scheduler.plan(now=0.02, sim_time=0.0)
+    10
+"""
+
+import math
+from typing import Optional
+
+
+class StepScheduler:
+    """Plans physics substeps and tick sleeps against the wall clock."""
+
+    def __init__(
+        self,
+        timestep: float,
+        speed: Optional[float] = 1.0,
+        tick_hz: float = 50.0,
+        max_substeps: Optional[int] = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            timestep: Physics timestep in seconds (``model.opt.timestep``).
+            speed: Target real-time factor (1.0 = real time, 2.0 = twice as
+                fast), or None to run as fast as possible.
+            tick_hz: Wall-clock ticks per second.
+            max_substeps: Most substeps per tick. Defaults to four ticks'
+                worth of simulated time at the target speed (ten ticks'
+                worth when unthrottled).
+
+        Raises:
+            ValueError: If timestep, speed or tick_hz is not positive.
+        """
+        if timestep <= 0 or tick_hz <= 0 or (speed is not None and speed <= 0):
+            raise ValueError("timestep, speed and tick_hz must be positive")
+        self.timestep = timestep
+        self.speed = speed
+        self.period = 1.0 / tick_hz
+        if max_substeps is None:
+            ticks_of_sim_time = 10 if speed is None else 4 * speed
+            max_substeps = math.ceil(ticks_of_sim_time * self.period / timestep)
+        self.max_substeps = max(1, max_substeps)
+        self.overruns = 0
+        self.dropped_ticks = 0
+        self._wall_anchor = 0.0
+        self._sim_anchor = 0.0
+        self._next_tick = 0.0
+
+    def reset(self, now: float, sim_time: float) -> None:
+        """Anchor simulated time to the wall clock (e.g. at start or after a pause).
+
+        Args:
+            now: Current wall-clock time (``time.perf_counter()``).
+            sim_time: Current simulated time (``data.time``).
+        """
+        self._wall_anchor = now
+        self._sim_anchor = sim_time
+        self._next_tick = now
+
+    def plan(self, now: float, sim_time: float) -> int:
+        """Return the number of substeps to run this tick.
+
+        Args:
+            now: Current wall-clock time.
+            sim_time: Current simulated time.
+        """
+        if self.speed is None:
+            return self.max_substeps
+        target = self._sim_anchor + (now - self._wall_anchor) * self.speed
+        # Small tolerance so float error does not skip a step that is due
+        substeps = math.floor((target - sim_time) / self.timestep + 1e-6)
+        if substeps > self.max_substeps:
+            # Too far behind to catch up: drop the backlog and re-anchor
+            self.overruns += 1
+            self._wall_anchor = now
+            self._sim_anchor = sim_time + self.max_substeps * self.timestep
+            return self.max_substeps
+        return max(0, substeps)
+
+    def sleep_time(self, now: float) -> float:
+        """Advance to the next tick and return how long to sleep until it.
+
+        Args:
+            now: Current wall-clock time, after the tick's work.
+        """
+        if self.speed is None:
+            return 0.0
+        self._next_tick += self.period
+        lag = now - self._next_tick
+        if lag > self.period:
+            missed = int(lag // self.period)
+            self.dropped_ticks += missed
+            self._next_tick += missed * self.period
+        return max(0.0, self._next_tick - now)
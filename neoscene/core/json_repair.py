@@ -0,0 +1,420 @@
+"""Lenient JSON reading for LLM output.
+
+LLMs regularly return almost-JSON: trailing commas, comments, single-quoted
+strings, unquoted keys, Python literals, or a response cut off mid-object.
+This module rewrites such text into strict JSON in a single left-to-right
+pass, keeping a stack of open containers so that every fix is local and
+string contents are never touched. Each fix is reported with its position.
+
+Example:
+    >>> result = repair_json("{'a': 1, b: [1, 2,], // note\\n")
+    >>> result.text
+    '{"a": 1, "b": [1, 2]}'
+    >>> len(result.fixes)
+    5
+"""
+
+import json
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+
+from neoscene.core.errors import NeosceneError
+
+# A bare word: identifier, number or literal (anything up to a delimiter)
+_BAREWORD = re.compile(r"[^\s,:\[\]{}\"'/]+")
+
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_JSON_LITERALS = ("true", "false", "null")
+_CLOSER = {"{": "}", "[": "]"}
+_CONTROL_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t"}
+
+
+class JsonRepairError(NeosceneError):
+    """Error for text that cannot be turned into JSON."""
+
+    pass
+
+
+@dataclass
+class JsonRepairResult:
+    """Output of repair_json.
+
+    Attributes:
+        text: Strict JSON text.
+        fixes: Human-readable descriptions of each fix, in order.
+    """
+
+    text: str
+    fixes: List[str] = field(default_factory=list)
+
+    @property
+    def repaired(self) -> bool:
+        """Whether any fix was applied."""
+        return bool(self.fixes)
+
+
+class _Frame:
+    """An open object or array and what it expects next."""
+
+    __slots__ = ("kind", "state", "pending_comma")
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        # Objects: key -> colon -> value -> comma; arrays: value -> comma
+        self.state = "key" if kind == "{" else "value"
+        self.pending_comma = False
+
+
+class _LenientReader:
+    """Single-pass rewriter from almost-JSON to JSON."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+        self.out: List[str] = []
+        self.fixes: List[str] = []
+        self.stack: List[_Frame] = []
+        self.done = False
+
+    def fix(self, message: str, pos: int) -> None:
+        """Record a fix at a position."""
+        self.fixes.append(f"{message} at {pos}")
+
+    def run(self) -> JsonRepairResult:
+        """Rewrite the whole text."""
+        text = self.text
+        n = len(text)
+        starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+        if not starts:
+            raise JsonRepairError("No JSON object or array found", details={"position": n})
+        self.pos = min(starts)
+        if text[:self.pos].strip():
+            self.fix("ignored leading text", 0)
+
+        while self.pos < n and not self.done:
+            c = text[self.pos]
+            if c in " \t\r\n":
+                self.pos += 1
+            elif c == "/" and text.startswith(("//", "/*"), self.pos):
+                self.skip_comment()
+            elif c in "}]":
+                self.close(c)
+            elif c == ",":
+                self.comma()
+            elif c == ":":
+                self.colon()
+            else:
+                self.token(c)
+
+        if not self.done:
+            self.finish_truncated()
+        elif text[self.pos:].strip():
+            self.fix("ignored trailing text", self.pos)
+
+        return JsonRepairResult("".join(self.out), self.fixes)
+
+    # -- structure ---------------------------------------------------------
+
+    def skip_comment(self) -> None:
+        """Skip a // line comment or /* block */ comment."""
+        start = self.pos
+        if self.text.startswith("//", start):
+            end = self.text.find("\n", start)
+        else:
+            end = self.text.find("*/", start + 2)
+            end = end + 2 if end != -1 else -1
+        self.pos = len(self.text) if end == -1 else end
+        self.fix("removed comment", start)
+
+    def emit_pending_comma(self, frame: _Frame) -> None:
+        """Write the comma held back after the previous member."""
+        if frame.pending_comma:
+            self.out.append(", ")
+            frame.pending_comma = False
+
+    def comma(self) -> None:
+        """Handle a ','."""
+        pos = self.pos
+        self.pos += 1
+        if not self.stack:
+            self.fix("removed stray ','", pos)
+            return
+        frame = self.stack[-1]
+        if frame.state == "comma":
+            # Held back until the next member so a trailing comma can be dropped
+            frame.pending_comma = True
+            frame.state = "key" if frame.kind == "{" else "value"
+        elif frame.state == "value" and frame.kind == "{":
+            self.out.append("null")
+            self.fix("inserted missing value", pos)
+            frame.pending_comma = True
+            frame.state = "key"
+        else:
+            self.fix("removed extra ','", pos)
+
+    def colon(self) -> None:
+        """Handle a ':'."""
+        pos = self.pos
+        self.pos += 1
+        if self.stack and self.stack[-1].state == "colon":
+            self.out.append(": ")
+            self.stack[-1].state = "value"
+        else:
+            self.fix("removed stray ':'", pos)
+
+    def close(self, closer: str) -> None:
+        """Handle a '}' or ']', closing any containers left open inside it."""
+        pos = self.pos
+        self.pos += 1
+        if not any(_CLOSER[f.kind] == closer for f in self.stack):
+            self.fix(f"removed unmatched '{closer}'", pos)
+            return
+        while _CLOSER[self.stack[-1].kind] != closer:
+            self.fix(f"closed unclosed '{self.stack[-1].kind}'", pos)
+            self.close_frame(pos)
+        self.close_frame(pos)
+
+    def close_frame(self, pos: int) -> None:
+        """Close the innermost container."""
+        frame = self.stack[-1]
+        if frame.pending_comma:
+            frame.pending_comma = False
+            self.fix("removed trailing comma", pos)
+        if frame.state in ("colon", "value") and frame.kind == "{":
+            if frame.state == "colon":
+                self.out.append(": ")
+            self.out.append("null")
+            self.fix("inserted missing value", pos)
+        self.stack.pop()
+        self.out.append(_CLOSER[frame.kind])
+        self.value_done()
+
+    def value_done(self) -> None:
+        """Advance the parent after a complete value."""
+        if self.stack:
+            self.stack[-1].state = "comma"
+        else:
+            self.done = True
+
+    def finish_truncated(self) -> None:
+        """Close everything still open at the end of the input."""
+        end = len(self.text)
+        if self.stack:
+            self.fix(f"closed {len(self.stack)} unclosed containers (truncated)", end)
+        while self.stack:
+            frame = self.stack[-1]
+            frame.pending_comma = False
+            if frame.kind == "{" and frame.state in ("colon", "value"):
+                if frame.state == "colon":
+                    self.out.append(": ")
+                self.out.append("null")
+            self.stack.pop()
+            self.out.append(_CLOSER[frame.kind])
+
+    # -- values ------------------------------------------------------------
+
+    def begin(self) -> str:
+        """Prepare the output for the token at the current position.
+
+        Returns:
+            "key" if the token is an object key, otherwise "value".
+        """
+        pos = self.pos
+        if not self.stack:
+            return "value"
+        frame = self.stack[-1]
+        if frame.state == "comma":
+            self.fix("inserted missing ','", pos)
+            frame.pending_comma = True
+            frame.state = "key" if frame.kind == "{" else "value"
+        elif frame.state == "colon":
+            self.fix("inserted missing ':'", pos)
+            self.out.append(": ")
+            frame.state = "value"
+        self.emit_pending_comma(frame)
+        return frame.state
+
+    def token(self, c: str) -> None:
+        """Handle a value or key token."""
+        top = self.stack[-1] if self.stack else None
+        if c in "{[" and top is not None and top.kind == "{" and top.state in ("key", "comma"):
+            # A container where a key belongs: the object was never closed
+            self.fix("closed unclosed '{'", self.pos)
+            self.close_frame(self.pos)
+            return
+
+        role = self.begin()
+        if role == "key":
+            if c in "\"'":
+                self.string(c)
+            else:
+                self.bare_key()
+            self.stack[-1].state = "colon"
+            return
+
+        if c in "{[":
+            if self.stack:
+                self.stack[-1].state = "comma"
+            self.out.append(c)
+            self.stack.append(_Frame(c))
+            self.pos += 1
+            return
+        if c in "\"'":
+            self.string(c)
+        else:
+            self.bare_value()
+        self.value_done()
+
+    def string(self, quote: str) -> None:
+        """Copy a string, normalizing quotes and control characters."""
+        text = self.text
+        start = self.pos
+        i = start + 1
+        n = len(text)
+        chunks = ['"']
+        run = i
+        if quote == "'":
+            self.fix("converted single-quoted string", start)
+        while i < n:
+            c = text[i]
+            if c == "\\":
+                if i + 1 < n and text[i + 1] == "'":
+                    chunks.append(text[run:i])
+                    chunks.append("'")
+                    i += 2
+                    run = i
+                    continue
+                i += 2
+                continue
+            if c == quote:
+                break
+            if c == '"' or c in _CONTROL_ESCAPES:
+                chunks.append(text[run:i])
+                chunks.append('\\"' if c == '"' else _CONTROL_ESCAPES[c])
+                if c != '"':
+                    self.fix("escaped control character in string", i)
+                run = i + 1
+            i += 1
+
+        chunks.append(text[run:min(i, n)])
+        if i >= n:
+            self.fix("closed unterminated string (truncated)", start)
+            if chunks[-1].endswith("\\"):
+                chunks[-1] = chunks[-1][:-1]
+        chunks.append('"')
+        self.out.append("".join(chunks))
+        self.pos = min(i + 1, n)
+
+    def bare_key(self) -> None:
+        """Quote an unquoted object key."""
+        match = _BAREWORD.match(self.text, self.pos)
+        if match is None:
+            raise JsonRepairError(
+                f"Unexpected character {self.text[self.pos]!r} at {self.pos}",
+                details={"position": self.pos},
+            )
+        self.fix("quoted unquoted key", self.pos)
+        self.out.append(json.dumps(match.group()))
+        self.pos = match.end()
+
+    def bare_value(self) -> None:
+        """Copy a literal or number, repairing the common near-misses."""
+        start = self.pos
+        match = _BAREWORD.match(self.text, start)
+        if match is None:
+            raise JsonRepairError(
+                f"Unexpected character {self.text[start]!r} at {start}",
+                details={"position": start},
+            )
+        word = match.group()
+        self.pos = match.end()
+
+        if word in _JSON_LITERALS:
+            self.out.append(word)
+            return
+        if word in _PYTHON_LITERALS:
+            self.out.append(_PYTHON_LITERALS[word])
+            self.fix(f"converted Python literal {word}", start)
+            return
+        try:
+            json.loads(word)
+            self.out.append(word)
+            return
+        except json.JSONDecodeError:
+            pass
+
+        truncated = self.pos == len(self.text)
+        if truncated:
+            for literal in _JSON_LITERALS:
+                if literal.startswith(word):
+                    self.out.append(literal)
+                    self.fix("completed truncated literal", start)
+                    return
+        number = _parse_number(word.rstrip("eE+-.") if truncated else word)
+        if number is not None:
+            self.out.append(number)
+            self.fix(f"normalized number {word!r}", start)
+            return
+
+        self.out.append(json.dumps(word))
+        self.fix(f"quoted bare word {word!r}", start)
+
+
+def _parse_number(word: str) -> Optional[str]:
+    """Return the JSON spelling of a lenient number (e.g. "+1", ".5", "2.")."""
+    try:
+        return str(int(word))
+    except ValueError:
+        pass
+    try:
+        number = float(word)
+    except ValueError:
+        return None
+    if math.isnan(number) or math.isinf(number):
+        return None
+    return repr(number)
+
+
+def repair_json(text: str) -> JsonRepairResult:
+    """Rewrite almost-JSON into strict JSON in a single pass.
+
+    Handles trailing and missing commas, // and /* */ comments,
+    single-quoted strings, unquoted keys, Python literals, raw control
+    characters in strings, mismatched closers and truncated input (open
+    strings and containers are closed in order). Text before the first
+    container and after the top-level value is ignored.
+
+    Args:
+        text: The text to repair.
+
+    Returns:
+        JsonRepairResult with the JSON text and the fixes applied.
+
+    Raises:
+        JsonRepairError: If the text contains no JSON value or has a
+            structure that cannot be repaired.
+    """
+    return _LenientReader(text).run()
+
+
+def loads_lenient(text: str) -> Tuple[Any, List[str]]:
+    """Parse JSON, repairing it only if strict parsing fails.
+
+    Args:
+        text: The JSON text.
+
+    Returns:
+        Tuple of (parsed data, list of fixes applied).
+
+    Raises:
+        JsonRepairError: If the text cannot be repaired.
+        json.JSONDecodeError: If the repaired text is still not valid JSON.
+    """
+    try:
+        return json.loads(text), []
+    except json.JSONDecodeError:
+        pass
+    result = repair_json(text)
+    return json.loads(result.text), result.fixes
@@ -0,0 +1,161 @@
+"""Pluggable LLM backends for the GeminiClient.
+
+A backend performs the actual model call; GeminiClient adds caching,
+scheduling and error wrapping on top. Two backends are provided:
+
+- GeminiBackend: the Google Generative AI SDK.
+- HTTPBackend: a plain HTTP/JSON endpoint, such as the local stand-in
+  server in ``neoscene.app.llm_standin`` used for load testing.
+
+HTTP protocol (POST, JSON body ``{"prompt": ..., "generation_config": {...}}``):
+
+- ``/generate`` returns ``{"text": "..."}``.
+- ``/generate_stream`` returns newline-delimited ``{"text": "<chunk>"}`` lines.
+- Errors use non-2xx status codes with ``{"error": "..."}``.
+"""
+
+import asyncio
+import json
+import urllib.error
+import urllib.request
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, Optional
+
+
+class LLMBackend(ABC):
+    """Interface for a text generation backend."""
+
+    name = "backend"
+
+    @abstractmethod
+    def generate(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        """Generate a complete response.
+
+        Args:
+            prompt: The prompt text.
+            generation_config: Temperature, token limit and other options.
+
+        Returns:
+            The generated text.
+        """
+
+    async def generate_async(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        """Generate a response without blocking the event loop.
+
+        The default implementation runs generate() in a worker thread.
+        """
+        return await asyncio.to_thread(self.generate, prompt, generation_config)
+
+    def generate_stream(self, prompt: str, generation_config: Dict[str, Any]) -> Iterator[str]:
+        """Generate a response as a stream of text chunks.
+
+        The default implementation yields the complete response once.
+        """
+        yield self.generate(prompt, generation_config)
+
+
+class GeminiBackend(LLMBackend):
+    """Backend for a ``google.generativeai.GenerativeModel``."""
+
+    name = "gemini"
+
+    def __init__(self, model: Any):
+        """Initialize the backend.
+
+        Args:
+            model: A GenerativeModel (or any object with the same methods).
+        """
+        self.model = model
+
+    def generate(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        """Generate a complete response."""
+        response = self.model.generate_content(prompt, generation_config=generation_config)
+        return response.text
+
+    async def generate_async(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        """Use the SDK's native async call when available."""
+        generate_content_async = getattr(self.model, "generate_content_async", None)
+        if generate_content_async is None:
+            return await super().generate_async(prompt, generation_config)
+        response = await generate_content_async(prompt, generation_config=generation_config)
+        return response.text
+
+    def generate_stream(self, prompt: str, generation_config: Dict[str, Any]) -> Iterator[str]:
+        """Stream the response chunks from the SDK."""
+        response = self.model.generate_content(
+            prompt,
+            generation_config=generation_config,
+            stream=True,
+        )
+        for chunk in response:
+            if chunk.text:
+                yield chunk.text
+
+
+class HTTPBackendError(Exception):
+    """Error response from an HTTP backend."""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        """Initialize the error.
+
+        Args:
+            message: Error message.
+            status: HTTP status code, if a response was received.
+        """
+        super().__init__(message)
+        self.status = status
+
+
+class HTTPBackend(LLMBackend):
+    """Backend that calls an HTTP/JSON generation endpoint.
+
+    Example:
+        >>> backend = HTTPBackend("http://127.0.0.1:8765")
+        >>> backend.generate("Describe a scene", {"temperature": 0.3})  # doctest: +SKIP
+    """
+
+    name = "http"
+
+    def __init__(self, url: str, timeout: float = 60.0):
+        """Initialize the backend.
+
+        Args:
+            url: Base URL of the server (e.g. "http://127.0.0.1:8765").
+            timeout: Socket timeout per request in seconds.
+        """
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _post(self, path: str, prompt: str, generation_config: Dict[str, Any]):
+        """Send a request and return the open response."""
+        body = json.dumps({"prompt": prompt, "generation_config": generation_config})
+        request = urllib.request.Request(
+            f"{self.url}{path}",
+            data=body.encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            return urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            detail = e.read().decode("utf-8", errors="replace")[:200]
+            raise HTTPBackendError(f"HTTP {e.code} from {self.url}: {detail}", status=e.code)
+        except (urllib.error.URLError, OSError) as e:
+            raise HTTPBackendError(f"Cannot reach {self.url}: {e}")
+
+    def generate(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        """Generate a complete response."""
+        with self._post("/generate", prompt, generation_config) as response:
+            return json.loads(response.read())["text"]
+
+    def generate_stream(self, prompt: str, generation_config: Dict[str, Any]) -> Iterator[str]:
+        """Stream newline-delimited JSON chunks."""
+        with self._post("/generate_stream", prompt, generation_config) as response:
+            for line in response:
+                line = line.strip()
+                if not line:
+                    continue
+                message = json.loads(line)
+                if "error" in message:
+                    raise HTTPBackendError(message["error"])
+                yield message["text"]
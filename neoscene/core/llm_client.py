@@ -4,13 +4,27 @@ This module provides a clean abstraction over the Gemini API, making it easy
 to swap out for other providers later.
 """
 
+import asyncio
+import hashlib
+import json
+import math
 import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
 import yaml
 from dotenv import load_dotenv
 
+from neoscene.core.llm_backends import GeminiBackend, HTTPBackend, LLMBackend
+from neoscene.core.metrics import REGISTRY
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -69,6 +83,707 @@ def load_llm_config(path: Optional[Path] = None) -> Dict[str, Any]:
         raise LLMConfigError(f"Failed to load LLM config from {path}: {e}")
 
 
+def get_default_cache_path() -> Path:
+    """Get the default path to the LLM response cache database."""
+    return Path.home() / ".cache" / "neoscene" / "llm_cache.sqlite"
+
+
+class ResponseCache:
+    """SQLite-backed cache of LLM responses keyed by prompt fingerprint.
+
+    Entries expire after ``ttl_seconds``; when more than ``max_entries``
+    are stored, the least recently used entries are evicted. The database
+    is opened lazily on first use and shared across threads.
+
+    Example:
+        >>> cache = ResponseCache(Path("/tmp/llm_cache.sqlite"))
+        >>> key = ResponseCache.make_key("gemini-2.0-flash", 0.3, "hello")
+        >>> cache.put(key, "response")
+        >>> cache.get(key)
+        'response'
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_seconds: float = 7 * 24 * 3600,
+        max_entries: int = 5000,
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database path. Defaults to get_default_cache_path().
+            ttl_seconds: Time-to-live of an entry in seconds.
+            max_entries: Maximum number of stored entries.
+        """
+        self.path = Path(path) if path is not None else get_default_cache_path()
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(model: str, temperature: float, prompt: str, **params: Any) -> str:
+        """Build the cache key for a request.
+
+        Args:
+            model: Model name.
+            temperature: Sampling temperature.
+            prompt: The full prompt text.
+            **params: Other generation parameters that affect the output.
+
+        Returns:
+            Hex SHA-256 fingerprint of the request.
+        """
+        payload = json.dumps(
+            {"model": model, "temperature": temperature, "prompt": prompt, "params": params},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the table if needed."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        """Return a cached response, or None if missing or expired.
+
+        Args:
+            key: Key from make_key().
+
+        Returns:
+            The cached response text, or None.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                if row is not None:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    conn.commit()
+                self.misses += 1
+                return None
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, response: str) -> None:
+        """Store a response, evicting expired and least recently used entries.
+
+        Args:
+            key: Key from make_key().
+            response: Response text to cache.
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, response, now, now),
+            )
+            conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+            conn.execute(
+                "DELETE FROM responses WHERE key NOT IN ("
+                "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+            conn.commit()
+
+    def delete(self, key: str) -> bool:
+        """Remove one entry, e.g. a response that failed validation.
+
+        Args:
+            key: Key from make_key().
+
+        Returns:
+            True if an entry was removed.
+        """
+        with self._lock:
+            conn = self._connect()
+            cursor = conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            conn.commit()
+            return cursor.rowcount > 0
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._connect().execute("DELETE FROM responses")
+            self._conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored entries."""
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss statistics.
+
+        Returns:
+            Dict with hits, misses, hit_ratio and the number of entries.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "entries": len(self),
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def cache_from_config(config: Dict[str, Any]) -> Optional[ResponseCache]:
+    """Create a ResponseCache from the ``cache`` section of an LLM config.
+
+    Args:
+        config: Loaded LLM configuration.
+
+    Returns:
+        A ResponseCache, or None if caching is disabled.
+    """
+    cache_config = config.get("cache") or {}
+    if not cache_config.get("enabled", False):
+        return None
+    path = cache_config.get("path")
+    return ResponseCache(
+        path=Path(path).expanduser() if path else None,
+        ttl_seconds=cache_config.get("ttl_seconds", 7 * 24 * 3600),
+        max_entries=cache_config.get("max_entries", 5000),
+    )
+
+
+class LLMQueueFullError(LLMError):
+    """The LLM request queue is full; the caller should retry later."""
+
+    def __init__(self, message: str, retry_after: float):
+        """Initialize the error.
+
+        Args:
+            message: Error message.
+            retry_after: Suggested number of seconds before retrying.
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+_current_session: ContextVar[Optional[str]] = ContextVar("llm_session", default=None)
+
+
+@contextmanager
+def llm_session(session_id: Optional[str]) -> Iterator[None]:
+    """Attribute the LLM requests made inside the block to a session.
+
+    The scheduler queues requests per session and serves sessions in turn,
+    so one busy session cannot starve the others.
+
+    Args:
+        session_id: Session identifier (None for the shared default queue).
+    """
+    token = _current_session.set(session_id)
+    try:
+        yield
+    finally:
+        _current_session.reset(token)
+
+
+class TokenBucket:
+    """Token-bucket rate limiter.
+
+    Tokens refill at ``rate`` per second up to ``burst``. ``reserve`` always
+    takes a token and returns how long the caller must wait for it, so
+    callers are served in the order they reserved.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second.
+            burst: Bucket capacity.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token.
+
+        Returns:
+            Seconds to wait before the token is available (0 if available now).
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class _Waiter:
+    """A request waiting for a concurrency slot."""
+
+    __slots__ = ("session", "granted", "enqueued_at")
+
+    def __init__(self, session: str):
+        self.session = session
+        self.granted: Future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class LLMScheduler:
+    """Shared admission control for LLM requests.
+
+    - At most ``max_concurrency`` requests run at once.
+    - Requests start no faster than the token-bucket rate limit allows.
+    - Waiting requests are queued per session and sessions are served
+      round-robin.
+    - Identical in-flight requests (same key) share one call.
+    - When ``max_queue`` requests are already waiting, new requests fail
+      immediately with LLMQueueFullError and a retry hint.
+
+    Works from both threads (run, slot) and asyncio code (run_async).
+
+    Example:
+        >>> scheduler = LLMScheduler(max_concurrency=2, requests_per_minute=60)
+        >>> scheduler.run(lambda: "response", key="prompt-hash")
+        'response'
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        requests_per_minute: Optional[float] = None,
+        burst: Optional[int] = None,
+        max_queue: int = 32,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrency: Maximum number of concurrent LLM requests.
+            requests_per_minute: Sustained request rate, or None for no limit.
+            burst: Requests allowed at once before rate limiting applies
+                (defaults to max_concurrency).
+            max_queue: Maximum number of waiting requests.
+        """
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self._bucket = (
+            TokenBucket(requests_per_minute / 60.0, burst or max_concurrency)
+            if requests_per_minute
+            else None
+        )
+        self._lock = threading.Lock()
+        self._queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self._waiting = 0
+        self._active = 0
+        self._inflight: Dict[str, Future] = {}
+        self._callers: Dict[Future, int] = {}  # callers waiting on each shared call
+        self._leaders: Dict[Future, asyncio.Task] = {}
+        self._service_time = 2.0  # moving average of call duration, seconds
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "coalesced": 0,
+            "rejected": 0,
+            "wait_seconds_total": 0.0,
+            "wait_seconds_max": 0.0,
+        }
+
+    # -- admission ---------------------------------------------------------
+
+    def _enqueue(self) -> _Waiter:
+        """Register a request, granting a slot at once if one is free."""
+        waiter = _Waiter(_current_session.get() or "default")
+        with self._lock:
+            self._stats["submitted"] += 1
+            if self._active < self.max_concurrency and self._waiting == 0:
+                self._active += 1
+                self._record_wait(0.0)
+                waiter.granted.set_result(None)
+                return waiter
+            if self._waiting >= self.max_queue:
+                self._stats["rejected"] += 1
+                retry_after = self._retry_after()
+                raise LLMQueueFullError(
+                    f"LLM request queue is full ({self._waiting} waiting), "
+                    f"retry in {retry_after:.0f}s",
+                    retry_after=retry_after,
+                )
+            self._queues.setdefault(waiter.session, deque()).append(waiter)
+            self._waiting += 1
+        return waiter
+
+    def _record_wait(self, seconds: float) -> None:
+        """Update wait-time statistics (lock held)."""
+        self._stats["wait_seconds_total"] += seconds
+        self._stats["wait_seconds_max"] = max(self._stats["wait_seconds_max"], seconds)
+
+    def _retry_after(self) -> float:
+        """Estimate when a slot will free up (lock held)."""
+        estimate = self._service_time * (self._waiting + 1) / self.max_concurrency
+        return float(max(1, math.ceil(estimate)))
+
+    def _release(self, duration: Optional[float] = None) -> None:
+        """Free a slot and hand it to the next session in turn."""
+        with self._lock:
+            self._active -= 1
+            if duration is not None:
+                self._stats["completed"] += 1
+                self._service_time = 0.8 * self._service_time + 0.2 * duration
+            while self._waiting and self._active < self.max_concurrency:
+                session, queue = next(iter(self._queues.items()))
+                waiter = queue.popleft()
+                del self._queues[session]
+                if queue:
+                    self._queues[session] = queue  # back of the round-robin
+                self._waiting -= 1
+                # A cancelled async waiter leaves the slot to the next one
+                if not waiter.granted.set_running_or_notify_cancel():
+                    continue
+                self._active += 1
+                self._record_wait(time.monotonic() - waiter.enqueued_at)
+                waiter.granted.set_result(None)
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """Withdraw a cancelled request, releasing its slot if it had one."""
+        with self._lock:
+            queue = self._queues.get(waiter.session)
+            if queue is not None and waiter in queue:
+                queue.remove(waiter)
+                if not queue:
+                    del self._queues[waiter.session]
+                self._waiting -= 1
+                return
+            if waiter.granted.cancelled():
+                return  # Skipped by _release, never held a slot
+        self._release()
+
+    def _acquire(self) -> None:
+        """Block until a slot and a rate-limit token are available."""
+        waiter = self._enqueue()
+        waiter.granted.result()
+        delay = self._bucket.reserve() if self._bucket else 0.0
+        if delay > 0:
+            time.sleep(delay)
+
+    async def _acquire_async(self) -> None:
+        """Wait without blocking the event loop for a slot and a token."""
+        waiter = self._enqueue()
+        try:
+            await asyncio.wrap_future(waiter.granted)
+            delay = self._bucket.reserve() if self._bucket else 0.0
+            if delay > 0:
+                await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+    # -- coalescing --------------------------------------------------------
+
+    def _join(self, key: Optional[str]) -> Tuple[Optional[Future], bool]:
+        """Return the shared future for a key and whether this caller leads."""
+        if key is None:
+            return None, True
+        with self._lock:
+            shared = self._inflight.get(key)
+            if shared is not None:
+                self._stats["coalesced"] += 1
+                self._callers[shared] += 1
+                return shared, False
+            shared = Future()
+            self._inflight[key] = shared
+            self._callers[shared] = 1
+            return shared, True
+
+    def _leave(self, key: str, shared: Future) -> None:
+        """Withdraw a cancelled caller; cancel the call once nobody waits for it."""
+        with self._lock:
+            if shared not in self._callers:
+                return
+            self._callers[shared] -= 1
+            if self._callers[shared] > 0:
+                return
+            del self._callers[shared]
+            if self._inflight.get(key) is shared:
+                del self._inflight[key]  # Later callers start a new call
+            task = self._leaders.get(shared)
+        if task is not None:
+            task.get_loop().call_soon_threadsafe(task.cancel)
+
+    def _settle(
+        self,
+        key: Optional[str],
+        shared: Optional[Future],
+        result: Any,
+        error: Optional[BaseException],
+    ) -> None:
+        """Publish the leader's outcome to coalesced followers."""
+        if shared is None:
+            return
+        with self._lock:
+            if self._inflight.get(key) is shared:
+                del self._inflight[key]
+            self._callers.pop(shared, None)
+        if shared.done():
+            return
+        if error is not None:
+            shared.set_exception(error)
+        else:
+            shared.set_result(result)
+
+    # -- public API --------------------------------------------------------
+
+    def run(self, call: Callable[[], str], key: Optional[str] = None) -> str:
+        """Run a blocking LLM call under the scheduler.
+
+        Args:
+            call: Function performing the request.
+            key: Request fingerprint; identical in-flight keys share one call.
+
+        Returns:
+            The call's result.
+
+        Raises:
+            LLMQueueFullError: If the queue is full.
+        """
+        shared, leader = self._join(key)
+        if not leader:
+            return shared.result()
+
+        try:
+            self._acquire()
+            start = time.monotonic()
+            try:
+                result = call()
+            finally:
+                self._release(time.monotonic() - start)
+        except BaseException as e:
+            self._settle(key, shared, None, e)
+            raise
+        self._settle(key, shared, result, None)
+        return result
+
+    async def run_async(self, call: Callable[[], Awaitable[str]], key: Optional[str] = None) -> str:
+        """Run an async LLM call under the scheduler.
+
+        A keyed call runs in its own task, which every caller of that key
+        awaits shielded: cancelling any caller, including the one that
+        started the call, leaves the call running for the others. It is
+        cancelled once all of them are.
+
+        Args:
+            call: Coroutine function performing the request.
+            key: Request fingerprint; identical in-flight keys share one call.
+
+        Returns:
+            The call's result.
+
+        Raises:
+            LLMQueueFullError: If the queue is full.
+        """
+        shared, leader = self._join(key)
+        if shared is None:
+            return await self._call_async(call)
+        if leader:
+            task = asyncio.ensure_future(self._lead_async(call, key, shared))
+            with self._lock:
+                self._leaders[shared] = task
+            task.add_done_callback(lambda _: self._leaders.pop(shared, None))
+        try:
+            return await asyncio.shield(asyncio.wrap_future(shared))
+        except asyncio.CancelledError:
+            self._leave(key, shared)
+            raise
+
+    async def _lead_async(
+        self,
+        call: Callable[[], Awaitable[str]],
+        key: str,
+        shared: Future,
+    ) -> None:
+        """Run a coalesced call and publish its outcome to every caller."""
+        try:
+            result = await self._call_async(call)
+        except asyncio.CancelledError:
+            # Every caller left, or the event loop is shutting down; never
+            # hand the cancellation itself to callers that were not cancelled
+            self._settle(key, shared, None, LLMAPIError("LLM request was cancelled"))
+            raise
+        except BaseException as e:
+            self._settle(key, shared, None, e)
+        else:
+            self._settle(key, shared, result, None)
+
+    async def _call_async(self, call: Callable[[], Awaitable[str]]) -> str:
+        """Wait for a slot and run the call; cancelled calls are not counted."""
+        await self._acquire_async()
+        start = time.monotonic()
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            self._release()
+            raise
+        except BaseException:
+            self._release(time.monotonic() - start)
+            raise
+        self._release(time.monotonic() - start)
+        return result
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a concurrency slot for a blocking block (e.g. a stream).
+
+        Raises:
+            LLMQueueFullError: If the queue is full.
+        """
+        self._acquire()
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(time.monotonic() - start)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue and wait-time metrics.
+
+        Returns:
+            Dict with queue depth (total and per session), in-flight count,
+            request counters and average/maximum wait in milliseconds.
+        """
+        with self._lock:
+            granted = self._stats["submitted"] - self._stats["rejected"] - self._waiting
+            total_wait = self._stats["wait_seconds_total"]
+            return {
+                "queue_depth": self._waiting,
+                "queue_by_session": {s: len(q) for s, q in self._queues.items()},
+                "in_flight": self._active,
+                "max_concurrency": self.max_concurrency,
+                "submitted": self._stats["submitted"],
+                "completed": self._stats["completed"],
+                "coalesced": self._stats["coalesced"],
+                "rejected": self._stats["rejected"],
+                "wait_ms_avg": round(1000 * total_wait / granted, 1) if granted > 0 else 0.0,
+                "wait_ms_max": round(1000 * self._stats["wait_seconds_max"], 1),
+            }
+
+
+def scheduler_from_config(config: Dict[str, Any]) -> Optional[LLMScheduler]:
+    """Create an LLMScheduler from the ``scheduler`` section of an LLM config.
+
+    Args:
+        config: Loaded LLM configuration.
+
+    Returns:
+        An LLMScheduler, or None if scheduling is disabled.
+    """
+    scheduler_config = config.get("scheduler") or {}
+    if not scheduler_config.get("enabled", False):
+        return None
+    return LLMScheduler(
+        max_concurrency=scheduler_config.get("max_concurrency", 4),
+        requests_per_minute=scheduler_config.get("requests_per_minute"),
+        burst=scheduler_config.get("burst"),
+        max_queue=scheduler_config.get("max_queue", 32),
+    )
+
+
+def backend_from_config(config: Dict[str, Any]) -> Optional[LLMBackend]:
+    """Create an LLM backend from the ``backend`` section of an LLM config.
+
+    The NEOSCENE_LLM_URL environment variable selects the HTTP backend with
+    that URL regardless of the config file.
+
+    Args:
+        config: Loaded LLM configuration.
+
+    Returns:
+        An HTTPBackend for ``type: http``, otherwise None (the client then
+        uses the Gemini SDK when an API key is available).
+
+    Raises:
+        LLMConfigError: If the HTTP backend has no URL.
+    """
+    backend_config = config.get("backend") or {}
+    env_url = os.getenv("NEOSCENE_LLM_URL")
+    backend_type = "http" if env_url else backend_config.get("type", "gemini")
+    if backend_type == "gemini":
+        return None
+    if backend_type != "http":
+        raise LLMConfigError(f"Unknown LLM backend type: {backend_type}")
+
+    url = env_url or backend_config.get("url")
+    if not url:
+        raise LLMConfigError("backend.url is required for the http backend")
+    return HTTPBackend(url, timeout=float(backend_config.get("timeout_seconds", 60)))
+
+
+# Rough characters-per-token ratio used to estimate token counts
+CHARS_PER_TOKEN = 4
+
+LLM_REQUEST_SECONDS = REGISTRY.histogram(
+    "neoscene_llm_request_duration_seconds",
+    "Latency of LLM backend calls (cache hits excluded)",
+    ("backend",),
+)
+LLM_REQUESTS = REGISTRY.counter(
+    "neoscene_llm_requests_total", "LLM backend calls", ("backend",)
+)
+LLM_ERRORS = REGISTRY.counter(
+    "neoscene_llm_errors_total", "Failed LLM backend calls", ("backend",)
+)
+LLM_TOKENS = REGISTRY.counter(
+    "neoscene_llm_tokens_total",
+    f"Estimated LLM tokens (~{CHARS_PER_TOKEN} characters per token)",
+    ("backend", "direction"),
+)
+
+
+def _record_llm_call(backend: str, start: float, prompt: str, response: Optional[str]) -> None:
+    """Record latency, token and error metrics for one backend call.
+
+    Args:
+        backend: Backend name.
+        start: perf_counter() value when the call started.
+        prompt: Prompt sent.
+        response: Response text, or None if the call failed.
+    """
+    LLM_REQUEST_SECONDS.observe(time.perf_counter() - start, backend=backend)
+    LLM_REQUESTS.inc(backend=backend)
+    LLM_TOKENS.inc(math.ceil(len(prompt) / CHARS_PER_TOKEN), backend=backend, direction="prompt")
+    if response is None:
+        LLM_ERRORS.inc(backend=backend)
+    else:
+        LLM_TOKENS.inc(
+            math.ceil(len(response) / CHARS_PER_TOKEN), backend=backend, direction="completion"
+        )
+
+
 class GeminiClient:
     """Client wrapper for Google's Gemini API.
 
@@ -81,12 +796,18 @@ class GeminiClient:
         >>> print(response)
     """
 
+    # Chunk size used to simulate streaming in mock mode
+    MOCK_STREAM_CHUNK_SIZE = 32
+
     def __init__(
         self,
         model_name: str = "gemini-1.5-flash",
         api_key: Optional[str] = None,
         temperature: float = 0.3,
         max_output_tokens: int = 2048,
+        cache: Optional[ResponseCache] = None,
+        scheduler: Optional[LLMScheduler] = None,
+        backend: Optional[LLMBackend] = None,
     ):
         """Initialize the Gemini client.
 
@@ -96,6 +817,11 @@ class GeminiClient:
                      GEMINI_API_KEY or GOOGLE_API_KEY environment variable.
             temperature: Sampling temperature (0.0 to 1.0).
             max_output_tokens: Maximum tokens in the response.
+            cache: Optional response cache for identical prompts.
+            scheduler: Optional scheduler limiting concurrency and request
+                rate across every user of this client.
+            backend: Optional backend to send requests to instead of the
+                Gemini SDK (no API key needed).
 
         Raises:
             LLMConfigError: If no API key is available.
@@ -103,6 +829,8 @@ class GeminiClient:
         self.model_name = model_name
         self.temperature = temperature
         self.max_output_tokens = max_output_tokens
+        self.cache = cache
+        self.scheduler = scheduler
 
         # Get API key from argument, env, or raise error
         self.api_key = api_key or os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")
@@ -110,8 +838,9 @@ class GeminiClient:
         # Initialize the generative AI client if available
         self._client = None
         self._model = None
+        self._backend = backend
 
-        if self.api_key:
+        if self.api_key and backend is None:
             self._init_client()
 
     def _init_client(self) -> None:
@@ -129,13 +858,29 @@ class GeminiClient:
 
     @property
     def is_configured(self) -> bool:
-        """Check if the client is properly configured with an API key."""
-        return self.api_key is not None
+        """Check if the client is configured with an API key or a backend."""
+        return self.api_key is not None or self._backend is not None
 
     @property
     def is_available(self) -> bool:
-        """Check if the Gemini API is available (client initialized)."""
-        return self._model is not None
+        """Check if a backend is available (client initialized)."""
+        return self.backend is not None
+
+    @property
+    def backend(self) -> Optional[LLMBackend]:
+        """The backend requests are sent to, or None in mock mode."""
+        if self._backend is not None:
+            return self._backend
+        if self._model is not None:
+            return GeminiBackend(self._model)
+        return None
+
+    @property
+    def _api_label(self) -> str:
+        """Name of the backend used in error messages."""
+        if self._backend is None:
+            return "Gemini API"
+        return f"LLM backend '{self._backend.name}'"
 
     @classmethod
     def from_default_config(cls, api_key: Optional[str] = None) -> "GeminiClient":
@@ -153,6 +898,9 @@ class GeminiClient:
             api_key=api_key,
             temperature=config.get("temperature", 0.3),
             max_output_tokens=config.get("max_output_tokens", 2048),
+            cache=cache_from_config(config),
+            scheduler=scheduler_from_config(config),
+            backend=backend_from_config(config),
         )
 
     @classmethod
@@ -172,6 +920,9 @@ class GeminiClient:
             api_key=api_key,
             temperature=config.get("temperature", 0.3),
             max_output_tokens=config.get("max_output_tokens", 2048),
+            cache=cache_from_config(config),
+            scheduler=scheduler_from_config(config),
+            backend=backend_from_config(config),
         )
 
     def generate(
@@ -179,6 +930,7 @@ class GeminiClient:
         prompt: str,
         temperature: Optional[float] = None,
         max_output_tokens: Optional[int] = None,
+        use_cache: bool = True,
         **kwargs: Any,
     ) -> str:
         """Generate a response from the LLM.
@@ -187,6 +939,7 @@ class GeminiClient:
             prompt: The input prompt to send to the model.
             temperature: Override the default temperature.
             max_output_tokens: Override the default max tokens.
+            use_cache: If False, bypass the response cache for this request.
             **kwargs: Additional arguments passed to the API.
 
         Returns:
@@ -196,29 +949,168 @@ class GeminiClient:
             LLMConfigError: If the client is not configured.
             LLMAPIError: If the API call fails.
         """
-        temp = temperature if temperature is not None else self.temperature
-        max_tokens = max_output_tokens if max_output_tokens is not None else self.max_output_tokens
-
         # If no API key or client, return a mock response
         if not self.is_configured or not self.is_available:
             return self._mock_generate(prompt)
 
-        try:
-            generation_config = {
-                "temperature": temp,
-                "max_output_tokens": max_tokens,
-                **kwargs,
-            }
+        generation_config = self._generation_config(temperature, max_output_tokens, **kwargs)
+        return self._cached_call(prompt, generation_config, use_cache)
+
+    def _generation_config(
+        self,
+        temperature: Optional[float],
+        max_output_tokens: Optional[int],
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """Build the generation config, applying client defaults."""
+        temp = temperature if temperature is not None else self.temperature
+        max_tokens = max_output_tokens if max_output_tokens is not None else self.max_output_tokens
+        return {
+            "temperature": temp,
+            "max_output_tokens": max_tokens,
+            **kwargs,
+        }
+
+    def _cache_key(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        """Build the response cache key for a request."""
+        params = {k: v for k, v in generation_config.items() if k != "temperature"}
+        return ResponseCache.make_key(
+            self.model_name, generation_config["temperature"], prompt, **params
+        )
+
+    def invalidate(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        json_mode: bool = False,
+        **kwargs: Any,
+    ) -> bool:
+        """Drop the cached response to a request, so the next call asks the model again.
 
-            response = self._model.generate_content(
-                prompt,
-                generation_config=generation_config,
+        Callers that parse or validate a response call this when it is
+        rejected; otherwise the cache would replay the bad response until
+        it expires. The arguments must match those of the original call.
+
+        Args:
+            prompt: The prompt of the rejected request.
+            temperature: Temperature override passed to the request.
+            max_output_tokens: Max tokens override passed to the request.
+            json_mode: True if the request used generate_json (or its variants).
+            **kwargs: Additional arguments passed to the request.
+
+        Returns:
+            True if a cached response was removed.
+        """
+        if self.cache is None:
+            return False
+        if json_mode:
+            kwargs["response_mime_type"] = "application/json"
+        generation_config = self._generation_config(temperature, max_output_tokens, **kwargs)
+        return self.cache.delete(self._cache_key(prompt, generation_config))
+
+    async def invalidate_async(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        json_mode: bool = False,
+        **kwargs: Any,
+    ) -> bool:
+        """Async variant of invalidate() that does the cache I/O in a worker thread."""
+        if self.cache is None:
+            return False
+        return await asyncio.to_thread(
+            self.invalidate, prompt, temperature, max_output_tokens, json_mode, **kwargs
+        )
+
+    def _cached_call(
+        self,
+        prompt: str,
+        generation_config: Dict[str, Any],
+        use_cache: bool,
+    ) -> str:
+        """Call the API, serving and storing responses through the cache."""
+        key = self._cache_key(prompt, generation_config)
+        cacheable = self.cache is not None and use_cache
+        if cacheable:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        if self.scheduler is not None:
+            text = self.scheduler.run(
+                lambda: self._call_api(prompt, generation_config),
+                key=key if use_cache else None,
             )
+        else:
+            text = self._call_api(prompt, generation_config)
 
-            return response.text
+        if cacheable:
+            self.cache.put(key, text)
+        return text
 
+    async def _cached_call_async(
+        self,
+        prompt: str,
+        generation_config: Dict[str, Any],
+        use_cache: bool,
+    ) -> str:
+        """Async variant of _cached_call.
+
+        Cache lookups and stores are SQLite file I/O behind a lock shared
+        with thread callers, so they run in a worker thread.
+        """
+        key = self._cache_key(prompt, generation_config)
+        cacheable = self.cache is not None and use_cache
+        if cacheable:
+            cached = await asyncio.to_thread(self.cache.get, key)
+            if cached is not None:
+                return cached
+
+        if self.scheduler is not None:
+            text = await self.scheduler.run_async(
+                lambda: self._call_api_async(prompt, generation_config),
+                key=key if use_cache else None,
+            )
+        else:
+            text = await self._call_api_async(prompt, generation_config)
+
+        if cacheable:
+            await asyncio.to_thread(self.cache.put, key, text)
+        return text
+
+    async def _call_api_async(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        """Send one request to the backend without blocking the event loop.
+
+        Raises:
+            LLMAPIError: If the API call fails.
+        """
+        backend = self.backend
+        start = time.perf_counter()
+        try:
+            text = await backend.generate_async(prompt, generation_config)
+        except Exception as e:
+            _record_llm_call(backend.name, start, prompt, None)
+            raise LLMAPIError(f"{self._api_label} call failed: {e}")
+        _record_llm_call(backend.name, start, prompt, text)
+        return text
+
+    def _call_api(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        """Send one request to the backend.
+
+        Raises:
+            LLMAPIError: If the API call fails.
+        """
+        backend = self.backend
+        start = time.perf_counter()
+        try:
+            text = backend.generate(prompt, generation_config)
         except Exception as e:
-            raise LLMAPIError(f"Gemini API call failed: {e}")
+            _record_llm_call(backend.name, start, prompt, None)
+            raise LLMAPIError(f"{self._api_label} call failed: {e}")
+        _record_llm_call(backend.name, start, prompt, text)
+        return text
 
     def _mock_generate(self, prompt: str) -> str:
         """Generate a mock response for testing without API access.
@@ -244,6 +1136,7 @@ class GeminiClient:
         prompt: str,
         temperature: Optional[float] = None,
         max_output_tokens: Optional[int] = None,
+        use_cache: bool = True,
         **kwargs: Any,
     ) -> str:
         """Generate a JSON response from the LLM using structured output mode.
@@ -254,6 +1147,7 @@ class GeminiClient:
             prompt: The input prompt.
             temperature: Override the default temperature.
             max_output_tokens: Override the default max tokens.
+            use_cache: If False, bypass the response cache for this request.
             **kwargs: Additional arguments passed to generate().
 
         Returns:
@@ -262,26 +1156,142 @@ class GeminiClient:
         if not self.is_configured or not self.is_available:
             return self._mock_generate(prompt)
 
-        temp = temperature if temperature is not None else self.temperature
-        max_tokens = max_output_tokens if max_output_tokens is not None else self.max_output_tokens
+        generation_config = self._generation_config(
+            temperature,
+            max_output_tokens,
+            response_mime_type="application/json",  # Force JSON output
+            **kwargs,
+        )
+        return self._cached_call(prompt, generation_config, use_cache)
 
-        try:
-            generation_config = {
-                "temperature": temp,
-                "max_output_tokens": max_tokens,
-                "response_mime_type": "application/json",  # Force JSON output
-                **kwargs,
-            }
+    async def generate_async(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        **kwargs: Any,
+    ) -> str:
+        """Async variant of generate() that does not block the event loop.
 
-            response = self._model.generate_content(
-                prompt,
-                generation_config=generation_config,
-            )
+        Args:
+            prompt: The input prompt to send to the model.
+            temperature: Override the default temperature.
+            max_output_tokens: Override the default max tokens.
+            use_cache: If False, bypass the response cache for this request.
+            **kwargs: Additional arguments passed to the API.
+
+        Returns:
+            The generated text response.
 
-            return response.text
+        Raises:
+            LLMAPIError: If the API call fails.
+        """
+        if not self.is_configured or not self.is_available:
+            return self._mock_generate(prompt)
 
-        except Exception as e:
-            raise LLMAPIError(f"Gemini API call failed: {e}")
+        generation_config = self._generation_config(temperature, max_output_tokens, **kwargs)
+        return await self._cached_call_async(prompt, generation_config, use_cache)
+
+    async def generate_json_async(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        **kwargs: Any,
+    ) -> str:
+        """Async variant of generate_json() that does not block the event loop.
+
+        Args:
+            prompt: The input prompt.
+            temperature: Override the default temperature.
+            max_output_tokens: Override the default max tokens.
+            use_cache: If False, bypass the response cache for this request.
+            **kwargs: Additional arguments passed to the API.
+
+        Returns:
+            The generated JSON string.
+
+        Raises:
+            LLMAPIError: If the API call fails.
+        """
+        if not self.is_configured or not self.is_available:
+            return self._mock_generate(prompt)
+
+        generation_config = self._generation_config(
+            temperature,
+            max_output_tokens,
+            response_mime_type="application/json",
+            **kwargs,
+        )
+        return await self._cached_call_async(prompt, generation_config, use_cache)
+
+    def generate_json_stream(
+        self,
+        prompt: str,
+        temperature: Optional[float] = None,
+        max_output_tokens: Optional[int] = None,
+        use_cache: bool = True,
+        **kwargs: Any,
+    ) -> Iterator[str]:
+        """Stream a JSON response from the LLM chunk by chunk.
+
+        Cached responses are yielded as a single chunk. A streamed response
+        is only stored in the cache once it has been received completely.
+        This is a blocking generator (cache and network I/O): iterate it
+        from a worker thread, as /chat/stream does, not on an event loop.
+
+        Args:
+            prompt: The input prompt.
+            temperature: Override the default temperature.
+            max_output_tokens: Override the default max tokens.
+            use_cache: If False, bypass the response cache for this request.
+            **kwargs: Additional arguments passed to the API.
+
+        Yields:
+            Text chunks of the generated JSON string, in order.
+
+        Raises:
+            LLMAPIError: If the API call fails.
+            LLMQueueFullError: If the scheduler queue is full.
+        """
+        if not self.is_configured or not self.is_available:
+            text = self._mock_generate(prompt)
+            for start in range(0, len(text), self.MOCK_STREAM_CHUNK_SIZE):
+                yield text[start:start + self.MOCK_STREAM_CHUNK_SIZE]
+            return
+
+        generation_config = self._generation_config(
+            temperature,
+            max_output_tokens,
+            response_mime_type="application/json",
+            **kwargs,
+        )
+
+        key = None
+        if self.cache is not None and use_cache:
+            key = self._cache_key(prompt, generation_config)
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        chunks: List[str] = []
+        backend = self.backend
+        with self.scheduler.slot() if self.scheduler is not None else nullcontext():
+            start = time.perf_counter()
+            try:
+                for text in backend.generate_stream(prompt, generation_config):
+                    chunks.append(text)
+                    yield text
+            except Exception as e:
+                _record_llm_call(backend.name, start, prompt, None)
+                raise LLMAPIError(f"{self._api_label} streaming call failed: {e}")
+            _record_llm_call(backend.name, start, prompt, "".join(chunks))
+
+        if key is not None:
+            self.cache.put(key, "".join(chunks))
 
     def __repr__(self) -> str:
         """Return a string representation of the client."""
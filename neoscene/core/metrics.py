@@ -0,0 +1,369 @@
+"""Prometheus metrics in the text exposition format.
+
+Metrics live in a process-wide registry (``REGISTRY``) and are rendered on
+demand by the API's ``/metrics`` endpoint:
+
+- ``Counter`` and ``Histogram`` are updated by the code paths they measure
+  (HTTP requests, LLM calls, exporter cache lookups). Each update is one
+  short critical section.
+- ``Gauge`` and ``CallbackCounter`` values are read from a callback at
+  scrape time. Hot loops such as the simulation worker only update plain
+  attributes on their own objects; nothing in the loop takes a lock or
+  touches the registry.
+- Pipeline stage histograms recorded by ``neoscene.core.tracing`` are
+  exported as ``neoscene_stage_duration_seconds``.
+
+Example:
+    >>> requests = Counter("demo_requests_total", "Requests handled", ("route",))
+    >>> requests.inc(route="/chat")
+    >>> requests.value(route="/chat")
+    1.0
+"""
+
+import math
+import threading
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from neoscene.core.logging_config import get_logger
+from neoscene.core.tracing import Histogram as _BucketCounts
+from neoscene.core.tracing import stage_histograms
+
+logger = get_logger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Histogram bucket upper bounds in seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60,
+)
+
+LabelValues = Tuple[str, ...]
+GaugeValue = Union[float, Mapping[Union[str, LabelValues], float]]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a label set as ``{name="value",...}`` (empty string for none)."""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _histogram_lines(
+    name: str,
+    labelnames: Sequence[str],
+    labelvalues: Sequence[str],
+    buckets: Sequence[float],
+    counts: Sequence[int],
+    total: float,
+    count: int,
+    scale: float = 1.0,
+) -> List[str]:
+    """Render one histogram series as cumulative ``_bucket``, ``_sum`` and ``_count``.
+
+    Args:
+        name: Metric name.
+        labelnames: Label names of the series.
+        labelvalues: Label values of the series.
+        buckets: Bucket upper bounds.
+        counts: Per-bucket counts (one more than buckets, the last is +Inf).
+        total: Sum of observed values.
+        count: Number of observations.
+        scale: Factor applied to bounds and sum (e.g. 0.001 for ms to s).
+    """
+    names = tuple(labelnames) + ("le",)
+    lines = []
+    cumulative = 0
+    for bound, bucket_count in zip(tuple(buckets) + (math.inf,), counts):
+        cumulative += bucket_count
+        le = "+Inf" if math.isinf(bound) else repr(float(bound) * scale)
+        labels = _format_labels(names, tuple(labelvalues) + (le,))
+        lines.append(f"{name}_bucket{labels} {cumulative}")
+    labels = _format_labels(labelnames, labelvalues)
+    lines.append(f"{name}_sum{labels} {_format_value(total * scale)}")
+    lines.append(f"{name}_count{labels} {count}")
+    return lines
+
+
+class _Metric:
+    """Base class: name, help text and label names."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Mapping[str, object]) -> LabelValues:
+        """Label values in label-name order."""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> List[str]:
+        """Return the sample lines of this metric."""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        """Return the HELP, TYPE and sample lines of this metric."""
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type}",
+            *self.samples(),
+        ]
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """Initialize the counter.
+
+        Args:
+            name: Metric name (should end in ``_total``).
+            documentation: HELP text.
+            labelnames: Label names; every update must set all of them.
+        """
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        """Increase the counter for a label set."""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        """Current value for a label set (0.0 if never incremented)."""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """Fixed-bucket histogram per label set."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        """Initialize the histogram.
+
+        Args:
+            name: Metric name (e.g. ``..._seconds``).
+            documentation: HELP text.
+            labelnames: Label names; every observation must set all of them.
+            buckets: Sorted bucket upper bounds.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        self._series: Dict[LabelValues, _BucketCounts] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: object) -> None:
+        """Record one observation for a label set."""
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            with self._lock:
+                series = self._series.setdefault(key, _BucketCounts(self.buckets))
+        series.observe(value)
+
+    def count(self, **labels: object) -> int:
+        """Number of observations for a label set."""
+        series = self._series.get(self._key(labels))
+        return series.snapshot()[2] if series is not None else 0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._series.items())
+        lines: List[str] = []
+        for key, series in items:
+            counts, total, count = series.snapshot()
+            lines.extend(
+                _histogram_lines(
+                    self.name, self.labelnames, key, self.buckets, counts, total, count
+                )
+            )
+        return lines
+
+
+class Gauge(_Metric):
+    """Value read from a callback when metrics are rendered.
+
+    The callback returns either a single number (for a gauge without
+    labels) or a mapping from label values to numbers. For a single label
+    the keys may be plain strings.
+    """
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        func: Callable[[], GaugeValue],
+        labelnames: Sequence[str] = (),
+    ):
+        """Initialize the gauge.
+
+        Args:
+            name: Metric name.
+            documentation: HELP text.
+            func: Callback returning the current value(s).
+            labelnames: Label names of the mapping keys.
+        """
+        super().__init__(name, documentation, labelnames)
+        self.func = func
+
+    def samples(self) -> List[str]:
+        try:
+            value = self.func()
+        except Exception as e:
+            logger.warning(f"Gauge {self.name} failed: {e}")
+            return []
+        if not isinstance(value, Mapping):
+            return [f"{self.name} {_format_value(value)}"]
+        lines = []
+        for key, sample in sorted(value.items(), key=lambda item: str(item[0])):
+            key = key if isinstance(key, tuple) else (key,)
+            labels = _format_labels(self.labelnames, tuple(str(k) for k in key))
+            lines.append(f"{self.name}{labels} {_format_value(sample)}")
+        return lines
+
+
+class CallbackCounter(Gauge):
+    """Counter whose value is read from a callback (e.g. a worker's step count)."""
+
+    type = "counter"
+
+
+class StageDurations(_Metric):
+    """Exports the tracing stage histograms (recorded in ms) in seconds."""
+
+    type = "histogram"
+
+    def __init__(self, name: str = "neoscene_stage_duration_seconds"):
+        """Initialize the exporter."""
+        super().__init__(name, "Duration of pipeline stages", ("stage",))
+
+    def samples(self) -> List[str]:
+        lines: List[str] = []
+        for stage, histogram in stage_histograms.items():
+            counts, total, count = histogram.snapshot()
+            lines.extend(
+                _histogram_lines(
+                    self.name, self.labelnames, (stage,), histogram.buckets,
+                    counts, total, count, scale=0.001,
+                )
+            )
+        return lines
+
+
+class MetricsRegistry:
+    """Named collection of metrics rendered together."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric, replacing any metric with the same name."""
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def unregister(self, name: str) -> None:
+        """Remove a metric if present."""
+        with self._lock:
+            self._metrics.pop(name, None)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Return a registered metric by name."""
+        return self._metrics.get(name)
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Return the counter with this name, creating it if needed."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if not isinstance(metric, Counter):
+                metric = self._metrics[name] = Counter(name, documentation, labelnames)
+            return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Return the histogram with this name, creating it if needed."""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if not isinstance(metric, Histogram):
+                metric = self._metrics[name] = Histogram(name, documentation, labelnames, buckets)
+            return metric
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        func: Callable[[], GaugeValue],
+        labelnames: Sequence[str] = (),
+    ) -> Gauge:
+        """Register a callback gauge, replacing any previous one of this name."""
+        return self.register(Gauge(name, documentation, func, labelnames))  # type: ignore
+
+    def callback_counter(
+        self,
+        name: str,
+        documentation: str,
+        func: Callable[[], GaugeValue],
+        labelnames: Sequence[str] = (),
+    ) -> CallbackCounter:
+        """Register a callback counter, replacing any previous one of this name."""
+        return self.register(CallbackCounter(name, documentation, func, labelnames))  # type: ignore
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+REGISTRY.register(StageDurations())
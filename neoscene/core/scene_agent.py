@@ -5,71 +5,48 @@ of natural language scene descriptions into valid SceneSpec objects using
 the LLM and asset catalog.
 """
 
+import asyncio
 import json
 import re
-from typing import Any, Dict, List, Optional
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, List, Literal, Optional, Tuple
 
 from pydantic import ValidationError
 
 from neoscene.core.asset_catalog import AssetCatalog
 from neoscene.core.errors import LLMError, NeosceneError, SceneValidationError
+from neoscene.core.json_repair import JsonRepairError, loads_lenient
 from neoscene.core.llm_client import GeminiClient, LLMAPIError
 from neoscene.core.logging_config import get_logger
-from neoscene.core.scene_schema import SceneSpec
+from neoscene.core.scene_edits import LocalEdit, apply_local_edit
+from neoscene.core.scene_patch import ScenePatchError, apply_scene_patch, scene_to_patch_base
+from neoscene.core.scene_schema import (
+    CameraSpec,
+    EnvironmentSpec,
+    LightSpec,
+    ObjectSpec,
+    PathSpec,
+    PhysicsSpec,
+    SceneSpec,
+    TaskSpec,
+)
+from neoscene.core.scene_stream import SceneStreamError, SceneStreamParser, StreamedElement
 from neoscene.core.scene_tools import list_assets_by_category
+from neoscene.core.speculation import CandidateVariant, SpeculativeGeneration
+from neoscene.core.tracing import span, traced
 
 logger = get_logger(__name__)
 
-
-def _repair_json(json_str: str) -> str:
-    """Attempt to repair common JSON issues from LLM output.
-    
-    Fixes:
-    - Trailing commas before ] or }
-    - Single quotes to double quotes
-    - Removes JavaScript-style comments
-    - Truncated JSON (adds missing closing braces)
-    - Missing commas between elements
-    - Unquoted keys
-    """
-    s = json_str.strip()
-    
-    # Remove JavaScript comments
-    s = re.sub(r'//.*?(?:\n|$)', '\n', s)
-    s = re.sub(r'/\*.*?\*/', '', s, flags=re.DOTALL)
-    
-    # Replace single quotes with double quotes (but not inside strings)
-    # This is a simple heuristic - replace 'key': with "key":
-    s = re.sub(r"'([^']+)'(\s*:)", r'"\1"\2', s)
-    
-    # Remove trailing commas before ] or }
-    s = re.sub(r',(\s*[}\]])', r'\1', s)
-    
-    # Fix missing commas between } and { (common in arrays of objects)
-    s = re.sub(r'\}(\s*)\{', r'},\1{', s)
-    
-    # Fix missing commas between ] and [ 
-    s = re.sub(r'\](\s*)\[', r'],\1[', s)
-    
-    # Fix missing commas between number/string and { or [
-    s = re.sub(r'(\d)(\s*)\{', r'\1,\2{', s)
-    s = re.sub(r'(\d)(\s*)\[', r'\1,\2[', s)
-    s = re.sub(r'"(\s*)\{', r'",\1{', s)
-    s = re.sub(r'"(\s*)\[', r'",\1[', s)
-    
-    # Fix missing commas between } or ] and "key":
-    s = re.sub(r'(\}|\])(\s*)"([^"]+)"(\s*):', r'\1,\2"\3"\4:', s)
-    
-    # Count braces and add missing ones
-    open_braces = s.count('{') - s.count('}')
-    open_brackets = s.count('[') - s.count(']')
-    
-    if open_braces > 0:
-        s = s.rstrip() + '}' * open_braces
-    if open_brackets > 0:
-        s = s.rstrip() + ']' * open_brackets
-    
-    return s
+# Schema models used to validate streamed values as soon as they complete
+_STREAMED_MODELS = {
+    "environment": EnvironmentSpec,
+    "physics": PhysicsSpec,
+    "objects": ObjectSpec,
+    "cameras": CameraSpec,
+    "lights": LightSpec,
+    "paths": PathSpec,
+    "tasks": TaskSpec,
+}
 
 
 class SceneGenerationError(NeosceneError):
@@ -78,7 +55,159 @@ class SceneGenerationError(NeosceneError):
     pass
 
 
-def _build_asset_catalog_summary(catalog: AssetCatalog) -> str:
+# Category display order shared by the full summary and the compact index
+_CATEGORY_ORDER = ["environment", "vehicle", "nature", "person", "animal", "sensor", "prop"]
+
+# Words that never identify an asset (skipped when scoping the asset context)
+_STOPWORDS = {
+    "the", "and", "with", "add", "put", "place", "create", "make", "some", "few",
+    "many", "more", "less", "into", "onto", "from", "near", "next", "there", "this",
+    "that", "them", "then", "want", "would", "like", "please", "scene", "around",
+    "each", "every", "other", "also", "have", "has", "its", "for", "all", "any",
+    "new", "remove", "delete", "change", "move", "set", "use", "using", "one",
+    "two", "three", "four", "five", "six", "seven", "eight", "nine", "ten",
+}
+
+
+def _ordered_categories(categories: List[str]) -> List[str]:
+    """Return categories in display order, unknown categories last."""
+    known = [c for c in _CATEGORY_ORDER if c in categories]
+    return known + sorted(c for c in categories if c not in _CATEGORY_ORDER)
+
+
+def _query_terms(text: str) -> List[str]:
+    """Split free text into catalog search terms.
+
+    Produces single words (with a naive singular form) and adjacent word
+    pairs, so "apple trees" yields "apple", "tree", "trees" and "apple tree".
+
+    Args:
+        text: Free text, usually the user message.
+
+    Returns:
+        De-duplicated list of lowercase search terms.
+    """
+    words = [w for w in re.findall(r"[a-z0-9]+", text.lower()) if w not in _STOPWORDS]
+    terms: List[str] = []
+    for word in words:
+        if len(word) < 3 or word.isdigit():
+            continue
+        terms.append(word)
+        if word.endswith("es") and len(word) > 4:
+            terms.append(word[:-2])
+        if word.endswith("s") and len(word) > 3:
+            terms.append(word[:-1])
+    for first, second in zip(words, words[1:]):
+        terms.append(f"{first} {second}")
+    return list(dict.fromkeys(terms))
+
+
+def _select_relevant_assets(
+    catalog: AssetCatalog,
+    text: str,
+    extra_ids: Optional[List[str]] = None,
+    per_term_limit: int = 3,
+) -> List[str]:
+    """Pre-select the assets relevant to a request.
+
+    Uses catalog search and fallback lookups for every term in the text.
+    Environments are always kept when none matched, since every scene
+    needs one.
+
+    Args:
+        catalog: The asset catalog.
+        text: The user request.
+        extra_ids: Asset IDs that must be included (e.g. from the current scene).
+        per_term_limit: Maximum search hits kept per term.
+
+    Returns:
+        List of asset IDs to describe in the prompt.
+    """
+    selected: Dict[str, None] = {}
+    for aid in extra_ids or []:
+        if aid in catalog:
+            selected[aid] = None
+
+    for term in _query_terms(text):
+        for summary in catalog.search(term, limit=per_term_limit):
+            selected[summary.asset_id] = None
+        fallback = catalog.find_fallback(term.replace(" ", "_"))
+        if fallback is not None:
+            selected[fallback.asset_id] = None
+
+    if not any(s.category == "environment" for s in catalog.list_all() if s.asset_id in selected):
+        for summary in catalog.list_all(category="environment"):
+            selected[summary.asset_id] = None
+
+    return list(selected)
+
+
+def _scene_asset_ids(scene: Optional[SceneSpec]) -> List[str]:
+    """Collect the asset IDs referenced by a scene."""
+    if scene is None:
+        return []
+    ids = [scene.environment.asset_id]
+    ids.extend(obj.asset_id for obj in scene.objects)
+    ids.extend(cam.asset_id for cam in scene.cameras if cam.asset_id)
+    return ids
+
+
+def _collect_unknown_asset_ids(catalog: AssetCatalog, raw_json: Optional[str]) -> List[str]:
+    """Find asset IDs in raw scene JSON that are not in the catalog.
+
+    Args:
+        catalog: The asset catalog.
+        raw_json: JSON text of a (possibly invalid) scene.
+
+    Returns:
+        List of unknown asset IDs, empty if the JSON cannot be parsed.
+    """
+    if not raw_json:
+        return []
+    try:
+        data = json.loads(raw_json)
+    except json.JSONDecodeError:
+        return []
+    if not isinstance(data, dict):
+        return []
+
+    refs = []
+    env = data.get("environment")
+    if isinstance(env, dict):
+        refs.append(env.get("asset_id"))
+    for key in ("objects", "cameras"):
+        for item in data.get(key) or []:
+            if isinstance(item, dict):
+                refs.append(item.get("asset_id"))
+    return [r for r in dict.fromkeys(refs) if isinstance(r, str) and r not in catalog]
+
+
+def _build_category_index(catalog: AssetCatalog, exclude: List[str]) -> List[str]:
+    """Build a compact ID-only index of the assets not described in detail.
+
+    Args:
+        catalog: The asset catalog.
+        exclude: Asset IDs already described in detail.
+
+    Returns:
+        Prompt lines, empty if every asset is already described.
+    """
+    excluded = set(exclude)
+    llm_data = catalog.for_llm_prompt(local_only=True)
+    lines = []
+    for category in _ordered_categories(list(llm_data)):
+        ids = [a["asset_id"] for a in llm_data[category] if a["asset_id"] not in excluded]
+        if ids:
+            lines.append(f"- {category}: {', '.join(ids)}")
+    if not lines:
+        return []
+    return ["### Other Assets (IDs only, use if the user asks for them)", *lines, ""]
+
+
+def _build_asset_catalog_summary(
+    catalog: AssetCatalog,
+    asset_ids: Optional[List[str]] = None,
+) -> str:
     """Build a summary of available assets for the LLM.
 
     Uses the categorized asset list from the catalog.
@@ -86,6 +215,8 @@ def _build_asset_catalog_summary(catalog: AssetCatalog) -> str:
 
     Args:
         catalog: The asset catalog.
+        asset_ids: If given, only these assets are described in detail and
+            the rest of the catalog is listed in a compact category index.
 
     Returns:
         Formatted string describing available assets by category.
@@ -95,14 +226,12 @@ def _build_asset_catalog_summary(catalog: AssetCatalog) -> str:
     
     # Use the new for_llm_prompt() method
     llm_data = catalog.for_llm_prompt(local_only=True)
+    scope = set(asset_ids) if asset_ids is not None else None
     
-    # Order categories logically
-    category_order = ["environment", "vehicle", "nature", "person", "animal", "sensor", "prop"]
-    
-    for category in category_order:
-        if category not in llm_data:
-            continue
+    for category in _ordered_categories(list(llm_data)):
         assets = llm_data[category]
+        if scope is not None:
+            assets = [a for a in assets if a["asset_id"] in scope]
         if not assets:
             continue
             
@@ -123,6 +252,9 @@ def _build_asset_catalog_summary(catalog: AssetCatalog) -> str:
             lines.append(f"- `{aid}`: tags=[{tags}]{extra_str}")
         
         lines.append("")
+
+    if scope is not None:
+        lines.extend(_build_category_index(catalog, exclude=list(scope)))
     
     # Add matching instructions
     lines.append("### Matching Rules")
@@ -261,15 +393,16 @@ def _extract_json_from_response(response: str) -> str:
     if json_match:
         return json_match.group(1).strip()
 
-    # Try to find raw JSON (starts with { and ends with })
-    json_match = re.search(r"\{.*\}", response, re.DOTALL)
-    if json_match:
-        return json_match.group(0).strip()
-
-    # If response looks like pure JSON
-    stripped = response.strip()
-    if stripped.startswith("{") and stripped.endswith("}"):
-        return stripped
+    # Find the raw JSON object (string-aware, so braces in values don't count)
+    start = response.find("{")
+    if start != -1:
+        parser = SceneStreamParser()
+        try:
+            parser.feed(response[start:])
+            return parser.finish()
+        except SceneStreamError:
+            # Unbalanced or truncated: leave it to the lenient JSON reader
+            return response[start:].strip()
 
     raise SceneGenerationError(f"Could not extract JSON from response: {response[:200]}...")
 
@@ -289,7 +422,6 @@ class SceneAgent:
 
     TODO(future): Add multi-turn conversation for iterative refinement
     TODO(future): Use LLM function calling for structured tool use
-    TODO(future): Add streaming support for real-time feedback
     TODO(future): Implement scene templates for common scenarios
     """
 
@@ -298,6 +430,10 @@ class SceneAgent:
         catalog: AssetCatalog,
         llm: GeminiClient,
         max_repair_attempts: int = 2,
+        scoped_context: bool = True,
+        edit_mode: Literal["full", "patch"] = "patch",
+        local_edits: bool = True,
+        speculation: Optional[SpeculativeGeneration] = None,
     ):
         """Initialize the SceneAgent.
 
@@ -305,24 +441,88 @@ class SceneAgent:
             catalog: Asset catalog for available assets.
             llm: LLM client for generation.
             max_repair_attempts: Max attempts to repair invalid JSON.
+            scoped_context: If True, describe only the assets relevant to each
+                request in detail instead of pasting the whole catalog.
+            edit_mode: How scene edits are requested from the LLM: "patch"
+                asks for a JSON Patch against the current scene, "full"
+                asks for the complete modified scene.
+            local_edits: If True, apply simple edits ("add 10 barrels",
+                "change timestep to 0.002") directly without the LLM.
+            speculation: If set, generate_and_repair_async runs several
+                candidates concurrently and keeps the first valid one.
         """
         self.catalog = catalog
         self.llm = llm
         self.max_repair_attempts = max_repair_attempts
+        self.scoped_context = scoped_context
+        self.edit_mode = edit_mode
+        self.local_edits = local_edits
+        self.speculation = speculation
 
         # Pre-build the asset summary
         self._asset_summary = _build_asset_catalog_summary(catalog)
         self._schema_summary = _build_schema_summary()
 
+        # Asset context size: full catalog vs. what was actually sent
+        self._prompt_stats = {"prompts": 0, "full_chars": 0, "scoped_chars": 0}
+
         logger.info(f"SceneAgent initialized with {len(catalog)} assets")
 
-    def _build_system_prompt(self) -> str:
-        """Build the system prompt for scene generation."""
+    def _asset_context(
+        self,
+        text: str,
+        extra_ids: Optional[List[str]] = None,
+        full: bool = False,
+    ) -> str:
+        """Build the asset section of a prompt for one request.
+
+        Args:
+            text: Text used to pick relevant assets (usually the user message).
+            extra_ids: Asset IDs that must be described in detail.
+            full: If True, describe the whole catalog regardless of scoping.
+
+        Returns:
+            Asset summary to embed in the prompt.
+        """
+        if full or not self.scoped_context:
+            summary = self._asset_summary
+        else:
+            asset_ids = _select_relevant_assets(self.catalog, text, extra_ids=extra_ids)
+            summary = _build_asset_catalog_summary(self.catalog, asset_ids)
+            logger.debug(
+                f"Asset context scoped to {len(asset_ids)}/{len(self.catalog)} assets: "
+                f"{len(self._asset_summary)} -> {len(summary)} chars"
+            )
+
+        self._prompt_stats["prompts"] += 1
+        self._prompt_stats["full_chars"] += len(self._asset_summary)
+        self._prompt_stats["scoped_chars"] += len(summary)
+        return summary
+
+    def prompt_size_stats(self) -> Dict[str, Any]:
+        """Return before/after asset-context size metrics.
+
+        Returns:
+            Dict with the number of prompts built, total characters the full
+            catalog would have used, total characters actually sent, and the
+            resulting reduction ratio.
+        """
+        stats: Dict[str, Any] = dict(self._prompt_stats)
+        full = stats["full_chars"]
+        stats["reduction"] = round(1.0 - stats["scoped_chars"] / full, 3) if full else 0.0
+        return stats
+
+    def _build_system_prompt(self, asset_summary: Optional[str] = None) -> str:
+        """Build the system prompt for scene generation.
+
+        Args:
+            asset_summary: Asset section to embed. Defaults to the full catalog.
+        """
         return f"""You are a scene generation assistant for MuJoCo simulations.
 Your task is to convert natural language scene descriptions into valid JSON
 that conforms to the SceneSpec schema.
 
-{self._asset_summary}
+{asset_summary or self._asset_summary}
 
 {self._schema_summary}
 
@@ -394,30 +594,54 @@ Instructions:
             LLMError: If LLM generation fails.
             SceneValidationError: If the generated JSON is invalid.
         """
+        full_prompt = self._build_generation_prompt(user_prompt, previous_scene)
+        # Lower temperature for more consistent output
+        raw_response = self._call_llm(full_prompt, temperature=0.3, action="generation")
+        with self._evict_on_failure(full_prompt, temperature=0.3):
+            return self._finish_generation(raw_response, user_prompt)
+
+    async def generate_scene_spec_async(
+        self,
+        user_prompt: str,
+        previous_scene: Optional[SceneSpec] = None,
+    ) -> SceneSpec:
+        """Async variant of generate_scene_spec that does not block the event loop.
+
+        Args:
+            user_prompt: Natural language description of the desired scene.
+            previous_scene: Optional previous scene to modify (for incremental updates).
+
+        Returns:
+            Valid SceneSpec object.
+        """
+        full_prompt = self._build_generation_prompt(user_prompt, previous_scene)
+        raw_response = await self._call_llm_async(full_prompt, temperature=0.3, action="generation")
+        async with self._evict_on_failure_async(full_prompt, temperature=0.3):
+            return self._finish_generation(raw_response, user_prompt)
+
+    @traced("prompt_build")
+    def _build_generation_prompt(
+        self,
+        user_prompt: str,
+        previous_scene: Optional[SceneSpec],
+        full_catalog: bool = False,
+    ) -> str:
+        """Build the full prompt for generating a scene."""
         if previous_scene:
             logger.info(f"Updating scene '{previous_scene.name}' with: '{user_prompt[:100]}...'")
         else:
             logger.info(f"Generating scene for prompt: '{user_prompt[:100]}...'")
 
-        system_prompt = self._build_system_prompt()
+        asset_summary = self._asset_context(
+            user_prompt, _scene_asset_ids(previous_scene), full=full_catalog
+        )
+        system_prompt = self._build_system_prompt(asset_summary)
         user_message = self._build_user_prompt(user_prompt, previous_scene)
-        full_prompt = f"{system_prompt}\n\n---\n\n{user_message}"
-
-        try:
-            # Use generate_json for structured output (Gemini JSON mode)
-            raw_response = self.llm.generate_json(
-                full_prompt,
-                temperature=0.3,  # Lower for more consistent output
-            )
-            logger.debug(f"LLM response received: {len(raw_response)} chars")
-        except LLMAPIError as e:
-            logger.error(f"LLM generation failed: {e}")
-            raise LLMError(
-                f"LLM generation failed: {e}",
-                llm_provider="gemini",
-                original_error=e,
-            )
+        return f"{system_prompt}\n\n---\n\n{user_message}"
 
+    def _finish_generation(self, raw_response: str, user_prompt: str) -> SceneSpec:
+        """Parse and validate a generation response and log the result."""
+        logger.debug(f"LLM response received: {len(raw_response)} chars")
         spec = self._parse_and_validate(raw_response, user_prompt)
 
         logger.info(
@@ -429,6 +653,100 @@ Instructions:
 
         return spec
 
+    def _call_llm(
+        self,
+        prompt: str,
+        temperature: float,
+        action: str,
+        json_mode: bool = True,
+    ) -> str:
+        """Call the LLM and wrap API failures in LLMError.
+
+        Args:
+            prompt: The full prompt.
+            temperature: Sampling temperature.
+            action: Short description used in error messages (e.g. "repair").
+            json_mode: If True, use Gemini JSON mode (generate_json).
+
+        Returns:
+            Raw LLM response.
+
+        Raises:
+            LLMError: If the LLM call fails.
+        """
+        try:
+            with span("llm"):
+                if json_mode:
+                    # Use generate_json for structured output (Gemini JSON mode)
+                    return self.llm.generate_json(prompt, temperature=temperature)
+                return self.llm.generate(prompt, temperature=temperature)
+        except LLMAPIError as e:
+            logger.error(f"LLM {action} failed: {e}")
+            raise LLMError(
+                f"LLM {action} failed: {e}",
+                llm_provider="gemini",
+                original_error=e,
+            )
+
+    @contextmanager
+    def _evict_on_failure(
+        self,
+        prompt: str,
+        temperature: float,
+        json_mode: bool = True,
+    ) -> Iterator[None]:
+        """Drop the cached LLM response to ``prompt`` if the block rejects it.
+
+        The response cache stores replies before they are parsed; without
+        this a malformed or invalid reply would be replayed until it
+        expires instead of the model being asked again.
+
+        Args:
+            prompt: The full prompt passed to _call_llm.
+            temperature: Sampling temperature passed to _call_llm.
+            json_mode: json_mode passed to _call_llm.
+        """
+        try:
+            yield
+        except (SceneValidationError, ScenePatchError):
+            self.llm.invalidate(prompt, temperature=temperature, json_mode=json_mode)
+            raise
+
+    @asynccontextmanager
+    async def _evict_on_failure_async(
+        self,
+        prompt: str,
+        temperature: float,
+        json_mode: bool = True,
+    ) -> AsyncIterator[None]:
+        """Async variant of _evict_on_failure; the cache I/O runs off the event loop."""
+        try:
+            yield
+        except (SceneValidationError, ScenePatchError):
+            await self.llm.invalidate_async(prompt, temperature=temperature, json_mode=json_mode)
+            raise
+
+    async def _call_llm_async(
+        self,
+        prompt: str,
+        temperature: float,
+        action: str,
+        json_mode: bool = True,
+    ) -> str:
+        """Async variant of _call_llm."""
+        try:
+            with span("llm"):
+                if json_mode:
+                    return await self.llm.generate_json_async(prompt, temperature=temperature)
+                return await self.llm.generate_async(prompt, temperature=temperature)
+        except LLMAPIError as e:
+            logger.error(f"LLM {action} failed: {e}")
+            raise LLMError(
+                f"LLM {action} failed: {e}",
+                llm_provider="gemini",
+                original_error=e,
+            )
+
     def _parse_and_validate(
         self,
         raw_response: str,
@@ -446,6 +764,22 @@ Instructions:
         Raises:
             SceneValidationError: If validation fails.
         """
+        json_str, data = self._parse_json(raw_response)
+        return self._validate_scene_data(data, json_str)
+
+    @traced("json_parse")
+    def _parse_json(self, raw_response: str) -> Tuple[str, Any]:
+        """Extract and parse the JSON payload of an LLM response.
+
+        Args:
+            raw_response: Raw LLM response.
+
+        Returns:
+            Tuple of (extracted JSON string, parsed data).
+
+        Raises:
+            SceneValidationError: If no JSON can be extracted or parsed.
+        """
         # Extract JSON from response
         try:
             json_str = _extract_json_from_response(raw_response)
@@ -457,39 +791,38 @@ Instructions:
                 raw_data=raw_response,
             )
 
-        # Parse JSON (with repair attempt)
+        # Parse JSON, repairing common LLM mistakes locally before any LLM repair call
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError as e:
-            # Try to repair common JSON issues
-            logger.debug(f"JSON parse failed at position {e.pos}, attempting repair")
-            repaired = _repair_json(json_str)
-            try:
-                data = json.loads(repaired)
-                logger.info("JSON repaired successfully")
-            except json.JSONDecodeError as e2:
-                # Log the problematic section for debugging
-                pos = e2.pos if hasattr(e2, 'pos') else 0
-                context_start = max(0, pos - 100)
-                context_end = min(len(repaired), pos + 100)
-                context = repaired[context_start:context_end]
-                logger.warning(f"Invalid JSON at pos {pos}: ...{context}...")
-                
-                # Write full JSON to temp file for debugging
-                import tempfile
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-                    f.write(json_str)
-                    logger.warning(f"Saved failing JSON to: {f.name}")
-                
-                raise SceneValidationError(
-                    f"Invalid JSON: {e2}",
-                    validation_errors=[str(e2)],
-                    raw_data=json_str,
-                )
+            data, fixes = loads_lenient(json_str)
+        except (JsonRepairError, json.JSONDecodeError) as e:
+            logger.warning(f"Invalid JSON that could not be repaired: {e}")
+            raise SceneValidationError(
+                f"Invalid JSON: {e}",
+                validation_errors=[str(e)],
+                raw_data=json_str,
+            )
+        if fixes:
+            logger.info(f"JSON repaired locally with {len(fixes)} fixes: {fixes[:5]}")
+
+        return json_str, data
+
+    def _validate_scene_data(self, data: Any, json_str: str) -> SceneSpec:
+        """Validate parsed scene data against the schema and the catalog.
 
+        Args:
+            data: Parsed JSON data.
+            json_str: The JSON text (kept as raw_data for repair prompts).
+
+        Returns:
+            Validated SceneSpec.
+
+        Raises:
+            SceneValidationError: If validation fails.
+        """
         # Validate with Pydantic
         try:
-            spec = SceneSpec.model_validate(data)
+            with span("schema_validation"):
+                spec = SceneSpec.model_validate(data)
         except ValidationError as e:
             errors = [f"{err['loc']}: {err['msg']}" for err in e.errors()]
             logger.warning(f"Schema validation failed: {len(errors)} errors")
@@ -500,7 +833,8 @@ Instructions:
             )
 
         # Validate asset IDs exist in catalog
-        validation_errors = self._validate_asset_references(spec)
+        with span("asset_validation"):
+            validation_errors = self._validate_asset_references(spec)
         if validation_errors:
             logger.warning(f"Asset validation failed: {validation_errors}")
             raise SceneValidationError(
@@ -584,24 +918,294 @@ Instructions:
                         user_prompt,
                         last_error.raw_data,
                         last_error.validation_errors,
+                        previous_scene,
                     )
             except SceneValidationError as e:
                 last_error = e
                 if attempt < self.max_repair_attempts:
                     continue
-                logger.error(f"Failed after {self.max_repair_attempts + 1} attempts")
-                raise SceneGenerationError(
-                    f"Failed to generate valid scene after {self.max_repair_attempts + 1} attempts. "
-                    f"Last errors: {e.validation_errors}"
-                )
+                raise self._repair_exhausted(e)
 
         raise SceneGenerationError("Unexpected error in generate_and_repair")
 
+    async def generate_and_repair_async(
+        self,
+        user_prompt: str,
+        previous_scene: Optional[SceneSpec] = None,
+    ) -> SceneSpec:
+        """Async variant of generate_and_repair.
+
+        With speculation enabled, several candidates are generated
+        concurrently (see generate_speculative_async).
+
+        Args:
+            user_prompt: Natural language description of the desired scene.
+            previous_scene: Optional previous scene to modify (for incremental updates).
+
+        Returns:
+            Valid SceneSpec object.
+
+        Raises:
+            SceneGenerationError: If generation fails after all repair attempts.
+        """
+        if self.speculation is not None:
+            return await self.generate_speculative_async(user_prompt, previous_scene)
+
+        try:
+            return await self.generate_scene_spec_async(user_prompt, previous_scene)
+        except SceneValidationError as e:
+            return await self._repair_async(user_prompt, e, previous_scene)
+
+    async def _repair_async(
+        self,
+        user_prompt: str,
+        error: SceneValidationError,
+        previous_scene: Optional[SceneSpec] = None,
+    ) -> SceneSpec:
+        """Run the LLM repair loop starting from a validation error.
+
+        Raises:
+            SceneGenerationError: If every repair attempt fails.
+        """
+        for attempt in range(1, self.max_repair_attempts + 1):
+            logger.info(f"Repair attempt {attempt}/{self.max_repair_attempts}")
+            repair_prompt = self._build_repair_prompt(
+                user_prompt, error.raw_data, error.validation_errors, previous_scene
+            )
+            raw_response = await self._call_llm_async(
+                repair_prompt, temperature=0.2, action="repair", json_mode=False
+            )
+            try:
+                async with self._evict_on_failure_async(
+                    repair_prompt, temperature=0.2, json_mode=False
+                ):
+                    return self._parse_and_validate(raw_response, user_prompt)
+            except SceneValidationError as e:
+                error = e
+        raise self._repair_exhausted(error)
+
+    async def generate_speculative_async(
+        self,
+        user_prompt: str,
+        previous_scene: Optional[SceneSpec] = None,
+    ) -> SceneSpec:
+        """Generate several candidates concurrently and keep the first valid one.
+
+        Candidates use the configured temperatures and prompt variants. Each
+        is validated as soon as it arrives; the first valid SceneSpec wins
+        and the remaining requests are cancelled. The number of extra
+        candidates is limited by the speculation budget. If every candidate
+        is invalid, the usual repair loop runs on the first failure.
+
+        Args:
+            user_prompt: Natural language description of the desired scene.
+            previous_scene: Optional previous scene to modify.
+
+        Returns:
+            Valid SceneSpec object.
+
+        Raises:
+            LLMError: If every candidate failed with an LLM error.
+            SceneGenerationError: If generation fails after all repair attempts.
+        """
+        speculation = self.speculation or SpeculativeGeneration()
+        variants = speculation.plan()
+        logger.info(f"Speculative generation with {len(variants)} candidates")
+
+        tasks = {
+            asyncio.ensure_future(self._speculative_candidate(user_prompt, previous_scene, v)): i
+            for i, v in enumerate(variants)
+        }
+        invalid: List[Tuple[int, SceneValidationError]] = []
+        llm_errors: List[LLMError] = []
+        winner: Optional[int] = None
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=tasks.get):
+                    try:
+                        spec = task.result()
+                    except SceneValidationError as e:
+                        invalid.append((tasks[task], e))
+                        continue
+                    except LLMError as e:
+                        llm_errors.append(e)
+                        continue
+                    winner = tasks[task]
+                    logger.info(f"Speculative candidate {winner} won")
+                    return spec
+        finally:
+            cancelled = 0
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    cancelled += 1
+            speculation.record(winner, cancelled)
+
+        if not invalid:
+            raise llm_errors[0]
+        first_error = min(invalid, key=lambda item: item[0])[1]
+        return await self._repair_async(user_prompt, first_error, previous_scene)
+
+    async def _speculative_candidate(
+        self,
+        user_prompt: str,
+        previous_scene: Optional[SceneSpec],
+        variant: CandidateVariant,
+    ) -> SceneSpec:
+        """Generate and validate one speculative candidate."""
+        full_prompt = self._build_generation_prompt(
+            user_prompt, previous_scene, full_catalog=variant.full_catalog
+        )
+        raw_response = await self._call_llm_async(
+            full_prompt, temperature=variant.temperature, action="generation"
+        )
+        async with self._evict_on_failure_async(full_prompt, temperature=variant.temperature):
+            return self._finish_generation(raw_response, user_prompt)
+
+    def _repair_exhausted(self, error: SceneValidationError) -> SceneGenerationError:
+        """Build the error raised when every repair attempt failed."""
+        logger.error(f"Failed after {self.max_repair_attempts + 1} attempts")
+        return SceneGenerationError(
+            f"Failed to generate valid scene after {self.max_repair_attempts + 1} attempts. "
+            f"Last errors: {error.validation_errors}"
+        )
+
+    def stream_scene_spec(
+        self,
+        user_prompt: str,
+        previous_scene: Optional[SceneSpec] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Generate a scene while streaming the LLM response.
+
+        Simple edits of previous_scene are applied locally without streaming.
+        Each object, camera, light, path and task (and each other top-level
+        field) is validated as soon as it has been received. A response that
+        is malformed or truncated is detected while streaming; if the local
+        JSON repair cannot fix it, it goes to the LLM repair loop.
+
+        Args:
+            user_prompt: Natural language description of the desired scene.
+            previous_scene: Optional previous scene to modify.
+
+        Yields:
+            Progress events as dicts with an "event" key:
+            - "element": a value completed (section, index, valid, errors)
+            - "repair": a repair attempt started (attempt, errors)
+            - "scene": the final validated SceneSpec (scene), with the
+              summary of a local edit (description) if one was applied
+
+        Raises:
+            LLMError: If the LLM call fails.
+            SceneGenerationError: If no valid scene is produced after all
+                repair attempts.
+        """
+        local = self.try_local_edit(previous_scene, user_prompt)
+        if local is not None:
+            yield {"event": "scene", "scene": local.scene, "description": local.description}
+            return
+
+        full_prompt = self._build_generation_prompt(user_prompt, previous_scene)
+        parser = SceneStreamParser()
+        spec: Optional[SceneSpec] = None
+        error: Optional[SceneValidationError] = None
+        stream_errors: List[str] = []
+
+        try:
+            for chunk in self.llm.generate_json_stream(full_prompt, temperature=0.3):
+                for element in parser.feed(chunk):
+                    yield self._element_event(element)
+            json_str = parser.finish()
+        except SceneStreamError as e:
+            # Malformed or truncated: try the local lenient reader before the LLM
+            logger.warning(f"Streamed scene is malformed: {e.message}")
+            stream_errors.append(e.message)
+            json_str = parser.text
+        except LLMAPIError as e:
+            logger.error(f"LLM streaming generation failed: {e}")
+            raise LLMError(
+                f"LLM streaming generation failed: {e}",
+                llm_provider="gemini",
+                original_error=e,
+            )
+
+        try:
+            spec = self._parse_and_validate(json_str, user_prompt)
+        except SceneValidationError as e:
+            self.llm.invalidate(full_prompt, temperature=0.3, json_mode=True)
+            error = SceneValidationError(
+                e.message,
+                validation_errors=stream_errors + e.validation_errors,
+                raw_data=e.raw_data,
+            )
+
+        for attempt in range(1, self.max_repair_attempts + 1):
+            if error is None:
+                break
+            logger.info(f"Repair attempt {attempt}/{self.max_repair_attempts}")
+            yield {"event": "repair", "attempt": attempt, "errors": error.validation_errors}
+            try:
+                spec = self._repair_scene_spec(
+                    user_prompt, error.raw_data, error.validation_errors, previous_scene
+                )
+                error = None
+            except SceneValidationError as e:
+                error = e
+
+        if error is not None:
+            raise self._repair_exhausted(error)
+
+        logger.info(
+            f"Streamed scene: name='{spec.name}', objects={len(spec.objects)}, "
+            f"cameras={len(spec.cameras)}, paths={len(spec.paths)}"
+        )
+        yield {"event": "scene", "scene": spec}
+
+    def _element_event(self, element: StreamedElement) -> Dict[str, Any]:
+        """Validate a streamed value and describe it as a progress event."""
+        errors = self._validate_streamed_element(element)
+        if errors:
+            logger.debug(f"Streamed {element.section}[{element.index}] invalid: {errors}")
+        return {
+            "event": "element",
+            "section": element.section,
+            "index": element.index,
+            "valid": not errors,
+            "errors": errors,
+        }
+
+    def _validate_streamed_element(self, element: StreamedElement) -> List[str]:
+        """Validate one streamed value against its schema model and the catalog.
+
+        Args:
+            element: The completed value.
+
+        Returns:
+            List of validation error messages (empty if valid).
+        """
+        if element.error:
+            return [f"Invalid JSON: {element.error}"]
+
+        model = _STREAMED_MODELS.get(element.section)
+        if model is None:
+            return []
+        try:
+            item = model.model_validate(element.data)
+        except ValidationError as e:
+            return [f"{err['loc']}: {err['msg']}" for err in e.errors()]
+
+        asset_id = getattr(item, "asset_id", None)
+        if asset_id and asset_id not in self.catalog:
+            return [f"{element.section} asset_id '{asset_id}' not found"]
+        return []
+
     def _repair_scene_spec(
         self,
         original_prompt: str,
         invalid_json: str,
         errors: List[str],
+        previous_scene: Optional[SceneSpec] = None,
     ) -> SceneSpec:
         """Attempt to repair an invalid SceneSpec.
 
@@ -609,6 +1213,7 @@ Instructions:
             original_prompt: Original user prompt.
             invalid_json: The invalid JSON that was generated.
             errors: List of validation errors.
+            previous_scene: The scene being edited, if any.
 
         Returns:
             Repaired SceneSpec.
@@ -616,7 +1221,26 @@ Instructions:
         Raises:
             SceneValidationError: If repair fails.
         """
-        repair_prompt = f"""{self._build_system_prompt()}
+        repair_prompt = self._build_repair_prompt(
+            original_prompt, invalid_json, errors, previous_scene
+        )
+        raw_response = self._call_llm(
+            repair_prompt, temperature=0.2, action="repair", json_mode=False
+        )
+        with self._evict_on_failure(repair_prompt, temperature=0.2, json_mode=False):
+            return self._parse_and_validate(raw_response, original_prompt)
+
+    @traced("prompt_build")
+    def _build_repair_prompt(
+        self,
+        original_prompt: str,
+        invalid_json: str,
+        errors: List[str],
+        previous_scene: Optional[SceneSpec] = None,
+    ) -> str:
+        """Build the prompt asking the LLM to fix an invalid scene."""
+        asset_summary = self._repair_asset_context(original_prompt, invalid_json, previous_scene)
+        return f"""{self._build_system_prompt(asset_summary)}
 
 ---
 
@@ -634,16 +1258,39 @@ The previous attempt to generate a scene for "{original_prompt}" produced invali
 Fix the JSON to resolve all validation errors. Return ONLY the corrected JSON, no explanations.
 Remember to use ONLY asset_id values from the Available Assets list."""
 
-        try:
-            raw_response = self.llm.generate(repair_prompt, temperature=0.2)
-        except LLMAPIError as e:
-            raise LLMError(
-                f"LLM repair failed: {e}",
-                llm_provider="gemini",
-                original_error=e,
-            )
+    def _repair_asset_context(
+        self,
+        original_prompt: str,
+        invalid_json: Optional[str],
+        previous_scene: Optional[SceneSpec] = None,
+    ) -> str:
+        """Build the asset section for a repair prompt.
 
-        return self._parse_and_validate(raw_response, original_prompt)
+        Starts from the assets relevant to the original request and to the
+        scene being edited, as the generation prompt does, and expands it
+        with candidates for every unknown asset ID in the invalid JSON.
+        Falls back to the full catalog if no candidate can be found.
+
+        Args:
+            original_prompt: Original user prompt.
+            invalid_json: The invalid JSON that was generated.
+            previous_scene: The scene being edited, if any.
+
+        Returns:
+            Asset summary to embed in the repair prompt.
+        """
+        if not self.scoped_context:
+            return self._asset_summary
+
+        unknown = _collect_unknown_asset_ids(self.catalog, invalid_json)
+        expansion = " ".join(u.replace("_", " ") for u in unknown)
+        scene_ids = _scene_asset_ids(previous_scene)
+        scope = _select_relevant_assets(self.catalog, original_prompt, extra_ids=scene_ids)
+        candidates = _select_relevant_assets(self.catalog, expansion) if expansion else []
+        if unknown and not set(candidates) - set(scope):
+            logger.info(f"No candidates for unknown assets {unknown}, using full catalog")
+            return self._asset_context(original_prompt, full=True)
+        return self._asset_context(original_prompt, extra_ids=scene_ids + candidates)
 
     def update_scene_spec(
         self,
@@ -654,7 +1301,10 @@ Remember to use ONLY asset_id values from the Available Assets list."""
 
         If previous is None, behaves like generate_scene_spec (creates new scene).
         Otherwise, asks the LLM to MODIFY the existing scene according to
-        user_prompt and returns a NEW SceneSpec.
+        user_prompt and returns a NEW SceneSpec. Simple edits are applied
+        locally without the LLM. In "patch" edit mode the LLM returns a JSON
+        Patch that is applied locally; if the patch cannot be applied or
+        validated, the scene is regenerated in full.
 
         Args:
             previous: The previous scene to modify, or None to create new.
@@ -673,10 +1323,86 @@ Remember to use ONLY asset_id values from the Available Assets list."""
 
         logger.info(f"Editing scene '{previous.name}': '{user_prompt[:100]}...'")
 
-        # Build editing prompt with explicit instructions
-        prev_json = json.dumps(previous.model_dump(), indent=2)
+        local = self.try_local_edit(previous, user_prompt)
+        if local is not None:
+            return local.scene
+
+        if self.edit_mode == "patch":
+            try:
+                return self._patch_scene_spec(previous, user_prompt)
+            except (SceneValidationError, ScenePatchError) as e:
+                logger.info(f"Patch edit failed, regenerating full scene: {e.message}")
+
+        return self._regenerate_scene_spec(previous, user_prompt)
+
+    async def update_scene_spec_async(
+        self,
+        previous: Optional[SceneSpec],
+        user_prompt: str,
+    ) -> SceneSpec:
+        """Async variant of update_scene_spec that does not block the event loop.
+
+        Args:
+            previous: The previous scene to modify, or None to create new.
+            user_prompt: Natural language description of desired changes.
+
+        Returns:
+            Updated or new SceneSpec.
+        """
+        if previous is None:
+            logger.info(f"No previous scene, creating new: '{user_prompt[:100]}...'")
+            return await self.generate_and_repair_async(user_prompt)
+
+        logger.info(f"Editing scene '{previous.name}': '{user_prompt[:100]}...'")
+
+        local = self.try_local_edit(previous, user_prompt)
+        if local is not None:
+            return local.scene
 
-        system_instructions = f"""You are a MuJoCo SCENE & TASK PLANNER.
+        if self.edit_mode == "patch":
+            try:
+                full_prompt = self._build_patch_prompt(previous, user_prompt)
+                raw_response = await self._call_llm_async(
+                    full_prompt, temperature=0.2, action="edit"
+                )
+                async with self._evict_on_failure_async(full_prompt, temperature=0.2):
+                    return self._apply_patch_response(previous, full_prompt, raw_response)
+            except (SceneValidationError, ScenePatchError) as e:
+                logger.info(f"Patch edit failed, regenerating full scene: {e.message}")
+
+        full_prompt = self._build_regenerate_prompt(previous, user_prompt)
+        raw_response = await self._call_llm_async(full_prompt, temperature=0.3, action="edit")
+        async with self._evict_on_failure_async(full_prompt, temperature=0.3):
+            return self._finish_edit(raw_response, user_prompt)
+
+    def try_local_edit(
+        self,
+        previous: Optional[SceneSpec],
+        user_prompt: str,
+    ) -> Optional[LocalEdit]:
+        """Apply a simple edit without the LLM.
+
+        Args:
+            previous: The scene to modify, or None.
+            user_prompt: The user's edit request.
+
+        Returns:
+            The LocalEdit, or None if local edits are disabled or the request
+            is not a simple edit (the caller should then ask the LLM).
+        """
+        if not self.local_edits:
+            return None
+        with span("local_edit"):
+            return apply_local_edit(previous, user_prompt, self.catalog)
+
+    def _build_edit_system_prompt(self, previous: SceneSpec, user_prompt: str) -> str:
+        """Build the system prompt shared by full and patch edits.
+
+        Args:
+            previous: The scene being edited.
+            user_prompt: The user's edit request.
+        """
+        return f"""You are a MuJoCo SCENE & TASK PLANNER.
 
 You receive:
 1. The CURRENT SceneSpec JSON.
@@ -744,18 +1470,39 @@ User: "Create a task to drive from the tractor to coordinates (20, 15)"
 - z: positive = up (usually 0 for ground paths)
 - For an orchard with rows along X axis, alternate Y positions for zig-zag
 
-{self._asset_summary}
+{self._asset_context(user_prompt, _scene_asset_ids(previous))}
 
 {self._schema_summary}
 
 IMPORTANT:
-- Always respond with VALID JSON matching the SceneSpec schema.
+- Always respond with VALID JSON in the format requested below.
 - DO NOT wrap JSON in markdown, no explanations, JSON ONLY.
 - Use ONLY asset_id values from the Available Assets list above.
 - If user says "start over", "new scene", "clear all": create fresh scene.
 - Keep existing objects/cameras unless user asks to remove them.
 """
 
+    def _regenerate_scene_spec(self, previous: SceneSpec, user_prompt: str) -> SceneSpec:
+        """Edit a scene by asking the LLM for the complete updated scene.
+
+        Args:
+            previous: The scene being edited.
+            user_prompt: The user's edit request.
+
+        Returns:
+            Updated SceneSpec.
+        """
+        full_prompt = self._build_regenerate_prompt(previous, user_prompt)
+        raw_response = self._call_llm(full_prompt, temperature=0.3, action="edit")
+        with self._evict_on_failure(full_prompt, temperature=0.3):
+            return self._finish_edit(raw_response, user_prompt)
+
+    @traced("prompt_build")
+    def _build_regenerate_prompt(self, previous: SceneSpec, user_prompt: str) -> str:
+        """Build the prompt asking for the complete updated scene."""
+        prev_json = json.dumps(previous.model_dump(), indent=2)
+        system_instructions = self._build_edit_system_prompt(previous, user_prompt)
+
         user_block = f"""CURRENT_SCENE_JSON:
 {prev_json}
 
@@ -767,20 +1514,11 @@ Instructions:
 - If task/path planning: create PathSpec + TaskSpec entries
 - Return the FULL UPDATED SceneSpec JSON only (no markdown, no explanation)"""
 
-        full_prompt = system_instructions + "\n\n" + user_block
-
-        try:
-            # Use generate_json for structured output (Gemini JSON mode)
-            raw_response = self.llm.generate_json(full_prompt, temperature=0.3)
-            logger.debug(f"LLM edit response received: {len(raw_response)} chars")
-        except LLMAPIError as e:
-            logger.error(f"LLM edit failed: {e}")
-            raise LLMError(
-                f"LLM edit failed: {e}",
-                llm_provider="gemini",
-                original_error=e,
-            )
+        return system_instructions + "\n\n" + user_block
 
+    def _finish_edit(self, raw_response: str, user_prompt: str) -> SceneSpec:
+        """Parse and validate a full-scene edit response and log the result."""
+        logger.debug(f"LLM edit response received: {len(raw_response)} chars")
         spec = self._parse_and_validate(raw_response, user_prompt)
 
         logger.info(
@@ -792,6 +1530,96 @@ Instructions:
 
         return spec
 
+    def _patch_scene_spec(self, previous: SceneSpec, user_prompt: str) -> SceneSpec:
+        """Edit a scene by asking the LLM for a JSON Patch.
+
+        The LLM sees the current scene as compact JSON and answers with
+        only the operations needed, so the response size tracks the size
+        of the change rather than the size of the scene.
+
+        Args:
+            previous: The scene being edited.
+            user_prompt: The user's edit request.
+
+        Returns:
+            Updated SceneSpec.
+
+        Raises:
+            LLMError: If the LLM call fails.
+            ScenePatchError: If the patch cannot be applied.
+            SceneValidationError: If the response or patched scene is invalid.
+        """
+        full_prompt = self._build_patch_prompt(previous, user_prompt)
+        raw_response = self._call_llm(full_prompt, temperature=0.2, action="edit")
+        with self._evict_on_failure(full_prompt, temperature=0.2):
+            return self._apply_patch_response(previous, full_prompt, raw_response)
+
+    @traced("prompt_build")
+    def _build_patch_prompt(self, previous: SceneSpec, user_prompt: str) -> str:
+        """Build the prompt asking for a JSON Patch against the current scene."""
+        prev_json = json.dumps(scene_to_patch_base(previous), separators=(",", ":"))
+        system_instructions = self._build_edit_system_prompt(previous, user_prompt)
+
+        user_block = f"""CURRENT_SCENE_JSON:
+{prev_json}
+
+USER_REQUEST:
+{user_prompt}
+
+Instructions:
+- Return ONLY the changes as a JSON Patch (RFC 6902) in this form:
+  {{"patch": [
+    {{"op": "add", "path": "/objects/-", "value": {{"asset_id": "barrel", "instances": []}}}},
+    {{"op": "replace", "path": "/physics/timestep", "value": 0.001}},
+    {{"op": "remove", "path": "/objects/1"}}
+  ]}}
+- Paths are JSON Pointers into CURRENT_SCENE_JSON (list items by index, "-" appends)
+- Remove list items from the highest index down so indices stay valid
+- If the user wants a completely new scene, return {{"scene": <full SceneSpec JSON>}}
+- No markdown, no explanation"""
+
+        return system_instructions + "\n\n" + user_block
+
+    def _apply_patch_response(
+        self,
+        previous: SceneSpec,
+        full_prompt: str,
+        raw_response: str,
+    ) -> SceneSpec:
+        """Apply the patch in an LLM response to the current scene.
+
+        Raises:
+            ScenePatchError: If the patch cannot be applied.
+            SceneValidationError: If the response or patched scene is invalid.
+        """
+        logger.debug(
+            f"Patch edit: prompt {len(full_prompt)} chars, response {len(raw_response)} chars"
+        )
+        json_str, data = self._parse_json(raw_response)
+
+        if isinstance(data, dict) and isinstance(data.get("scene"), dict):
+            return self._validate_scene_data(data["scene"], json_str)
+        if isinstance(data, dict) and isinstance(data.get("patch"), list):
+            spec = apply_scene_patch(previous, data["patch"])
+        elif isinstance(data, dict) and isinstance(data.get("merge_patch"), dict):
+            spec = apply_scene_patch(previous, data["merge_patch"])
+        else:
+            raise ScenePatchError("LLM response is not a patch")
+
+        validation_errors = self._validate_asset_references(spec)
+        if validation_errors:
+            raise SceneValidationError(
+                f"Invalid asset references: {len(validation_errors)} errors",
+                validation_errors=validation_errors,
+                raw_data=json_str,
+            )
+
+        logger.info(
+            f"Patched scene: name='{spec.name}', ops={len(data.get('patch') or [])}, "
+            f"objects={len(spec.objects)}, paths={len(spec.paths)}, tasks={len(spec.tasks)}"
+        )
+        return spec
+
     def suggest_scene(self, user_prompt: str) -> Dict[str, Any]:
         """Get a scene suggestion as a dictionary (for debugging/preview).
 
@@ -804,17 +1632,14 @@ Instructions:
         Returns:
             Raw dictionary from LLM (may not be valid SceneSpec).
         """
-        system_prompt = self._build_system_prompt()
+        system_prompt = self._build_system_prompt(self._asset_context(user_prompt))
         user_message = self._build_user_prompt(user_prompt)
         full_prompt = f"{system_prompt}\n\n---\n\n{user_message}"
 
         try:
             raw_response = self.llm.generate(full_prompt, temperature=0.3)
             json_str = _extract_json_from_response(raw_response)
-            try:
-                return json.loads(json_str)
-            except json.JSONDecodeError:
-                return json.loads(_repair_json(json_str))
-        except (LLMAPIError, json.JSONDecodeError, SceneGenerationError) as e:
+            return loads_lenient(json_str)[0]
+        except (LLMAPIError, json.JSONDecodeError, JsonRepairError, SceneGenerationError) as e:
             logger.warning(f"suggest_scene failed: {e}")
             return {"error": str(e)}
@@ -0,0 +1,333 @@
+"""Deterministic local edits for simple chat messages.
+
+Messages such as "add 10 barrels", "remove the bird", "make it 5 rows" or
+"change timestep to 0.002" have an unambiguous meaning and can be applied
+to the current SceneSpec directly, without an LLM round trip. Each rule
+either handles a message with confidence or returns None so the caller can
+fall through to the LLM.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Pattern, Tuple
+
+from pydantic import ValidationError
+
+from neoscene.core.asset_catalog import AssetCatalog
+from neoscene.core.asset_manifest import AssetManifest
+from neoscene.core.logging_config import get_logger
+from neoscene.core.scene_schema import (
+    EnvironmentSpec,
+    InstanceSpec,
+    ObjectSpec,
+    PhysicsSpec,
+    Pose,
+    SceneSpec,
+)
+from neoscene.core.scene_tools import suggest_layout_for_count
+
+logger = get_logger(__name__)
+
+_NUMBER_WORDS = {
+    "a": 1, "an": 1, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+    "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10, "twelve": 12,
+    "twenty": 20,
+}
+
+# Largest group added without asking the LLM
+MAX_LOCAL_COUNT = 100
+
+_COUNT = r"(?P<count>\d+|" + "|".join(_NUMBER_WORDS) + r")"
+_NOUN = r"(?P<what>[a-z][a-z _-]*?)"
+
+_ADD = re.compile(
+    rf"^(?:please\s+)?(?:add|place|put|spawn|insert)\s+(?:{_COUNT}\s+)?(?:more\s+)?{_NOUN}$"
+)
+_REMOVE = re.compile(rf"^(?:please\s+)?(?:remove|delete)\s+(?P<all>all\s+)?(?:the\s+)?{_NOUN}$")
+_GRID = re.compile(
+    r"^(?:please\s+)?(?:make it|use|arrange (?:it |them )?in(?:to)?|change (?:it )?to)\s+"
+    r"(?P<n>\d+)\s+(?P<dim>rows?|columns?|cols?)$"
+    r"|^(?:please\s+)?set (?:the )?(?P<dim2>rows|columns|cols)\s+(?:to|=)\s+(?P<n2>\d+)$"
+)
+_PHYSICS = re.compile(
+    r"^(?:please\s+)?(?:change|set|make)\s+(?:the\s+)?(?:physics\s+)?"
+    r"(?P<field>timestep|time step|solver|iterations|integrator)\s+(?:to|=)\s+(?P<value>\S+)$"
+)
+_ENVIRONMENT = re.compile(
+    r"^(?:please\s+)?(?:change|switch|set)\s+(?:the\s+)?(?:environment|terrain|world)\s+to\s+"
+    r"(?:an?\s+|the\s+)?(?P<what>[a-z][a-z _-]*?)$"
+)
+
+_PHYSICS_FIELDS = {
+    "timestep": "timestep",
+    "time step": "timestep",
+    "solver": "solver",
+    "iterations": "iterations",
+    "integrator": "integrator",
+}
+_PHYSICS_CHOICES = {
+    "solver": ["PGS", "CG", "Newton"],
+    "integrator": ["Euler", "RK4", "implicit", "implicitfast"],
+}
+
+
+@dataclass
+class LocalEdit:
+    """A scene edit applied without the LLM.
+
+    Attributes:
+        scene: The edited scene.
+        description: Short human-readable summary of the change.
+    """
+
+    scene: SceneSpec
+    description: str
+
+
+def _normalize(message: str) -> str:
+    """Lowercase a message and strip punctuation and filler."""
+    text = message.strip().lower().rstrip(".!")
+    return re.sub(r"\s+", " ", text)
+
+
+def _singular_forms(phrase: str) -> List[str]:
+    """Return the phrase and its naive singular forms."""
+    forms = [phrase]
+    if phrase.endswith("ies") and len(phrase) > 4:
+        forms.append(phrase[:-3] + "y")
+    if phrase.endswith("es") and len(phrase) > 4:
+        forms.append(phrase[:-2])
+    if phrase.endswith("s") and len(phrase) > 3:
+        forms.append(phrase[:-1])
+    return forms
+
+
+def _asset_names(manifest: AssetManifest) -> List[str]:
+    """Return every name that unambiguously identifies an asset."""
+    names = [manifest.asset_id, manifest.asset_id.replace("_", " "), manifest.name]
+    names.extend(manifest.tags)
+    names.extend(manifest.semantics.human_names)
+    return [n.lower() for n in names]
+
+
+def resolve_asset(
+    catalog: AssetCatalog,
+    phrase: str,
+    category: Optional[str] = None,
+) -> Optional[AssetManifest]:
+    """Resolve a noun phrase to a catalog asset, only if the match is exact.
+
+    The phrase (or its singular form) must equal the asset's ID, name, a tag
+    or a human name, or be listed in its fallback concepts. Partial matches
+    are left to the LLM.
+
+    Args:
+        catalog: The asset catalog.
+        phrase: Noun phrase from the message (e.g. "barrels").
+        category: Optional category filter.
+
+    Returns:
+        The matching manifest, or None.
+    """
+    for form in _singular_forms(phrase.strip()):
+        manifest = catalog.best_match(form, category=category)
+        if manifest is not None and form in _asset_names(manifest):
+            return manifest
+        fallback = catalog.find_fallback(form, category=category)
+        if fallback is not None:
+            return fallback
+    return None
+
+
+def _object_positions(scene: SceneSpec) -> List[List[float]]:
+    """Collect the anchor positions of the objects in a scene."""
+    positions = []
+    for obj in scene.objects:
+        if obj.instances:
+            positions.extend(inst.pose.position for inst in obj.instances)
+        elif obj.layout is not None:
+            anchor = obj.layout.origin if obj.layout.type == "grid" else obj.layout.center
+            positions.append(anchor)
+    return positions
+
+
+def _free_center(scene: SceneSpec, margin: float) -> List[float]:
+    """Pick a spot next to the existing objects for a new group."""
+    positions = _object_positions(scene)
+    if not positions:
+        return [0.0, 0.0, 0.0]
+    mean_x = sum(p[0] for p in positions) / len(positions)
+    max_y = max(p[1] for p in positions)
+    return [round(mean_x, 2), round(max_y + margin, 2), 0.0]
+
+
+def _unique_name(scene: SceneSpec, base: str) -> str:
+    """Return an object name not used in the scene yet."""
+    taken = {obj.name for obj in scene.objects}
+    if base not in taken:
+        return base
+    index = 2
+    while f"{base}_{index}" in taken:
+        index += 1
+    return f"{base}_{index}"
+
+
+def _add_objects(scene: SceneSpec, match: re.Match, catalog: AssetCatalog) -> Optional[LocalEdit]:
+    """Handle "add 10 barrels"."""
+    raw_count = match.group("count") or "1"
+    count = int(raw_count) if raw_count.isdigit() else _NUMBER_WORDS[raw_count]
+    if not 1 <= count <= MAX_LOCAL_COUNT:
+        return None
+
+    manifest = resolve_asset(catalog, match.group("what"))
+    if manifest is None or manifest.category in ("environment", "sensor"):
+        return None
+
+    footprint = max((manifest.physical_size or [1.0, 1.0])[:2])
+    area_size = max(4.0, footprint * 2.0 * math.ceil(math.sqrt(count)))
+    center = _free_center(scene, margin=area_size / 2 + 2.0)
+    name = _unique_name(scene, manifest.asset_id if count == 1 else f"{manifest.asset_id}_group")
+
+    if count == 1:
+        obj = ObjectSpec(
+            asset_id=manifest.asset_id,
+            name=name,
+            instances=[InstanceSpec(pose=Pose(position=center))],
+        )
+    else:
+        layout = suggest_layout_for_count(count, center, area_size=area_size)
+        if layout["type"] == "grid" and layout["rows"] * layout["cols"] != count:
+            # A grid would change the count; scatter exactly `count` instead
+            layout = suggest_layout_for_count(count, center, area_size=area_size, organized=False)
+        obj = ObjectSpec.model_validate(
+            {"asset_id": manifest.asset_id, "name": name, "layout": layout}
+        )
+
+    edited = scene.model_copy(update={"objects": [*scene.objects, obj]})
+    return LocalEdit(edited, f"Added {count} {manifest.name} ({manifest.asset_id}).")
+
+
+def _remove_objects(
+    scene: SceneSpec, match: re.Match, catalog: AssetCatalog
+) -> Optional[LocalEdit]:
+    """Handle "remove the bird"."""
+    phrase = match.group("what").strip()
+    forms = _singular_forms(phrase)
+    manifest = resolve_asset(catalog, phrase)
+
+    matched = [
+        obj for obj in scene.objects
+        if (obj.name and obj.name.lower() in forms)
+        or (manifest is not None and obj.asset_id == manifest.asset_id)
+    ]
+    if not matched:
+        return None
+    plural = len(forms) > 1
+    if len(matched) > 1 and not match.group("all") and not plural:
+        # "remove the tree" with several tree groups: let the LLM decide
+        return None
+
+    kept = [obj for obj in scene.objects if all(obj is not m for m in matched)]
+    edited = scene.model_copy(update={"objects": kept})
+    names = ", ".join(obj.name or obj.asset_id for obj in matched)
+    return LocalEdit(edited, f"Removed {names}.")
+
+
+def _resize_grid(scene: SceneSpec, match: re.Match, catalog: AssetCatalog) -> Optional[LocalEdit]:
+    """Handle "make it 5 rows"."""
+    value = int(match.group("n") or match.group("n2"))
+    dim = (match.group("dim") or match.group("dim2"))[:3]
+    field = "rows" if dim == "row" else "cols"
+    if not 1 <= value <= MAX_LOCAL_COUNT:
+        return None
+
+    grids = [
+        i for i, obj in enumerate(scene.objects)
+        if obj.layout is not None and obj.layout.type == "grid"
+    ]
+    if len(grids) != 1:
+        return None
+
+    index = grids[0]
+    obj = scene.objects[index]
+    layout = obj.layout.model_copy(update={field: value})
+    objects = list(scene.objects)
+    objects[index] = obj.model_copy(update={"layout": layout})
+    edited = scene.model_copy(update={"objects": objects})
+    return LocalEdit(edited, f"Set {obj.name or obj.asset_id} to {layout.rows}x{layout.cols} grid.")
+
+
+def _set_physics(scene: SceneSpec, match: re.Match, catalog: AssetCatalog) -> Optional[LocalEdit]:
+    """Handle "change timestep to 0.002"."""
+    field = _PHYSICS_FIELDS[match.group("field")]
+    raw = match.group("value")
+
+    value: Any = raw
+    if field in _PHYSICS_CHOICES:
+        choices = {c.lower(): c for c in _PHYSICS_CHOICES[field]}
+        if raw not in choices:
+            return None
+        value = choices[raw]
+
+    try:
+        physics = PhysicsSpec.model_validate({**scene.physics.model_dump(), field: value})
+    except ValidationError:
+        return None
+
+    edited = scene.model_copy(update={"physics": physics})
+    return LocalEdit(edited, f"Set physics {field} to {getattr(physics, field)}.")
+
+
+def _set_environment(
+    scene: SceneSpec, match: re.Match, catalog: AssetCatalog
+) -> Optional[LocalEdit]:
+    """Handle "change the environment to desert"."""
+    manifest = resolve_asset(catalog, match.group("what"), category="environment")
+    if manifest is None:
+        return None
+    environment = EnvironmentSpec.model_validate(
+        {**scene.environment.model_dump(), "asset_id": manifest.asset_id}
+    )
+    edited = scene.model_copy(update={"environment": environment})
+    return LocalEdit(edited, f"Changed environment to {manifest.name}.")
+
+
+_RULES: List[Tuple[Pattern[str], Callable[..., Optional[LocalEdit]]]] = [
+    (_ADD, _add_objects),
+    (_REMOVE, _remove_objects),
+    (_GRID, _resize_grid),
+    (_PHYSICS, _set_physics),
+    (_ENVIRONMENT, _set_environment),
+]
+
+
+def apply_local_edit(
+    scene: Optional[SceneSpec],
+    message: str,
+    catalog: AssetCatalog,
+) -> Optional[LocalEdit]:
+    """Apply a simple edit to a scene without calling the LLM.
+
+    Args:
+        scene: The current scene. Nothing is handled locally without one.
+        message: The user's chat message.
+        catalog: Asset catalog used to resolve object names.
+
+    Returns:
+        The LocalEdit, or None if the message is not a simple edit that can
+        be handled with confidence.
+    """
+    if scene is None:
+        return None
+
+    text = _normalize(message)
+    for pattern, handler in _RULES:
+        match = pattern.match(text)
+        if match is None:
+            continue
+        edit = handler(scene, match, catalog)
+        if edit is not None:
+            logger.info(f"Local edit: {edit.description}")
+        return edit
+    return None
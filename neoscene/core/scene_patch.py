@@ -0,0 +1,252 @@
+"""Patch-based scene editing.
+
+This module applies small, LLM-generated edits to an existing SceneSpec
+instead of asking the LLM to regenerate the whole scene. Two formats are
+supported:
+
+- JSON Patch (RFC 6902): a list of add/remove/replace/move/copy/test ops
+- JSON Merge Patch (RFC 7386): a partial document merged into the scene
+
+The patched document is always re-validated against the SceneSpec schema.
+"""
+
+import copy
+from typing import Any, Dict, List, Union
+
+from pydantic import ValidationError
+
+from neoscene.core.errors import NeosceneError
+from neoscene.core.scene_schema import SceneSpec
+
+JsonPatch = List[Dict[str, Any]]
+
+
+class ScenePatchError(NeosceneError):
+    """Error while applying a patch to a scene."""
+
+    pass
+
+
+def _parse_pointer(pointer: str) -> List[str]:
+    """Split a JSON Pointer into unescaped reference tokens.
+
+    Args:
+        pointer: JSON Pointer string (e.g. "/objects/0/name").
+
+    Returns:
+        List of reference tokens.
+
+    Raises:
+        ScenePatchError: If the pointer is malformed.
+    """
+    if pointer == "":
+        return []
+    if not pointer.startswith("/"):
+        raise ScenePatchError(f"Invalid JSON pointer: '{pointer}'")
+    return [t.replace("~1", "/").replace("~0", "~") for t in pointer[1:].split("/")]
+
+
+def _list_index(container: list, token: str, allow_end: bool) -> int:
+    """Resolve a reference token to a list index."""
+    if token == "-" and allow_end:
+        return len(container)
+    if not token.isdigit():
+        raise ScenePatchError(f"Invalid list index: '{token}'")
+    index = int(token)
+    upper = len(container) if allow_end else len(container) - 1
+    if index > upper:
+        raise ScenePatchError(f"List index out of range: {index}")
+    return index
+
+
+def _resolve_parent(doc: Any, tokens: List[str], pointer: str) -> Any:
+    """Walk to the container holding the last token of a pointer."""
+    node = doc
+    for token in tokens[:-1]:
+        if isinstance(node, dict):
+            if token not in node:
+                raise ScenePatchError(f"Path not found: '{pointer}'")
+            node = node[token]
+        elif isinstance(node, list):
+            node = node[_list_index(node, token, allow_end=False)]
+        else:
+            raise ScenePatchError(f"Path not found: '{pointer}'")
+    return node
+
+
+def _get(doc: Any, pointer: str) -> Any:
+    """Return the value at a JSON Pointer."""
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        return doc
+    parent = _resolve_parent(doc, tokens, pointer)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise ScenePatchError(f"Path not found: '{pointer}'")
+        return parent[token]
+    if isinstance(parent, list):
+        return parent[_list_index(parent, token, allow_end=False)]
+    raise ScenePatchError(f"Path not found: '{pointer}'")
+
+
+def _add(doc: Any, pointer: str, value: Any) -> Any:
+    """Add a value at a JSON Pointer, returning the (possibly new) root."""
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        return value
+    parent = _resolve_parent(doc, tokens, pointer)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        parent[token] = value
+    elif isinstance(parent, list):
+        parent.insert(_list_index(parent, token, allow_end=True), value)
+    else:
+        raise ScenePatchError(f"Cannot add at '{pointer}'")
+    return doc
+
+
+def _remove(doc: Any, pointer: str) -> Any:
+    """Remove the value at a JSON Pointer and return it."""
+    tokens = _parse_pointer(pointer)
+    if not tokens:
+        raise ScenePatchError("Cannot remove the document root")
+    parent = _resolve_parent(doc, tokens, pointer)
+    token = tokens[-1]
+    if isinstance(parent, dict):
+        if token not in parent:
+            raise ScenePatchError(f"Path not found: '{pointer}'")
+        return parent.pop(token)
+    if isinstance(parent, list):
+        return parent.pop(_list_index(parent, token, allow_end=False))
+    raise ScenePatchError(f"Path not found: '{pointer}'")
+
+
+def apply_json_patch(doc: Any, patch: JsonPatch) -> Any:
+    """Apply an RFC 6902 JSON Patch to a document.
+
+    The input document is not modified. As a leniency for LLM output,
+    "replace" on a missing object member behaves like "add" (members left
+    at their default value are omitted from the prompt).
+
+    Args:
+        doc: The JSON document (dicts, lists and scalars).
+        patch: List of patch operations.
+
+    Returns:
+        The patched document.
+
+    Raises:
+        ScenePatchError: If an operation is malformed or cannot be applied.
+    """
+    if not isinstance(patch, list):
+        raise ScenePatchError("JSON Patch must be a list of operations")
+
+    result = copy.deepcopy(doc)
+    for i, op in enumerate(patch):
+        if not isinstance(op, dict) or "op" not in op or "path" not in op:
+            raise ScenePatchError(f"Operation {i} must have 'op' and 'path'")
+        kind, path = op["op"], op["path"]
+        if not isinstance(kind, str) or not isinstance(path, str):
+            raise ScenePatchError(f"Operation {i} must have string 'op' and 'path'")
+
+        if kind in ("add", "replace", "test") and "value" not in op:
+            raise ScenePatchError(f"Operation {i} ({kind}) is missing 'value'")
+        if kind in ("move", "copy") and not isinstance(op.get("from"), str):
+            raise ScenePatchError(f"Operation {i} ({kind}) needs a string 'from'")
+
+        if kind == "add":
+            result = _add(result, path, copy.deepcopy(op["value"]))
+        elif kind == "remove":
+            _remove(result, path)
+        elif kind == "replace":
+            tokens = _parse_pointer(path)
+            parent = _resolve_parent(result, tokens, path) if tokens else None
+            if tokens and not (isinstance(parent, dict) and tokens[-1] not in parent):
+                _remove(result, path)
+            result = _add(result, path, copy.deepcopy(op["value"]))
+        elif kind == "move":
+            value = _remove(result, op["from"])
+            result = _add(result, path, value)
+        elif kind == "copy":
+            result = _add(result, path, copy.deepcopy(_get(result, op["from"])))
+        elif kind == "test":
+            if _get(result, path) != op["value"]:
+                raise ScenePatchError(f"Test failed at '{path}'")
+        else:
+            raise ScenePatchError(f"Unknown patch operation: '{kind}'")
+
+    return result
+
+
+def apply_merge_patch(target: Any, patch: Any) -> Any:
+    """Apply an RFC 7386 JSON Merge Patch to a document.
+
+    The input document is not modified.
+
+    Args:
+        target: The JSON document.
+        patch: The merge patch. ``None`` values delete members.
+
+    Returns:
+        The merged document.
+    """
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+
+    result = copy.deepcopy(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = apply_merge_patch(result.get(key), value)
+    return result
+
+
+def scene_to_patch_base(scene: SceneSpec) -> Dict[str, Any]:
+    """Return the JSON document that patches are expressed against.
+
+    Members that are ``None`` are dropped to keep the prompt compact.
+
+    Args:
+        scene: The current scene.
+
+    Returns:
+        JSON-serializable scene document.
+    """
+    return scene.model_dump(exclude_none=True)
+
+
+def apply_scene_patch(
+    scene: SceneSpec,
+    patch: Union[JsonPatch, Dict[str, Any]],
+) -> SceneSpec:
+    """Apply a JSON Patch or merge patch to a scene and re-validate it.
+
+    Args:
+        scene: The current scene.
+        patch: A list of RFC 6902 operations, or a dict merge patch.
+
+    Returns:
+        The patched, validated SceneSpec.
+
+    Raises:
+        ScenePatchError: If the patch cannot be applied or the result is
+            not a valid SceneSpec.
+    """
+    base = scene_to_patch_base(scene)
+    if isinstance(patch, list):
+        data = apply_json_patch(base, patch)
+    elif isinstance(patch, dict):
+        data = apply_merge_patch(base, patch)
+    else:
+        raise ScenePatchError(f"Unsupported patch type: {type(patch).__name__}")
+
+    try:
+        return SceneSpec.model_validate(data)
+    except ValidationError as e:
+        errors = [f"{err['loc']}: {err['msg']}" for err in e.errors()]
+        raise ScenePatchError(
+            f"Patched scene is invalid: {len(errors)} errors",
+            details={"validation_errors": errors},
+        )
@@ -0,0 +1,274 @@
+"""Incremental parsing of streamed scene JSON.
+
+The LLM returns a scene as one JSON object. When the response is streamed,
+this parser scans each chunk as it arrives and reports every top-level
+value (``name``, ``environment``, ``physics``, ...) and every element of the
+top-level list sections (``objects``, ``cameras``, ``lights``, ``paths``,
+``tasks``) as soon as its closing character has been received. Each
+character is scanned exactly once.
+
+Structural errors (mismatched brackets) are reported as soon as they are
+seen, and a stream that ends with unclosed containers is reported as
+truncated instead of being patched up afterwards.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from neoscene.core.errors import NeosceneError
+
+# Top-level SceneSpec fields whose list elements are reported individually
+STREAMED_SECTIONS = ("objects", "cameras", "lights", "paths", "tasks")
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class SceneStreamError(NeosceneError):
+    """Error in the structure of a streamed scene (mismatch or truncation)."""
+
+    pass
+
+
+@dataclass
+class StreamedElement:
+    """A completed value from a streamed scene.
+
+    Attributes:
+        section: Top-level key the value belongs to (e.g. "objects").
+        index: Position within the section list, or None for a top-level
+            value that is not a list section.
+        data: The parsed value, or None if it was not valid JSON.
+        error: JSON parse error message, if any.
+    """
+
+    section: str
+    index: Optional[int]
+    data: Any = None
+    error: Optional[str] = None
+
+
+class SceneStreamParser:
+    """Single-pass incremental parser for a streamed scene JSON object.
+
+    Text before the opening brace (e.g. a markdown fence) and after the
+    closing brace is ignored.
+
+    Example:
+        >>> parser = SceneStreamParser()
+        >>> parser.feed('{"name": "demo", "objects": [{"asset_id": "cr')
+        [StreamedElement(section='name', index=None, data='demo', error=None)]
+        >>> [e.data for e in parser.feed('ate"}]}')]
+        [{'asset_id': 'crate'}]
+        >>> parser.finish()
+        '{"name": "demo", "objects": [{"asset_id": "crate"}]}'
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty parser."""
+        self._buffer = ""
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._root_start: Optional[int] = None
+        self._root_end: Optional[int] = None
+
+        # State of the root object: current key and its value
+        self._last_string: Optional[str] = None
+        self._key: Optional[str] = None
+        self._expect_value = False
+        self._value_start: Optional[int] = None
+        self._value_scalar = False
+
+        # State of the current element of a list section
+        self._element_start: Optional[int] = None
+        self._element_scalar = False
+        self._counts: Dict[str, int] = {}
+
+    @property
+    def text(self) -> str:
+        """All text received so far."""
+        return self._buffer
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether the root object has been closed."""
+        return self._root_end is not None
+
+    def section_counts(self) -> Dict[str, int]:
+        """Return the number of completed elements per list section."""
+        return dict(self._counts)
+
+    def feed(self, chunk: str) -> List[StreamedElement]:
+        """Scan the next chunk of the response.
+
+        Args:
+            chunk: Next piece of the streamed text.
+
+        Returns:
+            Values completed by this chunk, in stream order.
+
+        Raises:
+            SceneStreamError: If a closing bracket does not match.
+        """
+        self._buffer += chunk
+        completed: List[StreamedElement] = []
+        buf = self._buffer
+        stack = self._stack
+
+        i = self._pos
+        end = len(buf)
+        while i < end and self._root_end is None:
+            c = buf[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == "\\":
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+                    if len(stack) == 1 and not self._expect_value:
+                        self._last_string = self._decode(self._string_start, i + 1)
+                i += 1
+                continue
+
+            if c in " \t\r\n":
+                i += 1
+                continue
+
+            if not stack:
+                if c == "{":
+                    stack.append(c)
+                    self._root_start = i
+                i += 1
+                continue
+
+            depth = len(stack)
+
+            if c in "}]":
+                if _CLOSERS[stack[-1]] != c:
+                    raise SceneStreamError(
+                        f"Unexpected '{c}' at position {i}, expected '{_CLOSERS[stack[-1]]}'",
+                        details={"position": i},
+                    )
+                if depth == 2 and self._element_scalar:
+                    completed.append(self._complete_element(i))
+                if depth == 1 and self._value_scalar:
+                    completed.extend(self._complete_value(i))
+
+                stack.pop()
+                depth -= 1
+                if depth == 0:
+                    self._root_end = i
+                elif depth == 2 and self._in_section() and self._element_start is not None:
+                    completed.append(self._complete_element(i + 1))
+                elif depth == 1 and self._value_start is not None:
+                    completed.extend(self._complete_value(i + 1))
+                i += 1
+                continue
+
+            if c == ",":
+                if depth == 2 and self._element_start is not None:
+                    completed.append(self._complete_element(i))
+                elif depth == 1 and self._value_start is not None:
+                    completed.extend(self._complete_value(i))
+                i += 1
+                continue
+
+            if c == ":" and depth == 1:
+                self._key = self._last_string
+                self._expect_value = True
+                i += 1
+                continue
+
+            if depth == 1 and self._expect_value and self._value_start is None:
+                self._value_start = i
+                self._value_scalar = c not in "{["
+            elif depth == 2 and self._in_section() and self._element_start is None:
+                self._element_start = i
+                self._element_scalar = c not in "{["
+
+            if c == '"':
+                self._in_string = True
+                self._string_start = i
+            elif c in "{[":
+                stack.append(c)
+            i += 1
+
+        self._pos = end if self._root_end is not None else i
+        return completed
+
+    def finish(self) -> str:
+        """Signal the end of the stream and return the scene JSON text.
+
+        Returns:
+            The text of the root JSON object.
+
+        Raises:
+            SceneStreamError: If no object was found or the stream ended
+                before the root object was closed (truncated response).
+        """
+        if self._root_start is None:
+            raise SceneStreamError("No JSON object found in response")
+        if self._root_end is None:
+            open_containers = "".join(self._stack)
+            raise SceneStreamError(
+                f"Response truncated after {len(self._buffer)} chars "
+                f"with {len(self._stack)} unclosed containers",
+                details={
+                    "position": len(self._buffer),
+                    "open_containers": open_containers,
+                    "in_string": self._in_string,
+                    "section_counts": self.section_counts(),
+                },
+            )
+        return self._buffer[self._root_start:self._root_end + 1]
+
+    def _in_section(self) -> bool:
+        """Whether the scanner is directly inside a streamed list section."""
+        return (
+            len(self._stack) == 2
+            and self._stack[-1] == "["
+            and self._expect_value
+            and self._key in STREAMED_SECTIONS
+        )
+
+    def _decode(self, start: int, end: int) -> Any:
+        """Parse a slice of the buffer, returning the raw text on failure."""
+        text = self._buffer[start:end]
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return text
+
+    def _parse(self, section: str, index: Optional[int], start: int, end: int) -> StreamedElement:
+        """Parse a completed value into a StreamedElement."""
+        text = self._buffer[start:end]
+        try:
+            return StreamedElement(section, index, data=json.loads(text))
+        except json.JSONDecodeError as e:
+            return StreamedElement(section, index, error=str(e))
+
+    def _complete_element(self, end: int) -> StreamedElement:
+        """Finish the current element of a list section."""
+        section = self._key
+        index = self._counts.get(section, 0)
+        self._counts[section] = index + 1
+        element = self._parse(section, index, self._element_start, end)
+        self._element_start = None
+        self._element_scalar = False
+        return element
+
+    def _complete_value(self, end: int) -> List[StreamedElement]:
+        """Finish the current value of the root object."""
+        start = self._value_start
+        key = self._key
+        self._value_start = None
+        self._value_scalar = False
+        self._expect_value = False
+        if key in STREAMED_SECTIONS or key is None:
+            return []
+        return [self._parse(key, None, start, end)]
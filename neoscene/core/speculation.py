@@ -0,0 +1,151 @@
+"""Speculative parallel scene generation settings and budget.
+
+In speculative mode the SceneAgent sends several generation requests at
+once (different temperatures or prompt variants), keeps the first one that
+validates and cancels the rest. Every candidate beyond the first is an
+extra LLM call, so the number of extra calls is capped per deployment with
+a sliding time window.
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from neoscene.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class CandidateVariant:
+    """How one speculative candidate is generated.
+
+    Attributes:
+        temperature: Sampling temperature for this candidate.
+        full_catalog: If True, describe the whole asset catalog in the
+            prompt instead of only the assets relevant to the request.
+    """
+
+    temperature: float
+    full_catalog: bool = False
+
+
+DEFAULT_VARIANTS = [
+    CandidateVariant(temperature=0.3),
+    CandidateVariant(temperature=0.7),
+    CandidateVariant(temperature=0.3, full_catalog=True),
+]
+
+
+class SpeculativeGeneration:
+    """Candidate variants plus a shared cap on the extra LLM calls they cost.
+
+    Example:
+        >>> speculation = SpeculativeGeneration(max_extra_calls=10)
+        >>> len(speculation.plan())
+        3
+    """
+
+    def __init__(
+        self,
+        variants: Optional[List[CandidateVariant]] = None,
+        max_extra_calls: int = 200,
+        window_seconds: float = 3600.0,
+    ):
+        """Initialize speculative generation.
+
+        Args:
+            variants: Candidates to run per request; the first one is always
+                run and is not charged to the budget.
+            max_extra_calls: Maximum extra LLM calls within the window.
+            window_seconds: Length of the budget window in seconds.
+        """
+        self.variants = list(variants) if variants else list(DEFAULT_VARIANTS)
+        self.max_extra_calls = max_extra_calls
+        self.window_seconds = window_seconds
+        self._extra_calls: Deque[float] = deque()
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "extra_calls": 0, "throttled": 0, "cancelled": 0}
+        self._wins = [0] * len(self.variants)
+
+    def plan(self) -> List[CandidateVariant]:
+        """Reserve budget for a request and return the variants to run.
+
+        Returns:
+            The first variant plus as many extra variants as the budget
+            allows right now.
+        """
+        now = time.monotonic()
+        with self._lock:
+            while self._extra_calls and now - self._extra_calls[0] > self.window_seconds:
+                self._extra_calls.popleft()
+
+            wanted = len(self.variants) - 1
+            granted = max(0, min(wanted, self.max_extra_calls - len(self._extra_calls)))
+            self._extra_calls.extend([now] * granted)
+
+            self._stats["requests"] += 1
+            self._stats["extra_calls"] += granted
+            if granted < wanted:
+                self._stats["throttled"] += 1
+                logger.info(f"Speculation budget: {granted}/{wanted} extra candidates granted")
+
+        return self.variants[:granted + 1]
+
+    def record(self, winner: Optional[int], cancelled: int) -> None:
+        """Record the outcome of a speculative request.
+
+        Args:
+            winner: Index of the variant that produced the scene, if any.
+            cancelled: Number of candidates cancelled before finishing.
+        """
+        with self._lock:
+            if winner is not None:
+                self._wins[winner] += 1
+            self._stats["cancelled"] += cancelled
+
+    def stats(self) -> Dict[str, Any]:
+        """Return usage statistics.
+
+        Returns:
+            Dict with request, extra call, throttled and cancelled counts,
+            the wins per variant and the extra calls left in the window.
+        """
+        now = time.monotonic()
+        with self._lock:
+            in_window = sum(1 for t in self._extra_calls if now - t <= self.window_seconds)
+            return {
+                **self._stats,
+                "wins_by_variant": list(self._wins),
+                "budget_remaining": max(0, self.max_extra_calls - in_window),
+            }
+
+
+def speculation_from_config(config: Dict[str, Any]) -> Optional[SpeculativeGeneration]:
+    """Build speculative generation from the "speculative" section of the LLM config.
+
+    Args:
+        config: Loaded LLM configuration.
+
+    Returns:
+        SpeculativeGeneration, or None if disabled.
+    """
+    spec_config = config.get("speculative") or {}
+    if not spec_config.get("enabled", False):
+        return None
+
+    variants = [
+        CandidateVariant(
+            temperature=float(v.get("temperature", config.get("temperature", 0.3))),
+            full_catalog=bool(v.get("full_catalog", False)),
+        )
+        for v in spec_config.get("variants") or []
+    ]
+    budget = spec_config.get("budget") or {}
+    return SpeculativeGeneration(
+        variants=variants or None,
+        max_extra_calls=int(budget.get("max_extra_calls", 200)),
+        window_seconds=float(budget.get("window_seconds", 3600)),
+    )
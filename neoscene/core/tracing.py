@@ -0,0 +1,240 @@
+"""Lightweight per-stage latency tracing.
+
+Code marks pipeline stages with ``span("name")``. Every span duration is
+added to a process-wide histogram for that stage. When a request trace is
+active (``start_trace``), the span is also recorded on the trace, so the
+API can return the request's stage timings in a ``Server-Timing`` header
+and in the response body.
+
+Spans are cheap: two ``perf_counter`` calls, a context variable lookup and
+one short critical section per histogram update. They are safe to nest and
+to use from worker threads (``asyncio.to_thread`` copies the context, so
+spans recorded in a thread land on the request's trace).
+
+Example:
+    >>> with start_trace() as trace:
+    ...     with span("llm"):
+    ...         pass
+    >>> list(trace.timings())
+    ['llm']
+"""
+
+import bisect
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Histogram bucket upper bounds in milliseconds
+DEFAULT_BUCKETS_MS: Tuple[float, ...] = (
+    0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000,
+)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram.
+
+    Buckets are cumulative on export (Prometheus-style ``le`` bounds); the
+    last implicit bucket is +Inf.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS):
+        """Initialize an empty histogram.
+
+        Args:
+            buckets: Sorted upper bounds of the buckets.
+        """
+        self.buckets = tuple(buckets)
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+            if value > self._max:
+                self._max = value
+
+    def snapshot(self) -> Tuple[List[int], float, int]:
+        """Return (per-bucket counts, sum, count) at one instant."""
+        with self._lock:
+            return list(self._counts), self._sum, self._count
+
+    def quantile(self, q: float, counts: Optional[List[int]] = None) -> float:
+        """Estimate a quantile by linear interpolation within its bucket.
+
+        Args:
+            q: Quantile between 0 and 1.
+            counts: Bucket counts to use (default: current snapshot).
+
+        Returns:
+            The estimate (never above the largest value seen), or 0.0 if
+            the histogram is empty.
+        """
+        if counts is None:
+            counts = self.snapshot()[0]
+        total = sum(counts)
+        if total == 0:
+            return 0.0
+        rank = q * total
+        seen = 0
+        estimate = self.buckets[-1]
+        for index, count in enumerate(counts):
+            if count and seen + count >= rank:
+                low = self.buckets[index - 1] if index > 0 else 0.0
+                high = self.buckets[index] if index < len(self.buckets) else self._max
+                estimate = low + (high - low) * (rank - seen) / count
+                break
+            seen += count
+        return min(estimate, self._max)
+
+    def summary(self) -> Dict[str, float]:
+        """Return count, mean, max and estimated p50/p95/p99."""
+        counts, total, count = self.snapshot()
+        return {
+            "count": count,
+            "mean": round(total / count, 2) if count else 0.0,
+            "max": round(self._max, 2),
+            "p50": round(self.quantile(0.50, counts), 2),
+            "p95": round(self.quantile(0.95, counts), 2),
+            "p99": round(self.quantile(0.99, counts), 2),
+        }
+
+
+class _Registry:
+    """Process-wide histograms keyed by stage name."""
+
+    def __init__(self):
+        self._histograms: Dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> Histogram:
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, Histogram())
+        return histogram
+
+    def items(self) -> List[Tuple[str, Histogram]]:
+        with self._lock:
+            return sorted(self._histograms.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+stage_histograms = _Registry()
+
+
+class Trace:
+    """Stage timings of one request.
+
+    Repeated stages (e.g. several LLM calls during repair) are summed.
+    """
+
+    def __init__(self):
+        """Start the trace clock."""
+        self.start = time.perf_counter()
+        self._timings: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, milliseconds: float) -> None:
+        """Add time to a stage."""
+        with self._lock:
+            self._timings[name] = self._timings.get(name, 0.0) + milliseconds
+
+    def elapsed_ms(self) -> float:
+        """Milliseconds since the trace started."""
+        return (time.perf_counter() - self.start) * 1000.0
+
+    def timings(self, total: bool = False) -> Dict[str, float]:
+        """Return stage timings in milliseconds, in first-seen order.
+
+        Args:
+            total: Also include a "total" entry with the elapsed time.
+        """
+        with self._lock:
+            timings = {name: round(ms, 2) for name, ms in self._timings.items()}
+        if total:
+            timings["total"] = round(self.elapsed_ms(), 2)
+        return timings
+
+    def server_timing(self) -> str:
+        """Format the timings (with total) as a Server-Timing header value."""
+        return ", ".join(
+            f"{name};dur={ms}" for name, ms in self.timings(total=True).items()
+        )
+
+
+_current_trace: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+
+
+def current_trace() -> Optional[Trace]:
+    """Return the active request trace, if any."""
+    return _current_trace.get()
+
+
+@contextmanager
+def start_trace() -> Iterator[Trace]:
+    """Make a new trace active for the block."""
+    trace = Trace()
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+
+
+@contextmanager
+def use_trace(trace: Optional[Trace]) -> Iterator[None]:
+    """Make an existing trace active for the block (e.g. in a generator step)."""
+    token = _current_trace.set(trace)
+    try:
+        yield
+    finally:
+        _current_trace.reset(token)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time a pipeline stage.
+
+    Args:
+        name: Stage name (a Server-Timing token: no spaces or commas).
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        milliseconds = (time.perf_counter() - start) * 1000.0
+        stage_histograms.get(name).observe(milliseconds)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.add(name, milliseconds)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator that runs a (synchronous) function inside span(name)."""
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper  # type: ignore[return-value]
+    return decorator
+
+
+def stage_summary() -> Dict[str, Dict[str, float]]:
+    """Return count, mean and p50/p95/p99 (ms) for every stage seen so far."""
+    return {name: histogram.summary() for name, histogram in stage_histograms.items()}
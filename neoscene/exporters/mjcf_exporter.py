@@ -4,15 +4,17 @@ This module provides functionality to convert the SceneSpec intermediate
 representation into valid MJCF XML that can be loaded by MuJoCo.
 """
 
+import copy
 import math
 import random
 import re
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 from xml.dom import minidom
 
 from neoscene.core.asset_catalog import AssetCatalog
+from neoscene.core.metrics import REGISTRY
 from neoscene.core.scene_schema import (
     GridLayout,
     InstanceSpec,
@@ -22,6 +24,7 @@ from neoscene.core.scene_schema import (
     RandomLayout,
     SceneSpec,
 )
+from neoscene.core.tracing import traced
 
 
 def _deg_to_rad(deg: float) -> float:
@@ -256,6 +259,63 @@ def _render_path_geoms(path: PathSpec, worldbody: ET.Element) -> None:
             geom.set("conaffinity", "0")
 
 
+# Parsed asset MJCF trees by path, with the mtime_ns they were parsed at; a
+# changed file replaces its entry. None marks empty or invalid files.
+_asset_cache: Dict[Path, Tuple[int, Optional[ET.Element]]] = {}
+
+ASSET_CACHE_LOOKUPS = REGISTRY.counter(
+    "neoscene_exporter_asset_cache_lookups_total",
+    "Asset MJCF parse cache lookups by result (hit or miss)",
+    ("result",),
+)
+
+
+def _asset_cache_hit_ratio() -> float:
+    """Fraction of asset cache lookups served from the cache."""
+    hits = ASSET_CACHE_LOOKUPS.value(result="hit")
+    lookups = hits + ASSET_CACHE_LOOKUPS.value(result="miss")
+    return hits / lookups if lookups else 0.0
+
+
+REGISTRY.gauge(
+    "neoscene_exporter_asset_cache_hit_ratio",
+    "Fraction of asset MJCF parse cache lookups that were hits",
+    _asset_cache_hit_ratio,
+)
+
+
+def _parse_asset_file(mjcf_path: Path) -> Optional[ET.Element]:
+    """Parse an asset MJCF file, reusing the parsed tree while the file is unchanged.
+
+    The exporter renames and re-parents the returned elements, so callers
+    get a deep copy of the cached tree.
+
+    Args:
+        mjcf_path: Path to the asset MJCF file.
+
+    Returns:
+        The root element, or None if the file is empty or not valid XML.
+    """
+    mtime_ns = mjcf_path.stat().st_mtime_ns
+    cached = _asset_cache.get(mjcf_path)
+    if cached is not None and cached[0] == mtime_ns:
+        ASSET_CACHE_LOOKUPS.inc(result="hit")
+        root = cached[1]
+        return copy.deepcopy(root) if root is not None else None
+
+    ASSET_CACHE_LOOKUPS.inc(result="miss")
+    # Remove XML comments
+    content = re.sub(r"<!--.*?-->", "", mjcf_path.read_text(), flags=re.DOTALL).strip()
+    root = None
+    if content:
+        try:
+            root = ET.fromstring(content)
+        except ET.ParseError:
+            root = None
+    _asset_cache[mjcf_path] = (mtime_ns, root)
+    return copy.deepcopy(root) if root is not None else None
+
+
 def _load_asset_content(mjcf_path: Path, prefix: str) -> dict:
     """Load asset MJCF content and extract worldbody/sensor elements.
 
@@ -266,20 +326,10 @@ def _load_asset_content(mjcf_path: Path, prefix: str) -> dict:
     Returns:
         Dictionary with 'worldbody' (list of body elements) and 'sensors' (list of sensor elements).
     """
-    content = mjcf_path.read_text()
-
-    # Remove XML comments
-    content = re.sub(r"<!--.*?-->", "", content, flags=re.DOTALL)
-    content = content.strip()
-
     result = {"worldbody": [], "sensors": [], "assets": [], "actuators": [], "has_freejoint": False}
 
-    if not content:
-        return result
-
-    try:
-        root = ET.fromstring(content)
-    except ET.ParseError:
+    root = _parse_asset_file(mjcf_path)
+    if root is None:
         return result
 
     # Build a mapping of original names to prefixed names for this asset
@@ -366,6 +416,7 @@ def _load_asset_content(mjcf_path: Path, prefix: str) -> dict:
     return result
 
 
+@traced("mjcf_export")
 def scene_to_mjcf(
     scene: SceneSpec,
     catalog: AssetCatalog,
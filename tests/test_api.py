@@ -1,11 +1,13 @@
 """Tests for the FastAPI endpoints."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
 from fastapi.testclient import TestClient
 
 from neoscene.app.api import app
+from neoscene.backends.frame_cache import JpegFrameCache
 from neoscene.core.scene_schema import EnvironmentSpec, SceneSpec
 
 
@@ -140,7 +142,7 @@ class TestGenerateSceneEndpoint:
         self, mock_agent: MagicMock, client: TestClient, mock_scene_spec: SceneSpec
     ) -> None:
         """Test that scene generation returns 200."""
-        mock_agent.generate_and_repair.return_value = mock_scene_spec
+        mock_agent.generate_and_repair_async = AsyncMock(return_value=mock_scene_spec)
 
         response = client.post(
             "/generate_scene",
@@ -153,7 +155,7 @@ class TestGenerateSceneEndpoint:
         self, mock_agent: MagicMock, client: TestClient, mock_scene_spec: SceneSpec
     ) -> None:
         """Test that response contains scene_spec."""
-        mock_agent.generate_and_repair.return_value = mock_scene_spec
+        mock_agent.generate_and_repair_async = AsyncMock(return_value=mock_scene_spec)
 
         response = client.post(
             "/generate_scene",
@@ -169,7 +171,7 @@ class TestGenerateSceneEndpoint:
         self, mock_agent: MagicMock, client: TestClient, mock_scene_spec: SceneSpec
     ) -> None:
         """Test that MJCF is included by default."""
-        mock_agent.generate_and_repair.return_value = mock_scene_spec
+        mock_agent.generate_and_repair_async = AsyncMock(return_value=mock_scene_spec)
 
         response = client.post(
             "/generate_scene",
@@ -185,7 +187,7 @@ class TestGenerateSceneEndpoint:
         self, mock_agent: MagicMock, client: TestClient, mock_scene_spec: SceneSpec
     ) -> None:
         """Test that MJCF can be excluded."""
-        mock_agent.generate_and_repair.return_value = mock_scene_spec
+        mock_agent.generate_and_repair_async = AsyncMock(return_value=mock_scene_spec)
 
         response = client.post(
             "/generate_scene",
@@ -195,6 +197,24 @@ class TestGenerateSceneEndpoint:
 
         assert data["mjcf_xml"] is None
 
+    @patch("neoscene.app.api.agent")
+    def test_generate_scene_reports_stage_timings(
+        self, mock_agent: MagicMock, client: TestClient, mock_scene_spec: SceneSpec
+    ) -> None:
+        """Test that stage timings are returned in Server-Timing and the body."""
+        mock_agent.generate_and_repair_async = AsyncMock(return_value=mock_scene_spec)
+
+        response = client.post(
+            "/generate_scene",
+            json={"prompt": "An orchard with a tractor"},
+        )
+
+        assert "mjcf_export;dur=" in response.headers["server-timing"]
+        assert "total" in response.json()["timings"]
+
+        stages = client.get("/timings").json()["stages"]
+        assert stages["mjcf_export"]["count"] >= 1
+
     def test_generate_scene_short_prompt_error(self, client: TestClient) -> None:
         """Test that short prompts are rejected."""
         response = client.post(
@@ -202,3 +222,96 @@ class TestGenerateSceneEndpoint:
             json={"prompt": "ab"},  # Too short
         )
         assert response.status_code == 422
+
+
+class TestGenerateSceneBatchEndpoint:
+    """Tests for the /generate_scene/batch endpoint."""
+
+    @patch("neoscene.app.api.agent")
+    def test_batch_streams_ndjson(
+        self, mock_agent: MagicMock, client: TestClient, mock_scene_spec: SceneSpec
+    ) -> None:
+        """Test that every prompt produces one NDJSON result line."""
+        import json
+
+        mock_agent.llm.scheduler = None
+        mock_agent.generate_and_repair_async = AsyncMock(return_value=mock_scene_spec)
+
+        response = client.post(
+            "/generate_scene/batch",
+            json={"prompts": ["An orchard", "A farm"], "validate_mjcf": False},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        results = [json.loads(line) for line in response.text.splitlines()]
+        assert sorted(r["index"] for r in results) == [0, 1]
+        assert all(r["status"] == "ok" for r in results)
+        assert results[0]["scene_spec"]["name"] == "test_scene"
+
+    def test_batch_rejects_empty_prompt(self, client: TestClient) -> None:
+        """Test that blank prompts are rejected."""
+        response = client.post("/generate_scene/batch", json={"prompts": ["ok prompt", " "]})
+        assert response.status_code == 400
+
+
+class TestMetricsEndpoint:
+    """Tests for the /metrics endpoint."""
+
+    def test_metrics_prometheus_format(self, client: TestClient) -> None:
+        """Test that metrics are served as Prometheus text."""
+        client.get("/health")
+
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE neoscene_http_request_duration_seconds histogram" in response.text
+        assert "neoscene_catalog_assets" in response.text
+        assert "neoscene_active_sessions" in response.text
+
+    def test_request_latency_labelled_by_route_template(self, client: TestClient) -> None:
+        """Test that path parameters do not create one series per value."""
+        client.get("/sensors/some-session")
+
+        text = client.get("/metrics").text
+
+        assert 'route="/sensors/{session_id}"' in text
+        assert "some-session" not in text
+
+
+class TestCameraEndpoint:
+    """Tests for the /camera endpoint."""
+
+    @staticmethod
+    def _frames(image: np.ndarray) -> JpegFrameCache:
+        return JpegFrameCache(lambda: 1, lambda: (1, image.copy()), tag="test")
+
+    @patch("neoscene.app.api.session_manager")
+    def test_returns_jpeg_with_etag(self, mock_manager, client: TestClient) -> None:
+        """Test that frames are served as JPEG tagged with the frame number."""
+        mock_manager.get_camera_frames.return_value = self._frames(np.zeros((8, 8, 3), np.uint8))
+
+        response = client.get("/camera/s1")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.headers["etag"] == '"test-1"'
+        assert response.content[:2] == b"\xff\xd8"
+
+    @patch("neoscene.app.api.session_manager")
+    def test_unchanged_frame_is_not_modified(self, mock_manager, client: TestClient) -> None:
+        """Test that If-None-Match with the current ETag gives 304 without a body."""
+        mock_manager.get_camera_frames.return_value = self._frames(np.zeros((8, 8, 3), np.uint8))
+
+        response = client.get("/camera/s1", headers={"If-None-Match": '"test-1"'})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    @patch("neoscene.app.api.session_manager")
+    def test_no_session_is_no_content(self, mock_manager, client: TestClient) -> None:
+        """Test that 204 is returned when there is no camera."""
+        mock_manager.get_camera_frames.return_value = None
+
+        assert client.get("/camera/missing").status_code == 204
@@ -0,0 +1,133 @@
+"""Tests for batch scene generation."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from neoscene.app.batch import (
+    BatchGenerator,
+    BatchItem,
+    get_export_pool,
+    read_prompts,
+    shutdown_export_pool,
+)
+from neoscene.core.llm_client import LLMQueueFullError
+from neoscene.core.scene_schema import EnvironmentSpec, SceneSpec
+
+ASSETS_PATH = Path(__file__).parent.parent / "neoscene" / "assets"
+
+
+@pytest.fixture
+def scene() -> SceneSpec:
+    """A minimal valid scene."""
+    return SceneSpec(name="batch_scene", environment=EnvironmentSpec(asset_id="orchard"))
+
+
+def _agent(side_effect) -> MagicMock:
+    """Create an agent mock whose generation follows side_effect."""
+    agent = MagicMock()
+    agent.llm.scheduler = None
+    agent.generate_and_repair_async = AsyncMock(side_effect=side_effect)
+    return agent
+
+
+def _collect(batch: BatchGenerator, items):
+    """Run a batch and return its results."""
+    async def main():
+        return [result async for result in batch.run(items)]
+    return asyncio.run(main())
+
+
+class TestReadPrompts:
+    """Tests for batch input parsing."""
+
+    def test_text_and_jsonl(self) -> None:
+        """Test mixing plain prompts and JSONL records."""
+        items = read_prompts(["an orchard", "", '{"prompt": "a farm", "id": 7}'])
+
+        assert items == [BatchItem(0, "an orchard"), BatchItem(1, "a farm", "7")]
+
+    def test_jsonl_without_prompt(self) -> None:
+        """Test that records need a prompt."""
+        with pytest.raises(ValueError):
+            read_prompts(['{"id": 1}'])
+
+
+class TestBatchGenerator:
+    """Tests for BatchGenerator."""
+
+    def test_generates_exports_and_validates(self, scene: SceneSpec) -> None:
+        """Test results for every prompt, with MJCF validated in the pool."""
+        agent = _agent(lambda prompt: scene)
+        batch = BatchGenerator(agent, ASSETS_PATH, workers=1, include_mjcf=True)
+
+        results = _collect(batch, read_prompts(["one", "two"]))
+
+        assert sorted(r["index"] for r in results) == [0, 1]
+        for result in results:
+            assert result["status"] == "ok"
+            assert result["valid"] is True
+            assert "<mujoco" in result["mjcf_xml"]
+            assert set(result["timings"]) >= {"generate_ms", "export_ms", "validate_ms"}
+
+    def test_failures_are_reported_per_item(self, scene: SceneSpec) -> None:
+        """Test that one failing prompt does not stop the batch."""
+        def generate(prompt: str) -> SceneSpec:
+            if prompt == "bad":
+                raise RuntimeError("generation failed")
+            return scene
+
+        batch = BatchGenerator(_agent(generate), ASSETS_PATH, workers=1, validate=False)
+
+        results = {r["prompt"]: r for r in _collect(batch, read_prompts(["good", "bad"]))}
+
+        assert results["good"]["status"] == "ok"
+        assert results["bad"]["status"] == "error"
+        assert "generation failed" in results["bad"]["error"]
+
+    def test_retries_when_llm_queue_full(self, scene: SceneSpec) -> None:
+        """Test that a full LLM queue is waited out instead of failing."""
+        agent = _agent([LLMQueueFullError("full", retry_after=0), scene])
+        batch = BatchGenerator(agent, ASSETS_PATH, workers=1, validate=False)
+
+        results = _collect(batch, read_prompts(["one"]))
+
+        assert results[0]["status"] == "ok"
+        assert agent.generate_and_repair_async.call_count == 2
+
+    def test_concurrency_defaults_to_scheduler_limit(self) -> None:
+        """Test that the batch stays within the LLM scheduler limit."""
+        agent = MagicMock()
+        agent.llm.scheduler.max_concurrency = 3
+
+        assert BatchGenerator(agent, ASSETS_PATH).concurrency == 3
+
+
+class TestExportPool:
+    """Tests for the shared export/validation process pool."""
+
+    def teardown_method(self) -> None:
+        """Shut down the pool created by the test."""
+        shutdown_export_pool()
+
+    def test_batches_share_one_pool(self, scene: SceneSpec) -> None:
+        """Test that consecutive batches reuse the pool instead of starting new processes."""
+        batch = BatchGenerator(_agent(lambda prompt: scene), ASSETS_PATH, workers=1)
+        pool = get_export_pool(ASSETS_PATH, 1)
+
+        _collect(batch, read_prompts(["one"]))
+        _collect(batch, read_prompts(["two"]))
+
+        assert get_export_pool(ASSETS_PATH, 1) is pool
+
+    def test_shutdown_and_different_settings_create_a_new_pool(self) -> None:
+        """Test that the pool is replaced after shutdown or for other settings."""
+        pool = get_export_pool(ASSETS_PATH, 1)
+
+        other = get_export_pool(ASSETS_PATH, 2)
+        assert other is not pool
+
+        shutdown_export_pool()
+        assert get_export_pool(ASSETS_PATH, 2) is not other
@@ -1,6 +1,6 @@
 """Tests for the /chat API endpoint."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
@@ -27,6 +27,8 @@ def client(mock_scene_spec):
         
         # Setup mock agent
         mock_agent.generate_and_repair.return_value = mock_scene_spec
+        mock_agent.update_scene_spec_async = AsyncMock(return_value=mock_scene_spec)
+        mock_agent.try_local_edit.return_value = None
         
         # Setup mock session manager
         mock_session = MagicMock()
@@ -34,6 +36,8 @@ def client(mock_scene_spec):
         mock_session.last_scene = mock_scene_spec
         
         mock_session_mgr.get_or_create_session.return_value = mock_session
+        mock_session_mgr.update_scene_async = AsyncMock()
+        mock_session_mgr.start_task_async = AsyncMock(return_value=True)
         mock_session_mgr.describe_scene.return_value = {
             "has_scene": True,
             "scene_name": "test_scene",
@@ -112,3 +116,126 @@ class TestChatEndpoint:
         data = response.json()
 
         assert data["user_message"] == message
+
+    def test_chat_updates_scene_off_event_loop(self, client: TestClient) -> None:
+        """Test that the scene update is awaited rather than run on the event loop."""
+        from neoscene.app import api
+
+        client.post("/chat", json={"message": "a field with a tractor"})
+
+        api.session_manager.update_scene_async.assert_awaited_once()
+        api.session_manager.update_scene.assert_not_called()
+
+    def test_chat_starts_task_off_event_loop(self, client: TestClient) -> None:
+        """Test that starting a task waits for the worker without blocking the event loop."""
+        from neoscene.app import api
+
+        response = client.post("/chat", json={"message": "start task patrol"})
+
+        assert "Started task 'patrol'" in response.json()["assistant_message"]
+        api.session_manager.start_task_async.assert_awaited_once_with(
+            "test-session-123", "patrol"
+        )
+        api.session_manager.start_task.assert_not_called()
+
+    def test_chat_local_edit_reports_its_description(
+        self, client: TestClient, mock_scene_spec: SceneSpec
+    ) -> None:
+        """Test that a local edit skips the LLM and the reply says what changed."""
+        from neoscene.app import api
+        from neoscene.core.scene_edits import LocalEdit
+
+        api.agent.try_local_edit.return_value = LocalEdit(
+            mock_scene_spec, "Added 10 Barrel (barrel)."
+        )
+
+        response = client.post("/chat", json={"message": "add 10 barrels"})
+
+        message = response.json()["assistant_message"]
+        assert message.startswith("Added 10 Barrel (barrel).")
+        assert "Updated scene" not in message
+        api.agent.update_scene_spec_async.assert_not_awaited()
+        api.session_manager.update_scene_async.assert_awaited_once()
+
+
+class TestChatStreamEndpoint:
+    """Tests for POST /chat/stream endpoint."""
+
+    def test_chat_stream_emits_events(
+        self, client: TestClient, mock_scene_spec: SceneSpec
+    ) -> None:
+        """Test that progress and the final scene are sent as SSE events."""
+        from neoscene.app import api
+
+        api.agent.stream_scene_spec.return_value = iter([
+            {"event": "element", "section": "objects", "index": 0, "valid": True, "errors": []},
+            {"event": "scene", "scene": mock_scene_spec},
+        ])
+
+        response = client.post("/chat/stream", json={"message": "an orchard"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "event: element" in response.text
+        assert "event: done" in response.text
+        assert "test_scene" in response.text
+        api.session_manager.update_scene.assert_called_once()
+        assert '"timings"' in response.text
+
+    def test_chat_stream_local_edit_reports_its_description(
+        self, client: TestClient, mock_scene_spec: SceneSpec
+    ) -> None:
+        """Test that the done event of a local edit says what changed."""
+        from neoscene.app import api
+
+        api.agent.stream_scene_spec.return_value = iter([
+            {"event": "scene", "scene": mock_scene_spec, "description": "Removed Cow."},
+        ])
+
+        response = client.post("/chat/stream", json={"message": "remove the cow"})
+
+        assert '"assistant_message": "Removed Cow. 0 object(s)' in response.text
+        assert "Updated scene" not in response.text
+
+    def test_chat_stream_reports_errors(self, client: TestClient) -> None:
+        """Test that a failed generation is sent as an error event."""
+        from neoscene.app import api
+
+        api.agent.stream_scene_spec.side_effect = RuntimeError("boom")
+
+        response = client.post("/chat/stream", json={"message": "an orchard"})
+
+        assert response.status_code == 200
+        assert "event: error" in response.text
+        assert "boom" in response.text
+
+    def test_chat_stream_rejects_control_commands(self, client: TestClient) -> None:
+        """Test that control commands must use /chat."""
+        response = client.post("/chat/stream", json={"message": "stop task"})
+        assert response.status_code == 400
+
+
+class TestLLMQueueFull:
+    """Tests for backpressure when the LLM queue is full."""
+
+    def test_chat_returns_429_with_retry_after(self, client: TestClient) -> None:
+        """Test that a full LLM queue is reported as 429 with a retry hint."""
+        from neoscene.app import api
+        from neoscene.core.llm_client import LLMQueueFullError
+
+        api.agent.update_scene_spec_async.side_effect = LLMQueueFullError(
+            "LLM request queue is full", retry_after=7
+        )
+
+        response = client.post("/chat", json={"message": "add a tractor"})
+
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "7"
+        assert response.json()["retry_after"] == 7
+
+    def test_llm_stats_endpoint(self, client: TestClient) -> None:
+        """Test that scheduler metrics are exposed."""
+        response = client.get("/llm/stats")
+
+        assert response.status_code == 200
+        assert "scheduler" in response.json()
@@ -250,7 +250,7 @@ class TestErrorInAPI:
     def test_api_returns_friendly_error(self) -> None:
         """Test that API returns friendly error responses."""
         from fastapi.testclient import TestClient
-        from unittest.mock import patch
+        from unittest.mock import AsyncMock, patch
 
         from neoscene.app.api import app
 
@@ -260,8 +260,8 @@ class TestErrorInAPI:
         from neoscene.core.scene_agent import SceneGenerationError
 
         with patch("neoscene.app.api.agent") as mock_agent:
-            mock_agent.generate_and_repair.side_effect = SceneGenerationError(
-                "Failed to generate scene"
+            mock_agent.generate_and_repair_async = AsyncMock(
+                side_effect=SceneGenerationError("Failed to generate scene")
             )
 
             response = client.post(
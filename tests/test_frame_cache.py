@@ -0,0 +1,108 @@
+"""Tests for the encode-once JPEG frame cache."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import numpy as np
+
+from neoscene.backends import frame_cache
+from neoscene.backends.frame_cache import JpegFrameCache
+
+
+class FrameSource:
+    """Stand-in for a worker's published frames."""
+
+    def __init__(self):
+        self.number = 0
+        self.image = None
+        self.snapshots = 0
+
+    def publish(self) -> None:
+        self.number += 1
+        self.image = np.full((16, 16, 3), self.number * 10, dtype=np.uint8)
+
+    def frame_number(self) -> int:
+        return self.number
+
+    def snapshot(self):
+        self.snapshots += 1
+        if self.image is None:
+            return None
+        return self.number, self.image.copy()
+
+
+def make_cache(source: FrameSource) -> JpegFrameCache:
+    return JpegFrameCache(source.frame_number, source.snapshot, tag="w1")
+
+
+class TestJpegFrameCache:
+    """Tests for JpegFrameCache."""
+
+    def test_no_frame_yet(self) -> None:
+        """Test that nothing is returned before the first frame."""
+        cache = make_cache(FrameSource())
+
+        assert cache.get() is None
+        assert cache.encodes == 0
+
+    def test_each_frame_encoded_once(self) -> None:
+        """Test that repeated reads of one frame share one encode and copy."""
+        source = FrameSource()
+        source.publish()
+        cache = make_cache(source)
+
+        first = cache.get()
+        second = cache.get()
+
+        assert first is second
+        assert first.data[:2] == b"\xff\xd8"
+        assert cache.encodes == 1
+        assert source.snapshots == 1
+
+    def test_etag_follows_frame_number(self) -> None:
+        """Test that a new frame is re-encoded under a new ETag."""
+        source = FrameSource()
+        source.publish()
+        cache = make_cache(source)
+        first = cache.get()
+
+        source.publish()
+        second = cache.get()
+
+        assert first.etag == '"w1-1"'
+        assert second.etag == '"w1-2"'
+        assert cache.encodes == 2
+
+    def test_concurrent_readers_share_encode(self) -> None:
+        """Test that readers arriving during an encode wait for it."""
+        source = FrameSource()
+        source.publish()
+        cache = make_cache(source)
+        encode = frame_cache.encode_jpeg
+
+        def slow_encode(image, quality):
+            time.sleep(0.1)
+            return encode(image, quality)
+
+        results = []
+        with patch.object(frame_cache, "encode_jpeg", side_effect=slow_encode):
+            threads = [threading.Thread(target=lambda: results.append(cache.get()))
+                       for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert cache.encodes == 1
+        assert len(results) == 4
+        assert all(result is results[0] for result in results)
+
+    def test_missing_encoder(self) -> None:
+        """Test that no frame is returned when no JPEG encoder is installed."""
+        source = FrameSource()
+        source.publish()
+        cache = make_cache(source)
+
+        with patch.object(frame_cache, "encode_jpeg", return_value=None):
+            assert cache.get() is None
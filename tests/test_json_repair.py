@@ -0,0 +1,108 @@
+"""Tests for the lenient JSON reader."""
+
+import json
+
+import pytest
+
+from neoscene.core.json_repair import JsonRepairError, loads_lenient, repair_json
+
+
+def _repair(text: str):
+    """Repair text and return (parsed data, fixes)."""
+    result = repair_json(text)
+    return json.loads(result.text), result.fixes
+
+
+class TestRepairJson:
+    """Tests for repair_json."""
+
+    def test_valid_json_unchanged(self) -> None:
+        """Test that valid JSON needs no fixes."""
+        data, fixes = _repair('{"a": [1, 2.5, true, null], "b": {"c": "d"}}')
+        assert data == {"a": [1, 2.5, True, None], "b": {"c": "d"}}
+        assert fixes == []
+
+    def test_trailing_commas(self) -> None:
+        """Test that trailing commas are removed."""
+        data, fixes = _repair('{"a": [1, 2,], "b": 3,}')
+        assert data == {"a": [1, 2], "b": 3}
+        assert sum("trailing comma" in f for f in fixes) == 2
+
+    def test_comments(self) -> None:
+        """Test that line and block comments are removed."""
+        data, _ = _repair('{"a": 1, // one\n /* two */ "b": 2}')
+        assert data == {"a": 1, "b": 2}
+
+    def test_single_quotes_and_unquoted_keys(self) -> None:
+        """Test that single-quoted strings and bare keys are converted."""
+        data, fixes = _repair("{name: 'it\\'s \"here\"', 'x': 1}")
+        assert data == {"name": 'it\'s "here"', "x": 1}
+        assert any("unquoted key" in f for f in fixes)
+
+    def test_string_contents_untouched(self) -> None:
+        """Test that text inside strings is never rewritten."""
+        text = '{"a": "x, } ] // not a comment \'q\'", "b": "{[,]}"}'
+        data, fixes = _repair(text)
+        assert data == json.loads(text)
+        assert fixes == []
+
+    def test_missing_commas(self) -> None:
+        """Test that missing commas between members are inserted."""
+        data, _ = _repair('{"a": [{"x": 1} {"x": 2}] "b": 3}')
+        assert data == {"a": [{"x": 1}, {"x": 2}], "b": 3}
+
+    def test_python_literals_and_numbers(self) -> None:
+        """Test that Python literals and loose numbers are normalized."""
+        data, _ = _repair('{"a": True, "b": None, "c": +1, "d": .5, "e": 2.}')
+        assert data == {"a": True, "b": None, "c": 1, "d": 0.5, "e": 2.0}
+
+    def test_truncated_closes_in_order(self) -> None:
+        """Test that truncated input is closed innermost first."""
+        data, fixes = _repair('{"objects": [{"asset_id": "cr')
+        assert data == {"objects": [{"asset_id": "cr"}]}
+        assert any("truncated" in f for f in fixes)
+
+    def test_truncated_after_key(self) -> None:
+        """Test that a key without a value gets null."""
+        data, _ = _repair('{"a": 1, "b":')
+        assert data == {"a": 1, "b": None}
+
+    def test_mismatched_closer(self) -> None:
+        """Test that a closer for an outer container closes inner ones."""
+        data, _ = _repair('{"a": [1, 2}')
+        assert data == {"a": [1, 2]}
+
+    def test_raw_newline_in_string(self) -> None:
+        """Test that raw control characters in strings are escaped."""
+        data, _ = _repair('{"a": "line\nbreak"}')
+        assert data == {"a": "line\nbreak"}
+
+    def test_surrounding_text_ignored(self) -> None:
+        """Test that prose before and after the JSON is dropped."""
+        data, _ = _repair('Sure! {"a": 1} Hope this helps.')
+        assert data == {"a": 1}
+
+    def test_no_json_raises(self) -> None:
+        """Test that text without a container raises."""
+        with pytest.raises(JsonRepairError):
+            repair_json("no json here")
+
+    def test_linear_on_large_input(self) -> None:
+        """Test that a large malformed document is repaired in one pass."""
+        text = "{'items': [" + "{'a': 1,}, " * 20000 + "]"
+        data, _ = _repair(text)
+        assert len(data["items"]) == 20000
+
+
+class TestLoadsLenient:
+    """Tests for loads_lenient."""
+
+    def test_strict_json_has_no_fixes(self) -> None:
+        """Test that valid JSON is parsed directly."""
+        assert loads_lenient('{"a": 1}') == ({"a": 1}, [])
+
+    def test_repairs_when_needed(self) -> None:
+        """Test that invalid JSON is repaired and fixes are reported."""
+        data, fixes = loads_lenient("{'a': 1,}")
+        assert data == {"a": 1}
+        assert fixes
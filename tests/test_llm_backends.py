@@ -0,0 +1,143 @@
+"""Tests for LLM backends and the local stand-in server."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from neoscene.app.llm_standin import (
+    DEFAULT_RESPONSE,
+    RecordedResponses,
+    StandinConfig,
+    StandinServer,
+)
+from neoscene.core.llm_backends import HTTPBackend, HTTPBackendError
+from neoscene.core.llm_client import (
+    GeminiClient,
+    LLMAPIError,
+    LLMConfigError,
+    backend_from_config,
+)
+
+
+@pytest.fixture
+def server():
+    """Start a fast stand-in server on a free port."""
+    responses = RecordedResponses([
+        {"prompt": "exact prompt", "response": '{"exact": true}'},
+        {"match": "warehouse", "response": '{"name": "warehouse"}'},
+    ])
+    standin = StandinServer(
+        responses,
+        StandinConfig(latency_ms=5, latency_sigma=0, stream_chunk_size=4),
+        port=0,
+    )
+    standin.start()
+    yield standin
+    standin.stop()
+
+
+class TestRecordedResponses:
+    """Tests for response lookup."""
+
+    def test_lookup_order(self) -> None:
+        """Test exact, substring and round-robin lookup."""
+        responses = RecordedResponses([
+            {"prompt": "p", "response": "exact"},
+            {"match": "tractor", "response": "tractor"},
+        ])
+
+        assert responses.lookup("p") == "exact"
+        assert responses.lookup("a red tractor") == "tractor"
+        assert responses.lookup("other") == "exact"
+        assert responses.lookup("other") == "tractor"
+
+    def test_empty_uses_default(self) -> None:
+        """Test the built-in scene is served when nothing is loaded."""
+        assert RecordedResponses([]).lookup("anything") == DEFAULT_RESPONSE
+
+    def test_from_paths(self, tmp_path: Path) -> None:
+        """Test loading .json and .jsonl files from a directory."""
+        (tmp_path / "scene.json").write_text('{"name": "a"}')
+        (tmp_path / "records.jsonl").write_text(
+            json.dumps({"match": "b", "response": "B"}) + "\n"
+        )
+
+        responses = RecordedResponses.from_paths([tmp_path])
+
+        assert len(responses) == 2
+        assert responses.lookup("b") == "B"
+
+
+class TestHTTPBackend:
+    """Tests for the HTTP backend against the stand-in server."""
+
+    def test_generate(self, server: StandinServer) -> None:
+        """Test a complete response."""
+        backend = HTTPBackend(server.url)
+        assert backend.generate("exact prompt", {}) == '{"exact": true}'
+        assert backend.generate("a warehouse", {}) == '{"name": "warehouse"}'
+
+    def test_generate_stream(self, server: StandinServer) -> None:
+        """Test that streamed chunks reassemble the response."""
+        backend = HTTPBackend(server.url)
+        chunks = list(backend.generate_stream("a warehouse", {}))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == '{"name": "warehouse"}'
+
+    def test_generate_async(self, server: StandinServer) -> None:
+        """Test the async call."""
+        backend = HTTPBackend(server.url)
+        result = asyncio.run(backend.generate_async("exact prompt", {}))
+        assert result == '{"exact": true}'
+
+    def test_injected_errors(self, server: StandinServer) -> None:
+        """Test that injected errors surface with their status code."""
+        server.config.errors = {503: 1.0}
+        backend = HTTPBackend(server.url)
+
+        with pytest.raises(HTTPBackendError) as exc_info:
+            backend.generate("exact prompt", {})
+
+        assert exc_info.value.status == 503
+        assert server.stats()["status"] == {503: 1}
+
+    def test_unreachable_server(self) -> None:
+        """Test that connection failures raise HTTPBackendError."""
+        backend = HTTPBackend("http://127.0.0.1:1", timeout=1)
+        with pytest.raises(HTTPBackendError, match="Cannot reach"):
+            backend.generate("prompt", {})
+
+
+class TestClientWithBackend:
+    """Tests for GeminiClient with a pluggable backend."""
+
+    def test_client_uses_backend_without_api_key(self, server: StandinServer) -> None:
+        """Test that a backend replaces the Gemini SDK and mock mode."""
+        client = GeminiClient(api_key=None, backend=HTTPBackend(server.url))
+
+        assert client.is_available
+        assert client.generate_json("a warehouse") == '{"name": "warehouse"}'
+
+    def test_client_wraps_backend_errors(self, server: StandinServer) -> None:
+        """Test that backend failures become LLMAPIError."""
+        server.config.errors = {500: 1.0}
+        client = GeminiClient(api_key=None, backend=HTTPBackend(server.url))
+
+        with pytest.raises(LLMAPIError, match="LLM backend 'http' call failed"):
+            client.generate("prompt")
+
+    def test_backend_from_config(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test selecting the backend from config and environment."""
+        monkeypatch.delenv("NEOSCENE_LLM_URL", raising=False)
+        assert backend_from_config({}) is None
+        backend = backend_from_config({"backend": {"type": "http", "url": "http://host:1/"}})
+        assert backend.url == "http://host:1"
+
+        with pytest.raises(LLMConfigError):
+            backend_from_config({"backend": {"type": "http"}})
+
+        monkeypatch.setenv("NEOSCENE_LLM_URL", "http://env:2")
+        assert backend_from_config({}).url == "http://env:2"
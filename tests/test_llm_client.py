@@ -1,8 +1,10 @@
 """Tests for the LLM client module."""
 
+import asyncio
 import tempfile
+import threading
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import yaml
@@ -11,8 +13,15 @@ from neoscene.core.llm_client import (
     GeminiClient,
     LLMAPIError,
     LLMConfigError,
+    LLMQueueFullError,
+    LLMScheduler,
+    ResponseCache,
+    TokenBucket,
+    cache_from_config,
     get_default_config_path,
+    llm_session,
     load_llm_config,
+    scheduler_from_config,
 )
 
 
@@ -214,3 +223,464 @@ class TestGeminiClientWithMockedAPI:
         with pytest.raises(LLMAPIError, match="Gemini API call failed"):
             client.generate("Test prompt")
 
+
+
+class TestGeminiClientAsync:
+    """Tests for the async GeminiClient API."""
+
+    def test_generate_async_uses_native_async_call(self) -> None:
+        """Test that the SDK's async call is awaited when available."""
+        mock_model = MagicMock()
+        mock_model.generate_content_async = AsyncMock(return_value=MagicMock(text="async"))
+        client = GeminiClient(api_key="test-key")
+        client._model = mock_model
+
+        response = asyncio.run(client.generate_async("Test prompt"))
+
+        assert response == "async"
+        mock_model.generate_content.assert_not_called()
+
+    def test_generate_json_async_falls_back_to_thread(self) -> None:
+        """Test that the blocking call runs in a thread without async support."""
+        mock_model = MagicMock(spec=["generate_content"])
+        mock_model.generate_content.return_value = MagicMock(text='{"a": 1}')
+        client = GeminiClient(api_key="test-key")
+        client._model = mock_model
+
+        response = asyncio.run(client.generate_json_async("Test prompt"))
+
+        assert response == '{"a": 1}'
+        config = mock_model.generate_content.call_args.kwargs["generation_config"]
+        assert config["response_mime_type"] == "application/json"
+
+    def test_generate_async_wraps_errors(self) -> None:
+        """Test that async API errors are wrapped in LLMAPIError."""
+        mock_model = MagicMock()
+        mock_model.generate_content_async = AsyncMock(side_effect=Exception("boom"))
+        client = GeminiClient(api_key="test-key")
+        client._model = mock_model
+
+        with pytest.raises(LLMAPIError, match="Gemini API call failed"):
+            asyncio.run(client.generate_async("Test prompt"))
+
+    def test_mock_generate_async_without_api(self) -> None:
+        """Test that async generation also falls back to the mock."""
+        with patch.dict("os.environ", {}, clear=True):
+            client = GeminiClient()
+            response = asyncio.run(client.generate_async("Hello world"))
+
+            assert "[MOCK RESPONSE]" in response
+
+
+class TestGeminiClientStream:
+    """Tests for streamed JSON generation."""
+
+    def test_stream_yields_chunks_and_caches(self, tmp_path: Path) -> None:
+        """Test that chunks are yielded in order and the full text is cached."""
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = [
+            MagicMock(text='{"a": '),
+            MagicMock(text="1}"),
+        ]
+        cache = ResponseCache(tmp_path / "cache.sqlite")
+        client = GeminiClient(api_key="test-key", cache=cache)
+        client._model = mock_model
+
+        chunks = list(client.generate_json_stream("Test prompt"))
+
+        assert chunks == ['{"a": ', "1}"]
+        assert mock_model.generate_content.call_args.kwargs["stream"] is True
+        assert list(client.generate_json_stream("Test prompt")) == ['{"a": 1}']
+        assert mock_model.generate_content.call_count == 1
+
+    def test_stream_wraps_errors(self) -> None:
+        """Test that streaming API errors are wrapped in LLMAPIError."""
+        mock_model = MagicMock()
+        mock_model.generate_content.side_effect = Exception("boom")
+        client = GeminiClient(api_key="test-key")
+        client._model = mock_model
+
+        with pytest.raises(LLMAPIError, match="streaming call failed"):
+            list(client.generate_json_stream("Test prompt"))
+
+    def test_mock_stream_without_api(self) -> None:
+        """Test that mock mode streams the mock response in chunks."""
+        with patch.dict("os.environ", {}, clear=True):
+            client = GeminiClient()
+            chunks = list(client.generate_json_stream("Generate a scene"))
+
+            assert len(chunks) > 1
+            assert "".join(chunks) == client._mock_generate("Generate a scene")
+
+
+class TestResponseCache:
+    """Tests for the disk-backed LLM response cache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path) -> ResponseCache:
+        """Create a cache in a temporary directory."""
+        cache = ResponseCache(tmp_path / "cache.sqlite", ttl_seconds=60, max_entries=3)
+        yield cache
+        cache.close()
+
+    def test_key_depends_on_model_temperature_and_prompt(self) -> None:
+        """Test that every fingerprint component changes the key."""
+        base = ResponseCache.make_key("m", 0.3, "p")
+
+        assert base == ResponseCache.make_key("m", 0.3, "p")
+        assert base != ResponseCache.make_key("m2", 0.3, "p")
+        assert base != ResponseCache.make_key("m", 0.5, "p")
+        assert base != ResponseCache.make_key("m", 0.3, "q")
+
+    def test_put_get_and_stats(self, cache: ResponseCache) -> None:
+        """Test round trip and hit/miss counters."""
+        assert cache.get("k") is None
+        cache.put("k", "v")
+
+        assert cache.get("k") == "v"
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 1
+
+    def test_expired_entry_is_a_miss(self, cache: ResponseCache) -> None:
+        """Test that entries older than the TTL are not served."""
+        cache.ttl_seconds = 0
+        cache.put("k", "v")
+
+        assert cache.get("k") is None
+
+    def test_size_limit_evicts_oldest(self, cache: ResponseCache) -> None:
+        """Test that the cache never exceeds max_entries."""
+        for i in range(5):
+            cache.put(f"k{i}", str(i))
+
+        assert len(cache) == 3
+        assert cache.get("k4") == "4"
+
+    def test_delete_removes_one_entry(self, cache: ResponseCache) -> None:
+        """Test that delete() drops only the given key."""
+        cache.put("k", "v")
+        cache.put("other", "w")
+
+        assert cache.delete("k") is True
+        assert cache.delete("k") is False
+        assert cache.get("k") is None
+        assert cache.get("other") == "w"
+
+    def test_cache_from_config_disabled(self) -> None:
+        """Test that caching is off unless enabled."""
+        assert cache_from_config({}) is None
+        assert cache_from_config({"cache": {"enabled": False}}) is None
+
+    def test_client_serves_repeated_prompt_from_cache(self, cache: ResponseCache) -> None:
+        """Test that identical prompts only call the API once."""
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = MagicMock(text='{"a": 1}')
+        client = GeminiClient(api_key="test-key", cache=cache)
+        client._model = mock_model
+
+        first = client.generate_json("same prompt")
+        second = client.generate_json("same prompt")
+
+        assert first == second == '{"a": 1}'
+        assert mock_model.generate_content.call_count == 1
+
+    def test_client_invalidate_drops_rejected_response(self, cache: ResponseCache) -> None:
+        """Test that an invalidated response is requested again instead of replayed."""
+        mock_model = MagicMock()
+        mock_model.generate_content.side_effect = [
+            MagicMock(text="{broken"),
+            MagicMock(text='{"a": 1}'),
+        ]
+        client = GeminiClient(api_key="test-key", cache=cache)
+        client._model = mock_model
+
+        assert client.generate_json("prompt", temperature=0.3) == "{broken"
+        assert client.invalidate("prompt", temperature=0.3, json_mode=True) is True
+        assert client.generate_json("prompt", temperature=0.3) == '{"a": 1}'
+        assert client.generate_json("prompt", temperature=0.3) == '{"a": 1}'
+        assert mock_model.generate_content.call_count == 2
+
+    def test_async_client_does_cache_io_off_the_event_loop(self, cache: ResponseCache) -> None:
+        """Test that async calls read and write the SQLite cache in worker threads."""
+        mock_model = MagicMock()
+        mock_model.generate_content_async = AsyncMock(return_value=MagicMock(text="async"))
+        client = GeminiClient(api_key="test-key", cache=cache)
+        client._model = mock_model
+        cache_threads = []
+        get, put = cache.get, cache.put
+        cache.get = lambda key: cache_threads.append(threading.get_ident()) or get(key)
+        cache.put = lambda key, text: cache_threads.append(threading.get_ident()) or put(key, text)
+
+        async def main() -> int:
+            await client.generate_async("prompt")
+            await client.generate_async("prompt")
+            return threading.get_ident()
+
+        loop_thread = asyncio.run(main())
+
+        assert len(cache_threads) == 3  # miss, store, hit
+        assert loop_thread not in cache_threads
+        assert mock_model.generate_content_async.await_count == 1
+
+    def test_client_bypass_flag(self, cache: ResponseCache) -> None:
+        """Test that use_cache=False always calls the API."""
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = MagicMock(text="text")
+        client = GeminiClient(api_key="test-key", cache=cache)
+        client._model = mock_model
+
+        client.generate("prompt")
+        client.generate("prompt", use_cache=False)
+
+        assert mock_model.generate_content.call_count == 2
+
+
+class TestLLMScheduler:
+    """Tests for the shared LLM request scheduler."""
+
+    def test_limits_concurrency(self) -> None:
+        """Test that no more than max_concurrency calls run at once."""
+        scheduler = LLMScheduler(max_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def call() -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "ok"
+
+        async def main() -> list:
+            return await asyncio.gather(*(scheduler.run_async(call) for _ in range(6)))
+
+        assert asyncio.run(main()) == ["ok"] * 6
+        assert peak == 2
+        stats = scheduler.stats()
+        assert stats["completed"] == 6
+        assert stats["queue_depth"] == 0
+        assert stats["in_flight"] == 0
+
+    def test_coalesces_identical_requests(self) -> None:
+        """Test that identical in-flight requests share a single call."""
+        scheduler = LLMScheduler(max_concurrency=4)
+        calls = 0
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "shared"
+
+        async def main() -> list:
+            return await asyncio.gather(*(scheduler.run_async(call, key="k") for _ in range(3)))
+
+        assert asyncio.run(main()) == ["shared"] * 3
+        assert calls == 1
+        assert scheduler.stats()["coalesced"] == 2
+
+    def test_cancelled_follower_does_not_cancel_others(self) -> None:
+        """Test that cancelling one coalesced caller leaves the others their result."""
+        scheduler = LLMScheduler(max_concurrency=4)
+        release = asyncio.Event()
+
+        async def call() -> str:
+            await release.wait()
+            return "shared"
+
+        async def main() -> list:
+            tasks = [asyncio.create_task(scheduler.run_async(call, key="k")) for _ in range(3)]
+            await asyncio.sleep(0.01)
+            tasks[1].cancel()
+            await asyncio.sleep(0.01)
+            release.set()
+            return await asyncio.gather(*tasks, return_exceptions=True)
+
+        results = asyncio.run(main())
+
+        assert results[0] == results[2] == "shared"
+        assert isinstance(results[1], asyncio.CancelledError)
+        assert scheduler.stats()["in_flight"] == 0
+
+    def test_cancelled_leader_does_not_cancel_followers(self) -> None:
+        """Test that cancelling the caller that started a shared call leaves it running."""
+        scheduler = LLMScheduler(max_concurrency=4)
+        release = asyncio.Event()
+        calls = 0
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "shared"
+
+        async def main() -> list:
+            leader = asyncio.create_task(scheduler.run_async(call, key="k"))
+            await asyncio.sleep(0.01)
+            follower = asyncio.create_task(scheduler.run_async(call, key="k"))
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            await asyncio.sleep(0.01)
+            release.set()
+            return await asyncio.gather(leader, follower, return_exceptions=True)
+
+        results = asyncio.run(main())
+
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert results[1] == "shared"
+        assert calls == 1
+        assert scheduler.stats()["completed"] == 1
+
+    def test_shared_call_is_cancelled_when_every_caller_is(self) -> None:
+        """Test that nobody waiting means the shared call stops and the key starts over."""
+        scheduler = LLMScheduler(max_concurrency=4)
+        cancelled = asyncio.Event()
+
+        async def slow() -> str:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return "never"
+
+        async def fast() -> str:
+            return "fresh"
+
+        async def main() -> str:
+            tasks = [asyncio.create_task(scheduler.run_async(slow, key="k")) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.wait_for(cancelled.wait(), timeout=1)
+            return await scheduler.run_async(fast, key="k")
+
+        assert asyncio.run(main()) == "fresh"
+        stats = scheduler.stats()
+        assert stats["completed"] == 1
+        assert stats["in_flight"] == 0
+
+    def test_cancelled_call_is_not_counted_as_completed(self) -> None:
+        """Test that an aborted call frees its slot without feeding the statistics."""
+        scheduler = LLMScheduler(max_concurrency=1)
+
+        async def call() -> str:
+            await asyncio.sleep(10)
+            return "never"
+
+        async def main() -> None:
+            task = asyncio.create_task(scheduler.run_async(call))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+
+        stats = scheduler.stats()
+        assert stats["completed"] == 0
+        assert stats["in_flight"] == 0
+
+    def test_release_skips_cancelled_waiters(self) -> None:
+        """Test that a slot freed while a waiter is being cancelled goes to the next waiter."""
+        scheduler = LLMScheduler(max_concurrency=1)
+        scheduler._acquire()
+        cancelled = scheduler._enqueue()
+        waiting = scheduler._enqueue()
+        # An async waiter cancelled before it withdrew itself
+        cancelled.granted.cancel()
+
+        scheduler._release(0.1)
+        scheduler._abandon(cancelled)
+
+        assert waiting.granted.done() and not waiting.granted.cancelled()
+        stats = scheduler.stats()
+        assert stats["in_flight"] == 1
+        assert stats["queue_depth"] == 0
+
+    def test_full_queue_raises_with_retry_hint(self) -> None:
+        """Test that requests beyond the queue limit are rejected."""
+        scheduler = LLMScheduler(max_concurrency=1, max_queue=1)
+
+        async def call() -> str:
+            await asyncio.sleep(0.05)
+            return "ok"
+
+        async def main() -> list:
+            return await asyncio.gather(
+                *(scheduler.run_async(call) for _ in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+        errors = [r for r in results if isinstance(r, LLMQueueFullError)]
+        assert len(errors) == 1
+        assert errors[0].retry_after >= 1
+        assert scheduler.stats()["rejected"] == 1
+
+    def test_sessions_served_round_robin(self) -> None:
+        """Test that a busy session does not starve other sessions."""
+        scheduler = LLMScheduler(max_concurrency=1)
+        order = []
+
+        def make_call(name: str):
+            async def call() -> str:
+                order.append(name)
+                await asyncio.sleep(0)
+                return name
+            return call
+
+        async def submit(session: str, name: str) -> str:
+            with llm_session(session):
+                return await scheduler.run_async(make_call(name))
+
+        async def main() -> None:
+            tasks = [asyncio.ensure_future(submit("a", f"a{i}")) for i in range(3)]
+            tasks.append(asyncio.ensure_future(submit("b", "b0")))
+            await asyncio.gather(*tasks)
+
+        asyncio.run(main())
+        # a0 runs immediately; of the queued requests, b0 is served before a2
+        assert order.index("b0") < order.index("a2")
+
+    def test_token_bucket_delays_beyond_burst(self) -> None:
+        """Test that requests past the burst have to wait for tokens."""
+        bucket = TokenBucket(rate=10.0, burst=2)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+
+    def test_sync_run_and_errors_propagate(self) -> None:
+        """Test the blocking API and that slots are released on errors."""
+        scheduler = LLMScheduler(max_concurrency=1)
+
+        def failing() -> str:
+            raise LLMAPIError("boom")
+
+        with pytest.raises(LLMAPIError):
+            scheduler.run(failing, key="k")
+        assert scheduler.run(lambda: "ok", key="k") == "ok"
+        assert scheduler.stats()["in_flight"] == 0
+
+    def test_scheduler_from_config(self) -> None:
+        """Test building the scheduler from config."""
+        assert scheduler_from_config({}) is None
+        scheduler = scheduler_from_config(
+            {"scheduler": {"enabled": True, "max_concurrency": 3, "max_queue": 5}}
+        )
+        assert scheduler.max_concurrency == 3
+        assert scheduler.max_queue == 5
+
+    def test_client_routes_calls_through_scheduler(self) -> None:
+        """Test that the client's API calls go through the scheduler."""
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value = MagicMock(text="text")
+        scheduler = LLMScheduler(max_concurrency=1)
+        client = GeminiClient(api_key="test-key", scheduler=scheduler)
+        client._model = mock_model
+
+        assert client.generate("prompt") == "text"
+        assert scheduler.stats()["completed"] == 1
@@ -0,0 +1,58 @@
+"""Tests for the chat load generator."""
+
+import pytest
+
+from neoscene.app.loadtest import LoadReport, load_prompts, parse_server_timing, percentile
+
+
+class TestPercentile:
+    """Tests for the percentile helper."""
+
+    def test_interpolates(self) -> None:
+        """Test percentiles over a simple range."""
+        values = list(range(1, 101))
+        assert percentile(values, 50) == pytest.approx(50.5)
+        assert percentile(values, 99) == pytest.approx(99.01)
+        assert percentile([7.0], 95) == 7.0
+
+    def test_empty(self) -> None:
+        """Test that no samples give 0."""
+        assert percentile([], 50) == 0.0
+
+
+class TestServerTiming:
+    """Tests for Server-Timing header parsing."""
+
+    def test_parses_durations(self) -> None:
+        """Test metrics with and without descriptions."""
+        header = 'llm;dur=812.5, validate;desc="Validate";dur=3.1, cache'
+        assert parse_server_timing(header) == {"llm": 812.5, "validate": 3.1}
+
+    def test_missing_header(self) -> None:
+        """Test that a missing header gives no timings."""
+        assert parse_server_timing(None) == {}
+
+
+class TestLoadReport:
+    """Tests for the load report."""
+
+    def test_summary(self) -> None:
+        """Test per-stage percentiles and status counts."""
+        report = LoadReport(duration=2.0)
+        for ms in (100.0, 200.0, 300.0):
+            report.add("total", ms)
+        report.statuses.update({200: 3, 429: 1})
+
+        summary = report.summary()
+
+        assert summary["requests"] == 4
+        assert summary["throughput_rps"] == 2.0
+        assert summary["statuses"] == {"200": 3, "429": 1}
+        assert summary["stages"]["total"]["p50"] == 200.0
+        assert "total" in report.format_table()
+
+    def test_load_prompts(self, tmp_path) -> None:
+        """Test reading plain-text and JSONL prompt files."""
+        path = tmp_path / "prompts.txt"
+        path.write_text('an orchard\n\n{"prompt": "a farm"}\n')
+        assert load_prompts(path) == ["an orchard", "a farm"]
@@ -0,0 +1,244 @@
+"""Tests for Prometheus metrics."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from neoscene.backends.session_manager import SimulationWorker
+from neoscene.core.asset_catalog import AssetCatalog
+from neoscene.core.llm_client import (
+    LLM_ERRORS,
+    LLM_REQUESTS,
+    LLM_TOKENS,
+    GeminiClient,
+    LLMAPIError,
+)
+from neoscene.core.metrics import (
+    CallbackCounter,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+    StageDurations,
+)
+from neoscene.core.scene_schema import (
+    EnvironmentSpec,
+    GridLayout,
+    ObjectSpec,
+    SceneSpec,
+)
+from neoscene.core.tracing import stage_histograms
+from neoscene.exporters import mjcf_exporter
+from neoscene.exporters.mjcf_exporter import ASSET_CACHE_LOOKUPS, scene_to_mjcf
+
+ASSETS_DIR = Path(__file__).parent.parent / "neoscene" / "assets"
+
+
+class TestMetricTypes:
+    """Tests for counters, histograms and gauges."""
+
+    def test_counter_renders_labels(self) -> None:
+        """Test that counter samples carry their labels."""
+        counter = Counter("requests_total", "Requests", ("route",))
+        counter.inc(route="/chat")
+        counter.inc(2, route="/chat")
+
+        assert counter.value(route="/chat") == 3.0
+        assert counter.render() == [
+            "# HELP requests_total Requests",
+            "# TYPE requests_total counter",
+            'requests_total{route="/chat"} 3.0',
+        ]
+
+    def test_counter_rejects_wrong_labels(self) -> None:
+        """Test that updates must set exactly the declared labels."""
+        counter = Counter("requests_total", "Requests", ("route",))
+        with pytest.raises(ValueError):
+            counter.inc(path="/chat")
+
+    def test_label_values_are_escaped(self) -> None:
+        """Test that quotes, backslashes and newlines are escaped."""
+        counter = Counter("c_total", "C", ("v",))
+        counter.inc(v='a"b\\c\nd')
+        assert counter.samples() == ['c_total{v="a\\"b\\\\c\\nd"} 1.0']
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Test that bucket counts accumulate up to +Inf."""
+        histogram = Histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            histogram.observe(value)
+
+        assert histogram.samples() == [
+            'latency_seconds_bucket{le="0.1"} 1',
+            'latency_seconds_bucket{le="1.0"} 3',
+            'latency_seconds_bucket{le="+Inf"} 4',
+            "latency_seconds_sum 6.05",
+            "latency_seconds_count 4",
+        ]
+
+    def test_gauge_reads_callback(self) -> None:
+        """Test that gauges read single values and labelled mappings."""
+        assert Gauge("g", "G", lambda: 3).samples() == ["g 3.0"]
+
+        gauge = Gauge("rate", "Rate", lambda: {"s2": 2.0, "s1": 1.0}, ("session",))
+        assert gauge.samples() == ['rate{session="s1"} 1.0', 'rate{session="s2"} 2.0']
+
+    def test_failing_gauge_is_skipped(self) -> None:
+        """Test that a failing callback yields no samples instead of an error."""
+        gauge = Gauge("broken", "Broken", lambda: 1 / 0)
+        assert gauge.samples() == []
+
+    def test_callback_counter_type(self) -> None:
+        """Test that callback counters are typed as counters."""
+        counter = CallbackCounter("steps_total", "Steps", lambda: 10)
+        assert "# TYPE steps_total counter" in counter.render()
+
+    def test_stage_durations_in_seconds(self) -> None:
+        """Test that tracing histograms (ms) are exported in seconds."""
+        stage_histograms.clear()
+        stage_histograms.get("llm").observe(250.0)
+        try:
+            samples = StageDurations().samples()
+        finally:
+            stage_histograms.clear()
+
+        assert 'neoscene_stage_duration_seconds_bucket{stage="llm",le="0.25"} 1' in samples
+        assert 'neoscene_stage_duration_seconds_sum{stage="llm"} 0.25' in samples
+        assert 'neoscene_stage_duration_seconds_count{stage="llm"} 1' in samples
+
+
+class TestMetricsRegistry:
+    """Tests for the registry."""
+
+    def test_counter_is_get_or_create(self) -> None:
+        """Test that asking for a counter twice returns the same instance."""
+        registry = MetricsRegistry()
+        first = registry.counter("x_total", "X")
+        assert registry.counter("x_total", "X") is first
+
+    def test_gauge_is_replaced(self) -> None:
+        """Test that re-registering a gauge replaces its callback."""
+        registry = MetricsRegistry()
+        registry.gauge("g", "G", lambda: 1)
+        registry.gauge("g", "G", lambda: 2)
+        assert "g 2.0" in registry.render()
+
+    def test_render_is_sorted_and_newline_terminated(self) -> None:
+        """Test the overall exposition layout."""
+        registry = MetricsRegistry()
+        registry.gauge("b", "B", lambda: 1)
+        registry.gauge("a", "A", lambda: 1)
+
+        text = registry.render()
+
+        assert text.endswith("\n")
+        assert text.index("# HELP a") < text.index("# HELP b")
+
+
+class TestLLMMetrics:
+    """Tests for LLM call metrics."""
+
+    def _client(self, backend: MagicMock) -> GeminiClient:
+        backend.name = "test-metrics"
+        return GeminiClient(api_key="test-key", backend=backend)
+
+    def test_successful_call_is_recorded(self) -> None:
+        """Test that calls and estimated tokens are counted."""
+        backend = MagicMock()
+        backend.generate.return_value = "x" * 8
+        client = self._client(backend)
+        before = LLM_REQUESTS.value(backend="test-metrics")
+        tokens = LLM_TOKENS.value(backend="test-metrics", direction="completion")
+
+        client.generate("p" * 40, use_cache=False)
+
+        assert LLM_REQUESTS.value(backend="test-metrics") == before + 1
+        assert LLM_TOKENS.value(backend="test-metrics", direction="completion") == tokens + 2
+
+    def test_failed_call_is_counted_as_error(self) -> None:
+        """Test that backend errors increment the error counter."""
+        backend = MagicMock()
+        backend.generate.side_effect = RuntimeError("boom")
+        client = self._client(backend)
+        before = LLM_ERRORS.value(backend="test-metrics")
+
+        with pytest.raises(LLMAPIError):
+            client.generate("prompt", use_cache=False)
+
+        assert LLM_ERRORS.value(backend="test-metrics") == before + 1
+
+
+class TestExporterAssetCache:
+    """Tests for the exporter's parsed asset cache."""
+
+    def test_repeated_exports_hit_cache_and_match(self) -> None:
+        """Test that cached assets give identical MJCF and count as hits."""
+        catalog = AssetCatalog(ASSETS_DIR)
+        spec = SceneSpec(
+            name="cache_test",
+            environment=EnvironmentSpec(asset_id="orchard"),
+            objects=[
+                ObjectSpec(
+                    asset_id="tractor",
+                    layout=GridLayout(rows=1, cols=3, spacing=[4.0, 4.0]),
+                )
+            ],
+        )
+        mjcf_exporter._asset_cache.clear()
+
+        first = scene_to_mjcf(spec, catalog)
+        hits = ASSET_CACHE_LOOKUPS.value(result="hit")
+        second = scene_to_mjcf(spec, catalog)
+
+        assert first == second
+        assert ASSET_CACHE_LOOKUPS.value(result="hit") > hits
+
+    def test_changed_file_is_reparsed(self, tmp_path: Path) -> None:
+        """Test that a modified asset file is not served from the cache."""
+        path = tmp_path / "asset.xml"
+        path.write_text('<mujoco><worldbody><body name="a"/></worldbody></mujoco>')
+        first = mjcf_exporter._load_asset_content(path, "p")
+        entries = len(mjcf_exporter._asset_cache)
+
+        path.write_text('<mujoco><worldbody><body name="bb"/></worldbody></mujoco>')
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        second = mjcf_exporter._load_asset_content(path, "p")
+
+        assert first["worldbody"][0].get("name") == "p_a"
+        assert second["worldbody"][0].get("name") == "p_bb"
+        # The stale tree is replaced, not kept alongside the new one
+        assert len(mjcf_exporter._asset_cache) == entries
+        assert mjcf_exporter._asset_cache[path][0] == path.stat().st_mtime_ns
+
+
+class TestSimulationWorkerRates:
+    """Tests for the worker's step rate and real-time factor."""
+
+    def test_rates_computed_over_window(self) -> None:
+        """Test that rates are derived from step and sim-time deltas."""
+        worker = SimulationWorker(xml_path="unused.xml")
+        worker._data = MagicMock(time=0.5)
+        worker.steps = 250
+        worker._rate_wall = 10.0
+
+        with patch("neoscene.backends.session_manager.time.perf_counter", return_value=12.0):
+            worker._update_rates()
+
+        assert worker.step_rate == pytest.approx(125.0)
+        assert worker.realtime_factor == pytest.approx(0.25)
+        assert worker._rate_steps == 250
+
+    def test_rates_unchanged_within_window(self) -> None:
+        """Test that rates are only refreshed once per window."""
+        worker = SimulationWorker(xml_path="unused.xml")
+        worker._data = MagicMock(time=0.5)
+        worker.steps = 10
+        worker._rate_wall = 10.0
+
+        with patch("neoscene.backends.session_manager.time.perf_counter", return_value=10.5):
+            worker._update_rates()
+
+        assert worker.step_rate == 0.0
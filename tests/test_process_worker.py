@@ -0,0 +1,140 @@
+"""Tests for out-of-process simulation workers."""
+
+import time
+import uuid
+from pathlib import Path
+
+import pytest
+
+from neoscene.backends import process_worker
+from neoscene.backends.process_worker import (
+    SimulationProcessError,
+    SimulationProcessPool,
+    process_pool_from_env,
+)
+from neoscene.backends.state_viewer import attach_state_ring
+
+SENSOR_MJCF = """
+<mujoco>
+  <option timestep="0.002"/>
+  <worldbody>
+    <geom type="plane" size="5 5 0.1"/>
+    <body name="box" pos="0 0 1">
+      <freejoint/>
+      <geom type="box" size="0.1 0.1 0.1"/>
+    </body>
+  </worldbody>
+  <sensor>
+    <framepos name="box_pos" objtype="body" objname="box"/>
+  </sensor>
+</mujoco>
+"""
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Spawn a pool with one warm process for the module's tests."""
+    pool = SimulationProcessPool(max_idle=1)
+    yield pool
+    pool.shutdown()
+
+
+@pytest.fixture
+def xml_path(tmp_path: Path) -> str:
+    """Write a model with one sensor and return its path."""
+    path = tmp_path / "scene.xml"
+    path.write_text(SENSOR_MJCF)
+    return str(path)
+
+
+def wait_for(predicate, timeout: float = 5.0) -> bool:
+    """Poll until predicate() is true or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+class TestProcessSimulationWorker:
+    """Tests for simulations running in pooled processes."""
+
+    def test_publishes_sensors_through_shared_memory(
+        self, pool: SimulationProcessPool, xml_path: str
+    ) -> None:
+        """Test that telemetry from the worker process reaches the API side."""
+        worker = pool.start_worker(xml_path, speed=None)
+        try:
+            assert wait_for(lambda: worker.telemetry is not None and worker.steps > 0)
+            first = worker.telemetry
+            assert wait_for(lambda: worker.telemetry.seq > first.seq)
+
+            sensors = worker.latest_sensors
+            assert set(sensors) == {"box_pos"}
+            assert len(sensors["box_pos"]) == 3
+            assert worker.telemetry.sim_time > first.sim_time
+            assert worker.running
+            assert worker.get_task_status() == {"active": False}
+        finally:
+            worker.stop()
+
+        assert not worker.running
+
+    def test_publishes_state_for_viewers(
+        self, pool: SimulationProcessPool, xml_path: str
+    ) -> None:
+        """Test that the worker process publishes its physics state for viewers."""
+        import mujoco
+
+        ring_name = f"neoscene_{uuid.uuid4().hex[:16]}"
+        model = mujoco.MjModel.from_xml_path(xml_path)
+        worker = pool.start_worker(xml_path, state_ring_name=ring_name)
+        try:
+            # Tracked: this process shares the worker process's resource tracker
+            ring = attach_state_ring(model, ring_name, track=True)
+            assert wait_for(lambda: ring.read() is not None and ring.read().sim_time > 0)
+            ring.close()
+        finally:
+            worker.stop()
+
+        assert attach_state_ring(model, ring_name) is None
+
+    def test_task_commands_round_trip(self, pool: SimulationProcessPool, xml_path: str) -> None:
+        """Test that task control is answered by the worker process."""
+        worker = pool.start_worker(xml_path)
+        try:
+            assert worker.start_task("missing") is False
+            worker.stop_task()
+        finally:
+            worker.stop()
+
+    def test_process_is_reused(self, pool: SimulationProcessPool, xml_path: str) -> None:
+        """Test that a released process runs the next simulation."""
+        first = pool.start_worker(xml_path)
+        pid = first._process.process.pid
+        first.stop()
+
+        second = pool.start_worker(xml_path)
+        try:
+            assert second._process.process.pid == pid
+        finally:
+            second.stop()
+
+    def test_bad_model_fails_to_start(self, pool: SimulationProcessPool, tmp_path: Path) -> None:
+        """Test that a model that does not load raises instead of hanging."""
+        path = tmp_path / "broken.xml"
+        path.write_text("<mujoco><worldbody><body>")
+
+        with pytest.raises(SimulationProcessError):
+            pool.start_worker(str(path))
+
+
+class TestProcessPoolFromEnv:
+    """Tests for enabling process workers from the environment."""
+
+    @pytest.mark.parametrize("value", ["", "0", "many"])
+    def test_disabled(self, monkeypatch, value: str) -> None:
+        """Test that unset, zero or invalid values keep thread workers."""
+        monkeypatch.setenv(process_worker.PROCESSES_ENV, value)
+        assert process_pool_from_env() is None
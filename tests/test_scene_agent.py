@@ -1,8 +1,9 @@
 """Tests for the SceneAgent."""
 
+import asyncio
 import json
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -13,9 +14,13 @@ from neoscene.core.scene_agent import (
     SceneAgent,
     SceneGenerationError,
     _build_asset_catalog_summary,
+    _collect_unknown_asset_ids,
     _extract_json_from_response,
+    _select_relevant_assets,
 )
 from neoscene.core.scene_schema import SceneSpec
+from neoscene.core.speculation import CandidateVariant, SpeculativeGeneration
+from neoscene.core.tracing import stage_histograms, stage_summary
 
 # Path to assets directory
 ASSETS_DIR = Path(__file__).parent.parent / "neoscene" / "assets"
@@ -157,6 +162,77 @@ class TestBuildAssetCatalogSummary:
         assert "crate_wooden_small" in summary
 
 
+class TestScopedAssetContext:
+    """Tests for retrieval-scoped asset context."""
+
+    def test_select_relevant_assets_matches_terms(self, catalog: AssetCatalog) -> None:
+        """Test that assets named in the request are selected."""
+        ids = _select_relevant_assets(catalog, "add 10 barrels")
+
+        assert "barrel" in ids
+        assert "forklift" not in ids
+
+    def test_select_relevant_assets_uses_fallbacks(self, catalog: AssetCatalog) -> None:
+        """Test that fallback_for concepts resolve to assets."""
+        ids = _select_relevant_assets(catalog, "a field of apple trees")
+
+        assert "oak_tree" in ids or "trees" in ids
+
+    def test_select_relevant_assets_keeps_environments(self, catalog: AssetCatalog) -> None:
+        """Test that environments are included when none matched."""
+        ids = _select_relevant_assets(catalog, "some barrels")
+
+        assert "orchard" in ids
+
+    def test_scoped_summary_is_smaller(self, catalog: AssetCatalog) -> None:
+        """Test that a scoped summary is smaller but still lists every ID."""
+        full = _build_asset_catalog_summary(catalog)
+        scoped = _build_asset_catalog_summary(catalog, ["orchard", "barrel"])
+
+        assert len(scoped) < len(full)
+        assert "`barrel`" in scoped
+        assert "`forklift`" not in scoped
+        assert "forklift" in scoped  # still present in the compact index
+
+    def test_collect_unknown_asset_ids(self, catalog: AssetCatalog) -> None:
+        """Test that unknown asset IDs are found in raw JSON."""
+        raw = '{"environment": {"asset_id": "orchard"}, "objects": [{"asset_id": "barel"}]}'
+
+        assert _collect_unknown_asset_ids(catalog, raw) == ["barel"]
+
+    def test_repair_context_keeps_previous_scene_assets(self, agent: SceneAgent) -> None:
+        """Test that repairing an edit still describes the edited scene's assets."""
+        previous = SceneSpec.model_validate(
+            {"name": "yard", "environment": {"asset_id": "orchard"},
+             "objects": [{"asset_id": "forklift"}]}
+        )
+        raw = (
+            '{"environment": {"asset_id": "orchard"}, '
+            '"objects": [{"asset_id": "barrel", "count": -1}]}'
+        )
+
+        summary = agent._repair_asset_context("add a barrel", raw, previous)
+
+        assert "`forklift`" in summary
+        assert "`forklift`" not in agent._repair_asset_context("add a barrel", raw)
+
+    def test_prompt_size_stats_recorded(
+        self, agent: SceneAgent, mock_llm: MagicMock
+    ) -> None:
+        """Test that before/after prompt sizes are recorded."""
+        mock_llm.generate_json.return_value = (
+            '{"name": "crates", "environment": {"asset_id": "orchard"}, '
+            '"objects": [{"asset_id": "crate_wooden_small"}]}'
+        )
+
+        agent.generate_scene_spec("An orchard with crates")
+        stats = agent.prompt_size_stats()
+
+        assert stats["prompts"] == 1
+        assert stats["scoped_chars"] < stats["full_chars"]
+        assert stats["reduction"] > 0
+
+
 class TestSceneAgent:
     """Tests for the SceneAgent class."""
 
@@ -296,6 +372,356 @@ class TestSceneAgentRepair:
         # Should try initial + max_repair_attempts
         assert mock_llm.generate.call_count == agent.max_repair_attempts + 1
 
+    def test_rejected_response_is_evicted_from_cache(
+        self, agent: SceneAgent, mock_llm: MagicMock
+    ) -> None:
+        """Test that a response failing validation is dropped from the LLM cache."""
+        mock_llm.generate_json.return_value = '{"name": "test"}'
+
+        with pytest.raises(SceneValidationError):
+            agent.generate_scene_spec("A tractor scene")
+
+        mock_llm.invalidate.assert_called_once()
+        args, kwargs = mock_llm.invalidate.call_args
+        assert "A tractor scene" in args[0]
+        assert kwargs == {"temperature": 0.3, "json_mode": True}
+
+    def test_valid_response_stays_cached(self, agent: SceneAgent, mock_llm: MagicMock) -> None:
+        """Test that a valid response is not evicted."""
+        mock_llm.generate_json.return_value = (
+            '{"name": "valid", "environment": {"asset_id": "orchard"}}'
+        )
+
+        agent.generate_scene_spec("An empty orchard")
+
+        mock_llm.invalidate.assert_not_called()
+
+
+class TestSceneAgentPatchEdit:
+    """Tests for patch-based scene editing."""
+
+    @pytest.fixture
+    def previous(self) -> SceneSpec:
+        """Create a scene to edit."""
+        return SceneSpec.model_validate(
+            {
+                "name": "edit_me",
+                "environment": {"asset_id": "orchard"},
+                "objects": [{"asset_id": "barrel"}, {"asset_id": "bird"}],
+            }
+        )
+
+    def test_patch_prompt_counts_prompt_build_once(
+        self, agent: SceneAgent, previous: SceneSpec
+    ) -> None:
+        """Test that building an edit prompt records a single prompt_build stage."""
+        stage_histograms.clear()
+
+        agent._build_patch_prompt(previous, "add a barrel")
+
+        assert stage_summary()["prompt_build"]["count"] == 1
+
+    def test_update_applies_json_patch(
+        self, agent: SceneAgent, mock_llm: MagicMock, previous: SceneSpec
+    ) -> None:
+        """Test that a patch response is applied locally."""
+        mock_llm.generate_json.return_value = json.dumps(
+            {"patch": [{"op": "remove", "path": "/objects/1"}]}
+        )
+
+        spec = agent.update_scene_spec(previous, "get rid of the bird")
+
+        assert [o.asset_id for o in spec.objects] == ["barrel"]
+        assert mock_llm.generate_json.call_count == 1
+
+    def test_simple_edit_applied_without_llm(
+        self, agent: SceneAgent, mock_llm: MagicMock, previous: SceneSpec
+    ) -> None:
+        """Test that a rule-based edit skips the LLM entirely."""
+        spec = agent.update_scene_spec(previous, "remove the bird")
+
+        assert [o.asset_id for o in spec.objects] == ["barrel"]
+        mock_llm.generate_json.assert_not_called()
+
+    def test_local_edits_can_be_disabled(
+        self, catalog: AssetCatalog, mock_llm: MagicMock, previous: SceneSpec
+    ) -> None:
+        """Test that local_edits=False always asks the LLM."""
+        agent = SceneAgent(catalog, mock_llm, local_edits=False)
+        mock_llm.generate_json.return_value = json.dumps(
+            {"patch": [{"op": "remove", "path": "/objects/1"}]}
+        )
+
+        agent.update_scene_spec(previous, "remove the bird")
+
+        assert mock_llm.generate_json.call_count == 1
+
+    def test_update_falls_back_to_full_regeneration(
+        self, agent: SceneAgent, mock_llm: MagicMock, previous: SceneSpec
+    ) -> None:
+        """Test that an unusable patch falls back to a full edit."""
+        mock_llm.generate_json.side_effect = [
+            json.dumps({"patch": [{"op": "remove", "path": "/objects/9"}]}),
+            json.dumps(
+                {"name": "edit_me", "environment": {"asset_id": "orchard"}, "objects": []}
+            ),
+        ]
+
+        spec = agent.update_scene_spec(previous, "remove everything")
+
+        assert spec.objects == []
+        assert mock_llm.generate_json.call_count == 2
+
+    def test_malformed_patch_path_falls_back_to_full_regeneration(
+        self, agent: SceneAgent, mock_llm: MagicMock, previous: SceneSpec
+    ) -> None:
+        """Test that a patch with a non-string path is rejected, not a crash."""
+        mock_llm.generate_json.side_effect = [
+            json.dumps({"patch": [{"op": "remove", "path": None}]}),
+            json.dumps(
+                {"name": "edit_me", "environment": {"asset_id": "orchard"}, "objects": []}
+            ),
+        ]
+
+        spec = agent.update_scene_spec(previous, "remove everything")
+
+        assert spec.objects == []
+        assert mock_llm.generate_json.call_count == 2
+
+    def test_full_edit_mode_skips_patch(
+        self, catalog: AssetCatalog, mock_llm: MagicMock, previous: SceneSpec
+    ) -> None:
+        """Test that edit_mode='full' asks for the complete scene."""
+        agent = SceneAgent(catalog, mock_llm, edit_mode="full")
+        mock_llm.generate_json.return_value = previous.model_dump_json()
+
+        agent.update_scene_spec(previous, "keep it")
+
+        prompt = mock_llm.generate_json.call_args[0][0]
+        assert "FULL UPDATED SceneSpec" in prompt
+
+
+class TestSceneAgentLocalRepair:
+    """Tests for local repair of malformed JSON responses."""
+
+    def test_malformed_json_repaired_without_llm_call(
+        self, agent: SceneAgent, mock_llm: MagicMock
+    ) -> None:
+        """Test that common LLM JSON mistakes are fixed without a repair prompt."""
+        mock_llm.generate_json.return_value = """{
+  // scene generated for the user
+  name: 'orchard_scene',
+  "environment": {"asset_id": "orchard",},
+  "objects": [{"asset_id": "crate_wooden_small", "name": "it's a crate"},],
+"""
+
+        spec = agent.generate_and_repair("an orchard with a crate")
+
+        assert spec.name == "orchard_scene"
+        assert spec.objects[0].name == "it's a crate"
+        assert mock_llm.generate_json.call_count == 1
+        mock_llm.generate.assert_not_called()
+
+    def test_parse_failure_does_not_write_temp_file(
+        self, agent: SceneAgent, mock_llm: MagicMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an unparseable response is reported without side effects."""
+        import tempfile
+
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", MagicMock(side_effect=AssertionError))
+        mock_llm.generate_json.return_value = '{"name": {"a" {"b"}'
+
+        with pytest.raises(SceneValidationError):
+            agent.generate_scene_spec("A scene")
+
+
+class TestSceneAgentAsync:
+    """Tests for the async SceneAgent API."""
+
+    def test_update_scene_spec_async_creates_scene(
+        self, agent: SceneAgent, mock_llm: MagicMock
+    ) -> None:
+        """Test that the async update awaits the async LLM call."""
+        mock_llm.generate_json_async = AsyncMock(
+            return_value='{"name": "async_scene", "environment": {"asset_id": "orchard"}}'
+        )
+
+        spec = asyncio.run(agent.update_scene_spec_async(None, "an orchard"))
+
+        assert spec.name == "async_scene"
+        mock_llm.generate_json.assert_not_called()
+
+    def test_generate_and_repair_async_repairs(
+        self, agent: SceneAgent, mock_llm: MagicMock
+    ) -> None:
+        """Test that the async repair loop sends a repair prompt."""
+        mock_llm.generate_json_async = AsyncMock(return_value='{"name": "broken"}')
+        mock_llm.generate_async = AsyncMock(
+            return_value='{"name": "fixed", "environment": {"asset_id": "orchard"}}'
+        )
+
+        spec = asyncio.run(agent.generate_and_repair_async("an orchard"))
+
+        assert spec.name == "fixed"
+        assert mock_llm.generate_async.await_count == 1
+
+    def test_async_rejected_response_is_evicted_off_the_event_loop(
+        self, agent: SceneAgent, mock_llm: MagicMock
+    ) -> None:
+        """Test that async generation evicts a rejected response with the async cache call."""
+        mock_llm.generate_json_async = AsyncMock(return_value='{"name": "broken"}')
+
+        with pytest.raises(SceneValidationError):
+            asyncio.run(agent.generate_scene_spec_async("an orchard"))
+
+        mock_llm.invalidate_async.assert_awaited_once()
+        mock_llm.invalidate.assert_not_called()
+
+
+class TestSceneAgentSpeculative:
+    """Tests for speculative parallel generation."""
+
+    VALID = '{"name": "%s", "environment": {"asset_id": "orchard"}}'
+
+    def test_first_valid_candidate_wins(
+        self, catalog: AssetCatalog, mock_llm: MagicMock
+    ) -> None:
+        """Test that a slow candidate is cancelled once a valid one arrives."""
+        started = []
+        cancelled = []
+
+        async def fake_generate(prompt: str, temperature: float) -> str:
+            started.append(temperature)
+            if temperature == 0.9:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(temperature)
+                    raise
+            if temperature == 0.1:
+                return '{"name": "invalid"}'
+            return self.VALID % f"t{temperature}"
+
+        mock_llm.generate_json_async = AsyncMock(side_effect=fake_generate)
+        speculation = SpeculativeGeneration(
+            variants=[CandidateVariant(0.1), CandidateVariant(0.5), CandidateVariant(0.9)]
+        )
+        agent = SceneAgent(catalog, mock_llm, speculation=speculation)
+
+        spec = asyncio.run(agent.generate_and_repair_async("an orchard"))
+
+        assert spec.name == "t0.5"
+        assert sorted(started) == [0.1, 0.5, 0.9]
+        assert cancelled == [0.9]
+        assert speculation.stats()["wins_by_variant"] == [0, 1, 0]
+
+    def test_all_invalid_falls_back_to_repair(
+        self, catalog: AssetCatalog, mock_llm: MagicMock
+    ) -> None:
+        """Test that the repair loop runs when no candidate is valid."""
+        mock_llm.generate_json_async = AsyncMock(return_value='{"name": "broken"}')
+        mock_llm.generate_async = AsyncMock(return_value=self.VALID % "repaired")
+        agent = SceneAgent(catalog, mock_llm, speculation=SpeculativeGeneration())
+
+        spec = asyncio.run(agent.generate_and_repair_async("an orchard"))
+
+        assert spec.name == "repaired"
+        assert mock_llm.generate_json_async.await_count == 3
+        assert mock_llm.generate_async.await_count == 1
+
+    def test_full_catalog_variant_uses_full_context(
+        self, catalog: AssetCatalog, mock_llm: MagicMock
+    ) -> None:
+        """Test that prompt variants change the asset context."""
+        mock_llm.generate_json_async = AsyncMock(return_value=self.VALID % "ok")
+        speculation = SpeculativeGeneration(
+            variants=[CandidateVariant(0.3), CandidateVariant(0.3, full_catalog=True)]
+        )
+        agent = SceneAgent(catalog, mock_llm, speculation=speculation)
+
+        asyncio.run(agent.generate_speculative_async("an orchard"))
+
+        prompts = [call.args[0] for call in mock_llm.generate_json_async.await_args_list]
+        assert len(prompts) == 2
+        assert len(prompts[1]) > len(prompts[0])
+
+
+class TestSceneAgentStream:
+    """Tests for streamed scene generation."""
+
+    def test_stream_reports_elements_then_scene(
+        self, agent: SceneAgent, mock_llm: MagicMock
+    ) -> None:
+        """Test that elements are validated while streaming."""
+        text = json.dumps({
+            "name": "streamed",
+            "environment": {"asset_id": "orchard"},
+            "objects": [
+                {"asset_id": "crate_wooden_small", "name": "crate"},
+                {"asset_id": "no_such_asset"},
+            ],
+        })
+        mock_llm.generate_json_stream.return_value = iter([text[:40], text[40:]])
+        mock_llm.generate.return_value = json.dumps({
+            "name": "streamed",
+            "environment": {"asset_id": "orchard"},
+            "objects": [{"asset_id": "crate_wooden_small", "name": "crate"}],
+        })
+
+        events = list(agent.stream_scene_spec("an orchard with crates"))
+
+        elements = [e for e in events if e["event"] == "element"]
+        assert [(e["section"], e["index"], e["valid"]) for e in elements] == [
+            ("name", None, True),
+            ("environment", None, True),
+            ("objects", 0, True),
+            ("objects", 1, False),
+        ]
+        assert "no_such_asset" in elements[-1]["errors"][0]
+        assert events[-2]["event"] == "repair"
+        assert events[-1]["event"] == "scene"
+        assert events[-1]["scene"].name == "streamed"
+
+    def test_stream_truncated_goes_to_repair(
+        self, agent: SceneAgent, mock_llm: MagicMock
+    ) -> None:
+        """Test that a truncated stream is sent to the repair loop."""
+        mock_llm.generate_json_stream.return_value = iter(
+            ['{"name": "cut", "environment": {"asset_id": "orchard"}, "objects": [{"asset_']
+        )
+        mock_llm.generate.return_value = '{"name": "fixed", "environment": {"asset_id": "orchard"}}'
+
+        events = list(agent.stream_scene_spec("an orchard"))
+
+        repair = [e for e in events if e["event"] == "repair"]
+        assert len(repair) == 1
+        assert "truncated" in repair[0]["errors"][0]
+        assert events[-1]["scene"].name == "fixed"
+
+    def test_stream_truncated_repaired_locally(
+        self, agent: SceneAgent, mock_llm: MagicMock
+    ) -> None:
+        """Test that a truncation the lenient reader can close needs no LLM repair."""
+        mock_llm.generate_json_stream.return_value = iter(
+            ['{"name": "cut", "environment": {"asset_id": "orchard"}, "objects": [']
+        )
+
+        events = list(agent.stream_scene_spec("an orchard"))
+
+        assert not [e for e in events if e["event"] == "repair"]
+        assert events[-1]["scene"].name == "cut"
+        mock_llm.generate.assert_not_called()
+
+    def test_stream_raises_when_repairs_exhausted(
+        self, agent: SceneAgent, mock_llm: MagicMock
+    ) -> None:
+        """Test that a scene that cannot be repaired raises."""
+        mock_llm.generate_json_stream.return_value = iter(['{"name": "broken"}'])
+        mock_llm.generate.return_value = '{"name": "still_broken"}'
+
+        with pytest.raises(SceneGenerationError):
+            list(agent.stream_scene_spec("an orchard"))
+
 
 class TestGoldenExample:
     """Tests using the golden example JSON."""
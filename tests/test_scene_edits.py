@@ -0,0 +1,125 @@
+"""Tests for deterministic local scene edits."""
+
+from pathlib import Path
+
+import pytest
+
+from neoscene.core.asset_catalog import AssetCatalog
+from neoscene.core.scene_edits import apply_local_edit, resolve_asset
+from neoscene.core.scene_schema import SceneSpec
+
+ASSETS_DIR = Path(__file__).parent.parent / "neoscene" / "assets"
+
+
+@pytest.fixture(scope="module")
+def catalog() -> AssetCatalog:
+    """Create an AssetCatalog instance for testing."""
+    return AssetCatalog(ASSETS_DIR)
+
+
+@pytest.fixture
+def scene() -> SceneSpec:
+    """Create a scene with a grid of trees and a single bird."""
+    return SceneSpec.model_validate(
+        {
+            "name": "farm",
+            "environment": {"asset_id": "orchard"},
+            "objects": [
+                {
+                    "asset_id": "oak_tree",
+                    "name": "trees",
+                    "layout": {
+                        "type": "grid",
+                        "origin": [0, 0, 0],
+                        "rows": 2,
+                        "cols": 3,
+                        "spacing": [3.0, 3.0],
+                    },
+                },
+                {
+                    "asset_id": "bird",
+                    "name": "bird",
+                    "instances": [{"pose": {"position": [1.0, 1.0, 2.0]}}],
+                },
+            ],
+        }
+    )
+
+
+class TestResolveAsset:
+    """Tests for resolve_asset."""
+
+    def test_plural_resolves_to_asset(self, catalog: AssetCatalog) -> None:
+        """Test that a plural noun resolves to its asset."""
+        assert resolve_asset(catalog, "barrels").asset_id == "barrel"
+
+    def test_unknown_phrase_returns_none(self, catalog: AssetCatalog) -> None:
+        """Test that unknown nouns are not guessed."""
+        assert resolve_asset(catalog, "spaceships") is None
+
+
+class TestApplyLocalEdit:
+    """Tests for apply_local_edit."""
+
+    def test_add_group_keeps_exact_count(self, catalog: AssetCatalog, scene: SceneSpec) -> None:
+        """Test that "add 10 barrels" adds a layout of exactly 10 barrels."""
+        edit = apply_local_edit(scene, "add 10 barrels", catalog)
+
+        added = edit.scene.objects[-1]
+        assert added.asset_id == "barrel"
+        layout = added.layout
+        count = layout.count if layout.type == "random" else layout.rows * layout.cols
+        assert count == 10
+        assert len(scene.objects) == 2
+
+    def test_add_single_object(self, catalog: AssetCatalog, scene: SceneSpec) -> None:
+        """Test that "add a cow" adds one instance."""
+        edit = apply_local_edit(scene, "Add a cow.", catalog)
+
+        added = edit.scene.objects[-1]
+        assert added.asset_id == "cow"
+        assert len(added.instances) == 1
+
+    def test_remove_object(self, catalog: AssetCatalog, scene: SceneSpec) -> None:
+        """Test that "remove the bird" drops the bird."""
+        edit = apply_local_edit(scene, "remove the bird", catalog)
+
+        assert [o.asset_id for o in edit.scene.objects] == ["oak_tree"]
+
+    def test_resize_grid(self, catalog: AssetCatalog, scene: SceneSpec) -> None:
+        """Test that "make it 5 rows" changes the only grid."""
+        edit = apply_local_edit(scene, "make it 5 rows", catalog)
+
+        assert edit.scene.objects[0].layout.rows == 5
+        assert edit.scene.objects[0].layout.cols == 3
+
+    def test_set_physics(self, catalog: AssetCatalog, scene: SceneSpec) -> None:
+        """Test that physics settings are validated and applied."""
+        edit = apply_local_edit(scene, "change timestep to 0.002", catalog)
+        assert edit.scene.physics.timestep == 0.002
+
+        edit = apply_local_edit(scene, "set solver to newton", catalog)
+        assert edit.scene.physics.solver == "Newton"
+
+    def test_change_environment(self, catalog: AssetCatalog, scene: SceneSpec) -> None:
+        """Test that the environment can be switched."""
+        edit = apply_local_edit(scene, "change the environment to desert", catalog)
+        assert edit.scene.environment.asset_id == "desert"
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "add a tractor near the trees",
+            "add 3 spaceships",
+            "remove the crates",
+            "set timestep to -1",
+            "make the scene look like autumn",
+        ],
+    )
+    def test_falls_through(self, catalog: AssetCatalog, scene: SceneSpec, message: str) -> None:
+        """Test that anything not handled with confidence is left to the LLM."""
+        assert apply_local_edit(scene, message, catalog) is None
+
+    def test_no_scene_falls_through(self, catalog: AssetCatalog) -> None:
+        """Test that nothing is handled without a current scene."""
+        assert apply_local_edit(None, "add 10 barrels", catalog) is None
@@ -0,0 +1,141 @@
+"""Tests for patch-based scene editing."""
+
+import pytest
+
+from neoscene.core.scene_patch import (
+    ScenePatchError,
+    apply_json_patch,
+    apply_merge_patch,
+    apply_scene_patch,
+)
+from neoscene.core.scene_schema import EnvironmentSpec, ObjectSpec, SceneSpec
+
+
+@pytest.fixture
+def scene() -> SceneSpec:
+    """Create a small scene to patch."""
+    return SceneSpec(
+        name="patch_scene",
+        environment=EnvironmentSpec(asset_id="orchard"),
+        objects=[
+            ObjectSpec(asset_id="barrel"),
+            ObjectSpec(asset_id="bird"),
+        ],
+    )
+
+
+class TestApplyJsonPatch:
+    """Tests for RFC 6902 JSON Patch application."""
+
+    def test_add_appends_to_list(self) -> None:
+        """Test that '-' appends to a list."""
+        doc = {"items": [1, 2]}
+        result = apply_json_patch(doc, [{"op": "add", "path": "/items/-", "value": 3}])
+
+        assert result == {"items": [1, 2, 3]}
+        assert doc == {"items": [1, 2]}  # input untouched
+
+    def test_remove_and_replace(self) -> None:
+        """Test remove and replace operations."""
+        doc = {"a": 1, "b": [1, 2, 3]}
+        result = apply_json_patch(
+            doc,
+            [
+                {"op": "remove", "path": "/b/0"},
+                {"op": "replace", "path": "/a", "value": 5},
+            ],
+        )
+
+        assert result == {"a": 5, "b": [2, 3]}
+
+    def test_replace_missing_member_adds_it(self) -> None:
+        """Test that replace on a missing member behaves like add."""
+        result = apply_json_patch({}, [{"op": "replace", "path": "/x", "value": 1}])
+
+        assert result == {"x": 1}
+
+    def test_move_and_copy(self) -> None:
+        """Test move and copy operations."""
+        doc = {"a": {"v": 1}, "b": {}}
+        result = apply_json_patch(
+            doc,
+            [
+                {"op": "copy", "from": "/a/v", "path": "/b/v"},
+                {"op": "move", "from": "/a", "path": "/c"},
+            ],
+        )
+
+        assert result == {"b": {"v": 1}, "c": {"v": 1}}
+
+    def test_escaped_pointer(self) -> None:
+        """Test that ~0 and ~1 are unescaped."""
+        result = apply_json_patch({"a/b": 1}, [{"op": "remove", "path": "/a~1b"}])
+
+        assert result == {}
+
+    def test_failed_test_op_raises(self) -> None:
+        """Test that a failing test operation raises."""
+        with pytest.raises(ScenePatchError, match="Test failed"):
+            apply_json_patch({"a": 1}, [{"op": "test", "path": "/a", "value": 2}])
+
+    def test_out_of_range_index_raises(self) -> None:
+        """Test that an invalid list index raises."""
+        with pytest.raises(ScenePatchError, match="out of range"):
+            apply_json_patch({"a": [1]}, [{"op": "remove", "path": "/a/3"}])
+
+    def test_unknown_op_raises(self) -> None:
+        """Test that unknown operations raise."""
+        with pytest.raises(ScenePatchError, match="Unknown patch operation"):
+            apply_json_patch({}, [{"op": "frobnicate", "path": "/a"}])
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            {"op": "remove", "path": None},
+            {"op": "replace", "path": 5, "value": 1},
+            {"op": None, "path": "/a"},
+            {"op": "move", "from": ["a"], "path": "/b"},
+        ],
+    )
+    def test_malformed_operation_raises_patch_error(self, op: dict) -> None:
+        """Test that non-string op, path or from fields raise ScenePatchError."""
+        with pytest.raises(ScenePatchError, match="must have string|needs a string"):
+            apply_json_patch({"a": 1}, [op])
+
+
+class TestApplyMergePatch:
+    """Tests for RFC 7386 JSON Merge Patch application."""
+
+    def test_merge_nested_and_delete(self) -> None:
+        """Test nested merge and null deletion."""
+        target = {"a": {"b": 1, "c": 2}, "d": 3}
+        result = apply_merge_patch(target, {"a": {"b": 5, "c": None}, "e": 4})
+
+        assert result == {"a": {"b": 5}, "d": 3, "e": 4}
+
+    def test_non_dict_patch_replaces(self) -> None:
+        """Test that a non-object patch replaces the target."""
+        assert apply_merge_patch({"a": 1}, [1, 2]) == [1, 2]
+
+
+class TestApplyScenePatch:
+    """Tests for patching a SceneSpec."""
+
+    def test_json_patch_removes_object(self, scene: SceneSpec) -> None:
+        """Test removing an object by index."""
+        result = apply_scene_patch(scene, [{"op": "remove", "path": "/objects/1"}])
+
+        assert [o.asset_id for o in result.objects] == ["barrel"]
+        assert len(scene.objects) == 2
+
+    def test_merge_patch_updates_physics(self, scene: SceneSpec) -> None:
+        """Test a merge patch on physics settings."""
+        result = apply_scene_patch(scene, {"physics": {"timestep": 0.001}})
+
+        assert result.physics.timestep == 0.001
+        assert result.physics.solver == scene.physics.solver
+
+    def test_invalid_result_raises(self, scene: SceneSpec) -> None:
+        """Test that a patch producing an invalid scene raises."""
+        with pytest.raises(ScenePatchError, match="invalid"):
+            apply_scene_patch(scene, [{"op": "remove", "path": "/environment"}])
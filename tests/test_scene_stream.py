@@ -0,0 +1,100 @@
+"""Tests for incremental parsing of streamed scene JSON."""
+
+import json
+
+import pytest
+
+from neoscene.core.scene_stream import SceneStreamError, SceneStreamParser
+
+SCENE = {
+    "name": "stream_scene",
+    "environment": {"asset_id": "orchard"},
+    "objects": [
+        {"asset_id": "crate_wooden_small", "name": "crates {[\"]}"},
+        {"asset_id": "tree_apple", "layout": {"type": "grid", "rows": 2, "cols": 3}},
+    ],
+    "cameras": [{"name": "top", "pose": {"position": [0, 0, 10]}}],
+    "tasks": [],
+}
+
+
+def _feed_all(parser: SceneStreamParser, text: str, chunk_size: int) -> list:
+    """Feed text in fixed-size chunks and collect completed elements."""
+    elements = []
+    for start in range(0, len(text), chunk_size):
+        elements.extend(parser.feed(text[start:start + chunk_size]))
+    return elements
+
+
+class TestSceneStreamParser:
+    """Tests for SceneStreamParser."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+    def test_reports_elements_in_order(self, chunk_size: int) -> None:
+        """Test that every value is reported once regardless of chunking."""
+        text = json.dumps(SCENE, indent=2)
+        parser = SceneStreamParser()
+
+        elements = _feed_all(parser, text, chunk_size)
+
+        assert [(e.section, e.index) for e in elements] == [
+            ("name", None),
+            ("environment", None),
+            ("objects", 0),
+            ("objects", 1),
+            ("cameras", 0),
+        ]
+        assert elements[2].data == SCENE["objects"][0]
+        assert parser.section_counts() == {"objects": 2, "cameras": 1}
+        assert json.loads(parser.finish()) == SCENE
+
+    def test_element_reported_before_stream_ends(self) -> None:
+        """Test that an object is reported as soon as it is closed."""
+        parser = SceneStreamParser()
+
+        elements = parser.feed('{"objects": [{"asset_id": "a"}, {"asset_id": "b"')
+
+        assert [e.data for e in elements] == [{"asset_id": "a"}]
+        assert not parser.is_complete
+
+    def test_ignores_text_around_object(self) -> None:
+        """Test that markdown fences around the object are skipped."""
+        parser = SceneStreamParser()
+        parser.feed('```json\n{"name": "x"}\n```')
+
+        assert parser.finish() == '{"name": "x"}'
+
+    def test_invalid_element_reports_error(self) -> None:
+        """Test that an element that is not valid JSON carries an error."""
+        parser = SceneStreamParser()
+
+        elements = parser.feed('{"objects": [{"asset_id": "a",}]}')
+
+        assert elements[0].data is None
+        assert elements[0].error
+
+    def test_mismatched_bracket_raises_immediately(self) -> None:
+        """Test that a structural error is detected while streaming."""
+        parser = SceneStreamParser()
+
+        with pytest.raises(SceneStreamError, match="Unexpected"):
+            parser.feed('{"objects": [{"asset_id": "a"]')
+
+    def test_truncated_stream_detected(self) -> None:
+        """Test that a stream ending with open containers is reported."""
+        parser = SceneStreamParser()
+        parser.feed('{"objects": [{"asset_id": "a"}, {"asset_id": "b')
+
+        with pytest.raises(SceneStreamError, match="truncated") as exc_info:
+            parser.finish()
+
+        assert exc_info.value.details["open_containers"] == "{[{"
+        assert exc_info.value.details["in_string"] is True
+
+    def test_no_object_raises(self) -> None:
+        """Test that a response without a JSON object is rejected."""
+        parser = SceneStreamParser()
+        parser.feed("no json here")
+
+        with pytest.raises(SceneStreamError, match="No JSON object"):
+            parser.finish()
@@ -0,0 +1,491 @@
+"""Tests for the simulation worker and session manager."""
+
+import asyncio
+import math
+import threading
+from collections import deque
+from pathlib import Path
+
+import mujoco
+import numpy as np
+import pytest
+
+from neoscene.backends.session_manager import (
+    ActuatorMap,
+    SceneSessionManager,
+    SensorLayout,
+    SimulationWorker,
+)
+from neoscene.backends.state_viewer import new_viewer_address
+
+JOINTS = [
+    "axle_rl", "axle_rr", "spinner", "left_hip", "right_hip",
+    "left_knee", "right_knee", "left_shoulder", "other",
+]
+
+ACTUATED_MJCF = """
+<mujoco>
+  <option timestep="0.002"/>
+  <worldbody>
+    {bodies}
+  </worldbody>
+  <actuator>
+    <velocity name="tractor_0_motor_rl" joint="axle_rl"/>
+    <velocity name="tractor_0_motor_rr" joint="axle_rr"/>
+    <velocity name="drive_spinner" joint="spinner"/>
+    <position name="human_0_left_hip_ctrl" joint="left_hip"/>
+    <position name="human_0_right_hip_ctrl" joint="right_hip"/>
+    <position name="human_0_left_knee_ctrl" joint="left_knee"/>
+    <position name="human_0_right_knee_ctrl" joint="right_knee"/>
+    <position name="human_0_left_shoulder_ctrl" joint="left_shoulder"/>
+    <position joint="other"/>
+  </actuator>
+  <sensor>
+    <jointpos name="axle_angle" joint="axle_rl"/>
+    <subtreecom name="com" body="world"/>
+  </sensor>
+</mujoco>
+""".format(
+    bodies="".join(
+        f'<body pos="{i} 0 1"><joint name="{joint}" type="hinge"/>'
+        f'<geom type="sphere" size="0.1"/></body>'
+        for i, joint in enumerate(JOINTS)
+    )
+)
+
+
+@pytest.fixture
+def worker(tmp_path: Path) -> SimulationWorker:
+    """Create a started worker on a model with drive and gait actuators."""
+    xml_path = tmp_path / "scene.xml"
+    xml_path.write_text(ACTUATED_MJCF)
+    worker = SimulationWorker(xml_path=str(xml_path))
+    worker.start()
+    worker._task_runner = None
+    worker._navigator = None
+    return worker
+
+
+class TestActuatorMap:
+    """Tests for actuator classification."""
+
+    def test_classifies_by_name(self, worker: SimulationWorker) -> None:
+        """Test that drives and gait actuators land in the right groups."""
+        actuators = ActuatorMap.from_model(worker._model)
+
+        assert actuators.left_drive.tolist() == [0]
+        assert actuators.right_drive.tolist() == [1]
+        assert actuators.drive.tolist() == [0, 1, 2]
+        assert actuators.gait.tolist() == [3, 4, 5, 6, 7]
+        assert actuators.gait_amplitude.tolist() == [20.0, 20.0, 30.0, 30.0, 15.0]
+        assert actuators.gait_phase.tolist() == [0.0, math.pi, 0.0, math.pi, math.pi]
+        assert actuators.gait_clamp.tolist() == [False, False, True, True, False]
+
+    def test_model_without_actuators(self) -> None:
+        """Test that a model without actuators gives empty groups."""
+        model = mujoco.MjModel.from_xml_string("<mujoco><worldbody/></mujoco>")
+
+        actuators = ActuatorMap.from_model(model)
+
+        assert actuators.drive.size == 0
+        assert actuators.gait.size == 0
+
+
+class TestApplyControls:
+    """Tests for the vectorized control writes."""
+
+    def test_fallback_drive_and_gait(self, worker: SimulationWorker) -> None:
+        """Test that drives go forward and gait follows the phase offsets."""
+        worker._data.time = t = 0.3
+
+        worker._apply_controls()
+
+        ctrl = worker._data.ctrl
+        assert ctrl[:3].tolist() == [2.0, 2.0, 2.0]
+        assert ctrl[3] == pytest.approx(20.0 * math.sin(2.0 * t))
+        assert ctrl[4] == pytest.approx(20.0 * math.sin(2.0 * t + math.pi))
+        assert ctrl[5] == pytest.approx(30.0 * max(0.0, math.sin(2.0 * t)))
+        assert ctrl[6] == pytest.approx(30.0 * max(0.0, math.sin(2.0 * t + math.pi)))
+        assert ctrl[7] == pytest.approx(15.0 * math.sin(2.0 * t + math.pi))
+        assert ctrl[8] == 0.0
+
+    def test_navigator_sets_differential_drive(self, worker: SimulationWorker) -> None:
+        """Test that navigator output is split across left and right motors."""
+
+        class Navigator:
+            def step(self, m, d, dt):
+                return 1.0, 2.0
+
+            def get_status(self):
+                return {"state": "FOLLOW"}
+
+        worker._navigator = Navigator()
+
+        worker._apply_controls()
+
+        ctrl = worker._data.ctrl
+        assert ctrl[0] == pytest.approx(1.0 - 0.75 * 2.0)
+        assert ctrl[1] == pytest.approx(1.0 + 0.75 * 2.0)
+        assert ctrl[2] == 0.0
+        assert worker.navigator_status == {"state": "FOLLOW"}
+
+    def test_controls_are_finite_over_steps(self, worker: SimulationWorker) -> None:
+        """Test that controls stay well-defined while stepping."""
+        for _ in range(50):
+            worker._apply_controls()
+            mujoco.mj_step(worker._model, worker._data)
+
+        assert np.all(np.isfinite(worker._data.ctrl))
+
+
+class TestSensorPublishing:
+    """Tests for the immutable telemetry snapshots."""
+
+    def test_no_sensors_before_first_publish(self, worker: SimulationWorker) -> None:
+        """Test that nothing is reported until the worker publishes."""
+        assert worker.telemetry is None
+        assert worker.latest_sensors == {}
+
+    def test_layout_maps_names_to_slices(self, worker: SimulationWorker) -> None:
+        """Test that the layout is read once from the model."""
+        layout = SensorLayout.from_model(worker._model)
+
+        assert layout.names == ["axle_angle", "com"]
+        assert layout.dim == [1, 3]
+        assert layout.to_dict(np.arange(4.0)) == {"axle_angle": 0.0, "com": [1.0, 2.0, 3.0]}
+
+    def test_published_values_match_sensordata(self, worker: SimulationWorker) -> None:
+        """Test that reads format the values published by the last tick."""
+        for _ in range(10):
+            worker._apply_controls()
+            mujoco.mj_step(worker._model, worker._data)
+        worker._read_sensors()
+        expected = worker._data.sensordata.copy()
+        sim_time = worker._data.time
+        mujoco.mj_step(worker._model, worker._data)
+
+        sensors = worker.latest_sensors
+
+        assert worker.telemetry.seq == 1
+        assert worker.telemetry.sim_time == sim_time
+        assert sensors["axle_angle"] == pytest.approx(expected[0])
+        assert sensors["com"] == pytest.approx(expected[1:4].tolist())
+
+    def test_each_publish_is_a_new_snapshot(self, worker: SimulationWorker) -> None:
+        """Test that publishing swaps in a new snapshot, leaving the old one intact."""
+        worker._read_sensors()
+        first = worker.telemetry
+        mujoco.mj_step(worker._model, worker._data)
+        worker._read_sensors()
+
+        assert worker.telemetry is not first
+        assert worker.telemetry.seq == first.seq + 1
+        assert worker.telemetry.timestamp >= first.timestamp
+
+    def test_snapshot_is_read_only(self, worker: SimulationWorker) -> None:
+        """Test that readers cannot modify published values."""
+        worker._read_sensors()
+
+        with pytest.raises(ValueError):
+            worker.telemetry.sensordata[0] = 123.0
+        with pytest.raises(AttributeError):
+            worker.telemetry.seq = 5
+
+
+class TestCommandQueue:
+    """Tests for commands run by the simulation loop between ticks."""
+
+    def test_commands_wait_for_the_loop(self, worker: SimulationWorker) -> None:
+        """Test that commands queue while running and run in order when drained."""
+        calls = []
+
+        first = worker.submit(lambda: calls.append("a"))
+        second = worker.submit(lambda: calls.append("b") or 42)
+
+        assert calls == [] and not second.done()
+        worker._run_commands()
+        assert calls == ["a", "b"]
+        assert first.done() and second.result() == 42
+
+    def test_command_errors_reach_the_caller(self, worker: SimulationWorker) -> None:
+        """Test that an exception is set on the future, not raised in the loop."""
+        future = worker.submit(lambda: 1 / 0)
+
+        worker._run_commands()
+
+        with pytest.raises(ZeroDivisionError):
+            future.result()
+
+    def test_commands_run_directly_when_stopped(self, worker: SimulationWorker) -> None:
+        """Test that nothing is queued once the loop is not running."""
+        worker.stop()
+
+        assert worker.submit(lambda: "now").result(timeout=0) == "now"
+
+    def test_command_submitted_during_shutdown_is_resolved(
+        self, worker: SimulationWorker
+    ) -> None:
+        """Test that a shutdown racing with submit still runs the submitted command."""
+        commands = worker._commands
+
+        class RacingQueue(deque):
+            def append(self, item) -> None:
+                # Shut down between submit's running check and its append
+                shutdown = threading.Thread(target=worker._shutdown)
+                shutdown.start()
+                shutdown.join(timeout=0.2)
+                super().append(item)
+
+        worker._commands = RacingQueue(commands)
+        future = worker.submit(lambda: "ran")
+
+        assert worker.join(timeout=2)
+        assert future.result(timeout=0) == "ran"
+
+    def test_task_control_runs_in_loop(self, worker: SimulationWorker) -> None:
+        """Test that start_task and stop_task reach the task runner via the loop."""
+
+        class Runner:
+            def __init__(self):
+                self.calls = []
+
+            def start_task(self, name):
+                self.calls.append(("start", name, threading.current_thread()))
+                return True
+
+            def stop_task(self):
+                self.calls.append(("stop", None, threading.current_thread()))
+
+        runner = worker._task_runner = Runner()
+        done = threading.Event()
+
+        def loop():
+            while not done.is_set():
+                worker._run_commands()
+                done.wait(0.001)
+
+        drainer = threading.Thread(target=loop)
+        worker.stop_task()
+        drainer.start()
+        try:
+            started = worker.start_task("patrol")
+        finally:
+            done.set()
+            drainer.join()
+
+        assert started is True
+        assert [call[:2] for call in runner.calls] == [("stop", None), ("start", "patrol")]
+        assert all(call[2] is drainer for call in runner.calls)
+
+
+CAMERA_MJCF = """
+<mujoco>
+  <worldbody>
+    <light pos="0 0 3"/>
+    <camera name="rear_cam" pos="0 -2 1" xyaxes="1 0 0 0 0 1"/>
+    <body pos="0 0 1">
+      <freejoint/>
+      <geom type="box" size="0.2 0.2 0.2" rgba="1 0 0 1"/>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+
+@pytest.fixture
+def camera_xml(tmp_path: Path) -> str:
+    """Write a model with one camera and return its path."""
+    xml_path = tmp_path / "camera.xml"
+    xml_path.write_text(CAMERA_MJCF)
+    return str(xml_path)
+
+
+class TestCameraRendering:
+    """Tests for the decoupled render thread."""
+
+    def test_render_requests_follow_demand_and_rate(self, camera_xml: str) -> None:
+        """Test that frames are only queued when wanted, idle and due."""
+        worker = SimulationWorker(xml_path=camera_xml, render_fps=10.0)
+        worker._model = mujoco.MjModel.from_xml_path(camera_xml)
+        worker._data = mujoco.MjData(worker._model)
+        worker._render_thread = object()  # Stand-in: no real render thread
+        worker._render_state = np.zeros(
+            mujoco.mj_stateSize(worker._model, mujoco.mjtState.mjSTATE_INTEGRATION)
+        )
+
+        worker._request_render()
+        assert not worker._render_wake.is_set()  # Nobody asked for a frame
+
+        worker.request_frame()
+        worker._request_render()
+        assert worker._render_wake.is_set()
+        assert worker._render_state.any()
+
+        worker._render_wake.clear()
+        worker._request_render()
+        assert not worker._render_wake.is_set()  # Next frame not due at 10 fps
+
+    def test_render_thread_publishes_frames(self, camera_xml: str) -> None:
+        """Test that frames are rendered off the physics thread on request."""
+        import time
+
+        worker = SimulationWorker(xml_path=camera_xml, render_fps=0.0)
+        thread = threading.Thread(target=worker.loop, daemon=True)
+        thread.start()
+        try:
+            worker.request_frame()
+            deadline = time.monotonic() + 5.0
+            while worker.frame_snapshot() is None and time.monotonic() < deadline:
+                if worker._render_thread is not None and not worker._render_thread.is_alive():
+                    pytest.skip("No OpenGL context available for offscreen rendering")
+                time.sleep(0.05)
+        finally:
+            worker.stop()
+            thread.join(timeout=2)
+            if worker._render_thread is not None:
+                worker._render_thread.join(timeout=2)
+        number, image = worker.frame_snapshot()
+
+        assert number >= 1
+        assert image.shape == (240, 320, 3)
+        assert image.any()
+        assert not image.flags.writeable
+        assert worker.latest_image is image
+
+    def test_running_is_set_before_render_thread_starts(self, camera_xml: str) -> None:
+        """Test that the render thread never sees a worker that is not running yet."""
+        worker = SimulationWorker(xml_path=camera_xml)
+        running_at_camera_init = []
+        # Stand-in for _init_camera, which starts the render thread
+        worker._init_camera = lambda: running_at_camera_init.append(worker.running)
+
+        worker.start()
+        worker.stop()
+
+        assert running_at_camera_init == [True]
+
+
+class RunningProcess:
+    """Stands in for a live viewer subprocess."""
+
+    def poll(self):
+        return None
+
+
+class TestViewerReuse:
+    """Tests for keeping one viewer process per session."""
+
+    def test_scene_is_sent_to_running_viewer(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that a live viewer receives the new scene instead of being restarted."""
+        from multiprocessing.connection import Listener
+
+        manager = SceneSessionManager(tmp_path)
+        monkeypatch.setattr(manager, "_spawn_viewer", pytest.fail)
+        session = manager.get_or_create_session("s1")
+        session.viewer_address = new_viewer_address()
+        session.viewer_process = RunningProcess()
+        accepted = []
+        with Listener(session.viewer_address, authkey=manager._viewer_authkey) as listener:
+            # Connecting authenticates, which needs the listener side to accept
+            acceptor = threading.Thread(target=lambda: accepted.append(listener.accept()))
+            acceptor.start()
+            manager._show_in_viewer(session, tmp_path / "scene.xml", "ring_1")
+            acceptor.join(timeout=5)
+            with accepted[0] as conn:
+                assert conn.recv() == ("load", str(tmp_path / "scene.xml"), "ring_1")
+                manager._show_in_viewer(session, tmp_path / "scene.xml", "ring_2")
+                assert conn.recv()[2] == "ring_2"
+        manager._kill_viewer(session)
+
+    def test_viewer_is_started_when_none_runs(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that the first scene (or a closed window) starts a viewer process."""
+        manager = SceneSessionManager(tmp_path)
+        calls = []
+        monkeypatch.setattr(
+            manager, "_spawn_viewer", lambda *args: calls.append(args) or RunningProcess()
+        )
+        session = manager.get_or_create_session("s1")
+
+        manager._show_in_viewer(session, tmp_path / "scene.xml", "ring_1")
+
+        assert calls == [(tmp_path / "scene.xml", "ring_1", session.viewer_address)]
+        assert session.viewer_address is not None
+
+
+class TestWorkerLifecycle:
+    """Tests for worker readiness and stop events."""
+
+    def test_ready_then_stopped(self, tmp_path: Path) -> None:
+        """Test that readiness and stop are signalled without polling."""
+        xml_path = tmp_path / "scene.xml"
+        xml_path.write_text(ACTUATED_MJCF)
+        worker = SimulationWorker(xml_path=str(xml_path))
+        thread = threading.Thread(target=worker.loop, daemon=True)
+        thread.start()
+
+        assert worker.wait_ready(timeout=5.0)
+        assert worker.running
+        assert not worker.join(timeout=0)
+
+        worker.stop()
+
+        assert worker.join(timeout=5.0)
+        assert not worker.running
+
+    def test_failed_start_is_not_ready(self, tmp_path: Path) -> None:
+        """Test that a model that does not load ends the wait at once."""
+        xml_path = tmp_path / "broken.xml"
+        xml_path.write_text("<mujoco><worldbody>")
+        worker = SimulationWorker(xml_path=str(xml_path))
+        threading.Thread(target=worker.loop, daemon=True).start()
+
+        assert worker.wait_ready(timeout=5.0) is False
+        assert worker.join(timeout=0)
+
+    def test_stop_before_start_wins(self, tmp_path: Path) -> None:
+        """Test that a worker stopped while loading does not keep running."""
+        xml_path = tmp_path / "scene.xml"
+        xml_path.write_text(ACTUATED_MJCF)
+        worker = SimulationWorker(xml_path=str(xml_path))
+        worker.stop()
+
+        worker.loop()
+
+        assert worker.join(timeout=0)
+        assert not worker.running
+        assert worker.steps == 0
+
+    def test_scene_is_given_at_start(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that the TaskRunner gets the construction-time scene before any tick."""
+        import neoscene.backends.task_runner as task_runner
+
+        class RecordingRunner:
+            def __init__(self, model, data):
+                self.scenes = []
+
+            def set_scene(self, scene):
+                self.scenes.append(scene)
+
+        monkeypatch.setattr(task_runner, "TaskRunner", RecordingRunner)
+        xml_path = tmp_path / "scene.xml"
+        xml_path.write_text(ACTUATED_MJCF)
+        scene = object()
+        worker = SimulationWorker(xml_path=str(xml_path), scene=scene)
+
+        worker.start()
+
+        assert worker._task_runner.scenes == [scene]
+
+    def test_update_scene_async_runs_in_a_thread(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that the awaitable update does the blocking work off the event loop."""
+        manager = SceneSessionManager(tmp_path)
+        threads = []
+
+        def update_scene(session, scene):
+            threads.append(threading.current_thread())
+
+        monkeypatch.setattr(manager, "update_scene", update_scene)
+
+        asyncio.run(manager.update_scene_async(manager.get_or_create_session("s1"), None))
+
+        assert threads and threads[0] is not threading.main_thread()
@@ -0,0 +1,88 @@
+"""Tests for the shared-memory ring buffers."""
+
+import numpy as np
+import pytest
+
+from neoscene.backends.shm_ring import ShmRing
+
+
+@pytest.fixture
+def ring():
+    """Create a small ring and remove it afterwards."""
+    ring = ShmRing.create(slots=3, slot_size=32)
+    yield ring
+    ring.close()
+
+
+class TestShmRing:
+    """Tests for ShmRing."""
+
+    def test_empty_ring(self, ring: ShmRing) -> None:
+        """Test that nothing is read before the first write."""
+        assert ring.latest_seq() == 0
+        assert ring.read() is None
+
+    def test_reads_newest_entry(self, ring: ShmRing) -> None:
+        """Test that readers get the newest payload with its metadata."""
+        ring.write(b"old", timestamp=1.0, sim_time=0.1)
+        ring.write(np.arange(3.0), timestamp=2.0, sim_time=0.2)
+
+        entry = ring.read()
+
+        assert entry.seq == 2
+        assert (entry.timestamp, entry.sim_time) == (2.0, 0.2)
+        assert entry.data.view(np.float64).tolist() == [0.0, 1.0, 2.0]
+
+    def test_slots_are_reused(self, ring: ShmRing) -> None:
+        """Test that writes wrap around the slots."""
+        for i in range(10):
+            ring.write(bytes([i]))
+
+        entry = ring.read()
+
+        assert entry.seq == 10
+        assert entry.data.tobytes() == bytes([9])
+
+    def test_entry_is_a_copy(self, ring: ShmRing) -> None:
+        """Test that later writes do not change an entry already read."""
+        ring.write(b"first")
+        entry = ring.read()
+        for _ in range(3):
+            ring.write(b"later")
+
+        assert entry.data.tobytes() == b"first"
+
+    def test_attach_by_name(self, ring: ShmRing) -> None:
+        """Test that another handle on the segment sees the writes."""
+        reader = ShmRing.attach(ring.name, slots=3, slot_size=32)
+        try:
+            ring.write(b"shared")
+            assert reader.read().data.tobytes() == b"shared"
+        finally:
+            reader.close()
+
+    def test_oversized_payload(self, ring: ShmRing) -> None:
+        """Test that payloads larger than a slot are rejected."""
+        with pytest.raises(ValueError):
+            ring.write(bytes(33))
+
+    def test_needs_two_slots(self) -> None:
+        """Test that a single-slot ring is refused."""
+        with pytest.raises(ValueError):
+            ShmRing.create(slots=1, slot_size=8)
+
+    def test_named_ring_untracked_attach(self) -> None:
+        """Test that a ring can be created under a chosen name and attached untracked."""
+        ring = ShmRing.create(slots=2, slot_size=8, name="neoscene_test_named_ring")
+        try:
+            reader = ShmRing.attach("neoscene_test_named_ring", 2, 8, track=False)
+            ring.write(b"state")
+            assert reader.read().data.tobytes() == b"state"
+            reader.close()
+        finally:
+            ring.close()
+
+    def test_attach_missing_ring(self) -> None:
+        """Test that attaching to a ring that does not exist raises."""
+        with pytest.raises(FileNotFoundError):
+            ShmRing.attach("neoscene_test_missing_ring", 2, 8)
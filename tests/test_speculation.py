@@ -0,0 +1,71 @@
+"""Tests for speculative generation settings and budget."""
+
+from neoscene.core.speculation import (
+    CandidateVariant,
+    SpeculativeGeneration,
+    speculation_from_config,
+)
+
+
+class TestSpeculativeGeneration:
+    """Tests for SpeculativeGeneration."""
+
+    def test_plan_returns_all_variants_within_budget(self) -> None:
+        """Test that every variant runs while the budget allows it."""
+        speculation = SpeculativeGeneration(max_extra_calls=10)
+
+        assert len(speculation.plan()) == 3
+        assert speculation.stats()["budget_remaining"] == 8
+
+    def test_budget_limits_extra_candidates(self) -> None:
+        """Test that the first candidate always runs but extras are capped."""
+        speculation = SpeculativeGeneration(max_extra_calls=3)
+
+        assert len(speculation.plan()) == 3
+        assert len(speculation.plan()) == 2
+        assert len(speculation.plan()) == 1
+        assert speculation.stats()["throttled"] == 2
+
+    def test_budget_window_expires(self) -> None:
+        """Test that extra calls outside the window no longer count."""
+        speculation = SpeculativeGeneration(max_extra_calls=2, window_seconds=0.0)
+
+        speculation.plan()
+        assert len(speculation.plan()) == 3
+
+    def test_record_counts_wins_and_cancellations(self) -> None:
+        """Test that outcomes are recorded per variant."""
+        speculation = SpeculativeGeneration()
+        speculation.record(winner=1, cancelled=2)
+
+        stats = speculation.stats()
+        assert stats["wins_by_variant"] == [0, 1, 0]
+        assert stats["cancelled"] == 2
+
+
+class TestSpeculationFromConfig:
+    """Tests for speculation_from_config."""
+
+    def test_disabled_by_default(self) -> None:
+        """Test that speculation is off without configuration."""
+        assert speculation_from_config({}) is None
+        assert speculation_from_config({"speculative": {"enabled": False}}) is None
+
+    def test_enabled_with_variants(self) -> None:
+        """Test that variants and budget are read from the config."""
+        speculation = speculation_from_config(
+            {
+                "speculative": {
+                    "enabled": True,
+                    "variants": [{"temperature": 0.2}, {"temperature": 0.9, "full_catalog": True}],
+                    "budget": {"max_extra_calls": 5, "window_seconds": 60},
+                }
+            }
+        )
+
+        assert speculation.variants == [
+            CandidateVariant(0.2),
+            CandidateVariant(0.9, full_catalog=True),
+        ]
+        assert speculation.max_extra_calls == 5
+        assert speculation.window_seconds == 60.0
@@ -0,0 +1,178 @@
+"""Tests for the state-displaying viewer."""
+
+import contextlib
+import threading
+import time
+import uuid
+from multiprocessing.connection import Client, Listener
+from pathlib import Path
+
+import mujoco
+import pytest
+
+from neoscene.backends.session_manager import SimulationWorker
+from neoscene.backends.state_viewer import (
+    ViewerHost,
+    apply_state,
+    attach_state_ring,
+    camera_pose,
+    new_viewer_address,
+)
+
+FALLING_MJCF = """
+<mujoco>
+  <worldbody>
+    <geom type="plane" size="5 5 0.1"/>
+    <body pos="0 0 2">
+      <freejoint/>
+      <geom type="sphere" size="0.1"/>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+
+@pytest.fixture
+def xml_path(tmp_path: Path) -> str:
+    """Write a model with a falling ball and return its path."""
+    path = tmp_path / "falling.xml"
+    path.write_text(FALLING_MJCF)
+    return str(path)
+
+
+class TestStateViewer:
+    """Tests for displaying a worker's published state."""
+
+    def test_no_ring_before_worker_publishes(self, xml_path: str) -> None:
+        """Test that the viewer waits (None) while the ring does not exist."""
+        model = mujoco.MjModel.from_xml_path(xml_path)
+
+        assert attach_state_ring(model, f"neoscene_{uuid.uuid4().hex[:16]}") is None
+
+    def test_displays_worker_state(self, xml_path: str) -> None:
+        """Test that the viewer's data follows the worker without stepping itself."""
+        ring_name = f"neoscene_{uuid.uuid4().hex[:16]}"
+        worker = SimulationWorker(xml_path=xml_path, state_ring_name=ring_name)
+        thread = threading.Thread(target=worker.loop, daemon=True)
+        thread.start()
+        model = mujoco.MjModel.from_xml_path(xml_path)
+        data = mujoco.MjData(model)
+        ring = None
+        try:
+            deadline = time.monotonic() + 5.0
+            while time.monotonic() < deadline:
+                ring = ring or attach_state_ring(model, ring_name, track=True)
+                if ring is not None and ring.latest_seq() >= 5:
+                    break
+                time.sleep(0.02)
+            entry = ring.read()
+            apply_state(model, data, entry)
+        finally:
+            worker.stop()
+            thread.join(timeout=2)
+            if ring is not None:
+                ring.close()
+
+        assert data.time == pytest.approx(entry.sim_time)
+        assert data.time > 0
+        assert data.qpos[2] < 2.0  # The ball has fallen in the worker's simulation
+        assert data.xpos[1][2] == pytest.approx(data.qpos[2])  # Kinematics updated
+        assert attach_state_ring(model, ring_name) is None  # Removed with the worker
+
+    def test_worker_without_viewer_publishes_nothing(self, xml_path: str) -> None:
+        """Test that workers only create a state ring when asked to."""
+        worker = SimulationWorker(xml_path=xml_path)
+        worker.start()
+        worker._publish_state()
+
+        assert worker._state_ring is None
+
+
+class FakeSimulate:
+    """Stands in for the viewer's simulate object: load() resets the camera."""
+
+    def __init__(self, cam: mujoco.MjvCamera):
+        self.cam = cam
+        self.loaded = []
+
+    def load(self, model, data, path: str):
+        self.loaded.append((model, data, path))
+        self.cam.lookat[:] = 0.0
+        self.cam.distance = 1.0
+
+
+class FakeViewer:
+    """Stands in for a passive viewer handle (no window needed)."""
+
+    def __init__(self):
+        self.cam = mujoco.MjvCamera()
+        self.sim = FakeSimulate(self.cam)
+
+    def _get_sim(self):
+        return self.sim
+
+    def lock(self):
+        return contextlib.nullcontext()
+
+
+class TestViewerHost:
+    """Tests for the long-lived viewer host."""
+
+    def test_newest_load_wins(self) -> None:
+        """Test that loads queued during a load are coalesced to the newest."""
+        host = ViewerHost()
+        host.load("a.xml", "ring_a")
+        host.load("b.xml", "ring_b")
+
+        assert host.next_request() == ("b.xml", "ring_b")
+        assert host.next_request() is None
+
+    def test_close_wins_over_loads(self) -> None:
+        """Test that a close request ends the host even after queued loads."""
+        host = ViewerHost()
+        host.load("a.xml", "ring_a")
+        host.close()
+
+        assert host.next_request() == "close"
+
+    def test_requests_arrive_over_socket(self) -> None:
+        """Test that authenticated clients can queue loads on the host."""
+        address = new_viewer_address()
+        host = ViewerHost(Listener(address, authkey=b"key"))
+        threading.Thread(target=host.serve, daemon=True).start()
+        try:
+            with Client(address, authkey=b"key") as conn:
+                conn.send(("load", "scene.xml", "ring"))
+                assert host.next_request(timeout=2.0) == ("scene.xml", "ring")
+        finally:
+            host._closed = True
+            host.listener.close()
+
+    def test_swaps_model_and_keeps_camera(self, xml_path: str) -> None:
+        """Test that a new model is loaded into the open viewer at the same camera pose."""
+        host = ViewerHost()
+        viewer = FakeViewer()
+        viewer.cam.lookat[:] = [1.0, 2.0, 3.0]
+        viewer.cam.distance = 7.0
+        viewer.cam.azimuth = 30.0
+
+        assert host.show(viewer, xml_path, "ring") is viewer
+
+        assert viewer.sim.loaded == [(host.model, host.data, xml_path)]
+        pose = camera_pose(viewer.cam)
+        assert pose["lookat"].tolist() == [1.0, 2.0, 3.0]
+        assert (pose["distance"], pose["azimuth"]) == (7.0, 30.0)
+
+    def test_bad_model_keeps_current_scene(self, xml_path: str, tmp_path: Path) -> None:
+        """Test that a model that fails to load leaves the shown scene alone."""
+        host = ViewerHost()
+        viewer = FakeViewer()
+        host.show(viewer, xml_path, "ring")
+        broken = tmp_path / "broken.xml"
+        broken.write_text("<mujoco><worldbody>")
+
+        assert host.show(viewer, str(broken), "ring_2") is viewer
+
+        assert host.xml_path == xml_path
+        assert host.loads == 1
+        assert len(viewer.sim.loaded) == 1
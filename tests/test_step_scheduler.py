@@ -0,0 +1,113 @@
+"""Tests for fixed-rate physics stepping."""
+
+from pathlib import Path
+
+import pytest
+
+from neoscene.backends.session_manager import SimulationWorker
+from neoscene.backends.step_scheduler import StepScheduler
+
+MINIMAL_MJCF = """
+<mujoco>
+  <option timestep="0.002"/>
+  <worldbody>
+    <body name="box" pos="0 0 1">
+      <freejoint/>
+      <geom type="box" size="0.1 0.1 0.1"/>
+    </body>
+  </worldbody>
+</mujoco>
+"""
+
+
+class TestStepScheduler:
+    """Tests for StepScheduler planning."""
+
+    def test_real_time_substeps_per_tick(self) -> None:
+        """Test that one 20 ms tick at 2 ms timestep needs 10 substeps."""
+        scheduler = StepScheduler(timestep=0.002, speed=1.0, tick_hz=50)
+        scheduler.reset(now=100.0, sim_time=0.0)
+
+        assert scheduler.plan(now=100.02, sim_time=0.0) == 10
+        assert scheduler.plan(now=100.04, sim_time=0.02) == 10
+
+    def test_speed_scales_substeps(self) -> None:
+        """Test that speed 2.0 runs twice the substeps per tick."""
+        scheduler = StepScheduler(timestep=0.002, speed=2.0, tick_hz=50)
+        scheduler.reset(now=0.0, sim_time=0.0)
+
+        assert scheduler.plan(now=0.02, sim_time=0.0) == 20
+
+    def test_catches_up_after_late_tick(self) -> None:
+        """Test that a late tick runs the missed substeps."""
+        scheduler = StepScheduler(timestep=0.002, speed=1.0, tick_hz=50)
+        scheduler.reset(now=0.0, sim_time=0.0)
+
+        assert scheduler.plan(now=0.05, sim_time=0.0) == 25
+        assert scheduler.overruns == 0
+
+    def test_never_runs_ahead(self) -> None:
+        """Test that no substeps run when simulated time is ahead of target."""
+        scheduler = StepScheduler(timestep=0.002, speed=1.0, tick_hz=50)
+        scheduler.reset(now=0.0, sim_time=0.0)
+
+        assert scheduler.plan(now=0.01, sim_time=0.02) == 0
+
+    def test_large_backlog_is_dropped(self) -> None:
+        """Test that a backlog over max_substeps is capped and re-anchored."""
+        scheduler = StepScheduler(timestep=0.002, speed=1.0, tick_hz=50, max_substeps=40)
+        scheduler.reset(now=0.0, sim_time=0.0)
+
+        assert scheduler.plan(now=1.0, sim_time=0.0) == 40
+        assert scheduler.overruns == 1
+        # Re-anchored: the next tick only needs its own 10 substeps
+        assert scheduler.plan(now=1.02, sim_time=0.08) == 10
+
+    def test_sleep_until_next_tick(self) -> None:
+        """Test that sleeps follow fixed deadlines, absorbing loop overhead."""
+        scheduler = StepScheduler(timestep=0.002, speed=1.0, tick_hz=50)
+        scheduler.reset(now=0.0, sim_time=0.0)
+
+        assert scheduler.sleep_time(now=0.005) == pytest.approx(0.015)
+        assert scheduler.sleep_time(now=0.03) == pytest.approx(0.01)
+
+    def test_late_ticks_are_dropped(self) -> None:
+        """Test that deadlines missed by over a period are skipped."""
+        scheduler = StepScheduler(timestep=0.002, speed=1.0, tick_hz=50)
+        scheduler.reset(now=0.0, sim_time=0.0)
+
+        sleep = scheduler.sleep_time(now=0.09)
+
+        assert scheduler.dropped_ticks == 3
+        assert sleep == 0.0
+
+    def test_fast_mode_never_sleeps(self) -> None:
+        """Test that speed=None runs max_substeps without sleeping."""
+        scheduler = StepScheduler(timestep=0.002, speed=None, tick_hz=50)
+        scheduler.reset(now=0.0, sim_time=0.0)
+
+        assert scheduler.plan(now=0.0, sim_time=0.0) == scheduler.max_substeps == 100
+        assert scheduler.sleep_time(now=0.0) == 0.0
+
+    def test_invalid_arguments(self) -> None:
+        """Test that non-positive rates are rejected."""
+        with pytest.raises(ValueError):
+            StepScheduler(timestep=0.0)
+        with pytest.raises(ValueError):
+            StepScheduler(timestep=0.002, speed=0.0)
+
+
+class TestSimulationWorkerStepping:
+    """Tests for the worker loop with the step scheduler."""
+
+    def test_headless_fast_run_stops_at_max_sim_time(self, tmp_path: Path) -> None:
+        """Test that an unthrottled run reaches max_sim_time and reports rates."""
+        xml_path = tmp_path / "scene.xml"
+        xml_path.write_text(MINIMAL_MJCF)
+        worker = SimulationWorker(xml_path=str(xml_path), speed=None, max_sim_time=0.5)
+
+        worker.loop()
+
+        assert worker.running is False
+        assert worker._data.time >= 0.5
+        assert worker.steps >= 250
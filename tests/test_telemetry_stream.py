@@ -0,0 +1,167 @@
+"""Tests for telemetry streaming (WebSocket and MJPEG)."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from neoscene.app.api import app
+from neoscene.app.telemetry_stream import (
+    MAX_MJPEG_FPS,
+    MAX_SENSOR_HZ,
+    TelemetryStream,
+    mjpeg_parts,
+    sensor_delta,
+)
+from neoscene.backends.frame_cache import JpegFrameCache
+from neoscene.backends.session_manager import RENDER_FPS
+
+
+@pytest.fixture
+def client():
+    """Create a test client for the API."""
+    return TestClient(app)
+
+
+def make_stream() -> TelemetryStream:
+    return TelemetryStream(MagicMock(), MagicMock(), "s1")
+
+
+class TestSensorDelta:
+    """Tests for sensor delta computation."""
+
+    def test_first_message_is_full(self) -> None:
+        """Test that nothing sent yet gives a full snapshot."""
+        assert sensor_delta(None, {"a": 1.0}) == (True, {"a": 1.0})
+
+    def test_only_changed_values(self) -> None:
+        """Test that unchanged values are left out."""
+        previous = {"a": 1.0, "b": [1.0, 2.0], "c": "FOLLOW"}
+        current = {"a": 1.0, "b": [1.0, 3.0], "c": "FOLLOW"}
+
+        assert sensor_delta(previous, current) == (False, {"b": [1.0, 3.0]})
+
+    def test_changed_names_give_full_snapshot(self) -> None:
+        """Test that a different sensor set (new scene) resends everything."""
+        assert sensor_delta({"a": 1.0}, {"b": 2.0}) == (True, {"b": 2.0})
+
+
+class TestBackpressure:
+    """Tests for coalescing updates for slow clients."""
+
+    def test_pending_deltas_are_merged(self) -> None:
+        """Test that deltas queued while the socket is busy are combined."""
+        stream = make_stream()
+
+        stream.queue_sensors(False, {"a": 1.0, "b": 1.0})
+        stream.queue_sensors(False, {"b": 2.0})
+
+        assert stream._pending_sensors == {"a": 1.0, "b": 2.0}
+        assert stream._pending_full is False
+
+    def test_full_snapshot_replaces_pending(self) -> None:
+        """Test that a full snapshot supersedes pending deltas."""
+        stream = make_stream()
+
+        stream.queue_sensors(False, {"a": 1.0})
+        stream.queue_sensors(True, {"b": 2.0})
+
+        assert stream._pending_sensors == {"b": 2.0}
+        assert stream._pending_full is True
+
+    def test_unsent_frame_is_dropped(self) -> None:
+        """Test that only the newest frame waits for a slow client."""
+        stream = make_stream()
+
+        stream.queue_frame(b"one")
+        stream.queue_frame(b"two")
+
+        assert stream._pending_frame == b"two"
+        assert stream.dropped_frames == 1
+
+    def test_rates_are_clamped(self) -> None:
+        """Test that client rates stay within limits."""
+        stream = make_stream()
+
+        stream.set_rates(sensor_hz=1000.0, camera_fps=-1.0)
+
+        assert stream.sensor_hz == MAX_SENSOR_HZ
+        assert stream.camera_fps == 0.0
+
+
+class TestTelemetryWebSocket:
+    """Tests for the /ws/{session_id} endpoint."""
+
+    @patch("neoscene.app.api.session_manager")
+    def test_streams_sensors_and_frames(self, mock_manager, client: TestClient) -> None:
+        """Test that a client gets a full sensor snapshot and a JPEG frame."""
+        image = np.zeros((8, 8, 3), np.uint8)
+        mock_manager.get_sensors.return_value = {"ok": True, "sensors": {"speed": 1.5}}
+        mock_manager.get_camera_frames.return_value = JpegFrameCache(
+            lambda: 1, lambda: (1, image.copy()), tag="t"
+        )
+
+        with client.websocket_connect("/ws/s1?sensor_hz=50&camera_fps=10") as ws:
+            messages = [ws.receive() for _ in range(2)]
+
+        texts = [m["text"] for m in messages if m.get("text")]
+        frames = [m["bytes"] for m in messages if m.get("bytes")]
+        assert texts == ['{"type": "sensors", "full": true, "sensors": {"speed": 1.5}}']
+        assert frames[0][:2] == b"\xff\xd8"
+
+    @patch("neoscene.app.api.session_manager")
+    def test_unknown_session_is_rejected(self, mock_manager, client: TestClient) -> None:
+        """Test that streams for missing sessions are refused."""
+        mock_manager.get_session.return_value = None
+
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            with client.websocket_connect("/ws/missing"):
+                pass
+
+        assert exc_info.value.code == 4404
+
+
+class TestMjpegStream:
+    """Tests for the MJPEG camera stream."""
+
+    def test_parts_carry_each_new_frame_once(self) -> None:
+        """Test that frames become multipart parts and repeats are skipped."""
+        numbers = iter([1, 1, 1, 2, 2])
+        state = {"number": 0}
+
+        def snapshot():
+            state["number"] = next(numbers)
+            return state["number"], np.full((8, 8, 3), state["number"], np.uint8)
+
+        frames = JpegFrameCache(lambda: -1, snapshot, tag="t")
+        manager = MagicMock()
+        manager.get_session.side_effect = [object()] * 5 + [None]
+        manager.get_camera_frames.return_value = frames
+
+        async def collect():
+            return [part async for part in mjpeg_parts(manager, "s1", MAX_MJPEG_FPS)]
+
+        parts = asyncio.run(collect())
+
+        assert len(parts) == 2
+        assert frames.encodes == 2
+        header, body = parts[0].split(b"\r\n\r\n", 1)
+        assert header.startswith(b"--frame\r\nContent-Type: image/jpeg")
+        assert body[:2] == b"\xff\xd8"
+        assert body.endswith(b"\r\n")
+
+    @patch("neoscene.app.api.session_manager")
+    def test_unknown_session_is_not_found(self, mock_manager, client: TestClient) -> None:
+        """Test that streams for missing sessions get 404."""
+        mock_manager.get_session.return_value = None
+
+        assert client.get("/camera/missing/stream").status_code == 404
+
+    def test_fps_is_bounded(self, client: TestClient) -> None:
+        """Test that out-of-range frame rates are rejected."""
+        assert client.get("/camera/s1/stream?fps=100").status_code == 422
+        # Nothing above the worker render rate: there would be no new frames to send
+        assert client.get(f"/camera/s1/stream?fps={RENDER_FPS + 1}").status_code == 422
@@ -0,0 +1,105 @@
+"""Tests for per-stage latency tracing."""
+
+import asyncio
+import time
+
+import pytest
+
+from neoscene.core.tracing import (
+    Histogram,
+    current_trace,
+    span,
+    stage_histograms,
+    stage_summary,
+    start_trace,
+    traced,
+    use_trace,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_histograms():
+    """Start every test with empty stage histograms."""
+    stage_histograms.clear()
+    yield
+    stage_histograms.clear()
+
+
+class TestSpans:
+    """Tests for spans and request traces."""
+
+    def test_span_records_on_active_trace(self) -> None:
+        """Test that spans land on the active trace and repeated stages add up."""
+        with start_trace() as trace:
+            with span("llm"):
+                time.sleep(0.01)
+            with span("llm"):
+                pass
+            with span("validate"):
+                pass
+
+        timings = trace.timings()
+        assert list(timings) == ["llm", "validate"]
+        assert timings["llm"] >= 10
+        assert current_trace() is None
+
+    def test_span_without_trace_still_feeds_histograms(self) -> None:
+        """Test that histograms are updated outside of any request."""
+        with span("export"):
+            pass
+
+        assert stage_summary()["export"]["count"] == 1
+
+    def test_trace_propagates_to_threads(self) -> None:
+        """Test that spans in asyncio.to_thread land on the request trace."""
+        def work() -> None:
+            with span("worker"):
+                pass
+
+        async def main():
+            with start_trace() as trace:
+                await asyncio.to_thread(work)
+            return trace
+
+        assert "worker" in asyncio.run(main()).timings()
+
+    def test_use_trace_and_decorator(self) -> None:
+        """Test re-activating a trace and the traced decorator."""
+        @traced("decorated")
+        def build() -> str:
+            return "prompt"
+
+        with start_trace() as trace:
+            pass
+        with use_trace(trace):
+            assert build() == "prompt"
+
+        assert "decorated" in trace.timings()
+
+    def test_server_timing_header(self) -> None:
+        """Test the Server-Timing header format."""
+        with start_trace() as trace:
+            trace.add("llm", 812.345)
+
+        header = trace.server_timing()
+        assert header.startswith("llm;dur=812.35, total;dur=")
+
+
+class TestHistogram:
+    """Tests for the latency histogram."""
+
+    def test_quantiles(self) -> None:
+        """Test that quantile estimates fall in the right buckets."""
+        histogram = Histogram(buckets=(10, 100, 1000))
+        for value in [5] * 90 + [500] * 10:
+            histogram.observe(value)
+
+        summary = histogram.summary()
+        assert summary["count"] == 100
+        assert summary["max"] == 500
+        assert 0 < summary["p50"] <= 10
+        assert 100 < summary["p99"] <= 500
+
+    def test_empty(self) -> None:
+        """Test an empty histogram."""
+        assert Histogram().summary()["p95"] == 0.0